@@ -1,17 +1,29 @@
+from .connection_pool import DaemonConnection, DaemonConnectionPool, PendingReply
 from .protocol import (
     PROTOCOL_VERSION,
     ProtocolError,
+    decode_json_message,
+    encode_json_message,
     make_error_response,
     make_response,
+    read_json_message,
     recv_json_message,
     send_json_message,
+    write_json_message,
 )
 
 __all__ = [
+    "DaemonConnection",
+    "DaemonConnectionPool",
+    "PendingReply",
     "PROTOCOL_VERSION",
     "ProtocolError",
+    "decode_json_message",
+    "encode_json_message",
     "make_error_response",
     "make_response",
+    "read_json_message",
     "recv_json_message",
     "send_json_message",
+    "write_json_message",
 ]
@@ -0,0 +1,196 @@
+"""Persistent connections to the bridge daemon control API.
+
+Instead of one TCP connection per control request, callers share a small pool
+of long-lived sockets.  Every request gets its own request_id and a reader
+thread per connection hands each response to whoever is waiting on that id,
+so several threads can have requests in flight on the same socket and the
+daemon may answer them in any order.  ``submit`` returns as soon as the
+request is written (pipelining) and ``batch`` writes several requests in a
+single send.  A connection that drops is reopened on the next request.
+"""
+
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import Any, Iterable
+
+from .protocol import encode_json_message, make_error_response, recv_json_message
+
+
+class _Link:
+    """One open socket and the requests waiting for a response on it."""
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.alive = True
+        self.pending: dict[str, Future] = {}
+
+
+class PendingReply:
+    """A request that has been written to the daemon and is awaiting its response."""
+
+    def __init__(self, connection: "DaemonConnection", link: _Link, request_id: str, command: str, future: Future):
+        self.connection = connection
+        self.request_id = request_id
+        self.command = command
+        self._link = link
+        self._future = future
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def result(self, timeout: float | None = None) -> dict[str, Any]:
+        try:
+            return self._future.result(timeout)
+        except TimeoutError:
+            # a late response for this id is dropped by the reader
+            self.connection._forget(self._link, self.request_id)
+            raise TimeoutError(f"daemon timeout for {self.command}") from None
+
+
+class DaemonConnection:
+    """A single reconnecting, multiplexed connection to the daemon control port."""
+
+    def __init__(self, host: str, port: int, connect_timeout: float = 5.0):
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self.connects = 0
+        self._link: _Link | None = None
+        self._send_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+
+    @property
+    def inflight(self) -> int:
+        link = self._link
+        return len(link.pending) if link is not None else 0
+
+    def _open(self) -> _Link:
+        sock = socket.create_connection((self.host, self.port), timeout=self.connect_timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.settimeout(None)
+        link = _Link(sock)
+        self._link = link
+        self.connects += 1
+        threading.Thread(target=self._read_loop, args=(link,), name=f"bridge-daemon-reader-{self.port}", daemon=True).start()
+        return link
+
+    def _read_loop(self, link: _Link) -> None:
+        try:
+            while link.alive:
+                msg = recv_json_message(link.sock)
+                with self._pending_lock:
+                    future = link.pending.pop(str(msg.get("request_id") or ""), None)
+                if future is not None:
+                    future.set_result(msg)
+        except Exception as exc:
+            self._drop(link, exc)
+
+    def _drop(self, link: _Link, exc: BaseException) -> None:
+        with self._pending_lock:
+            link.alive = False
+            if self._link is link:
+                self._link = None
+            pending = list(link.pending.values())
+            link.pending.clear()
+        try:
+            link.sock.close()
+        except Exception:
+            pass
+        for future in pending:
+            if not future.done():
+                future.set_exception(ConnectionError(f"daemon connection lost: {exc}"))
+
+    def _forget(self, link: _Link, request_id: str) -> None:
+        with self._pending_lock:
+            link.pending.pop(request_id, None)
+
+    def send(self, requests: list[dict[str, Any]]) -> list[PendingReply]:
+        """Write the requests in one send and return a PendingReply for each, in order."""
+        payload = b"".join(encode_json_message(request) for request in requests)
+        with self._send_lock:
+            for attempt in range(2):
+                link = self._link
+                reused = link is not None and link.alive
+                if not reused:
+                    link = self._open()
+                replies = []
+                with self._pending_lock:
+                    for request in requests:
+                        future: Future = Future()
+                        link.pending[request["request_id"]] = future
+                        replies.append(PendingReply(self, link, request["request_id"], request["command"], future))
+                try:
+                    link.sock.sendall(payload)
+                    return replies
+                except OSError as exc:
+                    # A socket the daemon already closed (idle timeout, restart) fails here
+                    # before anything was delivered, so one retry on a fresh socket is safe.
+                    self._drop(link, exc)
+                    if not reused or attempt:
+                        raise ConnectionError(f"daemon send failed: {exc}") from exc
+        raise ConnectionError("daemon send failed")
+
+    def close(self) -> None:
+        link = self._link
+        if link is not None:
+            self._drop(link, ConnectionError("closed"))
+
+
+def _make_request(command: str, params: dict[str, Any] | None) -> dict[str, Any]:
+    return {"type": "request", "request_id": uuid.uuid4().hex, "command": command, "params": params or {}}
+
+
+class DaemonConnectionPool:
+    """A few DaemonConnections; each request goes to the least busy one.
+
+    One connection already carries any number of concurrent requests; more
+    than one only helps against the threaded daemon, which answers each
+    control connection one request at a time.
+    """
+
+    def __init__(self, host: str, port: int, size: int = 2, timeout: float = 5.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.connections = [DaemonConnection(host, port, connect_timeout=timeout) for _ in range(max(1, int(size)))]
+
+    def _pick(self) -> DaemonConnection:
+        return min(self.connections, key=lambda connection: connection.inflight)
+
+    def submit(self, command: str, params: dict[str, Any] | None = None) -> PendingReply:
+        return self._pick().send([_make_request(command, params)])[0]
+
+    def request(self, command: str, params: dict[str, Any] | None = None, timeout: float | None = None) -> dict[str, Any]:
+        return self.submit(command, params).result(self.timeout if timeout is None else timeout)
+
+    def batch(
+        self,
+        calls: Iterable[tuple[str, dict[str, Any] | None]],
+        timeout: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """Send several control commands in one round trip; responses come back in call order.
+
+        A call that times out or loses its connection yields an error response
+        in its slot rather than failing the whole batch.
+        """
+        requests = [_make_request(command, params) for command, params in calls]
+        if not requests:
+            return []
+        replies = self._pick().send(requests)
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        responses = []
+        for reply in replies:
+            try:
+                responses.append(reply.result(max(0.0, deadline - time.monotonic())))
+            except TimeoutError as exc:
+                responses.append(make_error_response(reply.request_id, "timeout", str(exc), retryable=True))
+            except ConnectionError as exc:
+                responses.append(make_error_response(reply.request_id, "connection_lost", str(exc), retryable=True))
+        return responses
+
+    def close(self) -> None:
+        for connection in self.connections:
+            connection.close()
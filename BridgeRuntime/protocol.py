@@ -1,3 +1,4 @@
+import asyncio
 import json
 import socket
 import struct
@@ -5,6 +6,10 @@ import time
 from typing import Any
 
 PROTOCOL_VERSION = 1
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+# Each message is a little-endian u32 length followed by that many bytes of UTF-8 JSON.
+_FRAME_HEADER = struct.Struct("<I")
 
 
 class ProtocolError(RuntimeError):
@@ -29,24 +34,61 @@ def _read_exact(sock: socket.socket, size: int, timeout: float | None = None) ->
     return b"".join(chunks)
 
 
-def send_json_message(sock: socket.socket, payload: dict[str, Any]) -> None:
+def encode_json_message(payload: dict[str, Any]) -> bytes:
     raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
-    sock.sendall(struct.pack("<I", len(raw)))
-    sock.sendall(raw)
+    return _FRAME_HEADER.pack(len(raw)) + raw
 
 
-def recv_json_message(sock: socket.socket, timeout: float | None = None) -> dict[str, Any]:
-    header = _read_exact(sock, 4, timeout=timeout)
-    (size,) = struct.unpack("<I", header)
-    if size <= 0 or size > 16 * 1024 * 1024:
+def _frame_size(header: bytes) -> int:
+    (size,) = _FRAME_HEADER.unpack(header)
+    if size <= 0 or size > MAX_FRAME_SIZE:
         raise ProtocolError(f"invalid frame size: {size}")
-    raw = _read_exact(sock, size, timeout=timeout)
+    return size
+
+
+def decode_json_message(raw: bytes) -> dict[str, Any]:
     payload = json.loads(raw.decode("utf-8"))
     if not isinstance(payload, dict):
         raise ProtocolError("payload must be object")
     return payload
 
 
+def send_json_message(sock: socket.socket, payload: dict[str, Any]) -> None:
+    sock.sendall(encode_json_message(payload))
+
+
+def recv_json_message(sock: socket.socket, timeout: float | None = None) -> dict[str, Any]:
+    header = _read_exact(sock, 4, timeout=timeout)
+    raw = _read_exact(sock, _frame_size(header), timeout=timeout)
+    return decode_json_message(raw)
+
+
+async def read_json_message(reader: asyncio.StreamReader, timeout: float | None = None) -> dict[str, Any]:
+    """asyncio counterpart of recv_json_message; raises ConnectionError on EOF and TimeoutError on timeout."""
+    async def _read() -> dict[str, Any]:
+        try:
+            header = await reader.readexactly(4)
+            raw = await reader.readexactly(_frame_size(header))
+        except asyncio.IncompleteReadError as exc:
+            raise ConnectionError("socket closed") from exc
+        return decode_json_message(raw)
+
+    if timeout is None:
+        return await _read()
+    try:
+        # asyncio.timeout rather than wait_for: no extra task per message
+        async with asyncio.timeout(timeout):
+            return await _read()
+    except asyncio.TimeoutError as exc:
+        raise TimeoutError("read timed out") from exc
+
+
+async def write_json_message(writer: asyncio.StreamWriter, payload: dict[str, Any]) -> None:
+    """asyncio counterpart of send_json_message."""
+    writer.write(encode_json_message(payload))
+    await writer.drain()
+
+
 def make_response(request_id: str, result: Any, ok: bool = True) -> dict[str, Any]:
     return {"type": "response", "request_id": request_id, "ok": ok, "result": result}
 
@@ -0,0 +1,830 @@
+"""Slalom detour geometry for smart unstuck, plus a short-lived cache shared by followers.
+
+The functions here turn enemy positions into a detour path: overlapping
+touch_radius circles are clustered, each blocking cluster's welded outline is
+sampled, and both sides of it are tangent-walked into navmesh-validated
+waypoints (see _generate_slalom_waypoints).  Nothing here touches the game
+client, so layouts recorded in game can be replayed offline against a
+synthetic navmesh (Py4GWCoreLib/tests/bench_detour_planner.py).
+
+DetourPlanner caches cluster outlines and side paths for a short TTL so
+followers detouring around the same enemy group, or one follower re-entering
+a detour, do not rebuild them.
+
+Consumed by HeroAI/follow/smart_unstuck.py only. Import exact symbols,
+not the package root (per AGENTS.md follow-package rule).
+"""
+from __future__ import annotations
+
+import heapq
+import json
+import math
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Callable, Protocol
+
+
+class DetourConfig(Protocol):
+    """The SmartUnstuckConfig fields the detour geometry reads."""
+
+    touch_radius: float
+    navmesh_contains_margin: float
+    navmesh_snap_tolerance: float
+
+
+def _resolve_navmesh_position(
+    navmesh,
+    x: float,
+    y: float,
+    cfg: DetourConfig,
+) -> tuple[float, float] | None:
+    """Resolve an ideal waypoint (x, y) to a reachable navmesh position.
+
+    Returns the original point if it's already on the navmesh (within margin),
+    the nearest-reachable snap if within navmesh_snap_tolerance, or None when
+    no reachable position exists nearby. None means: don't place a waypoint
+    here, the follower can't go there.
+    """
+    if navmesh is None:
+        return (x, y)  # graceful degradation when pathing maps unavailable
+    try:
+        if navmesh.contains(x, y, cfg.navmesh_contains_margin):
+            return (x, y)
+        snapped = navmesh.find_nearest_reachable((x, y))
+        if snapped is not None:
+            sx, sy = float(snapped[0]), float(snapped[1])
+            if math.hypot(sx - x, sy - y) <= cfg.navmesh_snap_tolerance:
+                return (sx, sy)
+    except Exception:
+        return (x, y)
+    return None
+
+
+def _segment_walkable_on_navmesh(
+    a: tuple[float, float],
+    b: tuple[float, float],
+    navmesh,
+    margin: float,
+) -> bool:
+    """Walk the straight line from `a` to `b` through the navmesh trapezoids
+    and verify it stays on the mesh, `margin` away from walls.
+
+    Answers "is this segment between two waypoints actually walkable?" — a
+    per-point navmesh check on the endpoints alone misses the case where the
+    line in between crosses non-walkable terrain (e.g. props between two
+    enemy-circle boundary points). The walk is exact (NavMesh.segment_block),
+    so thin props cannot fall between samples; the waypoints themselves may be
+    snapped closer than `margin` to a wall, so the margin is relaxed within
+    `margin` of each end. Graceful when navmesh is None (returns True so the
+    system degrades to point-only checks).
+    """
+    if navmesh is None:
+        return True
+    try:
+        return navmesh.segment_block(a, b, margin, end_slack=margin) is None
+    except Exception:
+        return False
+
+
+# Slalom tuning: 1° boundary samples (~2.5u apart at radius 144); waypoint
+# stations every <=80u of outline arc length.
+_BOUNDARY_RESOLUTION_DEG: float = 1.0
+_WAYPOINT_SPACING_UNITS: float = 80.0
+
+
+def _cluster_enemy_indices(
+    enemies: tuple[tuple[float, float], ...],
+    cfg: DetourConfig,
+) -> tuple[tuple[int, ...], ...]:
+    """Group enemies whose touch_radius circles overlap. Returns one tuple of
+    indices per cluster (indices reference the input sequence)."""
+    r = float(cfg.touch_radius)
+    n = len(enemies)
+    if n == 0:
+        return ()
+    parent = list(range(n))
+
+    def find(i: int) -> int:
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    threshold_sq = (2.0 * r) * (2.0 * r)
+    for i in range(n):
+        for j in range(i + 1, n):
+            dx = enemies[i][0] - enemies[j][0]
+            dy = enemies[i][1] - enemies[j][1]
+            if (dx * dx + dy * dy) < threshold_sq:
+                ri, rj = find(i), find(j)
+                if ri != rj:
+                    parent[ri] = rj
+
+    groups: dict[int, list[int]] = {}
+    for i in range(n):
+        groups.setdefault(find(i), []).append(i)
+    return tuple(tuple(g) for g in groups.values())
+
+
+def _build_union_boundary(
+    member_circles: tuple[tuple[tuple[float, float], float], ...],
+) -> tuple[tuple[float, float], ...]:
+    """Outer outline of the union of member circles, sampled by ray-casting
+    from the centroid (one ray per `_BOUNDARY_RESOLUTION_DEG`).
+
+    Each ray returns the farthest ray-circle hit across all members — overlap
+    regions disappear because the ray exits at the outermost circle's edge.
+
+    Returns a closed CCW polyline around the centroid; first point is not
+    duplicated at the end. Assumes star-shaped from the centroid (holds for
+    clustered touch-radius circles where centers sit inside the union).
+    """
+    if not member_circles:
+        return ()
+    cx_total = sum(mc[0][0] for mc in member_circles) / len(member_circles)
+    cy_total = sum(mc[0][1] for mc in member_circles) / len(member_circles)
+    centroid = (cx_total, cy_total)
+    n_samples = max(8, int(round(360.0 / _BOUNDARY_RESOLUTION_DEG)))
+    polyline: list[tuple[float, float]] = []
+    for k in range(n_samples):
+        theta = 2.0 * math.pi * k / n_samples
+        ray_dx = math.cos(theta)
+        ray_dy = math.sin(theta)
+        max_t = 0.0
+        for (cc, cr) in member_circles:
+            ex = centroid[0] - cc[0]
+            ey = centroid[1] - cc[1]
+            # ray_dir is unit, so quadratic in t has a==1
+            b = 2.0 * ((ex * ray_dx) + (ey * ray_dy))
+            c = (ex * ex) + (ey * ey) - (cr * cr)
+            disc = (b * b) - (4.0 * c)
+            if disc < 0:
+                continue
+            sqrt_disc = math.sqrt(disc)
+            t_far = (-b + sqrt_disc) / 2.0
+            if t_far > max_t:
+                max_t = t_far
+        if max_t > 0:
+            polyline.append((centroid[0] + max_t * ray_dx, centroid[1] + max_t * ray_dy))
+    return tuple(polyline)
+
+
+def _boundary_center(boundary: tuple[tuple[float, float], ...]) -> tuple[float, float]:
+    n = len(boundary)
+    return (sum(b[0] for b in boundary) / n, sum(b[1] for b in boundary) / n)
+
+
+def _find_boundary_tangent_indices(
+    point: tuple[float, float],
+    boundary: tuple[tuple[float, float], ...],
+    center: tuple[float, float] | None = None,
+) -> tuple[int, int] | None:
+    """Return (ccw_idx, cw_idx) of the boundary samples that form the tangent
+    from an external `point` — the extremal angular directions, measured
+    relative to the direction of the boundary centroid to avoid wrap. Exact
+    for convex unions; tight approximation for the near-convex peanut shapes
+    from clustered circles. center is the boundary centroid when the caller
+    already has it (DetourPlanner keeps it per outline).
+    """
+    n = len(boundary)
+    if n == 0:
+        return None
+    px, py = point
+    if center is None:
+        center = _boundary_center(boundary)
+    dx = center[0] - px
+    dy = center[1] - py
+    ccw_best_angle = float("-inf")
+    cw_best_angle = float("inf")
+    ccw_idx = 0
+    cw_idx = 0
+    atan2 = math.atan2
+    for i, b in enumerate(boundary):
+        vx = b[0] - px
+        vy = b[1] - py
+        a = atan2((dx * vy) - (dy * vx), (dx * vx) + (dy * vy))
+        if a > ccw_best_angle:
+            ccw_best_angle = a
+            ccw_idx = i
+        if a < cw_best_angle:
+            cw_best_angle = a
+            cw_idx = i
+    return ccw_idx, cw_idx
+
+
+def _boundary_stations(
+    boundary: tuple[tuple[float, float], ...],
+    target_spacing: float,
+) -> tuple[tuple[float, ...], float, tuple[tuple[float, float], ...]]:
+    """Waypoint stations evenly spaced around the closed outline.
+
+    Returns (cum, spacing, stations): cum[i] is the arc length at boundary[i]
+    (cum[n] is the perimeter) and station k sits at arc length k * spacing,
+    with spacing = perimeter / ceil(perimeter / target_spacing), so never
+    wider than target_spacing.  The stations belong to the outline, not to a
+    walk, so every follower walking a stretch of it uses the same points.
+    """
+    n = len(boundary)
+    cum: list[float] = [0.0]
+    for i in range(n):
+        a = boundary[i]
+        b = boundary[(i + 1) % n]
+        cum.append(cum[-1] + math.hypot(b[0] - a[0], b[1] - a[1]))
+    perimeter = cum[-1]
+    count = max(1, int(math.ceil(perimeter / max(1.0, target_spacing))))
+    spacing = perimeter / count
+    stations: list[tuple[float, float]] = []
+    seg = 0
+    for k in range(count):
+        target_dist = k * spacing
+        while seg < n - 1 and cum[seg + 1] < target_dist:
+            seg += 1
+        a = boundary[seg]
+        b = boundary[(seg + 1) % n]
+        seg_len = cum[seg + 1] - cum[seg]
+        alpha = (target_dist - cum[seg]) / seg_len if seg_len > 0 else 0.0
+        stations.append((a[0] + alpha * (b[0] - a[0]), a[1] + alpha * (b[1] - a[1])))
+    return tuple(cum), spacing, tuple(stations)
+
+
+def _side_entry_exit(
+    tan_current: tuple[int, int],
+    tan_follow: tuple[int, int],
+    arc_dir: int,
+) -> tuple[int, int]:
+    """Boundary indices where a walk on side `arc_dir` leaves current's tangent and reaches follow's."""
+    if arc_dir > 0:
+        return tan_current[1], tan_follow[0]
+    return tan_current[0], tan_follow[1]
+
+
+def _build_path_for_side(
+    boundary: tuple[tuple[float, float], ...],
+    tan_current: tuple[int, int],
+    tan_follow: tuple[int, int],
+    arc_dir: int,
+    cfg: DetourConfig,
+    navmesh,
+    stations: tuple[tuple[float, ...], float, tuple[tuple[float, float], ...]] | None = None,
+    resolved: dict | None = None,
+    walkable: dict | None = None,
+) -> tuple[tuple[tuple[float, float], ...], int, int]:
+    """Walk one side (CCW or CW) of a cluster boundary from current's tangent
+    to follow's tangent and emit waypoints: the entry point, every outline
+    station passed on the way (see _boundary_stations), the exit point. Each
+    is navmesh-snapped and segment-validated against the previous emit; snap
+    or segment failures drop the candidate.
+
+    stations, resolved and walkable let a caller reuse the outline's stations
+    and the snap / segment results of earlier walks on the same outline
+    (DetourPlanner keeps them per outline). Returns (waypoints,
+    failed_segments, dropped_candidates).
+    """
+    n = len(boundary)
+    if n < 2:
+        return (), 0, 0
+    cum, spacing, station_points = stations or _boundary_stations(boundary, _WAYPOINT_SPACING_UNITS)
+    entry_idx, exit_idx = _side_entry_exit(tan_current, tan_follow, arc_dir)
+    perimeter = cum[-1]
+    start = cum[entry_idx]
+    if arc_dir > 0:
+        length = (cum[exit_idx] - start) % perimeter
+    else:
+        length = (start - cum[exit_idx]) % perimeter
+    if length < 1.0:
+        return (), 0, 0
+
+    # ("v", i) is boundary[i], ("s", k) station k; the keys index the shared snap/segment results.
+    count = len(station_points)
+    keys: list[tuple[str, int]] = [("v", entry_idx)]
+    if arc_dir > 0:
+        first = int(math.floor(start / spacing)) + 1
+        for step in range(count):
+            offset = (first + step) * spacing - start
+            if offset >= length - 1.0:
+                break
+            if offset > 1.0:
+                keys.append(("s", (first + step) % count))
+    else:
+        first = int(math.ceil(start / spacing)) - 1
+        for step in range(count):
+            offset = start - (first - step) * spacing
+            if offset >= length - 1.0:
+                break
+            if offset > 1.0:
+                keys.append(("s", (first - step) % count))
+    keys.append(("v", exit_idx))
+
+    waypoints: list[tuple[float, float]] = []
+    last_key: tuple[str, int] | None = None
+    failed_segs = 0
+    dropped_candidates = 0
+    for key in keys:
+        if resolved is not None and key in resolved:
+            position = resolved[key]
+        else:
+            ideal_x, ideal_y = boundary[key[1]] if key[0] == "v" else station_points[key[1]]
+            position = _resolve_navmesh_position(navmesh, ideal_x, ideal_y, cfg)
+            if resolved is not None:
+                resolved[key] = position
+        if position is None:
+            dropped_candidates += 1
+            continue
+        if waypoints:
+            pair = (last_key, key)
+            ok = walkable.get(pair) if walkable is not None else None
+            if ok is None:
+                ok = _segment_walkable_on_navmesh(
+                    waypoints[-1],
+                    position,
+                    navmesh,
+                    margin=cfg.navmesh_contains_margin,
+                )
+                if walkable is not None:
+                    walkable[pair] = ok
+            if not ok:
+                failed_segs += 1
+                continue
+        waypoints.append(position)
+        last_key = key
+    return tuple(waypoints), failed_segs, dropped_candidates
+
+
+def _path_length(path: tuple[tuple[float, float], ...]) -> float:
+    if len(path) < 2:
+        return 0.0
+    total = 0.0
+    for i in range(len(path) - 1):
+        total += math.hypot(path[i + 1][0] - path[i][0], path[i + 1][1] - path[i][1])
+    return total
+
+
+def _segment_circle_blocks(
+    seg_start: tuple[float, float],
+    seg_end: tuple[float, float],
+    center: tuple[float, float],
+    radius: float,
+    margin: float = 0.0,
+) -> bool:
+    """True iff the segment passes within radius+margin of `center`."""
+    sx, sy = seg_start
+    ex, ey = seg_end
+    cx, cy = center
+    dx = ex - sx
+    dy = ey - sy
+    seg_len_sq = (dx * dx) + (dy * dy)
+    if seg_len_sq < 1e-6:
+        return math.hypot(cx - sx, cy - sy) < (radius + margin)
+    t = (((cx - sx) * dx) + ((cy - sy) * dy)) / seg_len_sq
+    if t < 0.0:
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
+    closest_x = sx + (t * dx)
+    closest_y = sy + (t * dy)
+    return math.hypot(cx - closest_x, cy - closest_y) < (radius + margin)
+
+
+def _cluster_blocks_segment(
+    seg_start: tuple[float, float],
+    seg_end: tuple[float, float],
+    member_circles: tuple[tuple[tuple[float, float], float], ...],
+) -> bool:
+    """True iff the segment is blocked by ANY member circle of the cluster."""
+    for (cc, cr) in member_circles:
+        if _segment_circle_blocks(seg_start, seg_end, cc, cr):
+            return True
+    return False
+
+
+def _cluster_centroid(
+    member_circles: tuple[tuple[tuple[float, float], float], ...],
+) -> tuple[float, float]:
+    n = len(member_circles)
+    cx = sum(mc[0][0] for mc in member_circles) / n
+    cy = sum(mc[0][1] for mc in member_circles) / n
+    return (cx, cy)
+
+
+def _generate_slalom_waypoints(
+    current_xy: tuple[float, float],
+    follow_xy: tuple[float, float],
+    enemies: tuple[tuple[float, float], ...],
+    cfg: DetourConfig,
+    navmesh,
+    planner: DetourPlanner | None = None,
+    now_ms: float | None = None,
+    log: Callable[[str], None] | None = None,
+) -> tuple[
+    tuple[tuple[float, float], ...],
+    tuple[tuple[float, float], ...],
+    tuple[int, ...],
+    int,
+    tuple[tuple[tuple[float, float], ...], ...],
+]:
+    """Build a slalom path that walks the outer outline of overlapping enemy
+    clusters from current_xy toward follow_xy.
+
+    Returns (waypoints, render_centers, arc_directions, abort_idx, boundaries).
+
+    Per iteration: pick the closest cluster (by projection along current→goal)
+    whose union still blocks the direct segment; build its union outline; probe
+    BOTH sides via tangent-walk; pick the fully-walkable shorter one (or the
+    least-failed if neither is fully walkable). Repeat until no cluster blocks.
+
+    abort_idx = path index of the waypoint nearest follow_xy. render_centers
+    are raw enemy positions (one per accepted enemy) for overlay rendering.
+    boundaries are one closed polyline per accepted cluster.
+
+    With a planner, cluster outlines and side paths come from its cache (see
+    DetourPlanner). log receives the per-side probe lines; None keeps quiet.
+    """
+    if not enemies:
+        return (), (), (), -1, ()
+    r = float(cfg.touch_radius)
+    cluster_groups = _cluster_enemy_indices(enemies, cfg)
+    if not cluster_groups:
+        return (), (), (), -1, ()
+    member_circles_per_cluster: list[tuple[tuple[tuple[float, float], float], ...]] = []
+    member_enemy_pos_per_cluster: list[tuple[tuple[float, float], ...]] = []
+    for idx_group in cluster_groups:
+        member_circles_per_cluster.append(tuple((enemies[i], r) for i in idx_group))
+        member_enemy_pos_per_cluster.append(tuple(enemies[i] for i in idx_group))
+    gx, gy = float(follow_xy[0]), float(follow_xy[1])
+    waypoints: list[tuple[float, float]] = []
+    arc_directions: list[int] = []
+    accepted_enemy_positions: list[tuple[float, float]] = []
+    accepted_boundaries: list[tuple[tuple[float, float], ...]] = []
+    current = (float(current_xy[0]), float(current_xy[1]))
+    remaining_idx = list(range(len(member_circles_per_cluster)))
+    safety_cap = len(remaining_idx)
+    iterations = 0
+    while iterations < safety_cap and remaining_idx:
+        iterations += 1
+        sx, sy = current
+        sg_x = gx - sx
+        sg_y = gy - sy
+        sg_len_sq = (sg_x * sg_x) + (sg_y * sg_y)
+        sg_len = math.sqrt(sg_len_sq) if sg_len_sq > 1e-6 else 0.0
+        best: tuple[float, int] | None = None
+        for list_pos, ci in enumerate(remaining_idx):
+            mc = member_circles_per_cluster[ci]
+            if not _cluster_blocks_segment(current, follow_xy, mc):
+                continue
+            cent = _cluster_centroid(mc)
+            if sg_len < 1e-6:
+                proj = math.hypot(cent[0] - sx, cent[1] - sy)
+            else:
+                proj = (((cent[0] - sx) * sg_x) + ((cent[1] - sy) * sg_y)) / sg_len
+            if proj < 0:
+                continue
+            if best is None or proj < best[0]:
+                best = (proj, list_pos)
+        if best is None:
+            break
+        list_pos = best[1]
+        cluster_idx = remaining_idx[list_pos]
+        mc = member_circles_per_cluster[cluster_idx]
+        if planner is not None:
+            cluster_key, boundary, boundary_center = planner.cluster_boundary(mc, navmesh, now_ms)
+        else:
+            cluster_key, boundary = None, _build_union_boundary(mc)
+            boundary_center = _boundary_center(boundary) if boundary else None
+        if not boundary:
+            remaining_idx.pop(list_pos)
+            continue
+        tan_current = _find_boundary_tangent_indices(current, boundary, boundary_center)
+        tan_follow = _find_boundary_tangent_indices(follow_xy, boundary, boundary_center)
+        if tan_current is None or tan_follow is None:
+            remaining_idx.pop(list_pos)
+            continue
+        # Probe both sides; each entry: (arc_dir, waypoints, failed_segs, dropped, path_len).
+        side_results: list[tuple[int, tuple[tuple[float, float], ...], int, int, float]] = []
+        for arc_dir_candidate in (1, -1):
+            if planner is not None:
+                wps, n_failed, n_dropped = planner.side_path(
+                    cluster_key, boundary, tan_current, tan_follow, arc_dir_candidate, cfg, navmesh, now_ms
+                )
+            else:
+                wps, n_failed, n_dropped = _build_path_for_side(
+                    boundary, tan_current, tan_follow, arc_dir_candidate, cfg, navmesh
+                )
+            if len(wps) < 2:
+                if log is not None:
+                    log(
+                        f"stuck.slalom.probe arc_dir={arc_dir_candidate} "
+                        f"waypoints={len(wps)} failed_segs={n_failed} "
+                        f"dropped={n_dropped} -> reject (too few)"
+                    )
+                continue
+            length = _path_length(wps)
+            side_results.append((arc_dir_candidate, wps, n_failed, n_dropped, length))
+            if log is not None:
+                log(
+                    f"stuck.slalom.probe arc_dir={arc_dir_candidate} "
+                    f"waypoints={len(wps)} failed_segs={n_failed} "
+                    f"dropped={n_dropped} path_len={length:.0f}"
+                )
+        if not side_results:
+            remaining_idx.pop(list_pos)
+            continue
+        # Prefer fully-walkable shorter; fall back to least-failed when neither
+        # side is clean (better an imperfect detour than staying stuck).
+        fully_walkable = [s for s in side_results if s[2] == 0]
+        if fully_walkable:
+            fully_walkable.sort(key=lambda s: s[4])
+            chosen = fully_walkable[0]
+            fallback_used = False
+        else:
+            side_results.sort(key=lambda s: (s[2], s[4]))
+            chosen = side_results[0]
+            fallback_used = True
+        chosen_arc_dir = chosen[0]
+        chosen_wps = chosen[1]
+        chosen_failed = chosen[2]
+        chosen_len = chosen[4]
+        if log is not None:
+            log(
+                f"stuck.slalom.cluster_chosen arc_dir={chosen_arc_dir} "
+                f"waypoints={len(chosen_wps)} path_len={chosen_len:.0f} "
+                f"failed_segs={chosen_failed} fallback={fallback_used} "
+                f"fully_walkable_sides={len(fully_walkable)}/{len(side_results)}"
+            )
+        waypoints.extend(chosen_wps)
+        arc_directions.append(chosen_arc_dir)
+        accepted_enemy_positions.extend(member_enemy_pos_per_cluster[cluster_idx])
+        accepted_boundaries.append(boundary)
+        current = chosen_wps[-1]
+        remaining_idx.pop(list_pos)
+    if not waypoints:
+        return (), (), (), -1, ()
+    abort_idx = -1
+    best_dist = float("inf")
+    for i, wp in enumerate(waypoints):
+        d = math.hypot(wp[0] - gx, wp[1] - gy)
+        if d < best_dist - 1e-3:
+            best_dist = d
+            abort_idx = i
+    return (
+        tuple(waypoints),
+        tuple(accepted_enemy_positions),
+        tuple(arc_directions),
+        abort_idx,
+        tuple(accepted_boundaries),
+    )
+
+
+@dataclass(slots=True)
+class DetourPlannerStats:
+    plans: int = 0
+    plan_ns: int = 0
+    boundary_hits: int = 0
+    boundary_misses: int = 0
+    path_hits: int = 0
+    path_misses: int = 0
+
+    @property
+    def mean_plan_ms(self) -> float:
+        return (self.plan_ns / self.plans) / 1e6 if self.plans else 0.0
+
+
+@dataclass(slots=True)
+class _CachedOutline:
+    expires_ms: float
+    cell: tuple
+    centers: tuple[tuple[float, float], ...]
+    boundary: tuple[tuple[float, float], ...]
+    center: tuple[float, float] | None
+    stations: tuple[tuple[float, ...], float, tuple[tuple[float, float], ...]] | None
+    # (contains margin, snap tolerance) -> (snapped waypoint per station key, walkability per key pair)
+    memos: dict[tuple[float, float], tuple[dict, dict]] = field(default_factory=dict)
+
+
+class DetourPlanner:
+    """Slalom planning with cluster outlines and side paths cached for ttl_ms.
+
+    A cached outline is reused for a cluster with the same radius and member
+    count whose members each lie within `quantum` units of a member of the
+    cached one, so followers that see the same enemy group a few units apart
+    (client lag), or one follower re-entering a detour, share one outline
+    built from the first caller's positions.  Side paths are keyed by
+    outline, side, entry/exit boundary indices and the navmesh margins; they
+    are reused when the same tangent pair comes up again.  Walks with other
+    tangents on the same outline still share its waypoint stations and their
+    navmesh snap and segment results.  Handing in a
+    different navmesh object (map change) drops every entry.
+
+    One planner per process is shared by every follower in it; layouts can be
+    recorded while playing and replayed offline (record_layouts / load_layouts).
+    """
+
+    DEFAULT_TTL_MS: float = 1500.0
+    DEFAULT_QUANTUM: float = 24.0
+    DEFAULT_MAX_ENTRIES: int = 256
+
+    def __init__(
+        self,
+        ttl_ms: float = DEFAULT_TTL_MS,
+        quantum: float = DEFAULT_QUANTUM,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self.ttl_ms = float(ttl_ms)
+        self.quantum = float(quantum)
+        self.max_entries = int(max_entries)
+        self.stats = DetourPlannerStats()
+        # outline id -> _CachedOutline
+        self._outlines: OrderedDict[int, _CachedOutline] = OrderedDict()
+        # (radius, member count, centroid cell x, centroid cell y) -> outline ids
+        self._outline_cells: dict[tuple, set[int]] = {}
+        # (expires_ms, outline id) min-heap; _outlines is in recently-used order, not expiry order
+        self._outline_expiry: list[tuple[float, int]] = []
+        self._next_outline_id = 0
+        self._paths: OrderedDict[tuple, tuple[float, tuple[tuple[tuple[float, float], ...], int, int]]] = OrderedDict()
+        self._navmesh = None
+        self._recorded: deque[dict] | None = None
+
+    def plan(
+        self,
+        current_xy: tuple[float, float],
+        follow_xy: tuple[float, float],
+        enemies: tuple[tuple[float, float], ...],
+        cfg: DetourConfig,
+        navmesh,
+        now_ms: float | None = None,
+        log: Callable[[str], None] | None = None,
+    ):
+        """_generate_slalom_waypoints through the cache; same return value."""
+        if now_ms is None:
+            now_ms = time.monotonic() * 1000.0
+        if self._recorded is not None:
+            self._recorded.append({
+                "current": [float(current_xy[0]), float(current_xy[1])],
+                "follow": [float(follow_xy[0]), float(follow_xy[1])],
+                "enemies": [[float(x), float(y)] for x, y in enemies],
+                "touch_radius": float(cfg.touch_radius),
+                "navmesh_contains_margin": float(cfg.navmesh_contains_margin),
+                "navmesh_snap_tolerance": float(cfg.navmesh_snap_tolerance),
+                "t_ms": float(now_ms),
+            })
+        started_ns = time.perf_counter_ns()
+        result = _generate_slalom_waypoints(
+            current_xy, follow_xy, enemies, cfg, navmesh, planner=self, now_ms=now_ms, log=log
+        )
+        self.stats.plans += 1
+        self.stats.plan_ns += time.perf_counter_ns() - started_ns
+        return result
+
+    def cluster_boundary(
+        self,
+        member_circles: tuple[tuple[tuple[float, float], float], ...],
+        navmesh,
+        now_ms: float | None = None,
+    ) -> tuple[int, tuple[tuple[float, float], ...], tuple[float, float] | None]:
+        """Return (outline id, union outline, outline centroid) for a cluster, building the outline on a miss."""
+        now_ms = self._begin(navmesh, now_ms)
+        centers = tuple(c[0] for c in member_circles)
+        radius = round(float(member_circles[0][1]), 1) if member_circles else 0.0
+        cx, cy = _cluster_centroid(member_circles) if member_circles else (0.0, 0.0)
+        ci, cj = math.floor(cx / self.quantum), math.floor(cy / self.quantum)
+        for di in (-1, 0, 1):
+            for dj in (-1, 0, 1):
+                for outline_id in self._outline_cells.get((radius, len(centers), ci + di, cj + dj), ()):
+                    outline = self._outlines[outline_id]
+                    if outline.expires_ms > now_ms and self._same_members(centers, outline.centers):
+                        self._outlines.move_to_end(outline_id)
+                        self.stats.boundary_hits += 1
+                        return outline_id, outline.boundary, outline.center
+
+        self.stats.boundary_misses += 1
+        boundary = _build_union_boundary(member_circles)
+        outline_id = self._next_outline_id
+        self._next_outline_id += 1
+        cell = (radius, len(centers), ci, cj)
+        stations = _boundary_stations(boundary, _WAYPOINT_SPACING_UNITS) if len(boundary) >= 2 else None
+        center = _boundary_center(boundary) if boundary else None
+        self._outlines[outline_id] = _CachedOutline(now_ms + self.ttl_ms, cell, centers, boundary, center, stations)
+        self._outline_cells.setdefault(cell, set()).add(outline_id)
+        heapq.heappush(self._outline_expiry, (now_ms + self.ttl_ms, outline_id))
+        while len(self._outlines) > self.max_entries:
+            self._drop_outline(next(iter(self._outlines)))
+        return outline_id, boundary, center
+
+    def side_path(
+        self,
+        outline_id: int,
+        boundary: tuple[tuple[float, float], ...],
+        tan_current: tuple[int, int],
+        tan_follow: tuple[int, int],
+        arc_dir: int,
+        cfg: DetourConfig,
+        navmesh,
+        now_ms: float | None = None,
+    ) -> tuple[tuple[tuple[float, float], ...], int, int]:
+        """_build_path_for_side for an outline returned by cluster_boundary, cached."""
+        now_ms = self._begin(navmesh, now_ms)
+        entry_idx, exit_idx = _side_entry_exit(tan_current, tan_follow, arc_dir)
+        key = (
+            outline_id,
+            int(arc_dir),
+            entry_idx,
+            exit_idx,
+            float(cfg.navmesh_contains_margin),
+            float(cfg.navmesh_snap_tolerance),
+        )
+        entry = self._paths.get(key)
+        if entry is not None and entry[0] > now_ms:
+            self._paths.move_to_end(key)
+            self.stats.path_hits += 1
+            return entry[1]
+
+        self.stats.path_misses += 1
+        outline = self._outlines.get(outline_id)
+        if outline is None:
+            path = _build_path_for_side(boundary, tan_current, tan_follow, arc_dir, cfg, navmesh)
+        else:
+            resolved, walkable = outline.memos.setdefault(key[4:], ({}, {}))
+            path = _build_path_for_side(
+                boundary, tan_current, tan_follow, arc_dir, cfg, navmesh, outline.stations, resolved, walkable
+            )
+        self._paths[key] = (now_ms + self.ttl_ms, path)
+        self._paths.move_to_end(key)
+        while len(self._paths) > self.max_entries:
+            self._paths.popitem(last=False)
+        return path
+
+    def clear(self) -> None:
+        self._outlines.clear()
+        self._outline_cells.clear()
+        self._outline_expiry.clear()
+        self._paths.clear()
+        self._navmesh = None
+
+    def entry_counts(self) -> tuple[int, int]:
+        """(cached outlines, cached side paths), expired entries included until evicted."""
+        return len(self._outlines), len(self._paths)
+
+    # ── Layout recording ────────────────────────────────────────────────
+
+    def record_layouts(self, max_layouts: int = 1000) -> None:
+        """Start keeping the inputs of the last max_layouts plan() calls."""
+        self._recorded = deque(maxlen=int(max_layouts))
+
+    def recorded_layouts(self) -> list[dict]:
+        return list(self._recorded) if self._recorded is not None else []
+
+    def save_layouts(self, path: str) -> int:
+        """Write the recorded layouts as JSON lines; returns how many were written."""
+        layouts = self.recorded_layouts()
+        with open(path, "w", encoding="utf-8") as handle:
+            for layout in layouts:
+                handle.write(json.dumps(layout) + "\n")
+        return len(layouts)
+
+    @staticmethod
+    def load_layouts(path: str) -> list[dict]:
+        with open(path, "r", encoding="utf-8") as handle:
+            return [json.loads(line) for line in handle if line.strip()]
+
+    # ── Internals ───────────────────────────────────────────────────────
+
+    def _begin(self, navmesh, now_ms: float | None) -> float:
+        if navmesh is not self._navmesh:
+            self.clear()
+            self._navmesh = navmesh
+        now_ms = time.monotonic() * 1000.0 if now_ms is None else float(now_ms)
+        # Outlines expire with their side paths; drop the stale ones still indexed.
+        # Ids are never reused, so heap items for outlines already evicted are skipped.
+        expiry = self._outline_expiry
+        while expiry and expiry[0][0] <= now_ms:
+            _, outline_id = heapq.heappop(expiry)
+            if outline_id in self._outlines:
+                self._drop_outline(outline_id)
+        return now_ms
+
+    def _drop_outline(self, outline_id: int) -> None:
+        cell = self._outlines.pop(outline_id).cell
+        ids = self._outline_cells.get(cell)
+        if ids is not None:
+            ids.discard(outline_id)
+            if not ids:
+                del self._outline_cells[cell]
+
+    def _same_members(
+        self,
+        centers: tuple[tuple[float, float], ...],
+        cached: tuple[tuple[float, float], ...],
+    ) -> bool:
+        """True if every center has its own cached center within quantum units."""
+        limit_sq = self.quantum * self.quantum
+        unused = list(cached)
+        for x, y in centers:
+            for k, (cx, cy) in enumerate(unused):
+                if (x - cx) * (x - cx) + (y - cy) * (y - cy) <= limit_sq:
+                    del unused[k]
+                    break
+            else:
+                return False
+        return True
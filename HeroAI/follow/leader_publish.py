@@ -16,15 +16,17 @@ from Py4GWCoreLib.GlobalCache.shared_memory_src.HeroAIOptionStruct import HeroAI
 from Py4GWCoreLib.native_src.internals.types import Vec2f
 
 
-# Force-load the navmesh on first call. AutoPathing's cache is normally
+# Load the navmesh on first call. AutoPathing's cache is normally
 # populated by get_path() coroutine pumps; leader-side validation skips that.
+# Without a cache file the mesh is built in the background and this returns
+# None (no validation) until it is ready, instead of blocking the frame.
 def _get_navmesh():
     autopath = AutoPathing()
     nav = autopath.get_navmesh()
     if nav is not None:
         return nav
     try:
-        for _ in autopath.load_pathing_maps():
+        for _ in autopath.load_pathing_maps(wait=False):
             pass
     except Exception:
         return None
@@ -42,6 +44,9 @@ class NavMeshProtocol(Protocol):
     def contains(self, x: float, y: float, margin: float) -> bool:
         ...
 
+    def contains_many(self, points: list[tuple[float, float]], margin: float = 20) -> list[bool]:
+        ...
+
     def find_nearest_reachable(
         self,
         origin: tuple[float, float],
@@ -49,6 +54,13 @@ class NavMeshProtocol(Protocol):
     ) -> tuple[float, float] | None:
         ...
 
+    def find_nearest_reachable_many(
+        self,
+        origins: list[tuple[float, float]],
+        margin: float = 20,
+    ) -> list[tuple[float, float] | None]:
+        ...
+
 
 @dataclass(slots=True)
 class FollowIniConfig:
@@ -598,49 +610,13 @@ class FollowFormationPublisher:
             self.thresholds.combat_follow_threshold,
         )
 
-    def _validate_followpos(
-        self,
+    @staticmethod
+    def _followpos_candidates(
         raw_x: float,
         raw_y: float,
-        fallback_x: float,
-        fallback_y: float,
-        leader_zplane: int,
-        *,
-        bypass_validation: bool = False,
-        fallback_candidates: list[tuple[float, float]] | None = None,
-    ) -> tuple[float, float]:
-        """Use the raw FollowPos when valid; otherwise fall back near party mass."""
-
-        navmesh = self._get_cached_navmesh()
-        if navmesh is None:
-            return (raw_x, raw_y)
-
-        try:
-            if navmesh.contains(raw_x, raw_y, self.tuning.followpos_contains_margin):
-                return (raw_x, raw_y)
-        except Exception:
-            return (raw_x, raw_y)
-        if bypass_validation:
-            return (raw_x, raw_y)
-        max_fallback_distance = float(Range.Spellcast.value)
-
-        def _resolve_candidate(candidate_x: float, candidate_y: float) -> tuple[float, float] | None:
-            try:
-                if navmesh.contains(candidate_x, candidate_y, self.tuning.followpos_contains_margin):
-                    resolved_x = float(candidate_x)
-                    resolved_y = float(candidate_y)
-                else:
-                    snapped = navmesh.find_nearest_reachable((candidate_x, candidate_y))
-                    if snapped is None:
-                        return None
-                    resolved_x = float(snapped[0])
-                    resolved_y = float(snapped[1])
-            except Exception:
-                return None
-
-            if math.hypot(resolved_x - fallback_x, resolved_y - fallback_y) > max_fallback_distance:
-                return None
-            return (resolved_x, resolved_y)
+        fallback_candidates: list[tuple[float, float]] | None,
+    ) -> list[tuple[float, float]]:
+        """Fallback points for an invalid FollowPos, best first: party midpoints, spots around members, the raw point."""
 
         candidate_centers = [
             (float(candidate_x), float(candidate_y))
@@ -656,12 +632,8 @@ class FollowFormationPublisher:
                 midpoint_candidates.append(
                     ((left_x + right_x) / 2.0, (left_y + right_y) / 2.0)
                 )
-
         midpoint_candidates.sort(key=lambda pos: math.hypot(pos[0] - raw_x, pos[1] - raw_y))
-        for midpoint_x, midpoint_y in midpoint_candidates:
-            resolved_midpoint = _resolve_candidate(midpoint_x, midpoint_y)
-            if resolved_midpoint is not None:
-                return resolved_midpoint
+        candidates = midpoint_candidates
 
         candidate_centers.sort(key=lambda pos: math.hypot(pos[0] - raw_x, pos[1] - raw_y))
         adjacent_radius = float(Range.Adjacent.value)
@@ -675,30 +647,95 @@ class FollowFormationPublisher:
                 norm_x, norm_y = vec_x / length, vec_y / length
 
             tang_x, tang_y = -norm_y, norm_x
-            search_points = [
+            candidates.extend((
                 (center_x + (norm_x * adjacent_radius), center_y + (norm_y * adjacent_radius)),
                 (center_x - (norm_x * adjacent_radius), center_y - (norm_y * adjacent_radius)),
                 (center_x + (tang_x * adjacent_radius), center_y + (tang_y * adjacent_radius)),
                 (center_x - (tang_x * adjacent_radius), center_y - (tang_y * adjacent_radius)),
                 (center_x, center_y),
-            ]
+            ))
 
-            for candidate_x, candidate_y in search_points:
-                resolved_candidate = _resolve_candidate(candidate_x, candidate_y)
-                if resolved_candidate is not None:
-                    return resolved_candidate
+        candidates.append((float(raw_x), float(raw_y)))
+        return candidates
 
-        resolved_raw_snap = _resolve_candidate(raw_x, raw_y)
-        if resolved_raw_snap is not None:
-            return resolved_raw_snap
+    def _validate_followpositions(
+        self,
+        requests: list[tuple[float, float, float, float, list[tuple[float, float]] | None]],
+        *,
+        bypass_validation: bool = False,
+    ) -> list[tuple[float, float]]:
+        """Validate (raw_x, raw_y, fallback_x, fallback_y, fallback_candidates) FollowPos requests together.
+
+        A raw FollowPos on the navmesh is kept (checked for all requests in
+        one contains_many call).  Otherwise each request takes its first
+        fallback candidate that lies, or snaps, within Spellcast range of its
+        fallback, else the fallback itself.  Candidates on the
+        navmesh resolve to themselves; the off-mesh ones that come before a
+        request's first accepted on-mesh candidate are snapped for all
+        requests in one find_nearest_reachable_many call.
+        """
+
+        results = [(float(raw_x), float(raw_y)) for raw_x, raw_y, _, _, _ in requests]
+        navmesh = self._get_cached_navmesh()
+        if navmesh is None or bypass_validation:
+            return results
+
+        margin = self.tuning.followpos_contains_margin
+        try:
+            raw_on_mesh = navmesh.contains_many(results, margin)
+        except Exception:
+            return results
+        pending = [request_index for request_index, on_mesh in enumerate(raw_on_mesh) if not on_mesh]
+        if not pending:
+            return results
 
-        return (fallback_x, fallback_y)
+        max_fallback_distance = float(Range.Spellcast.value)
 
-    def _publish_active_slot(
+        def _in_range(pos_x: float, pos_y: float, fallback_x: float, fallback_y: float) -> bool:
+            return math.hypot(pos_x - fallback_x, pos_y - fallback_y) <= max_fallback_distance
+
+        # Per request: indices into snap_points (off-mesh candidates, best first), then the accepted on-mesh one if any.
+        snap_points: dict[tuple[float, float], int] = {}
+        on_mesh: dict[tuple[float, float], bool] = {}
+        chains: list[tuple[list[int], tuple[float, float] | None]] = []
+        for request_index in pending:
+            raw_x, raw_y, fallback_x, fallback_y, fallback_candidates = requests[request_index]
+            to_snap: list[int] = []
+            accepted: tuple[float, float] | None = None
+            for candidate in self._followpos_candidates(raw_x, raw_y, fallback_candidates):
+                if candidate not in on_mesh:
+                    try:
+                        on_mesh[candidate] = bool(navmesh.contains(candidate[0], candidate[1], margin))
+                    except Exception:
+                        on_mesh[candidate] = False
+                if not on_mesh[candidate]:
+                    to_snap.append(snap_points.setdefault(candidate, len(snap_points)))
+                elif _in_range(candidate[0], candidate[1], fallback_x, fallback_y):
+                    accepted = candidate
+                    break
+            chains.append((to_snap, accepted))
+
+        snapped: list[tuple[float, float] | None] = []
+        if snap_points:
+            try:
+                snapped = navmesh.find_nearest_reachable_many(list(snap_points), margin)
+            except Exception:
+                snapped = [None] * len(snap_points)
+
+        for request_index, (to_snap, accepted) in zip(pending, chains):
+            _, _, fallback_x, fallback_y, _ = requests[request_index]
+            resolved = accepted if accepted is not None else (fallback_x, fallback_y)
+            for point in to_snap:
+                snapped_pos = snapped[point]
+                if snapped_pos is not None and _in_range(float(snapped_pos[0]), float(snapped_pos[1]), fallback_x, fallback_y):
+                    resolved = (float(snapped_pos[0]), float(snapped_pos[1]))
+                    break
+            results[request_index] = resolved
+        return results
+
+    def _publish_active_slots(
         self,
-        options: HeroAIOptionStruct,
-        local_x: float,
-        local_y: float,
+        active_slots: list[tuple[HeroAIOptionStruct, float, float, list[tuple[float, float]]]],
         anchor_x: float,
         anchor_y: float,
         facing: float,
@@ -707,27 +744,25 @@ class FollowFormationPublisher:
         combat_threshold: float,
         *,
         bypass_validation: bool = False,
-        fallback_candidates: list[tuple[float, float]] | None = None,
     ) -> None:
-        options.FollowOffset.x = float(local_x)
-        options.FollowOffset.y = float(local_y)
-        options.FollowMoveThreshold = float(move_threshold)
-        options.FollowMoveThresholdCombat = float(combat_threshold)
-        rx, ry = self._rotate_local_to_world(local_x, local_y, facing)
+        """Publish FollowPos for every (options, local_x, local_y, fallback_candidates) slot, validated as one batch."""
+
+        requests: list[tuple[float, float, float, float, list[tuple[float, float]] | None]] = []
+        for options, local_x, local_y, fallback_candidates in active_slots:
+            options.FollowOffset.x = float(local_x)
+            options.FollowOffset.y = float(local_y)
+            options.FollowMoveThreshold = float(move_threshold)
+            options.FollowMoveThresholdCombat = float(combat_threshold)
+            rx, ry = self._rotate_local_to_world(local_x, local_y, facing)
+            requests.append((float(anchor_x + rx), float(anchor_y + ry), float(anchor_x), float(anchor_y), fallback_candidates))
+
         # Snap-or-fallback against navmesh; bails to anchor on elevated terrain.
-        pos_x, pos_y = self._validate_followpos(
-            float(anchor_x + rx),
-            float(anchor_y + ry),
-            float(anchor_x),
-            float(anchor_y),
-            int(leader_zplane),
-            bypass_validation=bypass_validation,
-            fallback_candidates=fallback_candidates,
-        )
-        options.FollowPos.x = pos_x
-        options.FollowPos.y = pos_y
-        options.FollowPos.z = float(leader_zplane)
-        options.LeaderFollowReady = True
+        positions = self._validate_followpositions(requests, bypass_validation=bypass_validation)
+        for (options, _, _, _), (pos_x, pos_y) in zip(active_slots, positions):
+            options.FollowPos.x = pos_x
+            options.FollowPos.y = pos_y
+            options.FollowPos.z = float(leader_zplane)
+            options.LeaderFollowReady = True
 
     def refresh_from_ini(self) -> None:
         self._reload_follow_points_from_ini()
@@ -820,6 +855,7 @@ class FollowFormationPublisher:
                 continue
             party_positions.append((float(account.AgentData.Pos.x), float(account.AgentData.Pos.y)))
 
+        active_slots: list[tuple[HeroAIOptionStruct, float, float, list[tuple[float, float]]]] = []
         for index in range(self.shared_memory_manager.max_num_players):
             account: AccountStruct = all_accounts.AccountData[index]
             if not (account.IsSlotActive and account.IsAccount) or all_accounts._is_slot_isolated_from_viewer(index, leader_index):
@@ -859,32 +895,15 @@ class FollowFormationPublisher:
                 self._apply_personal_flag_slot(options, leader_zplane)
                 continue
 
-            if leader_in_combat:
-                self._publish_active_slot(
-                    options,
-                    local_x,
-                    local_y,
-                    anchor_x,
-                    anchor_y,
-                    anchor_facing,
-                    leader_zplane,
-                    move_threshold,
-                    combat_threshold,
-                    bypass_validation=bypass_validation,
-                    fallback_candidates=fallback_candidates,
-                )
-                continue
+            active_slots.append((options, local_x, local_y, fallback_candidates))
 
-            self._publish_active_slot(
-                options,
-                local_x,
-                local_y,
-                anchor_x,
-                anchor_y,
-                anchor_facing,
-                leader_zplane,
-                move_threshold,
-                combat_threshold,
-                bypass_validation=bypass_validation,
-                fallback_candidates=fallback_candidates,
-            )
+        self._publish_active_slots(
+            active_slots,
+            anchor_x,
+            anchor_y,
+            anchor_facing,
+            leader_zplane,
+            move_threshold,
+            combat_threshold,
+            bypass_validation=bypass_validation,
+        )
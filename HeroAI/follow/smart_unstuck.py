@@ -13,6 +13,7 @@ a detour path and walks it via BT.Move. Two modes:
 
 Both modes feed waypoints to BT.Movement.MoveDirect; tolerance, radius, and
 the detection thresholds are live-tunable via FollowRuntime.ini sliders.
+The slalom geometry and its cache live in HeroAI/follow/detour_planner.py.
 
 Consumed by HeroAI/follow/follower_runtime.py only. Import exact symbols,
 not the package root (per AGENTS.md follow-package rule).
@@ -32,6 +33,8 @@ from Py4GWCoreLib.native_src.internals.types import Vec2f
 from Py4GWCoreLib.py4gwcorelib_src.BehaviorTree import BehaviorTree
 from Py4GWCoreLib.routines_src.BehaviourTrees import BT
 
+from .detour_planner import DetourPlanner, _resolve_navmesh_position
+
 
 # Outer-ring radius for waypoint overlay; not a behavior knob.
 _OVERLAY_TOUCH_RADIUS: float = 25.0
@@ -96,6 +99,8 @@ class SmartUnstuckState:
 
 
 SMART_UNSTUCK_CFG = SmartUnstuckConfig()
+# Slalom outlines/side paths shared by every follower in this process (short TTL).
+DETOUR_PLANNER = DetourPlanner()
 
 _first_call_logged = False
 
@@ -385,78 +390,13 @@ def _get_navmesh():
     if nav is not None:
         return nav
     try:
-        for _ in autopath.load_pathing_maps():
+        for _ in autopath.load_pathing_maps(wait=False):
             pass
     except Exception:
         return None
     return autopath.get_navmesh()
 
 
-def _resolve_navmesh_position(
-    navmesh,
-    x: float,
-    y: float,
-    cfg: SmartUnstuckConfig,
-) -> tuple[float, float] | None:
-    """Resolve an ideal waypoint (x, y) to a reachable navmesh position.
-
-    Returns the original point if it's already on the navmesh (within margin),
-    the nearest-reachable snap if within navmesh_snap_tolerance, or None when
-    no reachable position exists nearby. None means: don't place a waypoint
-    here, the follower can't go there.
-    """
-    if navmesh is None:
-        return (x, y)  # graceful degradation when pathing maps unavailable
-    try:
-        if navmesh.contains(x, y, cfg.navmesh_contains_margin):
-            return (x, y)
-        snapped = navmesh.find_nearest_reachable((x, y))
-        if snapped is not None:
-            sx, sy = float(snapped[0]), float(snapped[1])
-            if math.hypot(sx - x, sy - y) <= cfg.navmesh_snap_tolerance:
-                return (sx, sy)
-    except Exception:
-        return (x, y)
-    return None
-
-
-def _segment_walkable_on_navmesh(
-    a: tuple[float, float],
-    b: tuple[float, float],
-    navmesh,
-    sample_spacing: float,
-    margin: float,
-) -> bool:
-    """Probe the straight line from `a` to `b` at `sample_spacing` intervals
-    and verify each interior sample sits on the navmesh.
-
-    Answers "is this segment between two waypoints actually walkable?" — a
-    per-point navmesh check on the endpoints alone misses the case where the
-    line in between crosses non-walkable terrain (e.g. props between two
-    enemy-circle boundary points). Returns True for an unbroken walkable
-    segment, False if any interior sample fails. Graceful when navmesh is None
-    (returns True so the system degrades to point-only checks).
-    """
-    if navmesh is None:
-        return True
-    dx = b[0] - a[0]
-    dy = b[1] - a[1]
-    length = math.hypot(dx, dy)
-    if length < 1.0:
-        return True
-    n_samples = max(1, int(math.ceil(length / max(1.0, sample_spacing))))
-    for k in range(1, n_samples):
-        t = float(k) / float(n_samples)
-        x = a[0] + (t * dx)
-        y = a[1] + (t * dy)
-        try:
-            if not navmesh.contains(x, y, margin):
-                return False
-        except Exception:
-            return False
-    return True
-
-
 def _generate_arc_waypoints(
     current_xy: tuple[float, float],
     follow_xy: tuple[float, float],
@@ -515,450 +455,6 @@ def _get_enemies_in_range(
     return tuple(out)
 
 
-# Slalom tuning: 1° boundary samples (~2.5u apart at radius 144); waypoints
-# emitted every ~80u of arc length.
-_BOUNDARY_RESOLUTION_DEG: float = 1.0
-_WAYPOINT_SPACING_UNITS: float = 80.0
-
-
-def _cluster_enemy_indices(
-    enemies: tuple[tuple[float, float], ...],
-    cfg: SmartUnstuckConfig,
-) -> tuple[tuple[int, ...], ...]:
-    """Group enemies whose touch_radius circles overlap. Returns one tuple of
-    indices per cluster (indices reference the input sequence)."""
-    r = float(cfg.touch_radius)
-    n = len(enemies)
-    if n == 0:
-        return ()
-    parent = list(range(n))
-
-    def find(i: int) -> int:
-        root = i
-        while parent[root] != root:
-            root = parent[root]
-        while parent[i] != root:
-            parent[i], i = root, parent[i]
-        return root
-
-    threshold_sq = (2.0 * r) * (2.0 * r)
-    for i in range(n):
-        for j in range(i + 1, n):
-            dx = enemies[i][0] - enemies[j][0]
-            dy = enemies[i][1] - enemies[j][1]
-            if (dx * dx + dy * dy) < threshold_sq:
-                ri, rj = find(i), find(j)
-                if ri != rj:
-                    parent[ri] = rj
-
-    groups: dict[int, list[int]] = {}
-    for i in range(n):
-        groups.setdefault(find(i), []).append(i)
-    return tuple(tuple(g) for g in groups.values())
-
-
-def _build_union_boundary(
-    member_circles: tuple[tuple[tuple[float, float], float], ...],
-) -> tuple[tuple[float, float], ...]:
-    """Outer outline of the union of member circles, sampled by ray-casting
-    from the centroid (one ray per `_BOUNDARY_RESOLUTION_DEG`).
-
-    Each ray returns the farthest ray-circle hit across all members — overlap
-    regions disappear because the ray exits at the outermost circle's edge.
-
-    Returns a closed CCW polyline around the centroid; first point is not
-    duplicated at the end. Assumes star-shaped from the centroid (holds for
-    clustered touch-radius circles where centers sit inside the union).
-    """
-    if not member_circles:
-        return ()
-    cx_total = sum(mc[0][0] for mc in member_circles) / len(member_circles)
-    cy_total = sum(mc[0][1] for mc in member_circles) / len(member_circles)
-    centroid = (cx_total, cy_total)
-    n_samples = max(8, int(round(360.0 / _BOUNDARY_RESOLUTION_DEG)))
-    polyline: list[tuple[float, float]] = []
-    for k in range(n_samples):
-        theta = 2.0 * math.pi * k / n_samples
-        ray_dx = math.cos(theta)
-        ray_dy = math.sin(theta)
-        max_t = 0.0
-        for (cc, cr) in member_circles:
-            ex = centroid[0] - cc[0]
-            ey = centroid[1] - cc[1]
-            # ray_dir is unit, so quadratic in t has a==1
-            b = 2.0 * ((ex * ray_dx) + (ey * ray_dy))
-            c = (ex * ex) + (ey * ey) - (cr * cr)
-            disc = (b * b) - (4.0 * c)
-            if disc < 0:
-                continue
-            sqrt_disc = math.sqrt(disc)
-            t_far = (-b + sqrt_disc) / 2.0
-            if t_far > max_t:
-                max_t = t_far
-        if max_t > 0:
-            polyline.append((centroid[0] + max_t * ray_dx, centroid[1] + max_t * ray_dy))
-    return tuple(polyline)
-
-
-def _find_boundary_tangent_indices(
-    point: tuple[float, float],
-    boundary: tuple[tuple[float, float], ...],
-) -> tuple[int, int] | None:
-    """Return (ccw_idx, cw_idx) of the boundary samples that form the tangent
-    from an external `point` — the extremal angular directions, normalized
-    around the boundary centroid to avoid wrap. Exact for convex unions; tight
-    approximation for the near-convex peanut shapes from clustered circles.
-    """
-    n = len(boundary)
-    if n == 0:
-        return None
-    px, py = point
-    bx = sum(b[0] for b in boundary) / n
-    by = sum(b[1] for b in boundary) / n
-    base = math.atan2(by - py, bx - px)
-    ccw_best_angle = float("-inf")
-    cw_best_angle = float("inf")
-    ccw_idx = 0
-    cw_idx = 0
-    for i, b in enumerate(boundary):
-        a = math.atan2(b[1] - py, b[0] - px)
-        while (a - base) >= math.pi:
-            a -= 2.0 * math.pi
-        while (a - base) < -math.pi:
-            a += 2.0 * math.pi
-        if a > ccw_best_angle:
-            ccw_best_angle = a
-            ccw_idx = i
-        if a < cw_best_angle:
-            cw_best_angle = a
-            cw_idx = i
-    return ccw_idx, cw_idx
-
-
-def _walk_boundary_directed(
-    boundary: tuple[tuple[float, float], ...],
-    entry_idx: int,
-    exit_idx: int,
-    arc_direction: int,
-) -> tuple[tuple[float, float], ...]:
-    """Walk the closed `boundary` from entry_idx to exit_idx in the given
-    direction (+1 CCW / increasing index, -1 CW / decreasing). Endpoints
-    included; wraps modulo n."""
-    n = len(boundary)
-    if n == 0:
-        return ()
-    walk: list[tuple[float, float]] = [boundary[entry_idx]]
-    if entry_idx == exit_idx:
-        return tuple(walk)
-    step = 1 if arc_direction > 0 else -1
-    i = entry_idx
-    for _ in range(n):
-        i = (i + step) % n
-        walk.append(boundary[i])
-        if i == exit_idx:
-            break
-    return tuple(walk)
-
-
-def _build_navmesh_aware_waypoints_with_segments(
-    walk: tuple[tuple[float, float], ...],
-    cfg: SmartUnstuckConfig,
-    navmesh,
-    target_spacing: float,
-) -> tuple[tuple[tuple[float, float], ...], int, int]:
-    """Emit waypoints at uniform arc-length intervals along the boundary,
-    each navmesh-snapped and segment-validated against the previous emit.
-
-    Spacing = total_length / ceil(total_length / target_spacing), so it's
-    slightly <= target_spacing and never larger. Snap or segment failures
-    drop the candidate; gaps between emitted waypoints are always an exact
-    multiple of `actual_spacing`, never wider.
-
-    Returns (waypoints, n_failed_segments, n_dropped_candidates).
-    """
-    if len(walk) < 2:
-        return (), 0, 0
-    cum: list[float] = [0.0]
-    for k in range(1, len(walk)):
-        d = math.hypot(walk[k][0] - walk[k - 1][0], walk[k][1] - walk[k - 1][1])
-        cum.append(cum[-1] + d)
-    total = cum[-1]
-    if total < 1.0:
-        return (), 0, 0
-    n_intervals = max(1, int(math.ceil(total / max(1.0, target_spacing))))
-    actual_spacing = total / n_intervals
-    segment_sample_spacing = max(20.0, actual_spacing / 4.0)
-    waypoints: list[tuple[float, float]] = []
-    failed_segs = 0
-    dropped_candidates = 0
-    walk_idx = 0
-    for i in range(n_intervals + 1):
-        target_dist = actual_spacing * i if i < n_intervals else total
-        while walk_idx < len(walk) - 1 and cum[walk_idx + 1] < target_dist:
-            walk_idx += 1
-        if walk_idx >= len(walk) - 1:
-            ideal_x, ideal_y = walk[-1]
-        else:
-            seg_a = cum[walk_idx]
-            seg_b = cum[walk_idx + 1]
-            if seg_b > seg_a:
-                alpha = (target_dist - seg_a) / (seg_b - seg_a)
-            else:
-                alpha = 0.0
-            ideal_x = walk[walk_idx][0] + alpha * (walk[walk_idx + 1][0] - walk[walk_idx][0])
-            ideal_y = walk[walk_idx][1] + alpha * (walk[walk_idx + 1][1] - walk[walk_idx][1])
-        resolved = _resolve_navmesh_position(navmesh, ideal_x, ideal_y, cfg)
-        if resolved is None:
-            dropped_candidates += 1
-            continue
-        if waypoints and not _segment_walkable_on_navmesh(
-            waypoints[-1],
-            resolved,
-            navmesh,
-            sample_spacing=segment_sample_spacing,
-            margin=cfg.navmesh_contains_margin,
-        ):
-            failed_segs += 1
-            continue
-        waypoints.append(resolved)
-    return tuple(waypoints), failed_segs, dropped_candidates
-
-
-def _build_path_for_side(
-    boundary: tuple[tuple[float, float], ...],
-    tan_current: tuple[int, int],
-    tan_follow: tuple[int, int],
-    arc_dir: int,
-    cfg: SmartUnstuckConfig,
-    navmesh,
-) -> tuple[tuple[tuple[float, float], ...], int, int]:
-    """Walk one side (CCW or CW) of a cluster boundary from current's tangent
-    to follow's tangent and emit waypoints. Returns (waypoints, failed_segments,
-    dropped_candidates) — see `_build_navmesh_aware_waypoints_with_segments`.
-    """
-    if arc_dir > 0:
-        entry_idx = tan_current[1]
-        exit_idx = tan_follow[0]
-    else:
-        entry_idx = tan_current[0]
-        exit_idx = tan_follow[1]
-    walk = _walk_boundary_directed(boundary, entry_idx, exit_idx, arc_dir)
-    if len(walk) < 2:
-        return (), 0, 0
-    return _build_navmesh_aware_waypoints_with_segments(
-        walk, cfg, navmesh, _WAYPOINT_SPACING_UNITS
-    )
-
-
-def _path_length(path: tuple[tuple[float, float], ...]) -> float:
-    if len(path) < 2:
-        return 0.0
-    total = 0.0
-    for i in range(len(path) - 1):
-        total += math.hypot(path[i + 1][0] - path[i][0], path[i + 1][1] - path[i][1])
-    return total
-
-
-def _segment_circle_blocks(
-    seg_start: tuple[float, float],
-    seg_end: tuple[float, float],
-    center: tuple[float, float],
-    radius: float,
-    margin: float = 0.0,
-) -> bool:
-    """True iff the segment passes within radius+margin of `center`."""
-    sx, sy = seg_start
-    ex, ey = seg_end
-    cx, cy = center
-    dx = ex - sx
-    dy = ey - sy
-    seg_len_sq = (dx * dx) + (dy * dy)
-    if seg_len_sq < 1e-6:
-        return math.hypot(cx - sx, cy - sy) < (radius + margin)
-    t = (((cx - sx) * dx) + ((cy - sy) * dy)) / seg_len_sq
-    if t < 0.0:
-        t = 0.0
-    elif t > 1.0:
-        t = 1.0
-    closest_x = sx + (t * dx)
-    closest_y = sy + (t * dy)
-    return math.hypot(cx - closest_x, cy - closest_y) < (radius + margin)
-
-
-def _cluster_blocks_segment(
-    seg_start: tuple[float, float],
-    seg_end: tuple[float, float],
-    member_circles: tuple[tuple[tuple[float, float], float], ...],
-) -> bool:
-    """True iff the segment is blocked by ANY member circle of the cluster."""
-    for (cc, cr) in member_circles:
-        if _segment_circle_blocks(seg_start, seg_end, cc, cr):
-            return True
-    return False
-
-
-def _cluster_centroid(
-    member_circles: tuple[tuple[tuple[float, float], float], ...],
-) -> tuple[float, float]:
-    n = len(member_circles)
-    cx = sum(mc[0][0] for mc in member_circles) / n
-    cy = sum(mc[0][1] for mc in member_circles) / n
-    return (cx, cy)
-
-
-def _generate_slalom_waypoints(
-    current_xy: tuple[float, float],
-    follow_xy: tuple[float, float],
-    enemies: tuple[tuple[float, float], ...],
-    cfg: SmartUnstuckConfig,
-    navmesh,
-) -> tuple[
-    tuple[tuple[float, float], ...],
-    tuple[tuple[float, float], ...],
-    tuple[int, ...],
-    int,
-    tuple[tuple[tuple[float, float], ...], ...],
-]:
-    """Build a slalom path that walks the outer outline of overlapping enemy
-    clusters from current_xy toward follow_xy.
-
-    Returns (waypoints, render_centers, arc_directions, abort_idx, boundaries).
-
-    Per iteration: pick the closest cluster (by projection along current→goal)
-    whose union still blocks the direct segment; build its union outline; probe
-    BOTH sides via tangent-walk; pick the fully-walkable shorter one (or the
-    least-failed if neither is fully walkable). Repeat until no cluster blocks.
-
-    abort_idx = path index of the waypoint nearest follow_xy. render_centers
-    are raw enemy positions (one per accepted enemy) for overlay rendering.
-    boundaries are one closed polyline per accepted cluster.
-    """
-    if not enemies:
-        return (), (), (), -1, ()
-    r = float(cfg.touch_radius)
-    cluster_groups = _cluster_enemy_indices(enemies, cfg)
-    if not cluster_groups:
-        return (), (), (), -1, ()
-    member_circles_per_cluster: list[tuple[tuple[tuple[float, float], float], ...]] = []
-    member_enemy_pos_per_cluster: list[tuple[tuple[float, float], ...]] = []
-    for idx_group in cluster_groups:
-        member_circles_per_cluster.append(tuple((enemies[i], r) for i in idx_group))
-        member_enemy_pos_per_cluster.append(tuple(enemies[i] for i in idx_group))
-    gx, gy = float(follow_xy[0]), float(follow_xy[1])
-    waypoints: list[tuple[float, float]] = []
-    arc_directions: list[int] = []
-    accepted_enemy_positions: list[tuple[float, float]] = []
-    accepted_boundaries: list[tuple[tuple[float, float], ...]] = []
-    current = (float(current_xy[0]), float(current_xy[1]))
-    remaining_idx = list(range(len(member_circles_per_cluster)))
-    safety_cap = len(remaining_idx)
-    iterations = 0
-    while iterations < safety_cap and remaining_idx:
-        iterations += 1
-        sx, sy = current
-        sg_x = gx - sx
-        sg_y = gy - sy
-        sg_len_sq = (sg_x * sg_x) + (sg_y * sg_y)
-        sg_len = math.sqrt(sg_len_sq) if sg_len_sq > 1e-6 else 0.0
-        best: tuple[float, int] | None = None
-        for list_pos, ci in enumerate(remaining_idx):
-            mc = member_circles_per_cluster[ci]
-            if not _cluster_blocks_segment(current, follow_xy, mc):
-                continue
-            cent = _cluster_centroid(mc)
-            if sg_len < 1e-6:
-                proj = math.hypot(cent[0] - sx, cent[1] - sy)
-            else:
-                proj = (((cent[0] - sx) * sg_x) + ((cent[1] - sy) * sg_y)) / sg_len
-            if proj < 0:
-                continue
-            if best is None or proj < best[0]:
-                best = (proj, list_pos)
-        if best is None:
-            break
-        list_pos = best[1]
-        cluster_idx = remaining_idx[list_pos]
-        mc = member_circles_per_cluster[cluster_idx]
-        boundary = _build_union_boundary(mc)
-        if not boundary:
-            remaining_idx.pop(list_pos)
-            continue
-        tan_current = _find_boundary_tangent_indices(current, boundary)
-        tan_follow = _find_boundary_tangent_indices(follow_xy, boundary)
-        if tan_current is None or tan_follow is None:
-            remaining_idx.pop(list_pos)
-            continue
-        # Probe both sides; each entry: (arc_dir, waypoints, failed_segs, dropped, path_len).
-        side_results: list[tuple[int, tuple[tuple[float, float], ...], int, int, float]] = []
-        for arc_dir_candidate in (1, -1):
-            wps, n_failed, n_dropped = _build_path_for_side(
-                boundary, tan_current, tan_follow, arc_dir_candidate, cfg, navmesh
-            )
-            if len(wps) < 2:
-                if hero_globals.show_stuck_avoidance_debug:
-                    _log(
-                        f"stuck.slalom.probe arc_dir={arc_dir_candidate} "
-                        f"waypoints={len(wps)} failed_segs={n_failed} "
-                        f"dropped={n_dropped} -> reject (too few)"
-                    )
-                continue
-            length = _path_length(wps)
-            side_results.append((arc_dir_candidate, wps, n_failed, n_dropped, length))
-            if hero_globals.show_stuck_avoidance_debug:
-                _log(
-                    f"stuck.slalom.probe arc_dir={arc_dir_candidate} "
-                    f"waypoints={len(wps)} failed_segs={n_failed} "
-                    f"dropped={n_dropped} path_len={length:.0f}"
-                )
-        if not side_results:
-            remaining_idx.pop(list_pos)
-            continue
-        # Prefer fully-walkable shorter; fall back to least-failed when neither
-        # side is clean (better an imperfect detour than staying stuck).
-        fully_walkable = [s for s in side_results if s[2] == 0]
-        if fully_walkable:
-            fully_walkable.sort(key=lambda s: s[4])
-            chosen = fully_walkable[0]
-            fallback_used = False
-        else:
-            side_results.sort(key=lambda s: (s[2], s[4]))
-            chosen = side_results[0]
-            fallback_used = True
-        chosen_arc_dir = chosen[0]
-        chosen_wps = chosen[1]
-        chosen_failed = chosen[2]
-        chosen_len = chosen[4]
-        if hero_globals.show_stuck_avoidance_debug:
-            _log(
-                f"stuck.slalom.cluster_chosen arc_dir={chosen_arc_dir} "
-                f"waypoints={len(chosen_wps)} path_len={chosen_len:.0f} "
-                f"failed_segs={chosen_failed} fallback={fallback_used} "
-                f"fully_walkable_sides={len(fully_walkable)}/{len(side_results)}"
-            )
-        waypoints.extend(chosen_wps)
-        arc_directions.append(chosen_arc_dir)
-        accepted_enemy_positions.extend(member_enemy_pos_per_cluster[cluster_idx])
-        accepted_boundaries.append(boundary)
-        current = chosen_wps[-1]
-        remaining_idx.pop(list_pos)
-    if not waypoints:
-        return (), (), (), -1, ()
-    abort_idx = -1
-    best_dist = float("inf")
-    for i, wp in enumerate(waypoints):
-        d = math.hypot(wp[0] - gx, wp[1] - gy)
-        if d < best_dist - 1e-3:
-            best_dist = d
-            abort_idx = i
-    return (
-        tuple(waypoints),
-        tuple(accepted_enemy_positions),
-        tuple(arc_directions),
-        abort_idx,
-        tuple(accepted_boundaries),
-    )
-
-
 def _publish_debug_snapshot(state: SmartUnstuckState, cfg: SmartUnstuckConfig) -> None:
     if state.mode == "idle":
         hero_globals.smart_unstuck_debug_snapshot = None
@@ -1201,7 +697,15 @@ def _enter_detour(
             arc_directions,
             abort_idx,
             union_boundaries,
-        ) = _generate_slalom_waypoints(current_xy, follow_xy, enemies, cfg, navmesh)
+        ) = DETOUR_PLANNER.plan(
+            current_xy,
+            follow_xy,
+            enemies,
+            cfg,
+            navmesh,
+            now_ms=_now_ms(),
+            log=_log if hero_globals.show_stuck_avoidance_debug else None,
+        )
         if slalom_waypoints and accepted_centers:
             state.mode = "detouring"
             state.circle_center = accepted_centers[0]
@@ -231,6 +231,12 @@ class AgentArray:
         agent = agent_array_ctx.GetAgentByID(agent_id)
         return agent
         
+    @staticmethod
+    def GetSnapshot():
+        """Purpose: Get this frame's columnar snapshot of the agent array (positions, health, allegiance, alive)."""
+        from .native_src.ShMem.AgentSnapshot import AgentSnapshot
+        return AgentSnapshot.current()
+        
     #region
     
     #region Manipulation
@@ -319,38 +325,23 @@ class AgentArray:
 
         @staticmethod
         def ByDistance(agent_array, pos, descending=False):
-            from .GlobalCache import GLOBAL_CACHE
-            from .Agent import Agent
             """
             Sorts agents by their distance to a given (x, y) position.
             sorted_agents_by_distance = Sort.ByDistance(agent_array, (100, 200))
             """
             if agent_array is None:
                 return []
-            return AgentArray.Sort.ByCondition(
-                agent_array,
-                condition_func=lambda agent_id: Utils.Distance(
-                    Agent.GetXY(agent_id),
-                    (pos[0], pos[1])
-                ),
-                reverse=descending
-            )
+            return AgentArray.GetSnapshot().sort_by_distance(agent_array, pos, descending)
 
         @staticmethod
         def ByHealth(agent_array, descending=False):
-            from .GlobalCache import GLOBAL_CACHE
-            from .Agent import Agent
             """
             Sorts agents by their health (HP).
             sorted_agents_by_health_desc = Sort.ByHealth(agent_array, descending=True)
             """
             if agent_array is None:
                 return []
-            return AgentArray.Sort.ByCondition(
-                agent_array,
-                condition_func=lambda agent_id: Agent.GetHealth(agent_id),
-                reverse=descending
-            )
+            return AgentArray.GetSnapshot().sort_by_health(agent_array, descending)
     #region Filter
     class Filter:
         @staticmethod
@@ -394,33 +385,30 @@ class AgentArray:
 
         @staticmethod
         def ByDistance(agent_array, pos, max_distance, negate=False):
-            from .GlobalCache import GLOBAL_CACHE
-            from .Agent import Agent
             """
             Filters agents based on their distance from a given position.
             agents_within_range = AgentArray.Filter.ByDistance(agent_array, (100, 200), 500)
             """
             if agent_array is None:
                 return []
-            def distance_filter(agent_id):
-                agent_x, agent_y = Agent.GetXY(agent_id)
-                distance = Utils.Distance((agent_x, agent_y), (pos[0], pos[1]))
-                return (distance > max_distance) if negate else (distance <= max_distance)
-
-            return AgentArray.Filter.ByCondition(agent_array, distance_filter)
+            snapshot = AgentArray.GetSnapshot()
+            if negate:
+                return snapshot.filter(agent_array, center=pos, min_distance=max_distance)
+            return snapshot.filter(agent_array, center=pos, max_distance=max_distance)
 
     #region Routines
     class Routines:
             @staticmethod
             def DetectLargestAgentCluster(agent_array, cluster_radius):
-                from .GlobalCache import GLOBAL_CACHE
-                from .Py4GWcorelib import Utils
-                from .Agent import Agent
+                from .native_src.ShMem.AgentSpatialGrid import AgentSpatialGrid
 
                 """
                 Detects the largest cluster of agents based on proximity and returns
                 the agent ID closest to the cluster's center of mass.
 
+                Agents are bucketed into a spatial grid with cluster_radius cells, so
+                linking neighbours only compares agents in adjacent cells.
+
                 Args:
                     agent_array (list[int]): List of agent IDs.
                     cluster_radius (float): Maximum distance between agents to consider them in the same cluster.
@@ -432,51 +420,5 @@ class AgentArray:
                 if not agent_array:
                     return 0  # no agents
 
-                cluster_radius_sq = cluster_radius ** 2
-
-                def is_in_radius(agent1, agent2):
-                    x1, y1 = Agent.GetXY(agent1)
-                    x2, y2 = Agent.GetXY(agent2)
-                    dx, dy = x1 - x2, y1 - y2
-                    return (dx * dx + dy * dy) <= cluster_radius_sq
-
-                # --- Group agents into clusters ---
-                unvisited = set(agent_array)
-                clusters = []
-
-                while unvisited:
-                    current = unvisited.pop()
-                    cluster = [current]
-                    stack = [current]
-
-                    while stack:
-                        node = stack.pop()
-                        neighbors = [a for a in list(unvisited) if is_in_radius(node, a)]
-                        for n in neighbors:
-                            unvisited.remove(n)
-                            cluster.append(n)
-                            stack.append(n)
-
-                    clusters.append(cluster)
-
-                # --- Find largest cluster ---
-                largest_cluster = max(clusters, key=len)
-
-                # --- Compute cluster center (average XY) ---
-                total_x = total_y = 0
-                for agent_id in largest_cluster:
-                    x, y = Agent.GetXY(agent_id)
-                    total_x += x
-                    total_y += y
-                center_x = total_x / len(largest_cluster)
-                center_y = total_y / len(largest_cluster)
-                center_pos = (center_x, center_y)
-
-                # --- Find agent closest to center ---
-                def dist(agent_id):
-                    ax, ay = Agent.GetXY(agent_id)
-                    return Utils.Distance((ax, ay), center_pos)
-
-                closest_agent_id = min(largest_cluster, key=dist)
-                return closest_agent_id
-
+                grid = AgentSpatialGrid.from_snapshot(AgentArray.GetSnapshot(), agent_array, cell_size=max(float(cluster_radius), 1.0))
+                return grid.densest_cluster_center(cluster_radius)
@@ -22,6 +22,26 @@ _tracked_agents: set = set()  # agent IDs that receive actual recharge packets f
 _callbacks: dict = {}  # event_name -> [callbacks]
 _callback_active = False
 
+# Incremental per-agent indexes over _events, updated in _process_event so the
+# cast queries do not rescan the deque.  Entries remember the append sequence
+# of the event they came from and are ignored once that event has rotated out
+# of _events.
+_appended = 0          # total events appended to _events since the last clear
+_casts: dict = {}      # agent_id -> [seq, skill_id, target_id, start, duration, casttime_seen, oldest_ts]
+_pending_skills: dict = {}  # agent_id -> (seq, skill_id) of the last activation/activate packet
+
+_CAST_SEQ, _CAST_SKILL, _CAST_TARGET, _CAST_START, _CAST_DURATION, _CAST_CASTTIME_SEEN, _CAST_OLDEST_TS = range(7)
+
+_CAST_START_TYPES = (EventType.SKILL_ACTIVATED, EventType.ATTACK_SKILL_ACTIVATED)
+_CAST_END_TYPES = (
+    EventType.SKILL_FINISHED,
+    EventType.ATTACK_SKILL_FINISHED,
+    EventType.SKILL_STOPPED,
+    EventType.ATTACK_SKILL_STOPPED,
+    EventType.INTERRUPTED,
+)
+_PENDING_SKILL_TYPES = (EventType.SKILL_ACTIVATED, EventType.ATTACK_SKILL_ACTIVATED, EventType.SKILL_ACTIVATE_PACKET)
+
 
 def _set_callback_active(is_active: bool):
     global _callback_active
@@ -32,49 +52,70 @@ def _is_callback_active() -> bool:
     return _callback_active
 
 
+def _clear_events():
+    """Drop the recorded events together with the indexes built from them."""
+    global _appended
+    _events.clear()
+    _casts.clear()
+    _pending_skills.clear()
+    _appended = 0
+
+
+def _is_retained(seq: int) -> bool:
+    """True while the event appended as number seq is still held in _events."""
+    maxlen = _events.maxlen
+    return maxlen is None or seq > _appended - maxlen
+
+
+def _record_event(ts: int, etype: int, agent: int, val: int, target: int, fval: float):
+    """Append an event to _events and fold it into the per-agent indexes."""
+    global _appended
+    _events.append((ts, etype, agent, val, target, fval))
+    _appended += 1
+    seq = _appended
+
+    cast = _casts.get(agent)
+    if etype in _CAST_START_TYPES:
+        _casts[agent] = [seq, val, target, ts, 0.0, False, ts]
+    elif etype in _CAST_END_TYPES:
+        _casts.pop(agent, None)
+    elif cast is not None:
+        if ts < cast[_CAST_OLDEST_TS]:
+            cast[_CAST_OLDEST_TS] = ts
+        # The first CASTTIME after the activation is the one that applies.
+        if etype == EventType.CASTTIME and not cast[_CAST_CASTTIME_SEEN]:
+            cast[_CAST_DURATION] = fval
+            cast[_CAST_CASTTIME_SEEN] = True
+
+    if etype in _PENDING_SKILL_TYPES:
+        _pending_skills[agent] = (seq, val)
+
+
 def _is_disabled(agent_id: int) -> bool:
     if not _is_callback_active():
         return False
     return agent_id in _disabled
 
 def _find_cast(agent_id: int) -> tuple[int, int, int, float] | None:
-    """Search recent events for an active cast by the agent. 
+    """Look up the agent's active cast in the cast index.
     Returns (skill_id, target_id, start_time, duration) or None."""
     if not _is_callback_active():
         return None
+    cast = _casts.get(agent_id)
+    if cast is None or not _is_retained(cast[_CAST_SEQ]):
+        return None
     now = _get_tick_count()
-    cast_start = None
-    skill_id = 0
-    target_id = 0
-    duration = 0.0
-    for ts, etype, agent, val, target, fval in reversed(list(_events)):
-        if agent != agent_id:
-            continue
-        if now - ts > 30000:
-            break
-        if etype in (
-            EventType.SKILL_FINISHED,
-            EventType.ATTACK_SKILL_FINISHED,
-            EventType.SKILL_STOPPED,
-            EventType.ATTACK_SKILL_STOPPED,
-            EventType.INTERRUPTED,
-        ):
-            return None
-        if etype in (EventType.SKILL_ACTIVATED, EventType.ATTACK_SKILL_ACTIVATED):
-            cast_start = ts
-            skill_id = val
-            target_id = target
-            break
-        if etype == EventType.CASTTIME:
-            duration = fval
-    if cast_start is None:
+    # Same 30s window as the event scan: every event the agent produced since
+    # the activation must still be recent.
+    if now - cast[_CAST_OLDEST_TS] > 30000:
         return None
-    if duration > 0 and now - cast_start > duration * 1000:
+    start, duration = cast[_CAST_START], cast[_CAST_DURATION]
+    if duration > 0 and now - start > duration * 1000:
         return None
-    return (skill_id, target_id, cast_start, duration)
+    return (cast[_CAST_SKILL], cast[_CAST_TARGET], start, duration)
 
 def _is_casting(agent_id: int) -> bool:
-        return _find_cast(agent_id) is not None
+    return _find_cast(agent_id) is not None
 
 def _casting_skill_id(agent_id: int) -> int:
     cast = _find_cast(agent_id)
@@ -335,12 +376,10 @@ def _check_stance(ts: int, agent: int, skill_id: int):
 def _get_pending_skill(agent_id: int) -> int:
     if not _is_callback_active():
         return 0
-    for _, etype, agent, val, _, _ in reversed(list(_events)):
-        if agent != agent_id:
-            continue
-        if etype in (EventType.SKILL_ACTIVATED, EventType.ATTACK_SKILL_ACTIVATED, EventType.SKILL_ACTIVATE_PACKET):
-            return val
-    return 0
+    pending = _pending_skills.get(agent_id)
+    if pending is None or not _is_retained(pending[0]):
+        return 0
+    return pending[1]
 
 
 def _cleanup_expired_stances():
@@ -369,7 +408,7 @@ def _process_event(event):
     val = event.value
     target = event.target_id
     fval = event.float_value
-    _events.append((ts, etype, agent, val, target, fval))
+    _record_event(ts, etype, agent, val, target, fval)
 
     if etype in (EventType.SKILL_ACTIVATED, EventType.ATTACK_SKILL_ACTIVATED):
         _observed.setdefault(agent, set())
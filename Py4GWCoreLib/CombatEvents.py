@@ -126,7 +126,7 @@ class CombatEvents:
 
     @staticmethod
     def ClearEvents():
-        helpers._events.clear()
+        helpers._clear_events()
 
     @staticmethod
     def GetRecentDamage(count: int = 20) -> List[Tuple[int, int, int, float, int, bool]]:
@@ -7,6 +7,10 @@ from Py4GWCoreLib import ModelID
 from Py4GWCoreLib import Item 
 from Py4GWCoreLib import WindowID
 from .ItemCache import RawItemCache, Bag_enum, ItemCache
+from .InventorySnapshot import EQUIPPED_BAGS, INVENTORY_BAGS, STORAGE_BAGS, InventoryDiff, InventorySnapshot
+
+# GetModelCountInStorage has always skipped Storage_5 (not Storage_14) when the anniversary panel is off
+_STORAGE_BAGS_WITHOUT_ANNIVERSARY = tuple(bag for bag in STORAGE_BAGS if bag != Bag_enum.Storage_5.value)
 
 class InventoryCache:
     def __init__(self, action_queue_manager, raw_item_cache, item_cache):
@@ -16,49 +20,28 @@ class InventoryCache:
         self._action_queue_manager:ActionQueueManager = action_queue_manager
 
 
+    @property
+    def snapshot(self) -> InventorySnapshot:
+        """Indexed view of the bags as of the last RawItemCache refresh."""
+        return self._raw_item_cache.snapshot
+
+    def GetInventoryDiff(self) -> InventoryDiff:
+        """Items added, removed or changed by the last RawItemCache refresh."""
+        return self._raw_item_cache.last_diff
+
     def GetInventorySpace(self):
-        bags_to_check = [
-            Bag_enum.Backpack.value,
-            Bag_enum.Belt_Pouch.value,
-            Bag_enum.Bag_1.value,
-            Bag_enum.Bag_2.value
-        ]
-        bag_array = self._raw_item_cache.get_bags(bags_to_check)
-        
-        total_items = 0
-        bag_size = 0
-        for bag in bag_array:
-            total_items += bag.GetItemCount()
-            bag_size += bag.GetSize()
-            
-        return total_items, bag_size
+        return self.snapshot.space(INVENTORY_BAGS)
     
     def GetStorageSpace(self, Anniversary_panel=True):
-        start = Bag_enum.Storage_1.value
-        end = Bag_enum.Storage_13.value
-
-        bags_to_check = list(range(start, end + 1))  # Storage_1 to Storage_13
-
-        if Anniversary_panel:
-            bags_to_check.append(Bag_enum.Storage_14.value)  # Add Storage_14 if available
-
-        bag_array = self._raw_item_cache.get_bags(bags_to_check)
-
-        total_items = 0
-        bag_size = 0
-        for bag in bag_array:
-            total_items += bag.GetItemCount()
-            bag_size += bag.GetSize()
-
-        return total_items, bag_size
+        # Storage_1 to Storage_13, plus Storage_14 if available
+        bags_to_check = STORAGE_BAGS if Anniversary_panel else STORAGE_BAGS[:-1]
+        return self.snapshot.space(bags_to_check)
     
     def GetZeroFilledStorageArray(self, Anniversary_panel=True, ExtraStoragePanes=0):
         """
         Returns a flat list of item_ids ordered by bag and slot.
         Empty slots are represented as 0.
         """
-        result = []
-
         # Base: Storage_1 to Storage_13
         start = Bag_enum.Storage_1.value
         end = Bag_enum.Storage_13.value
@@ -68,45 +51,19 @@ class InventoryCache:
 
         end += ExtraStoragePanes  # Add any extra panes
 
-        bags_to_check = list(range(start, min(end + 1, Bag_enum.Max.value)))
-
-        bag_array = self._raw_item_cache.get_bags(bags_to_check)
-
-        for bag in bag_array:
-            size = bag.GetSize()
-            item_slots = [0] * size  # Fill with 0s
-
-            for item in bag.GetItems():
-                if 0 <= item.slot < size:
-                    item_slots[item.slot] = item.item_id
-
-            result.extend(item_slots)
-
-        return result
+        bags_to_check = range(start, min(end + 1, Bag_enum.Max.value))
+        return self.snapshot.zero_filled(bags_to_check)
 
     def GetFreeSlotCount(self):
         """
         Purpose: Calculate and return the number of free slots in inventory bags (1 to 4).
         Returns: int: The number of free slots available.
         """
-        total_items, total_capacity = self.GetInventorySpace()
-        return max(total_capacity - total_items, 0)
+        return self.snapshot.free_slots(INVENTORY_BAGS)
 
     def GetAllInventoryItemIds(self) -> list:
         """Returns all item_ids currently in inventory bags (Backpack, Belt Pouch, Bag 1, Bag 2)."""
-        bags_to_check = [
-            Bag_enum.Backpack.value,
-            Bag_enum.Belt_Pouch.value,
-            Bag_enum.Bag_1.value,
-            Bag_enum.Bag_2.value
-        ]
-        bag_array = self._raw_item_cache.get_bags(bags_to_check)
-        item_ids = []
-        for bag in bag_array:
-            for item in bag.GetItems():
-                if item.item_id:
-                    item_ids.append(item.item_id)
-        return item_ids
+        return list(self.snapshot.item_ids(INVENTORY_BAGS))
 
     def GetItemCount(self, item_id: int) -> int:
         """
@@ -114,22 +71,7 @@ class InventoryCache:
         in bags Backpack, Belt Pouch, Bag 1, and Bag 2.
         Returns: int: Total quantity across all matching items.
         """
-        bags_to_check = [
-            Bag_enum.Backpack.value,
-            Bag_enum.Belt_Pouch.value,
-            Bag_enum.Bag_1.value,
-            Bag_enum.Bag_2.value
-        ]
-
-        bags = self._raw_item_cache.get_bags(bags_to_check)
-        total_quantity = 0
-
-        for bag in bags:
-            for item in bag.GetItems():
-                if item.item_id == item_id:
-                    total_quantity += item.quantity
-
-        return total_quantity
+        return self.snapshot.item_quantity(item_id, INVENTORY_BAGS)
 
     def GetModelCount(self, model_id: int) -> int:
         """
@@ -144,22 +86,7 @@ class InventoryCache:
         if model_id <= 0:
             return 0
         
-        bags_to_check = [
-            Bag_enum.Backpack.value,
-            Bag_enum.Belt_Pouch.value,
-            Bag_enum.Bag_1.value,
-            Bag_enum.Bag_2.value
-        ]
-
-        bags = self._raw_item_cache.get_bags(bags_to_check)
-        total_quantity = 0
-
-        for bag in bags:
-            for item in bag.GetItems():
-                if item.model_id == model_id:
-                    total_quantity += item.quantity
-
-        return total_quantity
+        return self.snapshot.model_quantity(model_id, INVENTORY_BAGS)
     
     def GetModelCountInStorage(self, model_id: int, Anniversary_panel: bool = True) -> int:
         """
@@ -175,48 +102,21 @@ class InventoryCache:
         if model_id <= 0:
             return 0
         
-        bags_to_check = [
-            Bag_enum.Storage_1.value,
-            Bag_enum.Storage_2.value,
-            Bag_enum.Storage_3.value,
-            Bag_enum.Storage_4.value,
-            Bag_enum.Storage_5.value if Anniversary_panel else None,
-            Bag_enum.Storage_6.value,
-            Bag_enum.Storage_7.value,
-            Bag_enum.Storage_8.value,
-            Bag_enum.Storage_9.value,
-            Bag_enum.Storage_10.value,
-            Bag_enum.Storage_11.value,
-            Bag_enum.Storage_12.value,
-            Bag_enum.Storage_13.value,
-            Bag_enum.Storage_14.value,
-        ]
-
-        bags = self._raw_item_cache.get_bags([bag for bag in bags_to_check if bag is not None])
-        total_quantity = 0
-
-        for bag in bags:
-            for item in bag.GetItems():
-                if item.model_id == model_id:
-                    total_quantity += item.quantity
-
-        return total_quantity
+        bags_to_check = STORAGE_BAGS if Anniversary_panel else _STORAGE_BAGS_WITHOUT_ANNIVERSARY
+        return self.snapshot.model_quantity(model_id, bags_to_check)
 
     def GetModelCountInEquipped(self, model_id: int) -> int:
         """
         Count items with the given model_id in the Equipped Items bag (bag id 22).
         """
-        EQUIPPED_BAG_ID = Bag_enum.Equipped_Items.value  # Equipped Items
         if model_id <= 0:
             return 0
 
-        bags= self._raw_item_cache.get_bags([EQUIPPED_BAG_ID]) or []
-        total = 0
-        for bag in bags:
-            for item in bag.GetItems():
-                if item.model_id == model_id:
-                    total += int(getattr(item, "quantity", 1) or 1)
-        return total
+        snapshot = self.snapshot
+        return sum(
+            int(snapshot.items[item_id].quantity or 1)
+            for item_id in snapshot.item_ids_by_model(model_id, EQUIPPED_BAGS)
+        )
 
     def GetFirstIDKit(self) -> int:
         """
@@ -225,26 +125,12 @@ class InventoryCache:
         Returns:
             int: The Item ID of the ID Kit with the lowest uses, or 0 if no ID Kit is found.
         """
-        bags_to_check = [
-            Bag_enum.Backpack.value,
-            Bag_enum.Belt_Pouch.value,
-            Bag_enum.Bag_1.value,
-            Bag_enum.Bag_2.value
-        ]
-
-        bags = self._raw_item_cache.get_bags(bags_to_check)
-        id_kits = []
-
-        for bag in bags:
-            for item in bag.GetItems():
-                if self.item_cache.Usage.IsIDKit(item.item_id):
-                    id_kits.append(item)
+        id_kits = [item_id for item_id in self.snapshot.item_ids(INVENTORY_BAGS) if self.item_cache.Usage.IsIDKit(item_id)]
 
         if not id_kits:
             return 0
 
-        id_kit_with_lowest_uses = min(id_kits, key=lambda item: self.item_cache.Usage.GetUses(item.item_id))
-        return id_kit_with_lowest_uses.item_id
+        return min(id_kits, key=self.item_cache.Usage.GetUses)
     
 
     def GetFirstUnidentifiedItem(self) -> int:
@@ -253,19 +139,9 @@ class InventoryCache:
         Returns:
             int: The Item ID of the first unidentified item found, or 0 if none found.
         """
-        bags_to_check = [
-            Bag_enum.Backpack.value,
-            Bag_enum.Belt_Pouch.value,
-            Bag_enum.Bag_1.value,
-            Bag_enum.Bag_2.value
-        ]
-
-        bags = self._raw_item_cache.get_bags(bags_to_check)
-
-        for bag in bags:
-            for item in bag.GetItems():
-                if not self.item_cache.Usage.IsIdentified(item.item_id):
-                    return item.item_id
+        for item_id in self.snapshot.item_ids(INVENTORY_BAGS):
+            if not self.item_cache.Usage.IsIdentified(item_id):
+                return item_id
 
         return 0
 
@@ -280,29 +156,19 @@ class InventoryCache:
         Returns:
             int: The item_id of the salvage kit with the fewest uses, or 0 if none found.
         """
-        bags_to_check = [
-            Bag_enum.Backpack.value,
-            Bag_enum.Belt_Pouch.value,
-            Bag_enum.Bag_1.value,
-            Bag_enum.Bag_2.value
-        ]
-
-        bags = self._raw_item_cache.get_bags(bags_to_check)
         kits = []
 
-        for bag in bags:
-            for item in bag.GetItems():
-                if not self.item_cache.Usage.IsSalvageKit(item.item_id):
-                    continue
-                if use_lesser and not self.item_cache.Usage.IsLesserKit(item.item_id):
-                    continue
-                kits.append(item)
+        for item_id in self.snapshot.item_ids(INVENTORY_BAGS):
+            if not self.item_cache.Usage.IsSalvageKit(item_id):
+                continue
+            if use_lesser and not self.item_cache.Usage.IsLesserKit(item_id):
+                continue
+            kits.append(item_id)
 
         if not kits:
             return 0
 
-        best_kit = min(kits, key=lambda item: self.item_cache.Usage.GetUses(item.item_id))
-        return best_kit.item_id
+        return min(kits, key=self.item_cache.Usage.GetUses)
 
     def GetFirstSalvageableItem(self) -> int:
         """
@@ -310,19 +176,9 @@ class InventoryCache:
         Returns:
             int: The Item ID of the first salvageable item found, or 0 if none found.
         """
-        bags_to_check = [
-            Bag_enum.Backpack.value,
-            Bag_enum.Belt_Pouch.value,
-            Bag_enum.Bag_1.value,
-            Bag_enum.Bag_2.value
-        ]
-
-        bags = self._raw_item_cache.get_bags(bags_to_check)
-
-        for bag in bags:
-            for item in bag.GetItems():
-                if self.item_cache.Usage.IsSalvageable(item.item_id):
-                    return item.item_id
+        for item_id in self.snapshot.item_ids(INVENTORY_BAGS):
+            if self.item_cache.Usage.IsSalvageable(item_id):
+                return item_id
 
         return 0
     
@@ -334,45 +190,17 @@ class InventoryCache:
         Returns:
             int: The Item ID of the first item with the specified model_id, or 0 if none found.
         """
-        bags_to_check = [
-            Bag_enum.Backpack.value,
-            Bag_enum.Belt_Pouch.value,
-            Bag_enum.Bag_1.value,
-            Bag_enum.Bag_2.value
-        ]
-
-        bags = self._raw_item_cache.get_bags(bags_to_check)
-
-        for bag in bags:
-            for item in bag.GetItems():
-                if item.model_id == model_id:
-                    return item.item_id
-
-        return 0
+        return self.snapshot.first_item_by_model(model_id, INVENTORY_BAGS)
     
     def GetAllItemIdsByModelID(self, model_id: int) -> list[int]:
         """
-        Purpose: Find the first item with the specified model_id in bags 1, 2, 3, and 4.
+        Purpose: Find all items with the specified model_id in bags 1, 2, 3, and 4.
         Args:
             model_id (int): The model ID to search for.
         Returns:
-            int: The Item ID of the first item with the specified model_id, or 0 if none found.
+            list[int]: The Item IDs of the matching items, in bag and slot order.
         """
-        bags_to_check = [
-            Bag_enum.Backpack.value,
-            Bag_enum.Belt_Pouch.value,
-            Bag_enum.Bag_1.value,
-            Bag_enum.Bag_2.value
-        ]
-        item_ids = []
-
-        bags = self._raw_item_cache.get_bags(bags_to_check)
-
-        for bag in bags:
-            for item in bag.GetItems():
-                if item.model_id == model_id:
-                    item_ids.append(item.item_id)
-        return item_ids
+        return list(self.snapshot.item_ids_by_model(model_id, INVENTORY_BAGS))
     
     def GetfirstModelIDInStorage(self, model_id: int) -> int:
         """
@@ -382,31 +210,7 @@ class InventoryCache:
         Returns:
             int: The Item ID of the first item with the specified model_id, or 0 if none found.
         """
-        bags_to_check = [
-            Bag_enum.Storage_1.value,
-            Bag_enum.Storage_2.value,
-            Bag_enum.Storage_3.value,
-            Bag_enum.Storage_4.value,
-            Bag_enum.Storage_5.value,
-            Bag_enum.Storage_6.value,
-            Bag_enum.Storage_7.value,
-            Bag_enum.Storage_8.value,
-            Bag_enum.Storage_9.value,
-            Bag_enum.Storage_10.value,
-            Bag_enum.Storage_11.value,
-            Bag_enum.Storage_12.value,
-            Bag_enum.Storage_13.value,
-            Bag_enum.Storage_14.value
-        ]
-
-        bags = self._raw_item_cache.get_bags(bags_to_check)
-
-        for bag in bags:
-            for item in bag.GetItems():
-                if item.model_id == model_id:
-                    return item.item_id
-
-        return 0
+        return self.snapshot.first_item_by_model(model_id, STORAGE_BAGS)
 
     def IdentifyItem (self, item_id, id_kit_id):
         """
@@ -556,15 +360,10 @@ class InventoryCache:
         """
         Locate the bag ID and slot of the given item ID in inventory bags (1, 2, 3, 4).
         """
-        bags_to_check = [1, 2, 3, 4]
-        bags = self._raw_item_cache.get_bags(bags_to_check)
-
-        for bag in bags:
-            for item in bag.GetItems():
-                if item.item_id == item_id:
-                    return bag.id, item.slot
-
-        return None, None
+        entry = self.snapshot.get(item_id)
+        if entry is None or entry.bag_id not in INVENTORY_BAGS:
+            return None, None
+        return entry.bag_id, entry.slot
 
     def DepositItemToStorage(self, item_id: int, Anniversary_panel: bool = True, ammount:int = -1) -> bool:
         """
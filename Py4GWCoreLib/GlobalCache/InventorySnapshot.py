@@ -0,0 +1,227 @@
+"""Immutable, indexed view of the inventory built once per RawItemCache refresh.
+
+RawItemCache.update reads every bag once and builds an InventorySnapshot:
+
+    items           item_id -> ItemEntry(item_id, bag_id, slot, model_id, quantity, item)
+    bag_items       bag_id  -> item ids in bag order
+    bag_sizes       bag_id  -> slot count
+    bag_item_counts bag_id  -> occupied slots (Bag.GetItemCount)
+    bag_models      bag_id  -> {model_id: total quantity}
+
+Queries over a group of bags (inventory, storage, ...) are answered from
+per-group model indexes that are built on first use and kept for the
+lifetime of the snapshot, so repeated GetModelCount / GetFirstModelID calls
+in a tick are dictionary lookups.  Snapshots are never mutated; diff()
+compares two of them to report added, removed and changed items.
+
+Bags only need the PyInventory.Bag accessors used here (GetItems, GetSize,
+GetItemCount; items expose item_id, model_id, quantity and slot), so tests can
+build snapshots from fake bags.  This module only depends on the standard
+library.
+"""
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, NamedTuple, Optional, Sequence
+
+# Bag ids (see ItemCache.Bag_enum)
+INVENTORY_BAGS: tuple[int, ...] = (1, 2, 3, 4)            # Backpack, Belt Pouch, Bag 1, Bag 2
+STORAGE_BAGS: tuple[int, ...] = tuple(range(8, 22))       # Storage 1 - 14
+EQUIPPED_BAGS: tuple[int, ...] = (22,)
+ALL_BAGS: tuple[int, ...] = tuple(range(1, 23))          # Backpack - Equipped Items
+
+
+class ItemEntry(NamedTuple):
+    item_id: int
+    bag_id: int
+    slot: int
+    model_id: int
+    quantity: int
+    item: Any  # the PyItem returned by Bag.GetItems()
+
+
+class InventoryDiff(NamedTuple):
+    added: tuple[int, ...]
+    removed: tuple[int, ...]
+    changed: tuple[int, ...]  # moved, restacked or changed model
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+
+EMPTY_DIFF = InventoryDiff((), (), ())
+
+
+class _GroupIndex:
+    """Model lookups for one group of bags, in bag then slot order."""
+    __slots__ = ("model_items", "model_quantity", "item_ids")
+
+    def __init__(self, snapshot: "InventorySnapshot", bag_ids: Sequence[int]):
+        model_items: dict[int, list[int]] = {}
+        model_quantity: dict[int, int] = {}
+        item_ids: list[int] = []
+        items = snapshot.items
+        for bag_id in bag_ids:
+            for item_id in snapshot.bag_items.get(bag_id, ()):
+                entry = items[item_id]
+                item_ids.append(item_id)
+                model_items.setdefault(entry.model_id, []).append(item_id)
+                model_quantity[entry.model_id] = model_quantity.get(entry.model_id, 0) + entry.quantity
+        self.model_items: dict[int, tuple[int, ...]] = {model: tuple(ids) for model, ids in model_items.items()}
+        self.model_quantity = model_quantity
+        self.item_ids: tuple[int, ...] = tuple(item_ids)
+
+
+class InventorySnapshot:
+    """Read-only inventory index; see the module docstring."""
+    __slots__ = ("generation", "items", "bag_items", "bag_sizes", "bag_item_counts", "bag_models", "_groups")
+
+    def __init__(
+        self,
+        generation: int,
+        items: dict[int, ItemEntry],
+        bag_items: dict[int, tuple[int, ...]],
+        bag_sizes: dict[int, int],
+        bag_item_counts: dict[int, int],
+        bag_models: dict[int, Mapping[int, int]],
+    ):
+        self.generation = generation
+        self.items: Mapping[int, ItemEntry] = MappingProxyType(items)
+        self.bag_items: Mapping[int, tuple[int, ...]] = MappingProxyType(bag_items)
+        self.bag_sizes: Mapping[int, int] = MappingProxyType(bag_sizes)
+        self.bag_item_counts: Mapping[int, int] = MappingProxyType(bag_item_counts)
+        self.bag_models: Mapping[int, Mapping[int, int]] = MappingProxyType(bag_models)
+        self._groups: dict[tuple[int, ...], _GroupIndex] = {}
+
+    @classmethod
+    def build(cls, bags: Mapping[int, Any], generation: int = 0) -> "InventorySnapshot":
+        """Index every bag in one pass. bags maps bag id -> PyInventory.Bag (or a compatible fake)."""
+        items: dict[int, ItemEntry] = {}
+        bag_items: dict[int, tuple[int, ...]] = {}
+        bag_sizes: dict[int, int] = {}
+        bag_item_counts: dict[int, int] = {}
+        bag_models: dict[int, Mapping[int, int]] = {}
+
+        for bag_id, bag in bags.items():
+            try:
+                size = int(bag.GetSize())
+                item_count = int(bag.GetItemCount())
+                bag_contents = bag.GetItems()
+            except Exception:
+                continue
+            ids: list[int] = []
+            models: dict[int, int] = {}
+            for item in bag_contents:
+                item_id = item.item_id
+                if not item_id:
+                    continue
+                entry = ItemEntry(item_id, bag_id, item.slot, item.model_id, item.quantity, item)
+                items[item_id] = entry
+                ids.append(item_id)
+                models[entry.model_id] = models.get(entry.model_id, 0) + entry.quantity
+            bag_items[bag_id] = tuple(ids)
+            bag_sizes[bag_id] = size
+            bag_item_counts[bag_id] = item_count
+            bag_models[bag_id] = MappingProxyType(models)
+
+        return cls(generation, items, bag_items, bag_sizes, bag_item_counts, bag_models)
+
+    @classmethod
+    def empty(cls) -> "InventorySnapshot":
+        return cls(0, {}, {}, {}, {}, {})
+
+    def _group(self, bag_ids: Iterable[int]) -> _GroupIndex:
+        key = tuple(bag_ids)
+        group = self._groups.get(key)
+        if group is None:
+            group = _GroupIndex(self, key)
+            self._groups[key] = group
+        return group
+
+    # ─── Items ────────────────────────────────────────────────────────
+
+    def get(self, item_id: int) -> Optional[ItemEntry]:
+        return self.items.get(item_id)
+
+    def __contains__(self, item_id: int) -> bool:
+        return item_id in self.items
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def location(self, item_id: int) -> tuple[Optional[int], Optional[int]]:
+        """(bag_id, slot) of an item, or (None, None)."""
+        entry = self.items.get(item_id)
+        if entry is None:
+            return None, None
+        return entry.bag_id, entry.slot
+
+    def item_ids(self, bag_ids: Iterable[int] = INVENTORY_BAGS) -> tuple[int, ...]:
+        return self._group(bag_ids).item_ids
+
+    def item_quantity(self, item_id: int, bag_ids: Iterable[int] = INVENTORY_BAGS) -> int:
+        entry = self.items.get(item_id)
+        if entry is None or entry.bag_id not in tuple(bag_ids):
+            return 0
+        return entry.quantity
+
+    # ─── Models ───────────────────────────────────────────────────────
+
+    def model_quantity(self, model_id: int, bag_ids: Iterable[int] = INVENTORY_BAGS) -> int:
+        return self._group(bag_ids).model_quantity.get(model_id, 0)
+
+    def item_ids_by_model(self, model_id: int, bag_ids: Iterable[int] = INVENTORY_BAGS) -> tuple[int, ...]:
+        return self._group(bag_ids).model_items.get(model_id, ())
+
+    def first_item_by_model(self, model_id: int, bag_ids: Iterable[int] = INVENTORY_BAGS) -> int:
+        ids = self._group(bag_ids).model_items.get(model_id)
+        return ids[0] if ids else 0
+
+    # ─── Bags ─────────────────────────────────────────────────────────
+
+    def space(self, bag_ids: Iterable[int] = INVENTORY_BAGS) -> tuple[int, int]:
+        """(occupied slots, total slots) over the bags that exist."""
+        used = 0
+        size = 0
+        for bag_id in bag_ids:
+            if bag_id in self.bag_sizes:
+                used += self.bag_item_counts[bag_id]
+                size += self.bag_sizes[bag_id]
+        return used, size
+
+    def free_slots(self, bag_ids: Iterable[int] = INVENTORY_BAGS) -> int:
+        used, size = self.space(bag_ids)
+        return max(size - used, 0)
+
+    def zero_filled(self, bag_ids: Iterable[int]) -> list[int]:
+        """Item ids by bag and slot; empty slots are 0."""
+        result: list[int] = []
+        items = self.items
+        for bag_id in bag_ids:
+            size = self.bag_sizes.get(bag_id)
+            if size is None:
+                continue
+            slots = [0] * size
+            for item_id in self.bag_items[bag_id]:
+                slot = items[item_id].slot
+                if 0 <= slot < size:
+                    slots[slot] = item_id
+            result.extend(slots)
+        return result
+
+    # ─── Changes ──────────────────────────────────────────────────────
+
+    def diff(self, previous: Optional["InventorySnapshot"]) -> InventoryDiff:
+        """Items added, removed or changed (bag, slot, model or quantity) since previous."""
+        if previous is None:
+            return InventoryDiff(tuple(self.items), (), ())
+        old = previous.items
+        new = self.items
+        added = tuple(item_id for item_id in new if item_id not in old)
+        removed = tuple(item_id for item_id in old if item_id not in new)
+        changed = tuple(
+            item_id for item_id, entry in new.items()
+            if (prev := old.get(item_id)) is not None and prev[:5] != entry[:5]
+        )
+        return InventoryDiff(added, removed, changed)
@@ -4,7 +4,8 @@ import Py4GW
 
 from Py4GWCoreLib.Py4GWcorelib import ThrottledTimer
 from Py4GWCoreLib import Bag
-from typing import Dict, List
+from .InventorySnapshot import ALL_BAGS, EMPTY_DIFF, InventoryDiff, InventorySnapshot
+from typing import Callable, Dict, List, Optional
 import time
 from enum import Enum
 
@@ -40,29 +41,43 @@ class Bag_enum(Enum):
 class RawItemCache:
     _instance = None
 
-    def __new__(cls, throttle: int = 75):
+    def __new__(cls, throttle: int = 75, bag_provider: Optional[Callable[[int], PyInventory.Bag]] = None):
         if cls._instance is None:
             cls._instance = super(RawItemCache, cls).__new__(cls)
             cls._instance._initialized = False
         return cls._instance
 
-    def __init__(self, throttle: int = 75):
+    def __init__(self, throttle: int = 75, bag_provider: Optional[Callable[[int], PyInventory.Bag]] = None):
         if self._initialized:
             self.throttle = throttle
+            if bag_provider is not None:
+                self.bag_provider = bag_provider
             return
         
         self.throttle = throttle
+        # bag_id -> PyInventory.Bag; tests can pass a provider that returns fake bags
+        self.bag_provider: Callable[[int], PyInventory.Bag] = bag_provider or self._default_bag_provider
         self.bags: Dict[int, PyInventory.Bag] = {}
         self.transitory_items: Dict[int, PyItem.PyItem] = {}
         self.update_throttle = ThrottledTimer(throttle)
         self.map_valid = False
+        # Indexed view of self.bags, rebuilt on every refresh (see InventorySnapshot)
+        self.snapshot: InventorySnapshot = InventorySnapshot.empty()
+        self.last_diff: InventoryDiff = EMPTY_DIFF
+        self._generation = 0
         self._initialized = True
         
+    @staticmethod
+    def _default_bag_provider(bag_id: int) -> PyInventory.Bag:
+        return PyInventory.Bag(bag_id, str(bag_id))
+        
     def reset(self):
         self.bags.clear()
         self.transitory_items.clear()
         self.update_throttle.Reset()
         self.map_valid = False
+        self.snapshot = InventorySnapshot.empty()
+        self.last_diff = EMPTY_DIFF
         
     def update(self):
         
@@ -70,15 +85,26 @@ class RawItemCache:
             return
 
         self.update_throttle.Reset()
+        self.refresh()
+        
+    def refresh(self):
+        """
+        Re-reads every bag and rebuilds the snapshot, ignoring the throttle.
+        """
         self.bags.clear()
 
         for bag in range(Bag_enum.Backpack.value, Bag_enum.Max.value):
             try:
-                bag_instance = PyInventory.Bag(bag, str(bag))
+                bag_instance = self.bag_provider(bag)
                 self.bags[bag] = bag_instance
             except Exception:
                 continue  # Skip invalid bags
             
+        self._generation += 1
+        previous = self.snapshot
+        self.snapshot = InventorySnapshot.build(self.bags, self._generation)
+        self.last_diff = self.snapshot.diff(previous)
+            
         # Clean up transitory items that no longer exist
         to_remove = []
         for item_id, item in self.transitory_items.items():
@@ -108,31 +134,13 @@ class RawItemCache:
         """
         Returns a list of item IDs in the specified bag.
         """
-        if bag not in self.bags:
-            return []
-
-        bag_instance = self.bags[bag]
-        items = bag_instance.GetItems()
-        item_ids = [item.item_id for item in items]
-        
-        return item_ids
+        return list(self.snapshot.bag_items.get(bag, ()))
                     
     def get_all_items(self):
         """
         Returns a list of all item IDs in all bags.
         """
-        all_item_ids = []
-        
-        for bag in range(Bag_enum.Backpack.value, Bag_enum.Max.value):
-            if bag not in self.bags:
-                continue
-            
-            bag_instance = self.bags[bag]
-            items = bag_instance.GetItems()
-            item_ids = [item.item_id for item in items]
-            all_item_ids.extend(item_ids)
-
-        return all_item_ids
+        return list(self.snapshot.item_ids(ALL_BAGS))
     
     def get_bag(self, bag: int):
         """
@@ -168,10 +176,9 @@ class RawItemCache:
         return list(self.bags.values())
     
     def get_item_by_id(self, item_id: int):
-        for bag in self.bags.values():
-            item = bag.FindItemById(item_id)
-            if item:
-                return item
+        entry = self.snapshot.items.get(item_id)
+        if entry is not None:
+            return entry.item
         
         # Check transitory cache
         item = self.transitory_items.get(item_id)
@@ -231,15 +238,7 @@ class ItemCache:
     
     def GetItemIdFromModelID(self, model_id):
         """Purpose: Retrieve the item ID from the model ID."""
-        bags = self.raw_item_array.get_all_bags()
-
-        for bag in bags:
-            for item in bag.GetItems():
-                # Check if the item's model ID matches the given model ID
-                if item.model_id == model_id:
-                    return item.item_id  # Return the item ID if a match is found
-
-        return 0  # Return 0 if no matching item is found
+        return self.raw_item_array.snapshot.first_item_by_model(model_id, ALL_BAGS)
     
     def GetItemByAgentID(self, agent_id: int):
         item = self.raw_item_array.get_item_by_id(agent_id)
@@ -644,26 +643,13 @@ class ItemArray:
         :param bags_to_check: A list of Bag enum members.
         :return: List of item IDs.
         """
-        # Convert Bag enums to int for cache access
-        bag_ids = [bag_enum.value for bag_enum in bags_to_check]
-        bags = self._raw_item_cache.get_bags(bag_ids)
-
-        all_item_ids = []
-        for bag_enum, bag in zip(bags_to_check, bags):
-            try:
-                items = bag.GetItems()
-                all_item_ids.extend([item.item_id for item in items])
-            except Exception as e:
-                Py4GW.Console.Log("GetItemArray", f"Error retrieving items from {bag_enum.name}: {str(e)}", Py4GW.Console.MessageType.Error)
-
-        return all_item_ids
+        # Convert Bag enums to int for snapshot access
+        bag_ids = tuple(bag_enum.value for bag_enum in bags_to_check)
+        return list(self._raw_item_cache.snapshot.item_ids(bag_ids))
     
     def GetRawItemArray(self, bag_list: List[int]) -> List[PyItem.PyItem]:
-        bags = self._raw_item_cache.get_bags(bag_list)
-        items = []
-        for bag in bags:
-            items.extend(bag.GetItems())
-        return items
+        snapshot = self._raw_item_cache.snapshot
+        return [snapshot.items[item_id].item for item_id in snapshot.item_ids(tuple(bag_list))]
     
     def GetAllBags(self):
         return self._raw_item_cache.get_all_bags()
@@ -165,6 +165,7 @@ class Py4GWSharedMemoryManager:
             player : AccountStruct = self.GetAccountData(index)
             player.reset()  # Reset all player fields to default values
             player.LastUpdated = self.GetBaseTimestamp()
+            self.GetAllAccounts().MarkSlotTableChanged()
            
     def ResetHeroAIData(self, index): 
             option:HeroAIOptionStruct = self.GetAllAccounts().HeroAIOptions[index]
@@ -580,6 +581,10 @@ class Py4GWSharedMemoryManager:
             claim_strength,
         )
 
+    def GetWhiteboardGeneration(self) -> int:
+        """Global whiteboard generation; consumers can skip rescans while it is unchanged."""
+        return self.GetAllAccounts().GetWhiteboardGeneration()
+
     def SweepExpiredIntents(self, now_tick: int) -> int:
         """Compact pass — zero expired slots."""
         return self.GetAllAccounts().SweepExpiredIntents(now_tick)
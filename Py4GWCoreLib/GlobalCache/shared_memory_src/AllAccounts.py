@@ -2,7 +2,7 @@ import ctypes
 from operator import index
 import Py4GW
 from PyParty import HeroPartyMember, PetInfo
-from ctypes import Structure, c_float
+from ctypes import Structure, c_float, c_uint32
 from Py4GWCoreLib.enums_src.Multiboxing_enums import SharedCommandType
 from Py4GWCoreLib.enums_src.Whiteboard_enums import (
     WhiteboardClaimStrength,
@@ -19,6 +19,7 @@ from .Globals import (
     SHMEM_MAX_CHAR_LEN,
     SHMEM_MAX_NUMBER_OF_SKILLS,
     SHMEM_MAX_INTENTS,
+    SHMEM_SLOT_CLAIM_STALE_MS,
 )
 
 from .SharedMessageStruct import SharedMessageStruct
@@ -26,6 +27,15 @@ from .HeroAIOptionStruct import HeroAIOptionStruct
 from .AccountStruct import AccountStruct
 from .KeyStruct import KeyStruct
 from .IntentStruct import IntentStruct
+from .SlotClaim import (
+    SlotClaimStruct,
+    atomic_increment_u32,
+    is_abandoned,
+    new_owner_token,
+    publish,
+    release,
+    try_take_over,
+)
 
 # Master toggle for all whiteboard/lock debug logs.
 # Default is silent. Flip this single flag when you want visibility again.
@@ -38,10 +48,52 @@ _HERO_SUBMIT_RETRY_AFTER: dict[tuple[int, int], int] = {}
 _PET_SUBMIT_RETRY_AFTER: dict[tuple[int, int], int] = {}
 _SLOT_SUBMIT_RETRY_COOLDOWN_MS = 5000
 
+# CountLocks results keyed by (buffer address, query). An entry stays valid
+# while WhiteboardGeneration is unchanged and now_tick lies in
+# [computed_at, earliest expiry among the counted locks).
+_LOCK_COUNT_CACHE: dict[tuple, tuple[int, int, int, int]] = {}
+_LOCK_COUNT_CACHE_MAX = 512
+
+
+class _SlotIndex:
+    """email/key -> slot lookups for one SlotTableGeneration of a shared buffer."""
+
+    __slots__ = ("generation", "accounts_by_email", "player_by_email_hwnd", "slot_by_key")
+
+    def __init__(self, generation: int):
+        self.generation = generation
+        self.accounts_by_email: dict[str, tuple[int, ...]] = {}  # IsAccount slots, ascending
+        self.player_by_email_hwnd: dict[tuple[str, int], int] = {}
+        self.slot_by_key: dict[tuple[int, int, int], int] = {}  # (hwnd, entity_type, local_index)
+
+
+class _InboxIndex:
+    """Active inbox slots for one InboxGeneration of a shared buffer."""
+
+    __slots__ = ("generation", "active", "by_receiver")
+
+    def __init__(self, generation: int):
+        self.generation = generation
+        self.active: list[tuple[int, str, str]] = []  # (index, sender, receiver), ascending
+        self.by_receiver: dict[str, list[tuple[int, str]]] = {}  # receiver -> [(index, sender)]
+
+
+# Per-process lookup indexes keyed by buffer address. Every AllAccounts view
+# of the same shared memory shares them; they are rebuilt only when the
+# matching generation counter in the buffer moves.
+_SLOT_INDEX: dict[int, _SlotIndex] = {}
+_INBOX_INDEX: dict[int, _InboxIndex] = {}
+
 #region AllAccounts
 class AllAccounts(Structure):
     _pack_ = 1
     _fields_ = [
+        # Claim header first so every CAS target is 4-byte aligned.
+        ("WhiteboardGeneration", c_uint32),  # Bumped on every whiteboard post/clear
+        ("InboxGeneration", c_uint32),  # Bumped on every inbox send/state change/finish
+        ("SlotTableGeneration", c_uint32),  # Bumped whenever a slot's email/key identity is (re)written
+        ("IntentClaims", SlotClaimStruct * SHMEM_MAX_INTENTS),  # Ownership/generation per Intents slot
+        ("InboxClaims", SlotClaimStruct * SHMEM_MAX_PLAYERS),  # Ownership/generation per Inbox slot
         ("Keys", KeyStruct * SHMEM_MAX_PLAYERS),  # KeyStruct for each player slot
         ("AccountData", AccountStruct * SHMEM_MAX_PLAYERS),
         ("Inbox", SharedMessageStruct * SHMEM_MAX_PLAYERS),  # Messages for each player
@@ -50,6 +102,11 @@ class AllAccounts(Structure):
     ]
 
     # Type hints for IntelliSense
+    WhiteboardGeneration: int
+    InboxGeneration: int
+    SlotTableGeneration: int
+    IntentClaims: list[SlotClaimStruct]
+    InboxClaims: list[SlotClaimStruct]
     AccountData: list["AccountStruct"]
     Inbox: list["SharedMessageStruct"]
     HeroAIOptions: list[HeroAIOptionStruct]
@@ -62,9 +119,143 @@ class AllAccounts(Structure):
             self.Keys[i].reset()
             self.AccountData[i].reset()
             self.Inbox[i].reset()
+            self.InboxClaims[i].reset()
             self.HeroAIOptions[i].reset()
         for i in range(SHMEM_MAX_INTENTS):
             self.Intents[i].reset()
+            self.IntentClaims[i].reset()
+        # Generations are bumped rather than zeroed so an index or cache keyed by a
+        # generation seen before the reset (_SLOT_INDEX, _INBOX_INDEX and
+        # _LOCK_COUNT_CACHE, in any process) never matches again.
+        self._bump_generation("WhiteboardGeneration")
+        self._bump_generation("InboxGeneration")
+        self.MarkSlotTableChanged()
+        self._invalidate_slot_index()
+        _INBOX_INDEX.pop(ctypes.addressof(self), None)
+
+    #region Slot claims
+    def _claim_free_slot(self, claims, slots, count: int) -> tuple[int, int]:
+        """Atomically claim the first free (or abandoned) slot. Returns (index, token) or (-1, 0).
+
+        The caller owns the slot until it clears it: write the payload, set
+        Active and call SlotClaim.publish() on the claim.
+        """
+        token = new_owner_token()
+        now = int(Py4GW.Game.get_tick_count64())
+        for i in range(count):
+            if slots[i].Active:
+                continue
+            claim = claims[i]
+            owner = int(claim.Owner)
+            if owner != 0 and not is_abandoned(claim, now, SHMEM_SLOT_CLAIM_STALE_MS):
+                continue
+            if not try_take_over(claim, owner, token):
+                continue  # Another account won this slot
+            if slots[i].Active:
+                # Published by its previous owner between our checks.
+                release(claim, token)
+                continue
+            return i, token
+        return -1, 0
+
+    def _take_published_slot(self, claims, index: int, observed_owner: int) -> int:
+        """Take exclusive ownership of a published slot before resetting it. Returns the token or 0.
+
+        observed_owner must be read before the caller inspected the slot, so a
+        slot that was cleared and re-posted in between is left alone.
+        """
+        token = new_owner_token()
+        if not try_take_over(claims[index], observed_owner, token):
+            return 0
+        return token
+
+    def _bump_generation(self, field_name: str) -> int:
+        return atomic_increment_u32(ctypes.addressof(self) + getattr(AllAccounts, field_name).offset)
+
+    def GetWhiteboardGeneration(self) -> int:
+        """Global whiteboard generation; unchanged value means no lock was posted or cleared."""
+        return int(self.WhiteboardGeneration)
+
+    def GetInboxGeneration(self) -> int:
+        """Global inbox generation; unchanged value means no message was sent, started or finished."""
+        return int(self.InboxGeneration)
+
+    def GetSlotTableGeneration(self) -> int:
+        """Slot-table generation; unchanged value means no slot's email or key was rewritten."""
+        return int(self.SlotTableGeneration)
+
+    def MarkSlotTableChanged(self) -> int:
+        """Call after writing a slot's AccountEmail/IsAccount/Keys so every process rebuilds its lookup index."""
+        return self._bump_generation("SlotTableGeneration")
+
+    def _slot_index(self) -> _SlotIndex:
+        generation = int(self.SlotTableGeneration)
+        address = ctypes.addressof(self)
+        index = _SLOT_INDEX.get(address)
+        if index is not None and index.generation == generation:
+            return index
+        index = _SlotIndex(generation)
+        accounts_by_email: dict[str, list[int]] = {}
+        all_accounts = self.AccountData
+        keys = self.Keys
+        for i in range(SHMEM_MAX_PLAYERS):
+            key = keys[i]
+            hwnd = int(key.HWND)
+            entity_type = int(key.EntityType)
+            if hwnd:
+                index.slot_by_key.setdefault((hwnd, entity_type, int(key.LocalIndex)), i)
+            account = all_accounts[i]
+            if not account.IsAccount:
+                continue
+            email = account.AccountEmail
+            if not email:
+                continue
+            accounts_by_email.setdefault(email, []).append(i)
+            if hwnd and entity_type == 0:
+                index.player_by_email_hwnd.setdefault((email, hwnd), i)
+        index.accounts_by_email = {email: tuple(slots) for email, slots in accounts_by_email.items()}
+        _SLOT_INDEX[address] = index
+        return index
+
+    def _invalidate_slot_index(self) -> None:
+        _SLOT_INDEX.pop(ctypes.addressof(self), None)
+
+    def _account_slots_for_email(self, account_email: str) -> tuple[int, ...]:
+        """IsAccount slots holding account_email, ascending, from the slot index."""
+        slots = self._slot_index().accounts_by_email.get(account_email, ())
+        all_accounts = self.AccountData
+        for i in slots:
+            account = all_accounts[i]
+            if not account.IsAccount or account.AccountEmail != account_email:
+                # A slot was rewritten without MarkSlotTableChanged(); rebuild and trust the fresh scan.
+                self._invalidate_slot_index()
+                return self._slot_index().accounts_by_email.get(account_email, ())
+        return slots
+
+    def _inbox_index(self) -> _InboxIndex:
+        generation = int(self.InboxGeneration)
+        address = ctypes.addressof(self)
+        index = _INBOX_INDEX.get(address)
+        if index is not None and index.generation == generation:
+            return index
+        index = _InboxIndex(generation)
+        inbox = self.Inbox
+        for i in range(SHMEM_MAX_PLAYERS):
+            message = inbox[i]
+            if not message.Active:
+                continue
+            sender = message.SenderEmail
+            receiver = message.ReceiverEmail
+            index.active.append((i, sender, receiver))
+            index.by_receiver.setdefault(receiver, []).append((i, sender))
+        _INBOX_INDEX[address] = index
+        return index
+
+    def GetIntentGeneration(self, index: int) -> int:
+        """Per-slot whiteboard generation, bumped whenever that slot is posted or cleared."""
+        if not (0 <= index < SHMEM_MAX_INTENTS):
+            return 0
+        return int(self.IntentClaims[index].Generation)
             
     #region Account
     def GetAccountData(self, index: int) -> AccountStruct:
@@ -196,12 +387,7 @@ class AllAccounts(Structure):
     def _find_account_slot_by_email(self, account_email: str) -> int:
         if not account_email:
             return -1
-        candidates: list[int] = []
-        all_accounts = self.AccountData
-        for i in range(SHMEM_MAX_PLAYERS):
-            account = all_accounts[i]
-            if account.AccountEmail == account_email and account.IsAccount:
-                candidates.append(i)
+        candidates = self._account_slots_for_email(account_email)
 
         if not candidates:
             return -1
@@ -228,25 +414,27 @@ class AllAccounts(Structure):
     def _find_player_slot_by_key(self, account_email: str, hwnd: int) -> int:
         if not account_email or not hwnd:
             return -1
-        for i in range(SHMEM_MAX_PLAYERS):
+        lookup = (account_email, int(hwnd))
+        i = self._slot_index().player_by_email_hwnd.get(lookup, -1)
+        if i != -1:
             account = self.AccountData[i]
-            if not account.IsAccount:
-                continue
-            if account.AccountEmail != account_email:
-                continue
             key = self.Keys[i]
-            if key.HWND == hwnd and key.EntityType == 0:
-                return i
-        return -1
+            if not (account.IsAccount and key.HWND == hwnd and key.EntityType == 0 and account.AccountEmail == account_email):
+                self._invalidate_slot_index()
+                i = self._slot_index().player_by_email_hwnd.get(lookup, -1)
+        return i
 
     def _find_slot_by_key(self, hwnd: int, entity_type: int, local_index: int) -> int:
         if not hwnd:
             return -1
-        for i in range(SHMEM_MAX_PLAYERS):
+        lookup = (int(hwnd), int(entity_type), int(local_index))
+        i = self._slot_index().slot_by_key.get(lookup, -1)
+        if i != -1:
             key = self.Keys[i]
-            if key.HWND == hwnd and key.EntityType == entity_type and key.LocalIndex == local_index:
-                return i
-        return -1
+            if not (key.HWND == hwnd and key.EntityType == entity_type and key.LocalIndex == local_index):
+                self._invalidate_slot_index()
+                i = self._slot_index().slot_by_key.get(lookup, -1)
+        return i
 
     def IsAccountIsolated(self, account_email: str) -> bool:
         index = self._find_account_slot_by_email(account_email)
@@ -413,9 +601,8 @@ class AllAccounts(Structure):
         Key = KeyStruct().AsPlayerKey(Py4GW.Console.get_gw_window_handle())
         self.Keys[slot_index] = new_account.Key = Key
         self.AccountData[slot_index] = new_account
-        
+        self.MarkSlotTableChanged()
 
-        
         ConsoleLog(SHMEM_MODULE_NAME, f"Submitted account data for {account_email} at slot {slot_index}.", Py4GW.Console.MessageType.Info)
         return slot_index
     
@@ -442,6 +629,7 @@ class AllAccounts(Structure):
         Key = KeyStruct().AsHeroKey(Py4GW.Console.get_gw_window_handle(), int(hero_data.hero_id.GetID()))
         self.Keys[slot_index] = new_account.Key = Key
         self.AccountData[slot_index] = new_account
+        self.MarkSlotTableChanged()
 
         ConsoleLog(SHMEM_MODULE_NAME, f"Submitted hero data for HeroID {hero_data.hero_id.GetID()} at slot {slot_index}.", Py4GW.Console.MessageType.Debug, log=False)
         return slot_index
@@ -467,7 +655,8 @@ class AllAccounts(Structure):
         Key = KeyStruct().AsPetKey(Py4GW.Console.get_gw_window_handle(), 0)
         self.Keys[slot_index] = new_account.Key = Key
         self.AccountData[slot_index] = new_account
-        
+        self.MarkSlotTableChanged()
+
         ConsoleLog(SHMEM_MODULE_NAME, f"Submitted pet data for AgentID {pet_data.agent_id} at slot {slot_index}.", Py4GW.Console.MessageType.Info)
         return slot_index
     
@@ -535,10 +724,8 @@ class AllAccounts(Structure):
         if own_index != -1:
             return own_index
 
-        all_accounts = self.AccountData
-        for i in range(SHMEM_MAX_PLAYERS):
-            account = all_accounts[i]
-            if account.AccountEmail == account_email and account.IsAccount and self._is_slot_active(i):
+        for i in self._account_slots_for_email(account_email):
+            if self._is_slot_active(i):
                 return i
             
         #submit if not found
@@ -879,9 +1066,10 @@ class AllAccounts(Structure):
     def GetAllMessages(self) -> list[tuple[int, SharedMessageStruct]]:
         """Get all messages in shared memory with their index."""
         messages = []
-        for index in range(SHMEM_MAX_PLAYERS):
-            message = self.Inbox[index]
-            if message.Active and self._can_communicate(message.SenderEmail, message.ReceiverEmail):
+        inbox = self.Inbox
+        for index, sender, receiver in self._inbox_index().active:
+            message = inbox[index]
+            if message.Active and self._can_communicate(sender, receiver):
                 messages.append((index, message))  # Add index and message
         return messages
     
@@ -915,7 +1103,7 @@ class AllAccounts(Structure):
             ConsoleLog(SHMEM_MODULE_NAME, f"Cannot communicate between {sender_email} and {receiver_email} (isolated or different groups).", Py4GW.Console.MessageType.Warning)
             return -1
         
-        for i in range(SHMEM_MAX_PLAYERS):
+        for i, _sender in self._inbox_index().by_receiver.get(receiver_email, ()):
             message = self.GetInbox(i)
             if not message.Active:
                 continue
@@ -938,11 +1126,9 @@ class AllAccounts(Structure):
             
             return i  # Matching active message is already queued/running; reuse it instead of duplicating it.
         
-        for i in range(SHMEM_MAX_PLAYERS):
+        i, _token = self._claim_free_slot(self.InboxClaims, self.Inbox, SHMEM_MAX_PLAYERS)
+        if i != -1:
             message = self.GetInbox(i)
-            if message.Active:
-                continue
-         
             message.SenderEmail = sender_email
             message.ReceiverEmail = receiver_email
             message.Command = command.value
@@ -955,9 +1141,11 @@ class AllAccounts(Structure):
                         SHMEM_MAX_CHAR_LEN)
                     for j in range(4)]
             message.ExtraData = (arr_type * 4)(*packed)
-            message.Active = True
             message.Running = False
             message.Timestamp = Py4GW.Game.get_tick_count64()
+            message.Active = True
+            publish(self.InboxClaims[i])
+            self._bump_generation("InboxGeneration")
             return i
 
         return -1
@@ -966,10 +1154,11 @@ class AllAccounts(Structure):
         """Read the next message for the given account.
         Returns the raw SharedMessage. Use self._c_wchar_array_to_str() to read ExtraData safely.
         """
-        for index in range(SHMEM_MAX_PLAYERS):
-            message = self.Inbox[index]
-            if (message.ReceiverEmail == account_email and message.Active and not message.Running
-                and self._can_communicate(message.SenderEmail, account_email)):
+        inbox = self.Inbox
+        for index, sender in self._inbox_index().by_receiver.get(account_email, ()):
+            message = inbox[index]
+            if (message.Active and not message.Running and message.ReceiverEmail == account_email
+                and self._can_communicate(sender, account_email)):
                 return index, message
         return -1, None
 
@@ -978,11 +1167,12 @@ class AllAccounts(Structure):
         If include_running is True, will also return a running message.
         Ensures ExtraData is returned as tuple[str] using existing helpers.
         """
-        for index in range(SHMEM_MAX_PLAYERS):
-            message = self.Inbox[index]
-            if message.ReceiverEmail != account_email or not message.Active:
+        inbox = self.Inbox
+        for index, sender in self._inbox_index().by_receiver.get(account_email, ()):
+            message = inbox[index]
+            if not message.Active or message.ReceiverEmail != account_email:
                 continue
-            if not self._can_communicate(message.SenderEmail, account_email):
+            if not self._can_communicate(sender, account_email):
                 continue
             if not message.Running or include_running:
                 return index, message
@@ -996,6 +1186,7 @@ class AllAccounts(Structure):
                 message.Running = True
                 message.Active = True
                 message.Timestamp = Py4GW.Game.get_tick_count64()
+                self._bump_generation("InboxGeneration")
             else:
                 ConsoleLog(SHMEM_MODULE_NAME, f"Message at index {message_index} does not belong to {account_email}.", Py4GW.Console.MessageType.Error)
         else:
@@ -1005,8 +1196,12 @@ class AllAccounts(Structure):
         """Mark a specific message as finished."""
         import ctypes as ct
         if 0 <= message_index < SHMEM_MAX_PLAYERS:
+            observed_owner = int(self.InboxClaims[message_index].Owner)
             message = self.Inbox[message_index]
             if message.ReceiverEmail == account_email:
+                token = self._take_published_slot(self.InboxClaims, message_index, observed_owner)
+                if not token:
+                    return  # Already finished by another caller
                 message.SenderEmail = ""
                 message.ReceiverEmail = ""
                 message.Command = SharedCommandType.NoCommand
@@ -1020,6 +1215,8 @@ class AllAccounts(Structure):
                 message.Timestamp = Py4GW.Game.get_tick_count64()
                 message.Running = False
                 message.Active = False
+                release(self.InboxClaims[message_index], token)
+                self._bump_generation("InboxGeneration")
             else:
                 ConsoleLog(
                     SHMEM_MODULE_NAME,
@@ -1084,19 +1281,31 @@ class AllAccounts(Structure):
                 out.append((i, intent))
         return out
 
+    def _clear_intent_slot(self, index: int, observed_owner: int, now_tick: int, reason: str, label: str = "CLEAR") -> bool:
+        """Take ownership of a posted slot, zero it and free it. False if it changed hands first."""
+        token = self._take_published_slot(self.IntentClaims, index, observed_owner)
+        if not token:
+            return False
+        intent = self.Intents[index]
+        lifetime = int(now_tick) - int(intent.PostedAtTick)
+        self._wb_log(
+            int(intent.KindID),
+            f"{label} slot={index} email='{intent.OwnerEmail}' "
+            f"{self._wb_lock_display(intent)} lifetime={lifetime}ms reason={reason}",
+        )
+        intent.reset()
+        release(self.IntentClaims[index], token)
+        self._bump_generation("WhiteboardGeneration")
+        return True
+
     def ClearIntent(self, index: int) -> None:
         """Zero a single intent slot."""
         if not (0 <= index < SHMEM_MAX_INTENTS):
             return
-        intent = self.Intents[index]
-        if intent.Active:
-            lifetime = int(Py4GW.Game.get_tick_count64()) - int(intent.PostedAtTick)
-            self._wb_log(
-                int(intent.KindID),
-                f"CLEAR slot={index} email='{intent.OwnerEmail}' "
-                f"{self._wb_lock_display(intent)} lifetime={lifetime}ms reason=explicit",
-            )
-        intent.reset()
+        observed_owner = int(self.IntentClaims[index].Owner)
+        if not self.Intents[index].Active:
+            return  # Empty, or claimed by a writer that has not published yet
+        self._clear_intent_slot(index, observed_owner, int(Py4GW.Game.get_tick_count64()), "explicit")
 
     def ClearIntentsByOwner(self, owner_email: str) -> int:
         """Zero every whiteboard slot whose OwnerEmail matches. Returns count cleared."""
@@ -1105,16 +1314,11 @@ class AllAccounts(Structure):
         count = 0
         now = int(Py4GW.Game.get_tick_count64())
         for i in range(SHMEM_MAX_INTENTS):
+            observed_owner = int(self.IntentClaims[i].Owner)
             intent = self.Intents[i]
             if intent.Active and intent.OwnerEmail == owner_email:
-                lifetime = now - int(intent.PostedAtTick)
-                self._wb_log(
-                    int(intent.KindID),
-                    f"CLEAR slot={i} email='{owner_email}' "
-                    f"{self._wb_lock_display(intent)} lifetime={lifetime}ms reason=owner_clear",
-                )
-                intent.reset()
-                count += 1
+                if self._clear_intent_slot(i, observed_owner, now, "owner_clear"):
+                    count += 1
         return count
 
     def ClearLockByOwnerKindTarget(
@@ -1135,6 +1339,7 @@ class AllAccounts(Structure):
         count = 0
         now = int(Py4GW.Game.get_tick_count64())
         for i in range(SHMEM_MAX_INTENTS):
+            observed_owner = int(self.IntentClaims[i].Owner)
             intent = self.Intents[i]
             if not intent.Active:
                 continue
@@ -1146,14 +1351,8 @@ class AllAccounts(Structure):
                 continue
             if int(intent.IsolationGroupID) != int(group_id):
                 continue
-            lifetime = now - int(intent.PostedAtTick)
-            self._wb_log(
-                int(intent.KindID),
-                f"CLEAR slot={i} email='{owner_email}' "
-                f"{self._wb_lock_display(intent)} lifetime={lifetime}ms reason=owner_clear",
-            )
-            intent.reset()
-            count += 1
+            if self._clear_intent_slot(i, observed_owner, now, "owner_clear"):
+                count += 1
         return count
 
     def PostLock(
@@ -1172,7 +1371,9 @@ class AllAccounts(Structure):
         """Claim a generic whiteboard slot. Returns slot index or -1 if full.
 
         Every lock is a lease. Past or missing expiry is rejected so no caller
-        can create a permanent lock.
+        can create a permanent lock. The slot is taken with a compare-and-swap
+        on its claim word, so accounts posting in the same frame never share
+        a slot.
         """
         now = int(Py4GW.Game.get_tick_count64())
         if not owner_email or kind_id <= 0 or target_id < 0:
@@ -1187,10 +1388,9 @@ class AllAccounts(Structure):
                 isolation_group_id = 0
             else:
                 isolation_group_id = int(self.AccountData[owner_slot].IsolationGroupID)
-        for i in range(SHMEM_MAX_INTENTS):
+        i, _token = self._claim_free_slot(self.IntentClaims, self.Intents, SHMEM_MAX_INTENTS)
+        if i != -1:
             intent = self.Intents[i]
-            if intent.Active:
-                continue
             intent.OwnerEmail = owner_email
             intent.KindID = int(kind_id)
             intent.LockMode = int(lock_mode)
@@ -1203,6 +1403,8 @@ class AllAccounts(Structure):
             intent.PostedAtTick = now
             intent.ExpiresAtTick = int(expires_at_tick)
             intent.Active = True
+            publish(self.IntentClaims[i])
+            self._bump_generation("WhiteboardGeneration")
             budget = int(expires_at_tick) - now
             self._wb_log(
                 int(intent.KindID),
@@ -1229,10 +1431,24 @@ class AllAccounts(Structure):
         reentry_policy: int = int(WhiteboardReentryPolicy.OWNER_REENTRANT),
         claim_strength: int = int(WhiteboardClaimStrength.HARD),
     ) -> int:
-        """Count matching active locks. Expired slots are ignored by readers."""
+        """Count matching active locks. Expired slots are ignored by readers.
+
+        Results are reused while WhiteboardGeneration is unchanged and none of
+        the counted locks has expired, so repeated gate checks skip the scan.
+        """
         if kind_id <= 0 or target_id < 0:
             return 0
+        generation = int(self.WhiteboardGeneration)
+        cache_key = (
+            ctypes.addressof(self), int(kind_id), int(key_id), int(target_id), int(group_id),
+            exclude_email, int(reentry_policy), int(claim_strength),
+        )
+        cached = _LOCK_COUNT_CACHE.get(cache_key)
+        if cached is not None and cached[0] == generation and cached[2] <= now_tick < cached[3]:
+            return cached[1]
+
         count = 0
+        valid_until = 0xFFFFFFFFFFFFFFFF
         for i in range(SHMEM_MAX_INTENTS):
             intent = self.Intents[i]
             if not intent.Active:
@@ -1257,6 +1473,11 @@ class AllAccounts(Structure):
             ):
                 continue
             count += 1
+            valid_until = min(valid_until, int(intent.ExpiresAtTick))
+
+        if len(_LOCK_COUNT_CACHE) >= _LOCK_COUNT_CACHE_MAX:
+            _LOCK_COUNT_CACHE.clear()
+        _LOCK_COUNT_CACHE[cache_key] = (generation, count, int(now_tick), valid_until)
         return count
 
     def IsLockBlocked(
@@ -1371,14 +1592,9 @@ class AllAccounts(Structure):
         """Compact pass: zero expired slots. Returns count cleared."""
         count = 0
         for i in range(SHMEM_MAX_INTENTS):
+            observed_owner = int(self.IntentClaims[i].Owner)
             intent = self.Intents[i]
             if intent.Active and now_tick >= int(intent.ExpiresAtTick):
-                lifetime = int(now_tick) - int(intent.PostedAtTick)
-                self._wb_log(
-                    int(intent.KindID),
-                    f"SWEEP slot={i} email='{intent.OwnerEmail}' "
-                    f"{self._wb_lock_display(intent)} lifetime={lifetime}ms reason=expired",
-                )
-                intent.reset()
-                count += 1
+                if self._clear_intent_slot(i, observed_owner, now_tick, "expired", "SWEEP"):
+                    count += 1
         return count
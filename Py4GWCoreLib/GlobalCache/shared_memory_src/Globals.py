@@ -47,4 +47,7 @@ SHMEM_MAX_INTENTS = 64
 SHMEM_INTENT_DEFAULT_PING_BUDGET_MS = 150
 # Sweep cadence for the periodic compact pass.
 SHMEM_INTENT_SWEEP_INTERVAL_MS = 100
+# A whiteboard/inbox slot claimed but never published for this long is
+# treated as abandoned (writer crashed mid-post) and may be reclaimed.
+SHMEM_SLOT_CLAIM_STALE_MS = 2000
 
@@ -0,0 +1,172 @@
+"""Cross-process slot claiming for the shared-memory whiteboard and inbox.
+
+Every claimable slot has a matching SlotClaimStruct in the shared buffer:
+
+    Owner          ownership token of the process holding the slot (0 = free)
+    Generation     bumped by the owner every time the slot is published or
+                   released, so readers can tell a slot changed without
+                   comparing its payload
+
+Writers take a slot with a 32-bit compare-and-swap on Owner (0 -> token) and
+keep it until the slot is cleared; clearing first moves Owner from the
+observed token to the clearer's token, so two processes can never write or
+reset the same slot at once.  A claim whose writer died before publishing is
+reclaimed once the same (Owner, Generation) pair has been seen unpublished
+for longer than the stale timeout.
+
+The CAS runs directly on the shared buffer through the platform primitive
+(InterlockedCompareExchange on 32-bit Windows, libatomic's
+__atomic_compare_exchange_4 elsewhere).  When neither is available
+ATOMIC_CAS_AVAILABLE is False and claims degrade to the previous
+check-then-write behaviour.
+
+This module only depends on the standard library so it can be loaded by path
+from helper processes (see tests/test_whiteboard_slot_claim.py).
+"""
+import ctypes
+import ctypes.util
+import itertools
+import os
+import sys
+from ctypes import Structure, c_uint32
+
+_U32_MASK = 0xFFFFFFFF
+_ATOMIC_SEQ_CST = 5
+
+
+class SlotClaimStruct(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("Owner", c_uint32),
+        ("Generation", c_uint32),
+    ]
+
+    Owner: int
+    Generation: int
+
+    def reset(self) -> None:
+        """Reset all fields to zero."""
+        self.Owner = 0
+        self.Generation = 0
+
+
+_OWNER_OFFSET = SlotClaimStruct.Owner.offset
+
+
+def _load_compare_exchange():
+    if sys.platform == "win32":
+        try:
+            # Exported by the 32-bit kernel32 only; 64-bit builds inline it.
+            fn = ctypes.WinDLL("kernel32").InterlockedCompareExchange
+        except (OSError, AttributeError):
+            return None
+        fn.argtypes = [ctypes.c_void_p, ctypes.c_long, ctypes.c_long]
+        fn.restype = ctypes.c_long
+
+        def _signed(value: int) -> int:
+            return value - 0x100000000 if value & 0x80000000 else value
+
+        def cas_win32(address: int, expected: int, desired: int) -> bool:
+            return (fn(address, _signed(desired), _signed(expected)) & _U32_MASK) == expected
+
+        return cas_win32
+
+    try:
+        lib = ctypes.CDLL(ctypes.util.find_library("atomic") or "libatomic.so.1")
+        fn = getattr(lib, "__atomic_compare_exchange_4")
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = [ctypes.c_void_p, ctypes.POINTER(c_uint32), c_uint32, ctypes.c_int, ctypes.c_int]
+    fn.restype = ctypes.c_bool
+
+    def cas_libatomic(address: int, expected: int, desired: int) -> bool:
+        return bool(fn(address, ctypes.byref(c_uint32(expected)), desired, _ATOMIC_SEQ_CST, _ATOMIC_SEQ_CST))
+
+    return cas_libatomic
+
+
+_compare_exchange = _load_compare_exchange()
+ATOMIC_CAS_AVAILABLE = _compare_exchange is not None
+
+
+def compare_exchange_u32(address: int, expected: int, desired: int) -> bool:
+    """Atomically replace the uint32 at address with desired if it equals expected."""
+    if _compare_exchange is not None:
+        return _compare_exchange(address, expected & _U32_MASK, desired & _U32_MASK)
+    value = c_uint32.from_address(address)
+    if value.value != expected:
+        return False
+    value.value = desired
+    return True
+
+
+def atomic_increment_u32(address: int) -> int:
+    """Atomically add one (wrapping) to the uint32 at address and return the new value."""
+    value = c_uint32.from_address(address)
+    while True:
+        current = value.value
+        bumped = (current + 1) & _U32_MASK
+        if compare_exchange_u32(address, current, bumped):
+            return bumped
+
+
+_token_counter = itertools.count(1)
+
+
+def new_owner_token() -> int:
+    """Return a fresh non-zero ownership token (process id in the high bits)."""
+    # The pid is read per call so forked helper processes get their own prefix.
+    prefix = (os.getpid() & 0xFFFFF) << 12
+    while True:
+        token = (prefix | (next(_token_counter) & 0xFFF)) & _U32_MASK
+        if token:
+            return token
+
+
+def try_claim(claim: SlotClaimStruct, token: int) -> bool:
+    """Take a free slot (Owner 0 -> token). Returns False if anyone else holds it."""
+    return try_take_over(claim, 0, token)
+
+
+def try_take_over(claim: SlotClaimStruct, observed_owner: int, token: int) -> bool:
+    """Move ownership from observed_owner to token; fails if the slot changed hands meanwhile."""
+    if claim.Owner != observed_owner:
+        return False
+    return compare_exchange_u32(ctypes.addressof(claim) + _OWNER_OFFSET, observed_owner, token)
+
+
+# claim address -> ((owner, generation), tick first seen unpublished)
+_unpublished_seen: dict[int, tuple[tuple[int, int], int]] = {}
+
+
+def is_abandoned(claim: SlotClaimStruct, now_tick: int, stale_after_ms: int) -> bool:
+    """True when this held-but-unpublished claim has not changed for longer than stale_after_ms.
+
+    Only call it for slots whose payload is not published (e.g. Active is
+    False); the first observation of a claim starts its timer.
+    """
+    key = ctypes.addressof(claim)
+    owner = claim.Owner
+    if owner == 0:
+        _unpublished_seen.pop(key, None)
+        return False
+    state = (owner, claim.Generation)
+    seen = _unpublished_seen.get(key)
+    if seen is None or seen[0] != state:
+        _unpublished_seen[key] = (state, int(now_tick))
+        return False
+    return int(now_tick) - seen[1] > stale_after_ms
+
+
+def publish(claim: SlotClaimStruct) -> int:
+    """Owner-only: mark the slot payload as changed. Returns the new slot generation."""
+    claim.Generation = (claim.Generation + 1) & _U32_MASK
+    return claim.Generation
+
+
+def release(claim: SlotClaimStruct, token: int) -> bool:
+    """Owner-only: bump the generation and free the slot. False if token no longer owns it."""
+    if claim.Owner != token:
+        return False
+    claim.Generation = (claim.Generation + 1) & _U32_MASK
+    return compare_exchange_u32(ctypes.addressof(claim) + _OWNER_OFFSET, token, 0)
@@ -73,6 +73,7 @@ class IniManager:
         self.defaults_path = "Defaults/"
         self.base_path = Py4GW.Console.get_projects_path() + "/Settings/"
         self._handlers: dict[str, ConfigNode] = {}
+        self.reload_check_ms = IniHandler.DEFAULT_RELOAD_CHECK_MS
         
 
         self._initialized = True
@@ -116,6 +117,12 @@ class IniManager:
     def _is_account_ready(self) -> bool:
         return self.get_account_email() != ""
 
+    def set_reload_check_interval(self, interval_ms: int):
+        """How often (ms) reads may stat INI files for external edits; 0 checks on every read."""
+        self.reload_check_ms = max(0, int(interval_ms))
+        for node in self._handlers.values():
+            node.ini_handler.reload_check_ms = self.reload_check_ms
+
     def _make_key(self, path: str, filename: str) -> str:
         path = path.strip("/")
         filename = filename.strip("/")
@@ -198,7 +205,7 @@ class IniManager:
 
 
             # Create IniHandler
-            ini = IniHandler(full_filename)
+            ini = IniHandler(full_filename, reload_check_ms=self.reload_check_ms)
 
             # Load window config
             section = "Window config"
@@ -278,9 +285,11 @@ class IniManager:
             if not node.needs_flush or not node.pending_writes or not node.write_time.IsExpired():
                 continue
 
+            # Stage every dirty key, then rewrite the file once.
             for (section, name), value in node.pending_writes.items():
-                node.ini_handler.write_key(section, name, value)
+                node.ini_handler.set_key(section, name, value)
                 node.cached_values[(section, name)] = value
+            node.ini_handler.flush()
 
             node.pending_writes.clear()
             node.needs_flush = False
@@ -492,15 +501,16 @@ class IniManager:
             return
 
         node.x_pos, node.y_pos = int(end_pos[0]), int(end_pos[1])
-        node.ini_handler.write_key("Window config", "x", node.x_pos)
-        node.ini_handler.write_key("Window config", "y", node.y_pos)
+        node.ini_handler.set_key("Window config", "x", node.x_pos)
+        node.ini_handler.set_key("Window config", "y", node.y_pos)
 
         node.width, node.height = int(end_size[0]), int(end_size[1])
-        node.ini_handler.write_key("Window config", "width", node.width)
-        node.ini_handler.write_key("Window config", "height", node.height)
+        node.ini_handler.set_key("Window config", "width", node.width)
+        node.ini_handler.set_key("Window config", "height", node.height)
 
         node.collapsed = new_collapsed
-        node.ini_handler.write_key("Window config", "collapsed", node.collapsed)
+        node.ini_handler.set_key("Window config", "collapsed", node.collapsed)
+        node.ini_handler.flush()
 
         node.update_time.Reset()
         node.needs_update = False
@@ -22,7 +22,7 @@ from .UIManager import UIManager,WindowFrames, FrameInfo
 from .Overlay import *
 import math
 
-from .py4gwcorelib_src.FrameCache import frame_cache
+from .py4gwcorelib_src.FrameCache import FRAME_CACHE, frame_cache
 
 """Map-related functionalities and utilities.
 
@@ -137,7 +137,7 @@ class Map:
     
     
     @staticmethod
-    @frame_cache(category="Map", source_lib="GetMapName")
+    @frame_cache(category="Map", source_lib="GetMapName", ms=1000, tags=("map_change",))
     def GetMapName(mapid=None) -> str:
         """
         Retrieve the name of a map by its ID.
@@ -269,7 +269,7 @@ class Map:
 
     
     @staticmethod
-    @frame_cache(category="Map", source_lib="GetRegionType")
+    @frame_cache(category="Map", source_lib="GetRegionType", ms=1000, tags=("map_change",))
     def GetRegionType() -> tuple[int, str]:
         """
         Retrieve the region type of the current map.
@@ -326,7 +326,7 @@ class Map:
         return len(players) -1
     
     @staticmethod
-    @frame_cache(category="Map", source_lib="GetAmountOfAvailableCharacters")
+    @frame_cache(category="Map", source_lib="GetAmountOfAvailableCharacters", ms=1000, tags=("map_change",))
     def GetMaxPartySize() -> int:
         """ Retrieve the maximum party size of the current map."""
         current_map_info = GWContext.InstanceInfo().GetMapInfo()
@@ -336,7 +336,7 @@ class Map:
         return current_map_info.max_party_size
     
     @staticmethod
-    @frame_cache(category="Map", source_lib="GetMinPartySize")
+    @frame_cache(category="Map", source_lib="GetMinPartySize", ms=1000, tags=("map_change",))
     def GetMinPartySize() -> int:
         """ Retrieve the minimum party size of the current map."""
         current_map_info = GWContext.InstanceInfo().GetMapInfo()
@@ -346,7 +346,7 @@ class Map:
         return current_map_info.min_party_size
     
     @staticmethod
-    @frame_cache(category="Map", source_lib="GetMinPlayerSize")
+    @frame_cache(category="Map", source_lib="GetMinPlayerSize", ms=1000, tags=("map_change",))
     def GetMinPlayerSize() -> int:
         """Retrieve the minimum player size of the current map."""
         current_map_info = GWContext.InstanceInfo().GetMapInfo()
@@ -355,7 +355,7 @@ class Map:
         return current_map_info.min_player_size
     
     @staticmethod
-    @frame_cache(category="Map", source_lib="GetMaxPlayerSize")
+    @frame_cache(category="Map", source_lib="GetMaxPlayerSize", ms=1000, tags=("map_change",))
     def GetMaxPlayerSize() -> int:
         """Retrieve the maximum player size of the current map."""
         current_map_info = GWContext.InstanceInfo().GetMapInfo()
@@ -406,7 +406,7 @@ class Map:
         return cinematic_ctx.h0004 != 0
     
     @staticmethod
-    @frame_cache(category="Map", source_lib="GetCampaign")
+    @frame_cache(category="Map", source_lib="GetCampaign", ms=1000, tags=("map_change",))
     def GetCampaign() -> tuple[int, str]:
         """
         Retrieve the campaign of the current map.
@@ -421,7 +421,7 @@ class Map:
         return current_map_info.campaign, CampaignName[current_map_info.campaign]
 
     @staticmethod
-    @frame_cache(category="Map", source_lib="GetContinent")
+    @frame_cache(category="Map", source_lib="GetContinent", ms=1000, tags=("map_change",))
     def GetContinent() -> tuple[int, str]:
         """
         Retrieve the continent of the current map.
@@ -2306,6 +2306,7 @@ class Map:
 
             return False
 
-    
-    
 
+# Map-derived values above are cached across frames under the "map_change" tag;
+# GetMapID is 0 while loading, so any travel changes this probe at least twice.
+FRAME_CACHE.watch("map_change", lambda: (Map.GetMapID(), Map.GetInstanceType(), Map.GetDistrict()))
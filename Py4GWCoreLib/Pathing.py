@@ -2,14 +2,26 @@ import Py4GW
 import PyPathing
 import math
 import heapq
-import pickle
+import os
 
 from .enums import name_to_map_id
-from typing import List, Tuple, Optional, Dict
-from collections import defaultdict
+from typing import List, NamedTuple, Tuple, Optional, Dict, Sequence, Union
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
 from Py4GWCoreLib import Utils
 from Py4GWCoreLib.Map import Map
 from Py4GWCoreLib.native_src.context.MapContext import PathingTrapezoid
+from .pathing_src.navmesh_cache import (
+    NavMeshCacheData, geometry_crc, navmesh_cache_from_bytes, read_navmesh_cache, write_navmesh_cache,
+    write_navmesh_cache_bytes,
+)
+from .pathing_src.navmesh_build import (
+    _PORTAL_HORIZ_TOL, _PORTAL_VERT_TOL, BSPArrays, adjacent_side, add_portal, build_bsp,
+    cross_layer_portal_pairs, local_portal_pairs, pack_cache_data, portal_is_valid, snapshot_pathing_maps,
+    snapshot_portals, trapezoid_centroids, trapezoids_touching,
+)
+from .pathing_src.navmesh_worker import NavMeshBuildJob
 
 class AABB:
     """Axis-aligned bounding box for trapezoid geometry checks."""
@@ -20,21 +32,6 @@ class AABB:
 
 # ─── BSP tree for O(log n) trapezoid point-location ─────────────────────────
 
-# Leaf size balances construction speed vs query performance
-_BSP_LEAF_SIZE = 16
-
-class _BspSplit:
-    __slots__ = ('split_y', 'above', 'below')
-    def __init__(self, split_y: float, above, below):
-        self.split_y = split_y
-        self.above = above
-        self.below = below
-
-class _BspLeaf:
-    __slots__ = ('traps',)
-    def __init__(self, traps: list):
-        self.traps = traps
-
 def _point_in_trapezoid(x: float, y: float, t: PathingTrapezoid, tol: float = 0.0) -> bool:
     if y < t.YB - tol or y > t.YT + tol:
         return False
@@ -46,71 +43,110 @@ def _point_in_trapezoid(x: float, y: float, t: PathingTrapezoid, tol: float = 0.
     right_x = t.XBR + (t.XTR - t.XBR) * ratio
     return left_x - tol <= x <= right_x + tol
 
-def _build_trap_bsp(traps: list, sorted_indices: list, depth: int = 0):
-    """Build BSP recursively using pre-sorted trapezoid indices."""
-    n = len(sorted_indices)
-    if n <= _BSP_LEAF_SIZE or depth >= 24:
-        return _BspLeaf([traps[i] for i in sorted_indices])
-
-    mid = n >> 1
-    mid_idx = sorted_indices[mid]
-    mid_prev_idx = sorted_indices[mid - 1]
-    split_y = (traps[mid_prev_idx].YT + traps[mid_idx].YB) * 0.5
-
-    above = [i for i in sorted_indices if traps[i].YT >= split_y]
-    below = [i for i in sorted_indices if traps[i].YB <= split_y]
-
-    if len(above) == n and len(below) == n:
-        return _BspLeaf([traps[i] for i in sorted_indices])
-
-    return _BspSplit(split_y,
-                     _build_trap_bsp(traps, above, depth + 1),
-                     _build_trap_bsp(traps, below, depth + 1))
-
-
-class TrapezoidBSP:
-    """BSP tree for O(log n) trapezoid point-location queries."""
+class _BSPLeafArrays(NamedTuple):
+    """Leaf trapezoids of a TrapezoidBSP as flat parallel arrays, for batch queries.
+
+    Entry k mirrors a leaf_items slot (same offsets per leaf), but each
+    leaf's entries are sorted by x_min and xmax_run is the running maximum
+    of x_max within the leaf, so the entries that can hold a given x are a
+    contiguous run found by bisection.  Zero-height trapezoids get an
+    empty x range and are never visited.
+    """
+    x_min: array
+    xmax_run: array
+    yb: array
+    yt: array
+    xbl: array
+    xbr: array
+    dxl: array                 # XTL - XBL
+    dxr: array                 # XTR - XBR
+    height: array
+    rank: array                # position in the leaf's original leaf_items order
+    trap_id: array
+    node_lean: array           # per node: max |dx| / height over the leaf, widens the run for tol > 0
+
+
+class TrapezoidBSP(BSPArrays):
+    """BSP tree for O(log n) trapezoid point-location queries.
+
+    The tree is stored as flat parallel arrays (node 0 is the root, built by
+    pathing_src.navmesh_build.build_bsp) so it can be persisted in the binary
+    navmesh cache and restored without rebuilding:
+
+      node_split_y[k]  split plane of split node k
+      node_above[k]    child index above the split, -1 for leaves
+      node_below[k]    child index below the split, -1 for leaves
+      node_leaf[k]     offset into leaf_items for leaves, -1 for splits
+      node_count[k]    number of leaf_items entries for leaf k
+
+    leaf_items holds indices into the trapezoid list the tree was built from.
+    find_many / contains_many answer whole batches of points against the
+    same tree, with the leaf trapezoids unpacked into _BSPLeafArrays.
+    """
 
     def __init__(self, trapezoids: List[PathingTrapezoid]):
-        if not trapezoids:
-            self._root = None
-        else:
-            sorted_indices = sorted(range(len(trapezoids)),
-                                   key=lambda i: (trapezoids[i].YT + trapezoids[i].YB) * 0.5)
-            self._root = _build_trap_bsp(trapezoids, sorted_indices)
+        super().__init__()
+        self._traps: List[PathingTrapezoid] = list(trapezoids)
+        self._leaf_arrays: Optional[_BSPLeafArrays] = None
+        build_bsp(self, self._traps)
+
+    @classmethod
+    def from_arrays(cls, trapezoids: List[PathingTrapezoid],
+                    split_y: array, above: array, below: array,
+                    leaf: array, count: array, items: array) -> "TrapezoidBSP":
+        """Restore a tree previously exported through the node/leaf arrays."""
+        bsp = cls.__new__(cls)
+        bsp._traps = list(trapezoids)
+        bsp.node_split_y = split_y
+        bsp.node_above = above
+        bsp.node_below = below
+        bsp.node_leaf = leaf
+        bsp.node_count = count
+        bsp.leaf_items = items
+        bsp._leaf_arrays = None
+        return bsp
 
     def find(self, x: float, y: float, tol: float = 0.0) -> Optional[int]:
         """Return trapezoid ID containing (x, y), or None."""
-        if self._root is None:
+        if not self.node_leaf:
             return None
 
-        stack = [self._root]
+        traps = self._traps
+        items = self.leaf_items
+        stack = [0]
         while stack:
             node = stack.pop()
-            if isinstance(node, _BspLeaf):
-                for t in node.traps:
+            start = self.node_leaf[node]
+            if start >= 0:
+                for k in range(start, start + self.node_count[node]):
+                    t = traps[items[k]]
                     if _point_in_trapezoid(x, y, t, tol):
                         return t.id
             else:
-                if y > node.split_y + tol:
-                    stack.append(node.above)
-                elif y < node.split_y - tol:
-                    stack.append(node.below)
+                split_y = self.node_split_y[node]
+                if y > split_y + tol:
+                    stack.append(self.node_above[node])
+                elif y < split_y - tol:
+                    stack.append(self.node_below[node])
                 else:
-                    stack.append(node.below)
-                    stack.append(node.above)
+                    stack.append(self.node_below[node])
+                    stack.append(self.node_above[node])
         return None
 
     def find_with_margin(self, x: float, y: float, margin: float) -> bool:
         """Return True if (x, y) is inside a trapezoid with margin inset from edges."""
-        if self._root is None:
+        if not self.node_leaf:
             return False
 
-        stack = [self._root]
+        traps = self._traps
+        items = self.leaf_items
+        stack = [0]
         while stack:
             node = stack.pop()
-            if isinstance(node, _BspLeaf):
-                for t in node.traps:
+            start = self.node_leaf[node]
+            if start >= 0:
+                for k in range(start, start + self.node_count[node]):
+                    t = traps[items[k]]
                     if t.YB <= y <= t.YT:
                         height = t.YT - t.YB
                         if height == 0:
@@ -121,27 +157,549 @@ class TrapezoidBSP:
                         if left_x + margin <= x <= right_x - margin:
                             return True
             else:
-                if y > node.split_y:
-                    stack.append(node.above)
-                elif y < node.split_y:
-                    stack.append(node.below)
+                split_y = self.node_split_y[node]
+                if y > split_y:
+                    stack.append(self.node_above[node])
+                elif y < split_y:
+                    stack.append(self.node_below[node])
                 else:
-                    stack.append(node.below)
-                    stack.append(node.above)
+                    stack.append(self.node_below[node])
+                    stack.append(self.node_above[node])
         return False
 
+    # ── Batch queries ──────────────────────────────────────────────────────
+
+    def _get_leaf_arrays(self) -> _BSPLeafArrays:
+        """Flatten the leaf trapezoids on first use."""
+        if self._leaf_arrays is not None:
+            return self._leaf_arrays
+
+        size = len(self.leaf_items)
+        x_min, xmax_run, yb, yt, xbl, xbr, dxl, dxr, height = (array('d', [0.0]) * size for _ in range(9))
+        rank = array('i', [0]) * size
+        trap_id = array('i', [0]) * size
+        node_lean = array('d', [0.0]) * len(self.node_leaf)
+
+        traps = self._traps
+        items = self.leaf_items
+        for node, start in enumerate(self.node_leaf):
+            if start < 0:
+                continue
+            entries = []
+            lean = 0.0
+            for r in range(self.node_count[node]):
+                t = traps[items[start + r]]
+                h = t.YT - t.YB
+                dl = t.XTL - t.XBL
+                dr = t.XTR - t.XBR
+                if h == 0:
+                    lo, hi = math.inf, -math.inf
+                else:
+                    # the same expressions find() evaluates at ratio 0 and 1
+                    lo, hi = min(t.XBL, t.XBL + dl), max(t.XBR, t.XBR + dr)
+                    lean = max(lean, abs(dl) / h, abs(dr) / h)
+                entries.append((lo, r, hi, t, h, dl, dr))
+            entries.sort(key=lambda e: (e[0], e[1]))
+
+            run = -math.inf
+            for k, (lo, r, hi, t, h, dl, dr) in enumerate(entries, start):
+                run = max(run, hi)
+                x_min[k], xmax_run[k] = lo, run
+                yb[k], yt[k], xbl[k], xbr[k] = t.YB, t.YT, t.XBL, t.XBR
+                dxl[k], dxr[k], height[k] = dl, dr, h
+                rank[k], trap_id[k] = r, t.id
+            node_lean[node] = lean
+
+        self._leaf_arrays = _BSPLeafArrays(x_min, xmax_run, yb, yt, xbl, xbr, dxl, dxr, height,
+                                           rank, trap_id, node_lean)
+        return self._leaf_arrays
+
+    def _leaf_batches(self, ys: Sequence[float], tol: float):
+        """Yield (leaf node, point indices) in the order find() visits leaves.
+
+        Every point goes down the tree together with the others: each split
+        node partitions the index list once, and points within tol of a
+        split go to both children, above first, like the scalar walk.
+        """
+        split_ys = self.node_split_y
+        node_leaf = self.node_leaf
+        node_above = self.node_above
+        node_below = self.node_below
+        stack = [(0, list(range(len(ys))))]
+        while stack:
+            node, indices = stack.pop()
+            if node_leaf[node] >= 0:
+                yield node, indices
+                continue
+            split_y = split_ys[node]
+            below = [i for i in indices if ys[i] <= split_y + tol]
+            above = [i for i in indices if ys[i] >= split_y - tol]
+            if below:
+                stack.append((node_below[node], below))
+            if above:
+                stack.append((node_above[node], above))
+
+    def find_many(self, xs: Sequence[float], ys: Sequence[float], tol: float = 0.0) -> List[Optional[int]]:
+        """Batch find(): the trapezoid ID containing (xs[i], ys[i]) or None, per point."""
+        result: List[Optional[int]] = [None] * len(xs)
+        if not self.node_leaf or not result:
+            return result
+
+        flat = self._get_leaf_arrays()
+        x_min, xmax_run, yb, yt = flat.x_min, flat.xmax_run, flat.yb, flat.yt
+        xbl, xbr, dxl, dxr, height = flat.xbl, flat.xbr, flat.dxl, flat.dxr, flat.height
+        rank, trap_id = flat.rank, flat.trap_id
+        for node, indices in self._leaf_batches(ys, tol):
+            start = self.node_leaf[node]
+            end = start + self.node_count[node]
+            # tol also extends a trapezoid along its slanted sides; 1e-6 absorbs rounding
+            slack = tol * (1.0 + flat.node_lean[node]) + 1e-6
+            for i in indices:
+                if result[i] is not None:
+                    continue
+                x = xs[i]
+                y = ys[i]
+                best = -1
+                k = bisect_left(xmax_run, x - slack, start, end)
+                while k < end and x_min[k] <= x + slack:
+                    if yb[k] - tol <= y <= yt[k] + tol and (best < 0 or rank[k] < rank[best]):
+                        ratio = (y - yb[k]) / height[k]
+                        if xbl[k] + dxl[k] * ratio - tol <= x <= xbr[k] + dxr[k] * ratio + tol:
+                            best = k
+                    k += 1
+                if best >= 0:
+                    result[i] = trap_id[best]
+        return result
+
+    def contains_many(self, xs: Sequence[float], ys: Sequence[float],
+                      margins: Union[float, Sequence[float]] = 0.0) -> List[bool]:
+        """Batch find_with_margin(), with one margin for all points or one per point."""
+        result = [False] * len(xs)
+        if not self.node_leaf or not result:
+            return result
+
+        per_point = not isinstance(margins, (int, float))
+        flat = self._get_leaf_arrays()
+        x_min, xmax_run, yb, yt = flat.x_min, flat.xmax_run, flat.yb, flat.yt
+        xbl, xbr, dxl, dxr, height = flat.xbl, flat.xbr, flat.dxl, flat.dxr, flat.height
+        for node, indices in self._leaf_batches(ys, 0.0):
+            start = self.node_leaf[node]
+            end = start + self.node_count[node]
+            for i in indices:
+                if result[i]:
+                    continue
+                x = xs[i]
+                y = ys[i]
+                margin = margins[i] if per_point else margins
+                slack = 1e-6 - margin if margin < 0.0 else 1e-6
+                k = bisect_left(xmax_run, x - slack, start, end)
+                while k < end and x_min[k] <= x + slack:
+                    if yb[k] <= y <= yt[k]:
+                        ratio = (y - yb[k]) / height[k]
+                        if xbl[k] + dxl[k] * ratio + margin <= x <= xbr[k] + dxr[k] * ratio - margin:
+                            result[i] = True
+                            break
+                    k += 1
+        return result
+
+
+# ─── Uniform grid for nearest / radius trapezoid queries ───────────────────
+
+# Target number of trapezoid centroids per grid cell
+_GRID_TRAPS_PER_CELL = 2.0
+
+def _closest_point_on_segment(px: float, py: float, ax: float, ay: float, bx: float, by: float) -> Tuple[float, float]:
+    dx = bx - ax
+    dy = by - ay
+    len2 = dx * dx + dy * dy
+    if len2 == 0.0:
+        return ax, ay
+    u = ((px - ax) * dx + (py - ay) * dy) / len2
+    if u <= 0.0:
+        return ax, ay
+    if u >= 1.0:
+        return bx, by
+    return ax + dx * u, ay + dy * u
+
+def _closest_point_on_trapezoid(x: float, y: float, t: PathingTrapezoid) -> Tuple[float, float]:
+    """Return the point of trapezoid t (boundary included) closest to (x, y)."""
+    if _point_in_trapezoid(x, y, t):
+        return x, y
+    best = (t.XBL, t.YB)
+    best_d2 = math.inf
+    for ax, ay, bx, by in ((t.XBL, t.YB, t.XBR, t.YB),
+                           (t.XBR, t.YB, t.XTR, t.YT),
+                           (t.XTR, t.YT, t.XTL, t.YT),
+                           (t.XTL, t.YT, t.XBL, t.YB)):
+        cx, cy = _closest_point_on_segment(x, y, ax, ay, bx, by)
+        d2 = (cx - x) * (cx - x) + (cy - y) * (cy - y)
+        if d2 < best_d2:
+            best_d2 = d2
+            best = (cx, cy)
+    return best
+
+def _inset_trapezoid(t: PathingTrapezoid, margin: float) -> Optional[Tuple[float, float, float, float, float, float]]:
+    """Region of t where contains(margin) holds, as (yb, yt, xbl, xbr, xtl, xtr).
+
+    The margin pulls the left and right sides in along X.  Where the
+    trapezoid is narrower than 2 * margin the region ends in a point (a
+    triangle is a trapezoid with xtl == xtr or xbl == xbr); None when it is
+    too narrow everywhere.
+    """
+    yb, yt = t.YB, t.YT
+    if yt <= yb:
+        return None
+    xbl, xbr = t.XBL + margin, t.XBR - margin
+    xtl, xtr = t.XTL + margin, t.XTR - margin
+    wb, wt = xbr - xbl, xtr - xtl
+    if wb >= 0.0 and wt >= 0.0:
+        return yb, yt, xbl, xbr, xtl, xtr
+    if wb < 0.0 and wt < 0.0:
+        return None
+    r = wb / (wb - wt)
+    y_cut = yb + (yt - yb) * r
+    x_cut = xbl + (xtl - xbl) * r
+    if wb >= 0.0:
+        return yb, y_cut, xbl, xbr, x_cut, x_cut
+    return y_cut, yt, x_cut, x_cut, xtl, xtr
+
+def _closest_point_on_quad(x: float, y: float, quad: Tuple[float, float, float, float, float, float]) -> Tuple[float, float]:
+    """Closest point to (x, y) of an (yb, yt, xbl, xbr, xtl, xtr) region, boundary included."""
+    yb, yt, xbl, xbr, xtl, xtr = quad
+    if yb <= y <= yt:
+        ratio = (y - yb) / (yt - yb) if yt > yb else 0.0
+        if xbl + (xtl - xbl) * ratio <= x <= xbr + (xtr - xbr) * ratio:
+            return x, y
+    best = (xbl, yb)
+    best_d2 = math.inf
+    for ax, ay, bx, by in ((xbl, yb, xbr, yb), (xbr, yb, xtr, yt), (xtr, yt, xtl, yt), (xtl, yt, xbl, yb)):
+        cx, cy = _closest_point_on_segment(x, y, ax, ay, bx, by)
+        d2 = (cx - x) * (cx - x) + (cy - y) * (cy - y)
+        if d2 < best_d2:
+            best_d2 = d2
+            best = (cx, cy)
+    return best
+
+def _rect_distance(px: float, py: float, x0: float, y0: float, x1: float, y1: float) -> float:
+    dx = max(x0 - px, 0.0, px - x1)
+    dy = max(y0 - py, 0.0, py - y1)
+    return math.hypot(dx, dy)
+
+
+class TrapezoidGridIndex:
+    """Uniform grid over the mesh for sub-linear nearest / radius queries.
+
+    Two bucket sets share one grid: each trapezoid's centroid is stored in
+    exactly one cell (nearest-centroid queries expand rings of cells until no
+    unvisited cell can hold a closer centroid), and each trapezoid's bounding
+    box is stored in every cell it overlaps (radius queries only test the
+    trapezoids of the cells the query circle touches).
+    """
+
+    def __init__(self, trapezoids: List[PathingTrapezoid], centroids: List[Tuple[float, float]]):
+        self._traps = trapezoids
+        self._cx = [c[0] for c in centroids]
+        self._cy = [c[1] for c in centroids]
+        n = len(trapezoids)
+        if n == 0:
+            self.nx = self.ny = 0
+            self.min_x = self.min_y = 0.0
+            self.cell_size = 1.0
+            self._centroid_cells: List[List[int]] = []
+            self._bbox_cells: List[List[int]] = []
+            return
+
+        self.min_x = min(min(t.XBL, t.XTL) for t in trapezoids)
+        self.min_y = min(t.YB for t in trapezoids)
+        max_x = max(max(t.XBR, t.XTR) for t in trapezoids)
+        max_y = max(t.YT for t in trapezoids)
+        width = max(max_x - self.min_x, 1.0)
+        height = max(max_y - self.min_y, 1.0)
+        self.cell_size = max(math.sqrt(width * height * _GRID_TRAPS_PER_CELL / n), 1.0)
+        self.nx = int(width / self.cell_size) + 1
+        self.ny = int(height / self.cell_size) + 1
+
+        self._centroid_cells = [[] for _ in range(self.nx * self.ny)]
+        self._bbox_cells = [[] for _ in range(self.nx * self.ny)]
+        for i, t in enumerate(trapezoids):
+            ci, cj = self._cell_of(self._cx[i], self._cy[i])
+            self._centroid_cells[cj * self.nx + ci].append(i)
+            i0, j0 = self._cell_of(min(t.XBL, t.XTL), t.YB)
+            i1, j1 = self._cell_of(max(t.XBR, t.XTR), t.YT)
+            for cj in range(j0, j1 + 1):
+                row = cj * self.nx
+                for ci in range(i0, i1 + 1):
+                    self._bbox_cells[row + ci].append(i)
+
+    def _cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        i = int((x - self.min_x) / self.cell_size)
+        j = int((y - self.min_y) / self.cell_size)
+        return min(max(i, 0), self.nx - 1), min(max(j, 0), self.ny - 1)
+
+    def _unvisited_lower_bound(self, x: float, y: float, i0: int, j0: int, i1: int, j1: int) -> float:
+        """Distance from (x, y) to the grid cells outside the visited block [i0..i1] x [j0..j1]."""
+        cs = self.cell_size
+        ox, oy = self.min_x, self.min_y
+        bound = math.inf
+        if i0 > 0:
+            bound = min(bound, _rect_distance(x, y, ox, oy, ox + i0 * cs, oy + self.ny * cs))
+        if i1 < self.nx - 1:
+            bound = min(bound, _rect_distance(x, y, ox + (i1 + 1) * cs, oy, ox + self.nx * cs, oy + self.ny * cs))
+        if j0 > 0:
+            bound = min(bound, _rect_distance(x, y, ox + i0 * cs, oy, ox + (i1 + 1) * cs, oy + j0 * cs))
+        if j1 < self.ny - 1:
+            bound = min(bound, _rect_distance(x, y, ox + i0 * cs, oy + (j1 + 1) * cs, ox + (i1 + 1) * cs, oy + self.ny * cs))
+        return bound
+
+    def nearest_centroid(self, x: float, y: float) -> Optional[int]:
+        """Return the trapezoid ID whose centroid is closest to (x, y).
+
+        Ties resolve to the trapezoid that comes first in the mesh, matching a
+        linear scan in insertion order.
+        """
+        if not self._traps:
+            return None
+        nx, ny = self.nx, self.ny
+        cells = self._centroid_cells
+        cx, cy = self._cx, self._cy
+        ci, cj = self._cell_of(x, y)
+        best = -1
+        best_d = math.inf
+        r = 0
+        while True:
+            i0, i1 = max(ci - r, 0), min(ci + r, nx - 1)
+            j0, j1 = max(cj - r, 0), min(cj + r, ny - 1)
+            for j in range(j0, j1 + 1):
+                row = j * nx
+                if j == cj - r or j == cj + r:
+                    ring_cols = range(i0, i1 + 1)
+                else:
+                    ring_cols = [i for i in (ci - r, ci + r) if i0 <= i <= i1]
+                for i in ring_cols:
+                    for k in cells[row + i]:
+                        d = math.hypot(cx[k] - x, cy[k] - y)
+                        if d < best_d or (d == best_d and k < best):
+                            best_d = d
+                            best = k
+            if best >= 0 and best_d <= self._unvisited_lower_bound(x, y, i0, j0, i1, j1):
+                break
+            if i0 == 0 and j0 == 0 and i1 == nx - 1 and j1 == ny - 1:
+                break
+            r += 1
+        return self._traps[best].id if best >= 0 else None
+
+    def nearest_point(self, x: float, y: float, margin: float = 0.0,
+                      insets: Optional[Dict[int, Optional[tuple]]] = None) -> Optional[Tuple[float, float, int]]:
+        """Return (px, py, trapezoid ID) of the closest point where contains(margin) holds.
+
+        Rings of cells are expanded around (x, y) and every trapezoid whose
+        bounding box overlaps a visited cell is measured exactly (distance to
+        its margin-inset region) until no unvisited cell can hold anything
+        closer; a point inside an inset region is returned unchanged at once.
+        insets caches the inset regions across calls with the same
+        margin (see NavMesh.find_nearest_reachable_many).  None when no
+        trapezoid is wide enough for the margin.
+        """
+        if not self._traps:
+            return None
+        if insets is None:
+            insets = {}
+        nx, ny = self.nx, self.ny
+        cells = self._bbox_cells
+        traps = self._traps
+        ci, cj = self._cell_of(x, y)
+        seen = set()
+        best = -1
+        best_d2 = math.inf
+        best_xy = (x, y)
+        r = 0
+        while True:
+            i0, i1 = max(ci - r, 0), min(ci + r, nx - 1)
+            j0, j1 = max(cj - r, 0), min(cj + r, ny - 1)
+            for j in range(j0, j1 + 1):
+                row = j * nx
+                if j == cj - r or j == cj + r:
+                    ring_cols = range(i0, i1 + 1)
+                else:
+                    ring_cols = [i for i in (ci - r, ci + r) if i0 <= i <= i1]
+                for i in ring_cols:
+                    for k in cells[row + i]:
+                        if k in seen:
+                            continue
+                        seen.add(k)
+                        if k in insets:
+                            quad = insets[k]
+                        else:
+                            quad = insets[k] = _inset_trapezoid(traps[k], margin)
+                        if quad is None:
+                            continue
+                        dx = max(min(quad[2], quad[4]) - x, 0.0, x - max(quad[3], quad[5]))
+                        dy = max(quad[0] - y, 0.0, y - quad[1])
+                        if dx * dx + dy * dy > best_d2:
+                            continue
+                        px, py = _closest_point_on_quad(x, y, quad)
+                        d2 = (px - x) * (px - x) + (py - y) * (py - y)
+                        if d2 < best_d2 or (d2 == best_d2 and k < best):
+                            best_d2 = d2
+                            best = k
+                            best_xy = (px, py)
+                            if d2 == 0.0:
+                                return x, y, traps[k].id
+            if best >= 0 and math.sqrt(best_d2) <= self._unvisited_lower_bound(x, y, i0, j0, i1, j1):
+                break
+            if i0 == 0 and j0 == 0 and i1 == nx - 1 and j1 == ny - 1:
+                break
+            r += 1
+        if best < 0:
+            return None
+        return best_xy[0], best_xy[1], traps[best].id
+
+    def within_radius(self, x: float, y: float, radius: float) -> List[int]:
+        """Return IDs of trapezoids with any point within radius of (x, y), in mesh order."""
+        if not self._traps or radius < 0:
+            return []
+        i0, j0 = self._cell_of(x - radius, y - radius)
+        i1, j1 = self._cell_of(x + radius, y + radius)
+        seen = set()
+        hits = []
+        r2 = radius * radius
+        traps = self._traps
+        for j in range(j0, j1 + 1):
+            row = j * self.nx
+            for i in range(i0, i1 + 1):
+                for k in self._bbox_cells[row + i]:
+                    if k in seen:
+                        continue
+                    seen.add(k)
+                    px, py = _closest_point_on_trapezoid(x, y, traps[k])
+                    if (px - x) * (px - x) + (py - y) * (py - y) <= r2:
+                        hits.append(k)
+        hits.sort()
+        return [traps[k].id for k in hits]
+
+
+# ─── Exact segment traversal through the trapezoids ────────────────────────
+
+# Containment slack (game units) when following a segment across shared trapezoid edges
+_SEGMENT_TOL = 0.5
+
+# Trapezoid sides, as reported in SegmentBlock
+_SIDE_BOTTOM, _SIDE_TOP, _SIDE_LEFT, _SIDE_RIGHT = range(4)
+
+Edge2D = Tuple[Tuple[float, float], Tuple[float, float]]
+
+
+class SegmentBlock(NamedTuple):
+    """Where a segment stops being walkable, as returned by NavMesh.segment_block."""
+    t: float                   # fraction of the segment that was walkable
+    point: Tuple[float, float]
+    trap_id: int               # trapezoid the segment was in, -1 when it starts off the mesh
+    edge: Optional[Edge2D]     # trapezoid edge that blocks, None when it starts off the mesh
+    reason: str                # "edge" (left the mesh), "clearance" (closer than margin) or "off_mesh"
+
+
+def _trapezoid_edge(t: PathingTrapezoid, side: int) -> Edge2D:
+    if side == _SIDE_BOTTOM:
+        return (t.XBL, t.YB), (t.XBR, t.YB)
+    if side == _SIDE_TOP:
+        return (t.XTL, t.YT), (t.XTR, t.YT)
+    if side == _SIDE_LEFT:
+        return (t.XBL, t.YB), (t.XTL, t.YT)
+    return (t.XBR, t.YB), (t.XTR, t.YT)
+
+def _clip_segment_to_trapezoid(t: PathingTrapezoid, x1: float, y1: float, dx: float, dy: float,
+                               tol: float) -> Optional[Tuple[float, float, int]]:
+    """Clip P(s) = (x1 + s*dx, y1 + s*dy), s in [0, 1], to trapezoid t grown by tol.
+
+    Returns (lo, hi, side) where side is the edge the segment leaves through
+    at hi (-1 when it does not leave before s = 1), or None if it misses t.
+    Each edge is a half-plane a + b*s >= 0; left/right are measured along X
+    like _point_in_trapezoid.
+    """
+    h = t.YT - t.YB
+    if h <= 0.0:
+        return None
+    ry = y1 - t.YB
+    kl = (t.XTL - t.XBL) / h
+    kr = (t.XTR - t.XBR) / h
+    lo, hi, side = 0.0, 1.0, -1
+
+    a, b = ry + tol, dy
+    if b > 0.0:
+        lo = max(lo, -a / b)
+    elif b < 0.0:
+        if -a / b < hi:
+            hi, side = -a / b, _SIDE_BOTTOM
+    elif a < 0.0:
+        return None
+
+    a, b = h - ry + tol, -dy
+    if b > 0.0:
+        lo = max(lo, -a / b)
+    elif b < 0.0:
+        if -a / b < hi:
+            hi, side = -a / b, _SIDE_TOP
+    elif a < 0.0:
+        return None
+
+    a, b = x1 - t.XBL - kl * ry + tol, dx - kl * dy
+    if b > 0.0:
+        lo = max(lo, -a / b)
+    elif b < 0.0:
+        if -a / b < hi:
+            hi, side = -a / b, _SIDE_LEFT
+    elif a < 0.0:
+        return None
+
+    a, b = t.XBR + kr * ry - x1 + tol, kr * dy - dx
+    if b > 0.0:
+        lo = max(lo, -a / b)
+    elif b < 0.0:
+        if -a / b < hi:
+            hi, side = -a / b, _SIDE_RIGHT
+    elif a < 0.0:
+        return None
+
+    if lo > hi:
+        return None
+    return lo, hi, side
+
+def _first_clearance_violation(t: PathingTrapezoid, x1: float, y1: float, dx: float, dy: float,
+                               margin: float, s0: float, s1: float) -> Optional[Tuple[float, int]]:
+    """First s in [s0, s1] where P(s) is within margin (along X) of t's left or right side.
+
+    Both distances are linear in s inside one trapezoid, so checking the two
+    ends of the range and solving for the crossing is exact.  Returns (s, side).
+    """
+    h = t.YT - t.YB
+    ry = y1 - t.YB
+    kl = (t.XTL - t.XBL) / h
+    kr = (t.XTR - t.XBR) / h
+    best: Optional[Tuple[float, int]] = None
+    for a, b, side in ((x1 - t.XBL - kl * ry - margin, dx - kl * dy, _SIDE_LEFT),
+                       (t.XBR + kr * ry - x1 - margin, kr * dy - dx, _SIDE_RIGHT)):
+        if a + b * s0 < -1e-9:
+            s = s0
+        elif a + b * s1 < -1e-9:
+            s = -a / b
+        else:
+            continue
+        if best is None or s < best[0]:
+            best = (s, side)
+    return best
+
 
 #region NavMesh
 
-# Portal creation tolerances
-_PORTAL_TOLERANCE = 32.0
-_PORTAL_VERT_TOL = 100.2
-_PORTAL_HORIZ_TOL = 100.6
+# Distance a projected point is moved inside its trapezoid, past rounding on the margin boundary
+_PROJECTION_NUDGE = 0.01
 
 class NavMesh:
     def __init__(self, pathing_maps, map_id: int):
         self.map_id = map_id
         self.trapezoids: Dict[int, PathingTrapezoid] = {}
+        self._cache_data: Optional[NavMeshCacheData] = None
+        self._init_search_state()
         self.portal_graph: Dict[int, List[int]] = {}  # Adjacency graph for pathfinding
         self.portal_costs: Dict[int, Dict[int, float]] = {}
         self.trap_id_to_layer: Dict[int, int] = {}  # Trap ID -> layer index
@@ -151,155 +709,81 @@ class NavMesh:
             self.trapezoids.update({t.id: t for t in traps})
             self.trap_id_to_layer.update({t.id: i for t in traps})
 
+        self._centroids: Dict[int, Tuple[float, float]] = trapezoid_centroids(self.trapezoids)
         self._bsp = TrapezoidBSP(list(self.trapezoids.values()))
+        self._grid: Optional[TrapezoidGridIndex] = None
 
         self.create_all_local_portals()
         self._create_cross_layer_portals_from_snapshots(pathing_maps)
 
+    @property
+    def portal_graph(self) -> Dict[int, List[int]]:
+        if self._portal_graph is None:
+            self._materialize_portals()
+        return self._portal_graph
+
+    @portal_graph.setter
+    def portal_graph(self, value: Dict[int, List[int]]):
+        self._portal_graph = value
+
+    @property
+    def portal_costs(self) -> Dict[int, Dict[int, float]]:
+        if self._portal_costs is None:
+            self._materialize_portals()
+        return self._portal_costs
+
+    @portal_costs.setter
+    def portal_costs(self, value: Dict[int, Dict[int, float]]):
+        self._portal_costs = value
+
+    def _materialize_portals(self):
+        """Expand the CSR adjacency of a cache-loaded mesh into the portal dicts on first use."""
+        data = self._cache_data
+        graph: Dict[int, List[int]] = {}
+        costs: Dict[int, Dict[int, float]] = {}
+        if data is not None:
+            trap_ids = data.trap_ids.tolist()
+            offsets = data.adj_offset.tolist()
+            targets = data.adj_target.tolist()
+            edge_costs = data.adj_cost.tolist()
+            for i, t_id in enumerate(trap_ids):
+                lo, hi = offsets[i], offsets[i + 1]
+                if lo == hi:
+                    continue
+                neighbors = [trap_ids[j] for j in targets[lo:hi]]
+                graph[t_id] = neighbors
+                costs[t_id] = dict(zip(neighbors, edge_costs[lo:hi]))
+        self._portal_graph = graph
+        self._portal_costs = costs
+
     def get_adjacent_side(self, a: PathingTrapezoid, b: PathingTrapezoid) -> Optional[str]:
-        if abs(a.YB - b.YT) < 1.0: return 'bottom_top'
-        if abs(a.YT - b.YB) < 1.0: return 'top_bottom'
-        if abs(a.XBR - b.XBL) < 1.0: return 'right_left'
-        if abs(a.XBL - b.XBR) < 1.0: return 'left_right'
-        return None
+        return adjacent_side(a, b)
 
     def create_portal(self, box1: AABB, box2: AABB, side: Optional[str]) -> bool:
         """Create portal connection between two trapezoids in portal_graph."""
         pt1, pt2 = box1.m_t, box2.m_t
-
-        def is_close(a, b): return abs(a - b) < _PORTAL_TOLERANCE
-
-        # Validate geometric adjacency based on side
-        if side == 'bottom_top':
-            if not pt1.YB == pt2.YT:
-                return False
-            x_min = max(pt1.XBL, pt2.XBR)
-            x_max = min(pt1.XBR, pt2.XBL)
-            if is_close(x_max, x_min): return False
-
-        elif side == 'top_bottom':
-            if not pt1.YT == pt2.YB:
-                return False
-            x_min = max(pt1.XTL, pt2.XTR)
-            x_max = min(pt1.XTR, pt2.XTL)
-            if is_close(x_max, x_min): return False
-
-        elif side == 'left_right':
-            if not pt1.XTR == pt2.XTL:
-                return False
-            y_min = max(pt1.YT, pt2.YT)
-            y_max = min(pt1.YB, pt2.YB)
-            if is_close(y_max, y_min): return False
-
-        elif side == 'right_left':
-            if not pt1.XTL == pt2.XTR:
-                return False
-            y_min = max(pt1.YT, pt2.YT)
-            y_max = min(pt1.YB, pt2.YB)
-            if is_close(y_max, y_min): return False
-
-        elif side is None:
-            # Cross-layer portal - no geometric validation needed
-            pass
-
-        else:
+        if not portal_is_valid(pt1, pt2, side):
             return False
 
-        # Add bidirectional adjacency to portal graph
-        self.portal_graph.setdefault(pt1.id, []).append(pt2.id)
-        self.portal_graph.setdefault(pt2.id, []).append(pt1.id)
-        transition_cost = 0.0 if side is None else math.hypot(
-            self.get_position(pt2.id)[0] - self.get_position(pt1.id)[0],
-            self.get_position(pt2.id)[1] - self.get_position(pt1.id)[1],
-        )
-        self.portal_costs.setdefault(pt1.id, {})[pt2.id] = transition_cost
-        self.portal_costs.setdefault(pt2.id, {})[pt1.id] = transition_cost
+        self.invalidate_path_cache()
+        add_portal(self.portal_graph, self.portal_costs, self._centroids, pt1, pt2, side)
         return True
 
     def create_all_local_portals(self):
-        # Group traps by zplane
-        zplane_traps = defaultdict(list)
-        for trap_id, z in self.trap_id_to_layer.items():
-            zplane_traps[z].append(self.trapezoids[trap_id])
-
-        for traps in zplane_traps.values():
-            trap_by_id = {t.id: t for t in traps}
-
-            for ti in traps:
-                for nid in ti.neighbor_ids:
-                    tj = trap_by_id.get(nid)
-                    if not tj or ti.id == tj.id:
-                        continue
-                    ai = AABB(ti)
-                    aj = AABB(tj)
-                    side = self.get_adjacent_side(ti, tj)
-                    if side:
-                        self.create_portal(ai, aj, side)
+        for ti, tj, side in local_portal_pairs(self.trapezoids, self.trap_id_to_layer):
+            self.create_portal(AABB(ti), AABB(tj), side)
 
     def touching(self, a: AABB, b: AABB, vert_tol: float = _PORTAL_VERT_TOL, horiz_tol: float = _PORTAL_HORIZ_TOL) -> bool:
         """Check if two trapezoid bounding boxes are geometrically adjacent."""
-        # Same vertical alignment
-        if abs(a.m_t.YB - b.m_t.YT) < vert_tol or abs(a.m_t.YT - b.m_t.YB) < vert_tol:
-            left_a = min(a.m_t.XBL, a.m_t.XTL)
-            right_a = max(a.m_t.XBR, a.m_t.XTR)
-            left_b = min(b.m_t.XBL, b.m_t.XTL)
-            right_b = max(b.m_t.XBR, b.m_t.XTR)
-            if right_a >= left_b and right_b >= left_a:
-                return True
-
-        # Same horizontal alignment
-        if abs(a.m_t.XBR - b.m_t.XBL) < horiz_tol or abs(a.m_t.XBL - b.m_t.XBR) < horiz_tol:
-            top_a = max(a.m_t.YT, a.m_t.YB)
-            bottom_a = min(a.m_t.YT, a.m_t.YB)
-            top_b = max(b.m_t.YT, b.m_t.YB)
-            bottom_b = min(b.m_t.YT, b.m_t.YB)
-            if top_a >= bottom_b and top_b >= bottom_a:
-                return True
-
-        return False
+        return trapezoids_touching(a.m_t, b.m_t, vert_tol, horiz_tol)
 
     def _create_cross_layer_portals_from_snapshots(self, pathing_maps):
         """Build cross-layer portal connections from snapshot portal data."""
-        cross_groups: Dict[Tuple[int, int], Dict[int, List[PathingTrapezoid]]] = defaultdict(lambda: defaultdict(list))
-
-        for plane_idx, pmap in enumerate(pathing_maps):
-            for portal in pmap.portals:
-                if portal.left_layer_id == portal.right_layer_id:
-                    continue
-
-                layer_pair = (min(portal.left_layer_id, portal.right_layer_id),
-                              max(portal.left_layer_id, portal.right_layer_id))
-
-                for trap_id in portal.trapezoid_indices:
-                    trap = self.trapezoids.get(trap_id)
-                    if trap:
-                        cross_groups[layer_pair][plane_idx].append(trap)
-
-        for plane_map in cross_groups.values():
-            planes = list(plane_map.keys())
-            if len(planes) < 2:
-                continue
-
-            for i in range(len(planes)):
-                for j in range(i + 1, len(planes)):
-                    traps_i = plane_map[planes[i]]
-                    traps_j = plane_map[planes[j]]
-
-                    for ti in traps_i:
-                        ai = AABB(ti)
-                        for tj in traps_j:
-                            if ti.id == tj.id:
-                                continue
-                            aj = AABB(tj)
-                            if self.touching(ai, aj):
-                                self.create_portal(ai, aj, None)
-
+        for ti, tj in cross_layer_portal_pairs(self.trapezoids, snapshot_portals(pathing_maps)):
+            self.create_portal(AABB(ti), AABB(tj), None)
 
     def get_position(self, t_id: int) -> Tuple[float, float]:
-        t = self.trapezoids[t_id]
-        cx = (t.XTL + t.XTR + t.XBL + t.XBR) / 4
-        cy = (t.YT + t.YB) / 2
-        return (cx, cy)
+        return self._centroids[t_id]
 
     def get_neighbors(self, t_id: int) -> List[int]:
         return self.portal_graph.get(t_id, [])
@@ -312,6 +796,44 @@ class NavMesh:
         tx, ty = self.get_position(to_id)
         return math.hypot(tx - fx, ty - fy)
 
+    def _init_search_state(self):
+        self.mesh_version = 0
+        self._search_graph: Optional[_SearchGraph] = None
+        self._path_cache: "OrderedDict[Tuple[int, int], Optional[Tuple[int, ...]]]" = OrderedDict()
+        self.path_cache_hits = 0
+        self.path_cache_misses = 0
+
+    def invalidate_path_cache(self):
+        """Drop the A* adjacency arrays and cached paths; call after mutating the portal graph."""
+        self.mesh_version += 1
+        self._search_graph = None
+        self._path_cache.clear()
+
+    def get_search_graph(self) -> "_SearchGraph":
+        if self._search_graph is None:
+            self._search_graph = _SearchGraph(self)
+        return self._search_graph
+
+    def find_path_ids(self, start_id: int, goal_id: int) -> Optional[Tuple[int, ...]]:
+        """Return the trapezoid ids of the cheapest route start_id -> goal_id, or None.
+
+        Results (including failures) are kept in an LRU cache keyed by the
+        trapezoid pair until the mesh changes.
+        """
+        key = (start_id, goal_id)
+        cache = self._path_cache
+        if key in cache:
+            cache.move_to_end(key)
+            self.path_cache_hits += 1
+            return cache[key]
+
+        self.path_cache_misses += 1
+        route = self.get_search_graph().search(start_id, goal_id)
+        cache[key] = route
+        if len(cache) > _PATH_CACHE_SIZE:
+            cache.popitem(last=False)
+        return route
+
     def find_trapezoid_id_by_coord(self, point: Tuple[float, float], tol: float = 20.0) -> Optional[int]:
         """Return trapezoid ID containing point, or None."""
         return self._bsp.find(point[0], point[1], tol)
@@ -320,19 +842,31 @@ class NavMesh:
         """Return True if (x, y) lies on the NavMesh with the given inset margin."""
         return self._bsp.find_with_margin(x, y, margin)
 
+    def find_trapezoid_ids_by_coord(self, points: Sequence[Tuple[float, float]],
+                                    tol: float = 20.0) -> List[Optional[int]]:
+        """find_trapezoid_id_by_coord for a batch of points, in one tree walk."""
+        return self._bsp.find_many([p[0] for p in points], [p[1] for p in points], tol)
+
+    def contains_many(self, points: Sequence[Tuple[float, float]],
+                      margin: Union[float, Sequence[float]] = 20.0) -> List[bool]:
+        """contains() for a batch of points, with one margin for all or one per point."""
+        return self._bsp.contains_many([p[0] for p in points], [p[1] for p in points], margin)
+
+    def get_spatial_index(self) -> TrapezoidGridIndex:
+        """Grid index over the trapezoids, built on first use next to the BSP."""
+        if self._grid is None:
+            traps = list(self.trapezoids.values())
+            self._grid = TrapezoidGridIndex(traps, [self._centroids[t.id] for t in traps])
+        return self._grid
+
     def find_nearest_trapezoid_id(self, x: float, y: float) -> Optional[int]:
         """Return the ID of the trapezoid whose centroid is closest to (x, y).
         """
-        best_id: Optional[int] = None
-        best_dist = float("inf")
-        for t_id, t in self.trapezoids.items():
-            cx = (t.XTL + t.XTR + t.XBL + t.XBR) / 4
-            cy = (t.YT + t.YB) / 2
-            d = math.hypot(cx - x, cy - y)
-            if d < best_dist:
-                best_dist = d
-                best_id = t_id
-        return best_id
+        return self.get_spatial_index().nearest_centroid(x, y)
+
+    def find_trapezoids_within(self, x: float, y: float, radius: float) -> List[int]:
+        """Return IDs of trapezoids that have any point within radius of (x, y)."""
+        return self.get_spatial_index().within_radius(x, y, radius)
 
     def find_nearest_reachable(
         self,
@@ -341,40 +875,147 @@ class NavMesh:
     ) -> Optional[Tuple[float, float]]:
         """Return the nearest reachable NavMesh position to origin.
 
-        If origin already lies on the mesh it is returned as-is.  Otherwise
-        the centroid of the closest trapezoid is returned.  Returns None only
-        when the NavMesh is empty.
+        If origin already lies on the mesh with the given margin it is
+        returned as-is.  Otherwise it is projected onto the closest point of
+        the walkable surface where contains(margin) holds; if no trapezoid is
+        wide enough for the margin, onto the closest walkable point at all.
+        Returns None only when the NavMesh is empty.
 
         Can be used for any position query – player location, click
         coordinates, waypoints, etc.
         """
-        if self.contains(origin[0], origin[1], margin):
-            return origin
+        return self.find_nearest_reachable_many([origin], margin)[0]
+
+    def find_nearest_reachable_many(
+        self,
+        origins: List[Tuple[float, float]],
+        margin: float = 20.0,
+    ) -> List[Optional[Tuple[float, float]]]:
+        """find_nearest_reachable for many points in one call, results in input order.
 
-        t_id = self.find_nearest_trapezoid_id(origin[0], origin[1])
-        if t_id is None:
+        Every query runs on the grid index and the points share one set of
+        margin-inset trapezoids; a point already on the mesh stops at the
+        first inset region that holds it.
+        """
+        grid = self.get_spatial_index()
+        insets: Dict[int, Optional[tuple]] = {}
+        exact_insets: Dict[int, Optional[tuple]] = {}
+        results: List[Optional[Tuple[float, float]]] = []
+        for origin in origins:
+            x, y = float(origin[0]), float(origin[1])
+            hit = grid.nearest_point(x, y, margin, insets)
+            if hit is None and margin > 0.0:
+                hit = grid.nearest_point(x, y, 0.0, exact_insets)
+            if hit is None:
+                results.append(None)
+                continue
+            px, py, t_id = hit
+            if px == x and py == y:
+                results.append(origin)
+                continue
+            # The projection lands on the inset boundary; nudge it inside so contains(margin) agrees.
+            cx, cy = self._centroids[t_id]
+            dist = math.hypot(cx - px, cy - py)
+            if dist > 0.0:
+                step = min(_PROJECTION_NUDGE, dist) / dist
+                px, py = px + (cx - px) * step, py + (cy - py) * step
+            results.append((px, py))
+        return results
+
+    def segment_block(self,
+                      p1: Tuple[float, float],
+                      p2: Tuple[float, float],
+                      margin: float = 0.0,
+                      end_slack: float = 0.0) -> Optional[SegmentBlock]:
+        """Walk the segment p1 -> p2 through the trapezoids; return where it is blocked, or None.
+
+        The walk starts in the trapezoid containing p1 and follows the
+        segment edge to edge, entering the next trapezoid through the portal
+        graph (or, failing that, whichever trapezoid the BSP finds just past
+        the edge), so thin obstacles cannot slip between samples.  With a
+        margin every point of the segment must also stay margin away (along
+        X, as in contains()) from the left and right sides of the trapezoid
+        it is in.  Within end_slack of either end the segment only has to be
+        on the mesh: endpoints such as agent positions are often closer than
+        margin to a wall, and may lie up to end_slack off the mesh.
+        """
+        x1, y1 = float(p1[0]), float(p1[1])
+        dx, dy = float(p2[0]) - x1, float(p2[1]) - y1
+        length = math.hypot(dx, dy)
+        if length <= _SEGMENT_TOL:
             return None
-        return self.get_position(t_id)
+        eps = _SEGMENT_TOL / length
+        check_from = min(0.5, end_slack / length)
+        check_to = 1.0 - check_from
+
+        cur = self._bsp.find(x1, y1, _SEGMENT_TOL)
+        if cur is None and end_slack > _SEGMENT_TOL:
+            cur = self._bsp.find(x1, y1, end_slack)
+        if cur is None:
+            return SegmentBlock(0.0, (x1, y1), -1, None, "off_mesh")
+
+        traps = self.trapezoids
+        graph = self.get_search_graph()
+        ids, offsets, targets = graph.ids, graph.offsets, graph.targets
+        s = 0.0
+        while True:
+            t = traps[cur]
+            clip = _clip_segment_to_trapezoid(t, x1, y1, dx, dy, _SEGMENT_TOL)
+            if clip is None or clip[0] > max(s, check_from) + eps:
+                return SegmentBlock(s, (x1 + dx * s, y1 + dy * s), -1, None, "off_mesh")
+            hi, side = clip[1], clip[2]
+
+            if margin > 0.0:
+                c0, c1 = max(s, clip[0], check_from), min(hi, check_to)
+                if c1 > c0:
+                    hit = _first_clearance_violation(t, x1, y1, dx, dy, margin, c0, c1)
+                    if hit is not None:
+                        u = hit[0]
+                        return SegmentBlock(u, (x1 + dx * u, y1 + dy * u), cur, _trapezoid_edge(t, hit[1]), "clearance")
+
+            if hi >= 1.0 - eps:
+                return None
+
+            nxt, best_hi = None, hi + eps
+            i = graph.index_of.get(cur)
+            if i is not None:
+                for k in range(offsets[i], offsets[i + 1]):
+                    n_id = ids[targets[k]]
+                    n_clip = _clip_segment_to_trapezoid(traps[n_id], x1, y1, dx, dy, _SEGMENT_TOL)
+                    if n_clip is not None and n_clip[0] <= hi + eps and n_clip[1] > best_hi:
+                        nxt, best_hi = n_id, n_clip[1]
+            if nxt is None:
+                u = min(1.0, hi + 2.0 * eps)
+                n_id = self._bsp.find(x1 + dx * u, y1 + dy * u)
+                if n_id is not None and n_id != cur:
+                    n_clip = _clip_segment_to_trapezoid(traps[n_id], x1, y1, dx, dy, _SEGMENT_TOL)
+                    if n_clip is not None and n_clip[0] <= hi + eps and n_clip[1] > best_hi:
+                        nxt = n_id
+            if nxt is None:
+                if hi >= check_to - eps:
+                    return None
+                return SegmentBlock(hi, (x1 + dx * hi, y1 + dy * hi), cur, _trapezoid_edge(t, side), "edge")
+            s, cur = hi, nxt
+
+    def is_segment_walkable(self,
+                            p1: Tuple[float, float],
+                            p2: Tuple[float, float],
+                            margin: float = 0.0,
+                            end_slack: float = 0.0) -> bool:
+        """Return True if the whole segment p1 -> p2 is walkable; see segment_block."""
+        return self.segment_block(p1, p2, margin, end_slack) is None
 
     def has_line_of_sight(self,
                           p1: Tuple[float, float],
                           p2: Tuple[float, float],
                           margin: float = 100,
                           step_dist: float = 200.0) -> bool:
+        """Return True if the segment p1 -> p2 stays on the mesh with the given margin.
 
-        total_dist = math.dist(p1, p2)
-        steps = int(total_dist / step_dist) + 1
-        dx = (p2[0] - p1[0]) / steps
-        dy = (p2[1] - p1[1]) / steps
-
-        for i in range(1, steps):
-            x = p1[0] + dx * i
-            y = p1[1] + dy * i
-            if not self._bsp.find_with_margin(x, y, margin):
-                return False
-        return True
-
-
+        Exact (segment_block with end_slack=margin); step_dist is kept for
+        callers of the former sampled check and is ignored.
+        """
+        return self.segment_block(p1, p2, margin, end_slack=margin) is None
 
     def smooth_path_by_los(self,
                            path: List[Tuple[float, float]],
@@ -395,53 +1036,186 @@ class NavMesh:
             i = j
         return result
 
+    def to_cache_data(self) -> NavMeshCacheData:
+        """Flatten the derived mesh data into the binary cache layout."""
+        return pack_cache_data(self.map_id, self.trapezoids, self.trap_id_to_layer, self._centroids,
+                               self._bsp, self.portal_graph, self.portal_costs)
+
+    @classmethod
+    def from_cache_data(cls, trapezoids: Dict[int, PathingTrapezoid], data: NavMeshCacheData) -> "NavMesh":
+        """Restore a NavMesh from cache arrays without rebuilding the BSP or portals.
+
+        trapezoids must be the same snapshot (same ids, same order) the data was
+        built from; callers are expected to have checked the geometry checksum.
+        """
+        nav = cls.__new__(cls)
+        nav.map_id = data.map_id
+        nav.trapezoids = trapezoids
+        trap_ids = data.trap_ids.tolist()
+        xy = data.centroids.tolist()
+
+        nav.trap_id_to_layer = dict(zip(trap_ids, data.trap_layer.tolist()))
+        nav._centroids = dict(zip(trap_ids, zip(xy[0::2], xy[1::2])))
+        nav._bsp = TrapezoidBSP.from_arrays(list(trapezoids.values()), data.bsp_split, data.bsp_above,
+                                            data.bsp_below, data.bsp_leaf, data.bsp_count, data.bsp_items)
+        nav._grid = None
+
+        # The portal dicts are expanded lazily from the CSR arrays on first access.
+        nav._cache_data = data
+        nav._portal_graph = None
+        nav._portal_costs = None
+        nav._init_search_state()
+        return nav
+
+    @staticmethod
+    def cache_filepath(folder: str, map_id: int) -> str:
+        return f"{folder}/navmesh_{map_id}.bin"
+
     def save_to_file(self, folder: str):
-        """Serialize NavMesh portal graph and metadata to disk."""
-        filepath = f"{folder}/navmesh_{self.map_id}.bin"
-        data = {
-            "map_id": self.map_id,
-            "portal_graph": self.portal_graph,
-            "portal_costs": self.portal_costs,
-            "trap_id_to_layer": self.trap_id_to_layer
-        }
-        with open(filepath, "wb") as f:
-            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        """Write the NavMesh (BSP, portal graph, costs, layers, centroids) to the binary cache."""
+        write_navmesh_cache(NavMesh.cache_filepath(folder, self.map_id), self.to_cache_data())
 
+    @staticmethod
+    def load_from_file(pathing_maps, map_id: int, folder: str) -> Optional["NavMesh"]:
+        """Load a NavMesh from the binary cache.
+
+        Returns None when the cache is missing, was written by another format
+        version, or no longer matches the trapezoids in pathing_maps.
+        """
+        filepath = NavMesh.cache_filepath(folder, map_id)
+        trapezoids, crc = NavMesh._snapshot_geometry(pathing_maps)
+        data, reason = read_navmesh_cache(filepath, map_id, crc)
+        if data is None:
+            Py4GW.Console.Log("NavMesh", f"Ignoring NavMesh cache for map {map_id}: {reason}", Py4GW.Console.MessageType.Debug)
+            return None
+
+        nav = NavMesh.from_cache_data(trapezoids, data)
+        Py4GW.Console.Log("NavMesh", f"Loaded NavMesh for map {map_id} with {len(data.adj_target)} portal edges and {len(nav.trapezoids)} trapezoids.", Py4GW.Console.MessageType.Info)
+        return nav
 
     @staticmethod
-    def load_from_file(pathing_maps, map_id: int, folder: str) -> "NavMesh":
-        """Load serialized NavMesh portal graph and rebuild BSP from current trapezoid data."""
-        filepath = f"{folder}/navmesh_{map_id}.bin"
+    def from_cache_bytes(pathing_maps, map_id: int, blob: bytes, verify_geometry: bool = True) -> Optional["NavMesh"]:
+        """load_from_file for a serialized cache held in memory, e.g. from a NavMeshBuildJob.
 
-        nav = NavMesh.__new__(NavMesh)
-        nav.map_id = map_id
-        nav.trapezoids = {}
-        nav.portal_graph = {}
-        nav.portal_costs = {}
-        nav.trap_id_to_layer = {}
+        Returns None when blob does not match the trapezoids in pathing_maps.
+        verify_geometry=False skips the geometry checksum, for a blob built
+        from a snapshot of these very pathing_maps objects.
+        """
+        trapezoids, crc = NavMesh._snapshot_geometry(pathing_maps, verify_geometry)
+        data, reason = navmesh_cache_from_bytes(blob, map_id, crc)
+        if data is not None and len(data.trap_ids) != len(trapezoids):
+            data, reason = None, "trapezoid count does not match current pathing maps"
+        if data is None:
+            Py4GW.Console.Log("NavMesh", f"Discarding built NavMesh for map {map_id}: {reason}", Py4GW.Console.MessageType.Warning)
+            return None
+        return NavMesh.from_cache_data(trapezoids, data)
 
+    @staticmethod
+    def _snapshot_geometry(pathing_maps, with_crc: bool = True) -> Tuple[Dict[int, PathingTrapezoid], Optional[int]]:
+        """The trapezoid dict NavMesh would register for pathing_maps and its geometry checksum."""
+        trapezoids: Dict[int, PathingTrapezoid] = {}
+        trap_id_to_layer: Dict[int, int] = {}
         for i, layer in enumerate(pathing_maps):
             traps = layer.trapezoids
-            nav.trapezoids.update({t.id: t for t in traps})
-            nav.trap_id_to_layer.update({t.id: i for t in traps})
+            trapezoids.update({t.id: t for t in traps})
+            trap_id_to_layer.update({t.id: i for t in traps})
+        return trapezoids, geometry_crc(trapezoids.values(), trap_id_to_layer) if with_crc else None
 
-        nav._bsp = TrapezoidBSP(list(nav.trapezoids.values()))
 
-        with open(filepath, "rb") as f:
-            data = pickle.load(f)
 
-        nav.portal_graph = data["portal_graph"]
-        if "portal_costs" in data:
-            nav.portal_costs = data["portal_costs"]
-        if "trap_id_to_layer" in data:
-            nav.trap_id_to_layer = data["trap_id_to_layer"]
+#region AStar
 
-        Py4GW.Console.Log("NavMesh", f"Loaded NavMesh for map {map_id} with {len(nav.portal_graph)} connections and {len(nav.trapezoids)} trapezoids.", Py4GW.Console.MessageType.Info)
-        return nav
+# Number of (start trapezoid, goal trapezoid) routes kept per NavMesh
+_PATH_CACHE_SIZE = 256
 
+class _SearchGraph:
+    """Integer-indexed adjacency arrays used by the A* engine.
 
+    Trapezoids are renumbered to dense indices; neighbors and transition costs
+    are stored CSR-style (targets/costs[offsets[i]:offsets[i + 1]]) and
+    centroids as parallel x/y lists, so the search loop only does list
+    indexing instead of dict lookups and get_position calls.
+    """
+    __slots__ = ('ids', 'index_of', 'cx', 'cy', 'offsets', 'targets', 'costs')
+
+    def __init__(self, navmesh: NavMesh):
+        data = navmesh._cache_data
+        if data is not None and navmesh._portal_graph is None:
+            # Cache-loaded mesh whose portal dicts were never touched: reuse the CSR arrays.
+            self.ids = data.trap_ids.tolist()
+            xy = data.centroids.tolist()
+            self.cx = xy[0::2]
+            self.cy = xy[1::2]
+            self.offsets = data.adj_offset.tolist()
+            self.targets = data.adj_target.tolist()
+            self.costs = data.adj_cost.tolist()
+            self.index_of = {t_id: i for i, t_id in enumerate(self.ids)}
+            return
+
+        self.ids = list(navmesh.trapezoids.keys())
+        self.index_of = {t_id: i for i, t_id in enumerate(self.ids)}
+        centroids = navmesh._centroids
+        self.cx = [centroids[t_id][0] for t_id in self.ids]
+        self.cy = [centroids[t_id][1] for t_id in self.ids]
+        self.offsets = [0]
+        self.targets = []
+        self.costs = []
+        index_of = self.index_of
+        for t_id in self.ids:
+            for nid in dict.fromkeys(navmesh.get_neighbors(t_id)):
+                j = index_of.get(nid)
+                if j is None:
+                    continue
+                self.targets.append(j)
+                self.costs.append(navmesh.get_transition_cost(t_id, nid))
+            self.offsets.append(len(self.targets))
+
+    def search(self, start_id: int, goal_id: int) -> Optional[Tuple[int, ...]]:
+        """A* over dense indices with a closed set. Returns trapezoid ids or None."""
+        start = self.index_of.get(start_id)
+        goal = self.index_of.get(goal_id)
+        if start is None or goal is None:
+            return None
+
+        cx, cy = self.cx, self.cy
+        offsets, targets, costs = self.offsets, self.targets, self.costs
+        gx, gy = cx[goal], cy[goal]
+        hypot = math.hypot
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        n = len(cx)
+        g_cost = [math.inf] * n
+        parent = [-1] * n
+        closed = bytearray(n)
+        g_cost[start] = 0.0
+        open_list = [(hypot(gx - cx[start], gy - cy[start]), start)]
+
+        while open_list:
+            _, current = heappop(open_list)
+            if closed[current]:
+                continue
+            if current == goal:
+                route = []
+                while current != -1:
+                    route.append(self.ids[current])
+                    current = parent[current]
+                route.reverse()
+                return tuple(route)
+            closed[current] = 1
+
+            g_current = g_cost[current]
+            for k in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[k]
+                new_cost = g_current + costs[k]
+                if new_cost < g_cost[neighbor]:
+                    # Zero-cost cross-layer portals make the heuristic inconsistent,
+                    # so a cheaper route re-opens an already closed node.
+                    closed[neighbor] = 0
+                    g_cost[neighbor] = new_cost
+                    parent[neighbor] = current
+                    heappush(open_list, (new_cost + hypot(gx - cx[neighbor], gy - cy[neighbor]), neighbor))
+        return None
 
-#region AStar
 
 class AStarNode:
     def __init__(self, node_id, g, f, parent=None):
@@ -487,30 +1261,16 @@ class AStar:
             Py4GW.Console.Log("A-Star", f"Invalid start or goal trapezoid: {start_id}, {goal_id}", Py4GW.Console.MessageType.Error)
             return False
 
-        open_list: List[AStarNode] = []
-        heapq.heappush(open_list, AStarNode(start_id, 0, self.heuristic(start_id, goal_id)))
-        came_from: Dict[int, int] = {}
-        cost_so_far: Dict[int, float] = {start_id: 0}
+        route = self.navmesh.find_path_ids(start_id, goal_id)
+        if route is None:
+            Py4GW.Console.Log("A-Star", f"Path not found from {start_id} to {goal_id}", Py4GW.Console.MessageType.Warning)
+            return False
 
-        while open_list:
-            current = heapq.heappop(open_list)
-            if current.id == goal_id:
-                self._reconstruct(came_from, goal_id)
-                # Prepend exact start position, append exact goal position
-                self.path.insert(0, start_pos)
-                self.path.append(goal_pos)
-                return True
-
-            for neighbor in self.navmesh.get_neighbors(current.id):
-                new_cost = cost_so_far[current.id] + self.navmesh.get_transition_cost(current.id, neighbor)
-                if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
-                    cost_so_far[neighbor] = new_cost
-                    priority = new_cost + self.heuristic(neighbor, goal_id)
-                    heapq.heappush(open_list, AStarNode(neighbor, new_cost, priority, current.id))
-                    came_from[neighbor] = current.id
-
-        Py4GW.Console.Log("A-Star", f"Path not found from {start_id} to {goal_id}", Py4GW.Console.MessageType.Warning)
-        return False
+        # Prepend exact start position, append exact goal position
+        self.path = [start_pos]
+        self.path.extend(self.navmesh.get_position(t_id) for t_id in route)
+        self.path.append(goal_pos)
+        return True
 
     def _reconstruct(self, came_from: Dict[int, int], end_id: int):
         self.path = []
@@ -678,6 +1438,12 @@ class AutoPathing:
         self.is_ready: bool = False
         self.pathing_map_cache: dict[tuple[int, ...], NavMesh] = {}
         self._last_group_key: Optional[tuple[int, ...]] = None
+        # Folder for the binary navmesh cache; set to None to always rebuild.
+        self.navmesh_cache_folder: Optional[str] = os.path.join(
+            Py4GW.Console.get_projects_path(), "data", "navmesh_cache")
+        # Build uncached navmeshes in a worker (NavMeshBuildJob); False builds them on the game thread.
+        self.background_build: bool = True
+        self._pending_build: Optional[Tuple[NavMeshBuildJob, tuple[int, ...], list]] = None
         self._initialized = True
 
     def _get_group_key(self, map_id: int) -> tuple[int, ...]:
@@ -686,7 +1452,14 @@ class AutoPathing:
                 return tuple(sorted(group))
         return (map_id,)  # Default: treat each unknown map_id as its own group
 
-    def load_pathing_maps(self):
+    def load_pathing_maps(self, wait: bool = True):
+        """Load the current map's navmesh from memory, the binary cache, or a background build.
+
+        A background build keeps running across calls; with wait=True this
+        yields once per frame until it lands (or the map changes), with
+        wait=False it returns right away and get_navmesh() picks the mesh up
+        once it is ready.  Until then get_path relies on PyPathing.PathPlanner.
+        """
         map_id = Map.GetMapID()
         if not map_id or not Map.IsMapReady():
             yield
@@ -695,23 +1468,107 @@ class AutoPathing:
         group_key = self._get_group_key(map_id)
         yield
 
+        building = self._poll_build(map_id)
         cached = self.pathing_map_cache.get(group_key)
         if cached is not None and cached.map_id == map_id and cached.trapezoids:
             yield
             return
-        pathing_maps = Map.Pathing.GetPathingMaps()
-        navmesh = NavMesh(pathing_maps, map_id) if pathing_maps else None
-        if navmesh and navmesh.trapezoids:
-            self.pathing_map_cache[group_key] = navmesh
+        if not building:
+            pathing_maps = Map.Pathing.GetPathingMaps()
+            navmesh = None
+            if pathing_maps:
+                navmesh = self._load_cached_navmesh(pathing_maps, map_id)
+                if navmesh is None and self.background_build:
+                    self._start_build(pathing_maps, map_id, group_key)
+                elif navmesh is None:
+                    navmesh = NavMesh(pathing_maps, map_id)
+                    self._save_cached_navmesh(navmesh)
+            if navmesh and navmesh.trapezoids:
+                self.pathing_map_cache[group_key] = navmesh
         yield
+        while wait and self._poll_build(map_id):
+            yield
+
+    def _start_build(self, pathing_maps, map_id: int, group_key: tuple[int, ...]):
+        self._cancel_build()
+        job = NavMeshBuildJob(snapshot_pathing_maps(pathing_maps, map_id))
+        self._pending_build = (job, group_key, pathing_maps)
+        Py4GW.Console.Log("NavMesh", f"Building NavMesh for map {map_id} in the background ({job.backend}).", Py4GW.Console.MessageType.Debug)
+
+    def _cancel_build(self, group_key: Optional[tuple[int, ...]] = None):
+        """Cancel the background build (only if it is for group_key, when given)."""
+        pending = self._pending_build
+        if pending is not None and (group_key is None or pending[1] == group_key):
+            pending[0].cancel()
+            self._pending_build = None
+
+    def _poll_build(self, map_id: int) -> bool:
+        """Install a finished background build; True while one for map_id is still running.
+
+        A build for another map is cancelled.  If the build fails, the mesh
+        is built on the calling thread as before.
+        """
+        pending = self._pending_build
+        if pending is None:
+            return False
+        job, group_key, pathing_maps = pending
+        if job.map_id != map_id:
+            Py4GW.Console.Log("NavMesh", f"Cancelled NavMesh build for map {job.map_id} (map changed).", Py4GW.Console.MessageType.Debug)
+            self._cancel_build()
+            return False
+        if not job.done():
+            return True
+
+        self._pending_build = None
+        blob = job.result()
+        navmesh = NavMesh.from_cache_bytes(pathing_maps, map_id, blob, verify_geometry=False) if blob else None
+        if navmesh is None:
+            Py4GW.Console.Log("NavMesh", f"Background NavMesh build for map {map_id} failed ({job.error or 'invalid result'}); building in place.", Py4GW.Console.MessageType.Warning)
+            navmesh = NavMesh(pathing_maps, map_id)
+            self._save_cached_navmesh(navmesh)
+        else:
+            Py4GW.Console.Log("NavMesh", f"Built NavMesh for map {map_id} with {len(navmesh.trapezoids)} trapezoids in {job.elapsed:.2f}s ({job.backend}).", Py4GW.Console.MessageType.Info)
+            self._save_cached_blob(map_id, blob)
+        if navmesh.trapezoids:
+            self.pathing_map_cache[group_key] = navmesh
+        return False
+
+    def _load_cached_navmesh(self, pathing_maps, map_id: int) -> Optional[NavMesh]:
+        if not self.navmesh_cache_folder:
+            return None
+        try:
+            return NavMesh.load_from_file(pathing_maps, map_id, self.navmesh_cache_folder)
+        except Exception as e:
+            Py4GW.Console.Log("NavMesh", f"NavMesh cache load failed for map {map_id}: {e}", Py4GW.Console.MessageType.Warning)
+            return None
+
+    def _save_cached_navmesh(self, navmesh: NavMesh):
+        if not self.navmesh_cache_folder or not navmesh.trapezoids:
+            return
+        try:
+            os.makedirs(self.navmesh_cache_folder, exist_ok=True)
+            navmesh.save_to_file(self.navmesh_cache_folder)
+        except Exception as e:
+            Py4GW.Console.Log("NavMesh", f"NavMesh cache save failed for map {navmesh.map_id}: {e}", Py4GW.Console.MessageType.Warning)
+
+    def _save_cached_blob(self, map_id: int, blob: bytes):
+        if not self.navmesh_cache_folder:
+            return
+        try:
+            os.makedirs(self.navmesh_cache_folder, exist_ok=True)
+            write_navmesh_cache_bytes(NavMesh.cache_filepath(self.navmesh_cache_folder, map_id), blob)
+        except Exception as e:
+            Py4GW.Console.Log("NavMesh", f"NavMesh cache save failed for map {map_id}: {e}", Py4GW.Console.MessageType.Warning)
 
     def clear_navmesh_cache(self, map_id: Optional[int] = None):
         if map_id is None:
+            self._cancel_build()
             self.pathing_map_cache.clear()
             self._last_group_key = None
             return
 
         group_key = self._get_group_key(map_id)
+        self._cancel_build(group_key)
         self.pathing_map_cache.pop(group_key, None)
         if self._last_group_key == group_key:
             self._last_group_key = None
@@ -724,6 +1581,11 @@ class AutoPathing:
 
         Map.Pathing.ClearPathingCache(map_id=map_id, include_live=True)
         self.clear_navmesh_cache(map_id)
+        if self.navmesh_cache_folder:
+            try:
+                os.remove(NavMesh.cache_filepath(self.navmesh_cache_folder, map_id))
+            except OSError:
+                pass
         yield from self.load_pathing_maps()
 
 
@@ -732,6 +1594,7 @@ class AutoPathing:
         if not map_id:
             return None
 
+        self._poll_build(map_id)
         group_key = self._get_group_key(map_id)
         nav = self.pathing_map_cache.get(group_key)
 
@@ -7,7 +7,11 @@ column definitions, and values.
 
 Architecture:
     DBMgr('name') — opens database by alias. Path resolved from PRIMARY catalog.
-    All operations are open → execute → commit → close (unless in transaction).
+    Auto-commit operations run on a persistent per-thread connection (PRAGMAs
+    applied once, sqlite3 statement cache kept warm) and commit per call.
+    Explicit transactions and lock retries use their own short-lived connections.
+    InsertMany/UpsertMany write many rows in one transaction, and the optional
+    write-behind worker (StartWriteBehind) coalesces queued small writes.
     Bootstrap runs once per process: creates PRIMARY, runs setup scripts, self-registers.
 
 Usage:
@@ -19,9 +23,11 @@ Usage:
 
 import json
 import os
+import queue
 import re
 import shutil
 import sqlite3
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -33,6 +39,9 @@ _PRIMARY_ALIAS = "PRIMARY"
 _PRIMARY_DB_FILENAME = "Py4GW_Internals.db"
 _IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 _PRIMARY_SETUP_RE = re.compile(r"^\d+_")
+_STATEMENT_CACHE_SIZE = 256      # sqlite3 prepared statements kept per pooled connection
+_SQL_CACHE_LIMIT = 1024          # generated INSERT/UPSERT strings kept per process
+_WRITE_BEHIND_MAX_BATCH = 1000   # queued writes committed per write-behind transaction
 
 # ---------------------------------------------------------------------------
 # Module-level helpers (no Py4GW dependency at import time)
@@ -62,6 +71,11 @@ def _get_data_path() -> Path:
     return (_get_projects_path() / "data").resolve()
 
 
+def _is_ddl(sql: str) -> bool:
+    """True for statements that may change a table's schema."""
+    return sql.lstrip()[:6].upper().startswith(("CREATE", "ALTER", "DROP"))
+
+
 # ---------------------------------------------------------------------------
 # DBMgr
 # ---------------------------------------------------------------------------
@@ -95,9 +109,28 @@ class DBMgr:
     _primary_path: Optional[Path] = None
     _primary_catalog_ensured: bool = False
     _catalog_consistent: bool = False
-    _read_connections: dict[str, sqlite3.Connection] = {}
     _ensured_database_paths: set[str] = set()
 
+    # Per-thread pooled read/write connections: {(role, db_key): (connection, epoch)}.
+    # Bumping a database's epoch makes every thread reopen its connections.
+    # _pool_open tracks the same connections across threads so invalidation
+    # can close them all before a database file is moved or deleted; pooled
+    # connections are opened with check_same_thread=False for that reason.
+    _pool = threading.local()
+    _pool_epochs: dict[str, int] = {}
+    _pool_open: dict[str, set] = {}
+    _pool_lock = threading.Lock()
+    _sql_cache: dict[tuple, str] = {}
+    _pk_cache: dict[tuple[str, str], tuple[str, ...]] = {}
+
+    # Write-behind worker state (see StartWriteBehind).
+    _wb_queue: Optional[queue.Queue] = None
+    _wb_thread: Optional[threading.Thread] = None
+    _wb_interval: float = 0.05
+    _wb_errors: int = 0
+    _wb_lock = threading.Lock()
+    _wb_atexit_registered: bool = False
+
     def __new__(cls, name: str) -> "DBMgr":
         """Return the single process-wide DBMgr instance."""
         cls._bootstrap_once()
@@ -355,6 +388,21 @@ class DBMgr:
 
         self._name = name
         self._db_path = self._resolve_db_path(name)
+        self._db_key = str(self._db_path.resolve())
+
+    @classmethod
+    def _detached(cls, name: str, db_path: Path) -> "DBMgr":
+        """Return a non-singleton DBMgr bound to *db_path*, for background workers.
+
+        Rebinding the shared instance from another thread would change the
+        caller's binding, so the write-behind worker executes through these.
+        """
+        mgr = object.__new__(DBMgr)
+        mgr._tx_conn = None
+        mgr._name = name
+        mgr._db_path = db_path
+        mgr._db_key = str(db_path.resolve())
+        return mgr
 
     # -----------------------------------------------------------------------
     # Path resolution helpers
@@ -376,21 +424,16 @@ class DBMgr:
         if name == _PRIMARY_ALIAS:
             return DBMgr._require_primary_path()
 
-        conn = sqlite3.connect(str(DBMgr._require_primary_path()))
-        try:
-            conn.row_factory = sqlite3.Row
-            row = conn.execute("SELECT path FROM databases WHERE name = ?", (name,)).fetchone()
-            if row is None:
-                raise ValueError(
-                    f"Database '{name}' not found in catalog. "
-                    f"Register it first with Register('{name}', 'filename.db'). "
-                    f"Use List() to see registered databases."
-                )
-            db_path = Path(row["path"])
-            DBMgr._ensure_database_present(name, db_path)
-            return db_path
-        finally:
-            conn.close()
+        rows = DBMgr._catalog_execute("SELECT path FROM databases WHERE name = ?", (name,), fetch=True)
+        if not rows:
+            raise ValueError(
+                f"Database '{name}' not found in catalog. "
+                f"Register it first with Register('{name}', 'filename.db'). "
+                f"Use List() to see registered databases."
+            )
+        db_path = Path(rows[0]["path"])
+        DBMgr._ensure_database_present(name, db_path)
+        return db_path
 
     # -----------------------------------------------------------------------
     # Validation helpers (Phase 6)
@@ -535,7 +578,7 @@ class DBMgr:
         """
         DBMgr._ensure_catalog_consistency()
         DBMgr._ensure_database_present(self._name, self._db_path)
-        conn = sqlite3.connect(str(self._db_path))
+        conn = sqlite3.connect(str(self._db_path), cached_statements=_STATEMENT_CACHE_SIZE, check_same_thread=False)
         conn.row_factory = sqlite3.Row
         try:
             self._apply_pragmas(conn)
@@ -545,7 +588,7 @@ class DBMgr:
                 conn.close()
                 self._recover_from_corruption()
                 # Reconnect to the recovered database
-                conn = sqlite3.connect(str(self._db_path))
+                conn = sqlite3.connect(str(self._db_path), cached_statements=_STATEMENT_CACHE_SIZE, check_same_thread=False)
                 conn.row_factory = sqlite3.Row
                 self._apply_pragmas(conn)
             else:
@@ -554,15 +597,14 @@ class DBMgr:
         return conn
 
     def _open_read_connection(self) -> sqlite3.Connection:
-        """Return a pooled read connection for the bound database."""
+        """Return this thread's pooled read connection for the bound database."""
         DBMgr._ensure_catalog_consistency()
         DBMgr._ensure_database_present(self._name, self._db_path)
-        db_key = str(self._db_path.resolve())
-        conn = DBMgr._read_connections.get(db_key)
-        if conn is not None:
-            return conn
+        return DBMgr._get_pooled_connection(self._db_key, self._connect_read_only, role="read")
 
-        conn = sqlite3.connect(str(self._db_path), isolation_level=None)
+    def _connect_read_only(self) -> sqlite3.Connection:
+        """Open an autocommit, ``query_only`` connection to the bound database."""
+        conn = sqlite3.connect(str(self._db_path), isolation_level=None, cached_statements=_STATEMENT_CACHE_SIZE, check_same_thread=False)
         conn.row_factory = sqlite3.Row
         try:
             self._apply_pragmas(conn)
@@ -572,26 +614,19 @@ class DBMgr:
             if "malformed" in msg or "file is not a database" in msg:
                 conn.close()
                 self._recover_from_corruption()
-                conn = sqlite3.connect(str(self._db_path), isolation_level=None)
+                conn = sqlite3.connect(str(self._db_path), isolation_level=None, cached_statements=_STATEMENT_CACHE_SIZE, check_same_thread=False)
                 conn.row_factory = sqlite3.Row
                 self._apply_pragmas(conn)
                 conn.execute("PRAGMA query_only = ON")
             else:
                 conn.close()
                 raise
-        DBMgr._read_connections[db_key] = conn
         return conn
 
     @classmethod
     def _close_read_connection(cls, db_key: str) -> None:
-        """Close one pooled read connection, ignoring any errors."""
-        conn = cls._read_connections.pop(db_key, None)
-        if conn is None:
-            return
-        try:
-            conn.close()
-        except Exception:
-            pass
+        """Close this thread's pooled read connection, ignoring any errors."""
+        cls._discard_pooled_connection(db_key, role="read")
 
     @staticmethod
     def _close_connection(conn: sqlite3.Connection) -> None:
@@ -601,6 +636,117 @@ class DBMgr:
         except Exception:
             pass
 
+    @classmethod
+    def _pooled_connections(cls) -> dict:
+        """Return this thread's ``{(role, db_key): (connection, epoch)}`` pool."""
+        conns = getattr(cls._pool, "connections", None)
+        if conns is None:
+            conns = {}
+            cls._pool.connections = conns
+        return conns
+
+    @classmethod
+    def _get_pooled_connection(cls, db_key: str, opener, role: str = "write") -> sqlite3.Connection:
+        """Return this thread's persistent *role* connection for *db_key*, opening it on first use."""
+        conns = cls._pooled_connections()
+        entry = conns.get((role, db_key))
+        if entry is not None:
+            if entry[1] == DBMgr._pool_epochs.get(db_key, 0):
+                return entry[0]
+            cls._close_pooled(db_key, entry[0])
+            del conns[(role, db_key)]
+        conn = opener()
+        # Read the epoch after opening: the opener may have run corruption recovery.
+        with DBMgr._pool_lock:
+            conns[(role, db_key)] = (conn, DBMgr._pool_epochs.get(db_key, 0))
+            DBMgr._pool_open.setdefault(db_key, set()).add(conn)
+        return conn
+
+    @classmethod
+    def _close_pooled(cls, db_key: str, conn: sqlite3.Connection) -> None:
+        """Close a pooled connection and drop it from the cross-thread registry."""
+        with DBMgr._pool_lock:
+            open_conns = DBMgr._pool_open.get(db_key)
+            if open_conns is not None:
+                open_conns.discard(conn)
+                if not open_conns:
+                    del DBMgr._pool_open[db_key]
+        DBMgr._close_connection(conn)
+
+    @classmethod
+    def _discard_pooled_connection(cls, db_key: str, role: str = "write") -> None:
+        """Close and forget this thread's pooled *role* connection for *db_key*."""
+        entry = cls._pooled_connections().pop((role, db_key), None)
+        if entry is not None:
+            cls._close_pooled(db_key, entry[0])
+
+    @classmethod
+    def _invalidate_pooled_connections(cls, db_key: str) -> None:
+        """Drop every pooled handle on *db_key* before its files are moved or deleted.
+
+        Every thread's connections (including the write-behind worker's) are
+        closed right away, so the files are no longer held open; the other
+        threads see the bumped epoch and reopen on their next call.
+        """
+        with DBMgr._pool_lock:
+            DBMgr._pool_epochs[db_key] = DBMgr._pool_epochs.get(db_key, 0) + 1
+            open_conns = DBMgr._pool_open.pop(db_key, ())
+        for conn in open_conns:
+            DBMgr._close_connection(conn)
+        cls._discard_pooled_connection(db_key)
+        cls._close_read_connection(db_key)
+        cls._forget_schema(db_key)
+
+    @classmethod
+    def _forget_schema(cls, db_key: str) -> None:
+        """Drop cached primary-key lookups for *db_key* after a schema change."""
+        for key in [k for k in DBMgr._pk_cache if k[0] == db_key]:
+            del DBMgr._pk_cache[key]
+
+    @classmethod
+    def CloseConnections(cls) -> None:
+        """Close the calling thread's pooled connections (e.g. before the thread exits)."""
+        conns = cls._pooled_connections()
+        for (_, db_key), (conn, _) in conns.items():
+            cls._close_pooled(db_key, conn)
+        conns.clear()
+
+    def _pooled_write_connection(self) -> sqlite3.Connection:
+        """Return this thread's persistent auto-commit connection to the bound database."""
+        return DBMgr._get_pooled_connection(self._db_key, self._open_connection)
+
+    @classmethod
+    def _catalog_connection(cls) -> sqlite3.Connection:
+        """Return this thread's persistent connection to the PRIMARY catalog."""
+        primary = cls._require_primary_path()
+
+        def _open() -> sqlite3.Connection:
+            conn = sqlite3.connect(str(primary), cached_statements=_STATEMENT_CACHE_SIZE, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            cls._apply_pragmas(conn)
+            return conn
+
+        return cls._get_pooled_connection(str(primary), _open)
+
+    @classmethod
+    def _catalog_execute(cls, sql: str, params: tuple = (), fetch: bool = False) -> Any:
+        """Run one catalog statement on the pooled PRIMARY connection.
+
+        Returns the fetched rows when *fetch* is set, otherwise commits and
+        returns ``cursor.rowcount``.  The connection is discarded on error so
+        a failed statement never leaves a transaction open on it.
+        """
+        conn = cls._catalog_connection()
+        try:
+            cursor = conn.execute(sql, params)
+            if fetch:
+                return cursor.fetchall()
+            conn.commit()
+            return cursor.rowcount
+        except Exception:
+            cls._discard_pooled_connection(str(cls._require_primary_path_raw()))
+            raise
+
     # -----------------------------------------------------------------------
     # Corruption recovery chain (Phase 4)
     # -----------------------------------------------------------------------
@@ -614,6 +760,7 @@ class DBMgr:
         Step 3: Raise ``sqlite3.DatabaseError`` if all steps fail.
         """
 
+        DBMgr._invalidate_pooled_connections(self._db_key)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         db_path = Path(self._db_path)
         corrupt_suffix = f".corrupt_{timestamp}.db"
@@ -686,8 +833,9 @@ class DBMgr:
             sql: SQL statement to execute (with ``?`` placeholders).
             params: Tuple of bind parameters.
             commit:
-                If ``True``: auto-rollback any orphan transaction, open a fresh
-                connection, execute, commit, close. Uses lock-retry with backoff.
+                If ``True``: auto-rollback any orphan transaction, execute on
+                this thread's pooled connection and commit. Lock errors fall
+                back to ``_retry_on_lock`` (fresh connections, with backoff).
                 If ``False``: use the held transaction connection. Raises
                 ``RuntimeError`` if no transaction is active.
             fetch:
@@ -703,24 +851,13 @@ class DBMgr:
 
         # Auto-rollback orphan transactions
         if commit and self._tx_conn is not None:
-            DBMgr._log(
-                f"Orphaned transaction on '{self._name}' auto-rolled back.",
-                "Warning",
-            )
-            try:
-                self._tx_conn.execute("ROLLBACK")
-            except Exception:
-                pass
-            DBMgr._close_connection(self._require_tx_conn())
-            self._tx_conn = None
+            self._rollback_orphan_transaction()
 
         # Determine connection strategy
         if not commit:
             conn = self._require_tx_conn()
-            do_close = False
         else:
-            conn = self._open_connection()
-            do_close = True
+            conn = self._pooled_write_connection()
 
         try:
             cursor = conn.execute(sql, params)
@@ -730,21 +867,26 @@ class DBMgr:
             else:
                 result = cursor.lastrowid or cursor.rowcount
 
-            if do_close:
+            if commit:
                 conn.commit()
 
+            if _is_ddl(sql):
+                DBMgr._forget_schema(self._db_key)
+
             return result
 
         except sqlite3.OperationalError as e:
-            if do_close and "locked" in str(e).lower():
-                DBMgr._close_connection(conn)
+            if commit and "locked" in str(e).lower():
+                DBMgr._discard_pooled_connection(self._db_key)
                 return self._retry_on_lock(sql, params, fetch)
+            if commit:
+                self._reset_pooled_write_connection(conn)
             raise
 
         except sqlite3.DatabaseError as e:
             msg = str(e).lower()
-            if do_close and ("malformed" in msg or "file is not a database" in msg):
-                DBMgr._close_connection(conn)
+            if commit and ("malformed" in msg or "file is not a database" in msg):
+                DBMgr._discard_pooled_connection(self._db_key)
                 self._recover_from_corruption()
                 retry_conn = self._open_connection()
                 try:
@@ -755,51 +897,72 @@ class DBMgr:
                     return retry_cursor.lastrowid or retry_cursor.rowcount
                 finally:
                     DBMgr._close_connection(retry_conn)
+            if commit:
+                self._reset_pooled_write_connection(conn)
             raise
 
-        finally:
-            if do_close:
-                DBMgr._close_connection(conn)
+        except Exception:
+            if commit:
+                self._reset_pooled_write_connection(conn)
+            raise
+
+    def _reset_pooled_write_connection(self, conn: sqlite3.Connection) -> None:
+        """Roll back a failed statement on the pooled connection, discarding it if that fails."""
+        try:
+            conn.rollback()
+        except Exception:
+            DBMgr._discard_pooled_connection(self._db_key)
+
+    def _rollback_orphan_transaction(self) -> None:
+        """Roll back and close a transaction left open by a missing EndTransaction()."""
+        DBMgr._log(
+            f"Orphaned transaction on '{self._name}' auto-rolled back.",
+            "Warning",
+        )
+        try:
+            self._require_tx_conn().execute("ROLLBACK")
+        except Exception:
+            pass
+        DBMgr._close_connection(self._require_tx_conn())
+        self._tx_conn = None
 
-    def _retry_on_lock(self, sql: str, params: tuple, fetch: bool) -> Any:
+    def _retry_on_lock(self, sql: str, params: Any, fetch: bool, many: bool = False) -> Any:
         """Retry a write operation on 'database is locked' errors with backoff.
 
-        3 attempts total with 0.1s / 0.5s delays.
+        3 attempts total with 0.1s / 0.5s delays, each on a fresh connection.
+        With *many*, *params* is a sequence of parameter tuples run through
+        ``executemany`` in one transaction and the total rowcount is returned.
         """
-        delays = [0.1, 0.5]
-        last_error = None
-        for attempt, delay in enumerate(delays):
+
+        def _attempt() -> Any:
+            conn = self._open_connection()
             try:
-                conn = self._open_connection()
-                try:
+                if many:
+                    cursor = conn.executemany(sql, params)
+                    result = cursor.rowcount
+                else:
                     cursor = conn.execute(sql, params)
                     if fetch:
                         result = [dict(row) for row in cursor.fetchall()]
                     else:
                         result = cursor.lastrowid or cursor.rowcount
-                    conn.commit()
-                    return result
-                finally:
-                    DBMgr._close_connection(conn)
+                conn.commit()
+                return result
+            finally:
+                DBMgr._close_connection(conn)
+
+        delays = [0.1, 0.5]
+        for delay in delays:
+            try:
+                return _attempt()
             except sqlite3.OperationalError as e:
                 if "locked" not in str(e).lower():
                     raise
-                last_error = e
                 time.sleep(delay)
 
         # Final attempt
         try:
-            conn = self._open_connection()
-            try:
-                cursor = conn.execute(sql, params)
-                if fetch:
-                    result = [dict(row) for row in cursor.fetchall()]
-                else:
-                    result = cursor.lastrowid or cursor.rowcount
-                conn.commit()
-                return result
-            finally:
-                DBMgr._close_connection(conn)
+            return _attempt()
         except sqlite3.OperationalError as e:
             if "locked" in str(e).lower():
                 raise sqlite3.OperationalError(
@@ -807,6 +970,54 @@ class DBMgr:
                 ) from e
             raise
 
+    def _execute_many(self, sql: str, rows: list, commit: bool = True) -> int:
+        """Run one statement for every parameter tuple in *rows* in a single transaction.
+
+        Same connection, lock-retry and corruption-recovery rules as
+        ``_execute``; returns the total number of rows affected.
+        """
+        if not rows:
+            return 0
+
+        if commit and self._tx_conn is not None:
+            self._rollback_orphan_transaction()
+
+        conn = self._pooled_write_connection() if commit else self._require_tx_conn()
+        try:
+            cursor = conn.executemany(sql, rows)
+            if commit:
+                conn.commit()
+            return cursor.rowcount
+
+        except sqlite3.OperationalError as e:
+            if commit and "locked" in str(e).lower():
+                DBMgr._discard_pooled_connection(self._db_key)
+                return self._retry_on_lock(sql, rows, False, many=True)
+            if commit:
+                self._reset_pooled_write_connection(conn)
+            raise
+
+        except sqlite3.DatabaseError as e:
+            msg = str(e).lower()
+            if commit and ("malformed" in msg or "file is not a database" in msg):
+                DBMgr._discard_pooled_connection(self._db_key)
+                self._recover_from_corruption()
+                retry_conn = self._open_connection()
+                try:
+                    retry_cursor = retry_conn.executemany(sql, rows)
+                    retry_conn.commit()
+                    return retry_cursor.rowcount
+                finally:
+                    DBMgr._close_connection(retry_conn)
+            if commit:
+                self._reset_pooled_write_connection(conn)
+            raise
+
+        except Exception:
+            if commit:
+                self._reset_pooled_write_connection(conn)
+            raise
+
     # =======================================================================
     # PUBLIC API — Lifecycle (Phase 8)
     # =======================================================================
@@ -859,16 +1070,10 @@ class DBMgr:
         DBMgr._ensured_database_paths.add(str(path.resolve()))
 
         # Register in PRIMARY catalog
-        cat = sqlite3.connect(str(DBMgr._require_primary_path()))
-        try:
-            cat.row_factory = sqlite3.Row
-            cat.execute(
-                "INSERT INTO databases (name, path) VALUES (?, ?)",
-                (name, str(path)),
-            )
-            cat.commit()
-        finally:
-            cat.close()
+        DBMgr._catalog_execute(
+            "INSERT INTO databases (name, path) VALUES (?, ?)",
+            (name, str(path)),
+        )
 
         DBMgr._catalog_consistent = True
         DBMgr._log(f"Database '{name}' registered at {path}.", "Info")
@@ -909,18 +1114,14 @@ class DBMgr:
             self._tx_conn = None
 
         # Get path from catalog before deleting the row
-        cat = sqlite3.connect(str(DBMgr._require_primary_path()))
-        try:
-            cat.row_factory = sqlite3.Row
-            row = cat.execute("SELECT path FROM databases WHERE name = ?", (name,)).fetchone()
-            db_path = Path(row["path"]) if row else None
-            cat.execute("DELETE FROM databases WHERE name = ?", (name,))
-            cat.commit()
-        finally:
-            cat.close()
+        rows = DBMgr._catalog_execute("SELECT path FROM databases WHERE name = ?", (name,), fetch=True)
+        db_path = Path(rows[0]["path"]) if rows else None
+        DBMgr._catalog_execute("DELETE FROM databases WHERE name = ?", (name,))
 
         # Delete files if requested
         if delete_file and db_path is not None:
+            DBMgr.FlushWrites()
+            DBMgr._invalidate_pooled_connections(str(db_path.resolve()))
             DBMgr._ensured_database_paths.discard(str(db_path.resolve()))
             for p in [db_path, Path(str(db_path) + "-wal"), Path(str(db_path) + "-shm")]:
                 if p.exists():
@@ -942,13 +1143,8 @@ class DBMgr:
             ``{name: path, ...}`` dictionary of all registered databases.
         """
         DBMgr._ensure_catalog_consistency()
-        cat = sqlite3.connect(str(DBMgr._require_primary_path()))
-        try:
-            cat.row_factory = sqlite3.Row
-            rows = cat.execute("SELECT name, path FROM databases").fetchall()
-            return {row["name"]: row["path"] for row in rows}
-        finally:
-            cat.close()
+        rows = DBMgr._catalog_execute("SELECT name, path FROM databases", fetch=True)
+        return {row["name"]: row["path"] for row in rows}
 
     def Has(self, name: str) -> bool:
         """Check whether a database name is registered in the PRIMARY catalog.
@@ -962,13 +1158,8 @@ class DBMgr:
         DBMgr._ensure_catalog_consistency()
         if name == _PRIMARY_ALIAS:
             return True
-        cat = sqlite3.connect(str(DBMgr._require_primary_path()))
-        try:
-            cat.row_factory = sqlite3.Row
-            row = cat.execute("SELECT 1 FROM databases WHERE name = ?", (name,)).fetchone()
-            return row is not None
-        finally:
-            cat.close()
+        rows = DBMgr._catalog_execute("SELECT 1 FROM databases WHERE name = ?", (name,), fetch=True)
+        return bool(rows)
 
     # =======================================================================
     # PUBLIC API — DDL (Phase 9)
@@ -1126,21 +1317,146 @@ class DBMgr:
         Returns:
             The ``rowid`` of the inserted row.
         """
-        self._validate_identifier(table)
-        for f in fields:
-            self._validate_identifier(f)
         if len(fields) != len(values):
             raise ValueError(
                 f"Insert field/value count mismatch: "
                 f"{len(fields)} fields vs {len(values)} values."
             )
+        sql = self._insert_sql(table, fields)
+        return self._execute(sql, tuple(values), commit=commit, fetch=False)
+
+    def InsertMany(
+        self,
+        table: str,
+        fields: list,
+        rows: list,
+        commit: bool = True,
+    ) -> int:
+        """Insert many rows into a table in a single transaction.
+
+        Args:
+            table: Table name.
+            fields: List of column names shared by every row.
+            rows: List of value sequences, each the same length as *fields*.
+            commit: If ``True`` (default), runs and commits as one transaction.
+                Set ``False`` inside a transaction.
+
+        Returns:
+            Number of rows inserted.
+        """
+        sql = self._insert_sql(table, fields)
+        return self._execute_many(sql, self._check_rows("InsertMany", fields, rows), commit=commit)
+
+    def UpsertMany(
+        self,
+        table: str,
+        fields: list,
+        rows: list,
+        commit: bool = True,
+    ) -> int:
+        """``Merge`` many rows into a table in a single transaction.
+
+        Args:
+            table: Table name.
+            fields: List of column names shared by every row.
+            rows: List of value sequences, each the same length as *fields*.
+            commit: If ``True`` (default), runs and commits as one transaction.
+                Set ``False`` inside a transaction.
+
+        Returns:
+            Number of rows inserted or updated.
+        """
+        sql = self._upsert_sql(table, fields, commit=commit)
+        return self._execute_many(sql, self._check_rows("UpsertMany", fields, rows), commit=commit)
+
+    def _insert_sql(self, table: str, fields: list) -> str:
+        """Return the cached ``INSERT`` statement for *table* / *fields*."""
+        key = ("INSERT", table, tuple(fields))
+        sql = DBMgr._sql_cache.get(key)
+        if sql is None:
+            self._validate_identifier(table)
+            for f in fields:
+                self._validate_identifier(f)
+            if not fields:
+                raise ValueError("Insert requires at least one field.")
+            cols = ", ".join(fields)
+            places = ", ".join(["?"] * len(fields))
+            sql = self._remember_sql(key, f"INSERT INTO {table} ({cols}) VALUES ({places})")
+        return sql
+
+    def _upsert_sql(self, table: str, fields: list, commit: bool = True) -> str:
+        """Return the cached ``Merge`` statement for *table* / *fields*."""
+        self._validate_identifier(table)
+        pk_columns = self._primary_key_columns(table, commit=commit)
+        key = ("UPSERT", table, tuple(fields), pk_columns)
+        sql = DBMgr._sql_cache.get(key)
+        if sql is not None:
+            return sql
+
+        for f in fields:
+            self._validate_identifier(f)
         if not fields:
-            raise ValueError("Insert requires at least one field.")
+            raise ValueError("Merge requires at least one field.")
 
         cols = ", ".join(fields)
-        places = ", ".join(["?"] * len(values))
-        sql = f"INSERT INTO {table} ({cols}) VALUES ({places})"
-        return self._execute(sql, tuple(values), commit=commit, fetch=False)
+        places = ", ".join(["?"] * len(fields))
+        if not pk_columns:
+            # No PK defined — fall back to simple INSERT
+            sql = f"INSERT INTO {table} ({cols}) VALUES ({places})"
+        else:
+            # UPDATE SET for non-PK columns
+            pk_list = ", ".join(pk_columns)
+            non_pk_fields = [f for f in fields if f not in pk_columns]
+            if non_pk_fields:
+                update_parts = ", ".join(f"{f} = excluded.{f}" for f in non_pk_fields)
+                sql = (
+                    f"INSERT INTO {table} ({cols}) VALUES ({places}) "
+                    f"ON CONFLICT({pk_list}) DO UPDATE SET {update_parts}"
+                )
+            else:
+                # All columns are PK — conflict means nothing to update
+                sql = f"INSERT OR IGNORE INTO {table} ({cols}) VALUES ({places})"
+        return self._remember_sql(key, sql)
+
+    def _primary_key_columns(self, table: str, commit: bool = True) -> tuple[str, ...]:
+        """Return the PRIMARY KEY column(s) of *table*, cached until a schema change.
+
+        Inside a transaction (``commit=False``) the schema is read fresh, since
+        the transaction may be the one changing it.
+        """
+        key = (self._db_key, table)
+        if commit:
+            cached = DBMgr._pk_cache.get(key)
+            if cached is not None:
+                return cached
+        schema = self.GetSchema(table, commit=commit)
+        pk_columns = tuple(s["name"] for s in schema if s["pk"])
+        if commit and schema:
+            DBMgr._pk_cache[key] = pk_columns
+        return pk_columns
+
+    @staticmethod
+    def _remember_sql(key: tuple, sql: str) -> str:
+        """Store a generated statement in the bounded process-wide SQL cache."""
+        if len(DBMgr._sql_cache) >= _SQL_CACHE_LIMIT:
+            DBMgr._sql_cache.clear()
+        DBMgr._sql_cache[key] = sql
+        return sql
+
+    @staticmethod
+    def _check_rows(op: str, fields: list, rows: list) -> list:
+        """Validate row widths for the batch APIs and return them as tuples."""
+        width = len(fields)
+        checked = []
+        for row in rows:
+            row = tuple(row)
+            if len(row) != width:
+                raise ValueError(
+                    f"{op} field/value count mismatch: "
+                    f"{width} fields vs {len(row)} values."
+                )
+            checked.append(row)
+        return checked
 
     def Update(
         self,
@@ -1246,18 +1562,9 @@ class DBMgr:
             params = ()
 
         if self._tx_conn is not None:
-            DBMgr._log(
-                f"Orphaned transaction on '{self._name}' auto-rolled back.",
-                "Warning",
-            )
-            try:
-                self._tx_conn.execute("ROLLBACK")
-            except Exception:
-                pass
-            DBMgr._close_connection(self._require_tx_conn())
-            self._tx_conn = None
+            self._rollback_orphan_transaction()
 
-        db_key = str(self._db_path.resolve())
+        db_key = self._db_key
         conn = self._open_read_connection()
         try:
             cursor = conn.execute(sql, params)
@@ -1284,7 +1591,7 @@ class DBMgr:
     def _retry_select_on_lock(self, sql: str, params: tuple) -> list[dict]:
         """Retry a standalone SELECT on lock errors with backoff."""
         delays = [0.1, 0.5]
-        db_key = str(self._db_path.resolve())
+        db_key = self._db_key
         for delay in delays:
             try:
                 conn = self._open_read_connection()
@@ -1346,46 +1653,12 @@ class DBMgr:
         Returns:
             The ``rowid`` of the inserted or updated row.
         """
-        self._validate_identifier(table)
-        for f in fields:
-            self._validate_identifier(f)
         if len(fields) != len(values):
             raise ValueError(
                 f"Merge field/value count mismatch: "
                 f"{len(fields)} fields vs {len(values)} values."
             )
-        if not fields:
-            raise ValueError("Merge requires at least one field.")
-
-        # Auto-detect PK column(s)
-        schema = self.GetSchema(table, commit=commit)
-        pk_columns = [s["name"] for s in schema if s["pk"]]
-        if not pk_columns:
-            # No PK defined — fall back to simple INSERT
-            cols = ", ".join(fields)
-            places = ", ".join(["?"] * len(values))
-            sql = f"INSERT INTO {table} ({cols}) VALUES ({places})"
-            return self._execute(sql, tuple(values), commit=commit, fetch=False)
-
-        # Build UPSERT
-        cols = ", ".join(fields)
-        places = ", ".join(["?"] * len(values))
-        pk_list = ", ".join(pk_columns)
-
-        # UPDATE SET for non-PK columns
-        non_pk_fields = [f for f in fields if f not in pk_columns]
-        if non_pk_fields:
-            update_parts = ", ".join(f"{f} = excluded.{f}" for f in non_pk_fields)
-            sql = (
-                f"INSERT INTO {table} ({cols}) VALUES ({places}) "
-                f"ON CONFLICT({pk_list}) DO UPDATE SET {update_parts}"
-            )
-        else:
-            # All columns are PK — conflict means nothing to update
-            sql = (
-                f"INSERT OR IGNORE INTO {table} ({cols}) VALUES ({places})"
-            )
-
+        sql = self._upsert_sql(table, fields, commit=commit)
         return self._execute(sql, tuple(values), commit=commit, fetch=False)
 
     # =======================================================================
@@ -1659,6 +1932,7 @@ class DBMgr:
                 f"Cannot backup '{self._name}' while a transaction is active. "
                 f"End the transaction first."
             )
+        DBMgr.FlushWrites()
 
         target_folder = Path(target_folder)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -1701,6 +1975,7 @@ class DBMgr:
             raise RuntimeError(
                 f"Cannot export '{self._name}' while a transaction is active."
             )
+        DBMgr.FlushWrites()
 
         target_path = Path(target_path).resolve()
         if target_path.exists():
@@ -1840,3 +2115,179 @@ class DBMgr:
         # DDL — execute without expecting a return value
         self._execute(sql, params, commit=commit, fetch=False)
         return None
+
+    # =======================================================================
+    # PUBLIC API — Write-behind (Phase 15)
+    # =======================================================================
+
+    @classmethod
+    def StartWriteBehind(cls, flush_interval_ms: int = 50) -> None:
+        """Start the background worker that commits deferred writes.
+
+        ``InsertDeferred``/``UpsertDeferred`` calls are queued and the worker
+        commits them every *flush_interval_ms* (or every
+        ``_WRITE_BEHIND_MAX_BATCH`` writes), running consecutive writes of the
+        same statement as one ``executemany`` transaction.  Lock retries and
+        corruption recovery apply exactly as for direct writes; failures are
+        logged and counted in ``GetWriteBehindErrors()``.
+
+        Idempotent: calling it while the worker runs only updates the interval.
+        """
+        DBMgr._wb_interval = max(0, int(flush_interval_ms)) / 1000.0
+        if DBMgr._wb_thread is not None and DBMgr._wb_thread.is_alive():
+            return
+        DBMgr._wb_queue = queue.Queue()
+        DBMgr._wb_thread = threading.Thread(
+            target=DBMgr._write_behind_loop,
+            args=(DBMgr._wb_queue,),
+            name="DBMgr-write-behind",
+            daemon=True,
+        )
+        DBMgr._wb_thread.start()
+        if not DBMgr._wb_atexit_registered:
+            import atexit
+
+            atexit.register(DBMgr.StopWriteBehind)
+            DBMgr._wb_atexit_registered = True
+
+    @classmethod
+    def StopWriteBehind(cls, flush: bool = True, timeout: Optional[float] = 5.0) -> None:
+        """Stop the write-behind worker, committing queued writes first when *flush* is set."""
+        worker, q = DBMgr._wb_thread, DBMgr._wb_queue
+        if worker is None or q is None:
+            return
+        if not flush:
+            try:
+                while True:
+                    q.get_nowait()
+                    q.task_done()
+            except queue.Empty:
+                pass
+        q.put(None)
+        worker.join(timeout)
+        DBMgr._wb_thread = None
+        DBMgr._wb_queue = None
+
+    @classmethod
+    def IsWriteBehindActive(cls) -> bool:
+        """Return ``True`` while the write-behind worker is running."""
+        return DBMgr._wb_thread is not None and DBMgr._wb_thread.is_alive()
+
+    @classmethod
+    def GetWriteBehindErrors(cls) -> int:
+        """Return how many deferred write batches failed since the process started."""
+        return DBMgr._wb_errors
+
+    @classmethod
+    def FlushWrites(cls, timeout: Optional[float] = None) -> bool:
+        """Block until every queued deferred write is committed.
+
+        Returns:
+            ``False`` if *timeout* (seconds) expired first, ``True`` otherwise
+            (including when write-behind is not running).
+        """
+        q = DBMgr._wb_queue
+        if q is None or threading.current_thread() is DBMgr._wb_thread:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with q.all_tasks_done:
+            while q.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                q.all_tasks_done.wait(remaining)
+        return True
+
+    def InsertDeferred(self, table: str, fields: list, values: list) -> None:
+        """Queue an ``Insert`` for the write-behind worker.
+
+        Runs immediately (like ``Insert``) when write-behind is not active.
+        Deferred writes commit on their own, outside any transaction held by
+        this instance, and return no rowid.
+        """
+        if len(fields) != len(values):
+            raise ValueError(
+                f"Insert field/value count mismatch: "
+                f"{len(fields)} fields vs {len(values)} values."
+            )
+        self._defer(self._insert_sql(table, fields), tuple(values))
+
+    def UpsertDeferred(self, table: str, fields: list, values: list) -> None:
+        """Queue a ``Merge`` for the write-behind worker (see ``InsertDeferred``)."""
+        if len(fields) != len(values):
+            raise ValueError(
+                f"Merge field/value count mismatch: "
+                f"{len(fields)} fields vs {len(values)} values."
+            )
+        self._defer(self._upsert_sql(table, fields), tuple(values))
+
+    def _defer(self, sql: str, params: tuple) -> None:
+        """Queue one write for the worker, or run it now when the worker is off."""
+        q = DBMgr._wb_queue
+        if q is None or not DBMgr.IsWriteBehindActive():
+            self._execute(sql, params, commit=True, fetch=False)
+            return
+        q.put((self._name, self._db_path, sql, params))
+
+    @staticmethod
+    def _write_behind_loop(q: queue.Queue) -> None:
+        """Worker body: gather queued writes for one interval, then commit them in runs."""
+        workers: dict[str, DBMgr] = {}
+        running = True
+        while running:
+            first = q.get()
+            batch = [first]
+            deadline = time.monotonic() + DBMgr._wb_interval
+            while first is not None and len(batch) < _WRITE_BEHIND_MAX_BATCH:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = q.get(timeout=remaining) if remaining > 0 else q.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(item)
+                if item is None:
+                    break
+
+            writes = [item for item in batch if item is not None]
+            running = len(writes) == len(batch)
+            try:
+                DBMgr._commit_write_runs(writes, workers)
+            finally:
+                for _ in batch:
+                    q.task_done()
+        DBMgr.CloseConnections()
+
+    @staticmethod
+    def _commit_write_runs(writes: list, workers: dict) -> None:
+        """Commit queued writes in order, one ``executemany`` per run of identical statements."""
+        start = 0
+        while start < len(writes):
+            name, db_path, sql, _ = writes[start]
+            end = start + 1
+            while end < len(writes) and writes[end][1] == db_path and writes[end][2] == sql:
+                end += 1
+            rows = [w[3] for w in writes[start:end]]
+            start = end
+            key = str(db_path)
+            mgr = workers.get(key)
+            if mgr is None:
+                mgr = DBMgr._detached(name, db_path)
+                workers[key] = mgr
+            try:
+                mgr._execute_many(sql, rows, commit=True)
+                continue
+            except Exception as e:
+                if len(rows) == 1:
+                    with DBMgr._wb_lock:
+                        DBMgr._wb_errors += 1
+                    DBMgr._log(f"Deferred write to '{name}' failed: {e}", "Error")
+                    continue
+            # The run was rolled back as a whole; replay it row by row so only
+            # the offending writes are dropped.
+            for params in rows:
+                try:
+                    mgr._execute(sql, params, commit=True, fetch=False)
+                except Exception as e:
+                    with DBMgr._wb_lock:
+                        DBMgr._wb_errors += 1
+                    DBMgr._log(f"Deferred write to '{name}' failed: {e}", "Error")
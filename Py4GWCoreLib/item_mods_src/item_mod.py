@@ -1,9 +1,9 @@
-from typing import Optional, Type, cast
+from typing import Iterable, Optional, Type, cast
 
 from PyItem import ItemModifier
 
 from Py4GWCoreLib.enums_src.Item_enums import ItemType, Rarity
-from Py4GWCoreLib.item_mods_src.item_modifier_parser import ItemModifierParser
+from Py4GWCoreLib.item_mods_src.item_modifier_parser import ItemModifierParser, ParsedModifiers
 from Py4GWCoreLib.item_mods_src.properties import InherentProperty, InscriptionProperty, ItemProperty, PrefixProperty, SuffixProperty, TargetItemTypeProperty
 from Py4GWCoreLib.item_mods_src._typing import TUpgrade
 from Py4GWCoreLib.item_mods_src.types import ItemUpgradeType
@@ -121,10 +121,48 @@ class ItemMod:
     
     @staticmethod
     def get_item_upgrades_from_modifiers(runtime_modifiers : list[ItemModifier], rarity: Rarity | int = Rarity.Blue) -> tuple[Upgrade | None, Upgrade | None, Upgrade | None, list[Upgrade] | None]:
-        parser = ItemModifierParser(runtime_modifiers, rarity)
-        properties = parser.get_properties()
+        return ItemMod.get_item_upgrades_from_parsed(ItemModifierParser.parse(runtime_modifiers, rarity))
+    
+    @staticmethod
+    def get_item_upgrades_from_parsed(parsed : ParsedModifiers) -> tuple[Upgrade | None, Upgrade | None, Upgrade | None, list[Upgrade] | None]:
+        '''
+        Gets the upgrades of a parsed modifier set. The upgrades are extracted once per shared parse result;
+        the upgrade objects are shared between items with identical modifiers and must not be modified.
+        '''
+        if parsed.upgrades is None:
+            prefix, suffix, inscription, inherent = ItemMod.get_item_upgrades_from_properties(list(parsed.properties), parsed.rarity)
+            parsed.upgrades = (prefix, suffix, inscription, tuple(inherent) if inherent else None)
+        
+        prefix, suffix, inscription, inherent = parsed.upgrades
+        return prefix, suffix, inscription, list(inherent) if inherent else None
+    
+    @staticmethod
+    def get_items_upgrades(item_ids : Iterable[int]) -> dict[int, tuple[Upgrade | None, Upgrade | None, Upgrade | None, list[Upgrade] | None]]:
+        '''
+        Gets the upgrades of many items in one call (e.g. a whole bag). Items with identical modifier sets are parsed only once.
+        '''
+        from Py4GWCoreLib.Item import Item
+        
+        item_ids = list(item_ids)
+        parsed_items = ItemModifierParser.parse_many(
+            (Item.Customization.Modifiers.GetModifiers(item_id), Item.Rarity.GetRarity(item_id)[0])
+            for item_id in item_ids
+        )
+        return {item_id: ItemMod.get_item_upgrades_from_parsed(parsed) for item_id, parsed in zip(item_ids, parsed_items)}
+    
+    @staticmethod
+    def get_bag_upgrades(*bag_ids : int) -> dict[int, tuple[Upgrade | None, Upgrade | None, Upgrade | None, list[Upgrade] | None]]:
+        '''
+        Gets the upgrades of every item in the given bags, keyed by item id.
+        
+        Example usage:
+        
+        for item_id, (prefix, suffix, inscription, inherent) in ItemMod.get_bag_upgrades(Bag.Backpack, Bag.Belt_Pouch).items():
+            ...
+        '''
+        from Py4GWCoreLib.ItemArray import ItemArray
         
-        return ItemMod.get_item_upgrades_from_properties(properties, rarity)
+        return ItemMod.get_items_upgrades(ItemArray.GetItemArray(ItemArray.CreateBagList(*bag_ids)))
     
     @staticmethod
     def get_item_upgrades_from_properties(properties : list[ItemProperty], rarity: Rarity | int = Rarity.Blue) -> tuple[Upgrade | None, Upgrade | None, Upgrade | None, list[Upgrade] | None]:
@@ -154,8 +192,7 @@ class ItemMod:
         rarity, _ = Item.Rarity.GetRarity(item_id)
         runtime_modifiers = Item.Customization.Modifiers.GetModifiers(item_id)
         
-        parser = ItemModifierParser(runtime_modifiers, rarity)
-        properties = parser.get_properties()
+        properties = ItemModifierParser.parse(runtime_modifiers, rarity).properties
         target_item_type_prop = next((p for p in properties if isinstance(p, TargetItemTypeProperty)), None)
         
         return target_item_type_prop.item_type if target_item_type_prop else None
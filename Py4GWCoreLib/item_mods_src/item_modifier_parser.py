@@ -3,89 +3,177 @@ from PyItem import ItemModifier
 from Py4GWCoreLib.enums_src.Item_enums import Rarity
 from Py4GWCoreLib.item_mods_src.decoded_modifier import DecodedModifier
 from Py4GWCoreLib.item_mods_src.properties import InherentProperty, InscriptionProperty, ItemProperty, PrefixProperty, SuffixProperty
-from typing import TypeVar, cast
+from typing import Iterable, Optional, TypeVar, cast
 
 T = TypeVar("T", bound=ItemProperty)
 
+# Parsed modifier sets kept for reuse; least recently used entries are dropped first.
+_PARSE_CACHE_LIMIT = 4096
+
+ModifierSetKey = tuple[int, tuple[tuple[int, int | str, int, int], ...]]
+
+
+class ParsedModifiers:
+    """
+    Parse result for one set of raw modifiers and rarity.
+    The same instance is shared by every item with an identical modifier set, so treat it as read-only.
+    """
+    __slots__ = ("modifiers", "properties", "rarity", "upgrades")
+
+    def __init__(self, modifiers: tuple[DecodedModifier, ...], properties: tuple[ItemProperty, ...], rarity: Rarity):
+        self.modifiers = modifiers
+        self.properties = properties
+        self.rarity = rarity
+        self.upgrades: Optional[tuple] = None  # filled once by ItemMod.get_item_upgrades_from_modifiers
+
+
+_parse_cache: dict[ModifierSetKey, ParsedModifiers] = {}
+_parse_hits = 0
+_parse_misses = 0
+
+
 class ItemModifierParser:
     def __init__(self, runtime_modifiers: list[ItemModifier], rarity: Rarity | int = Rarity.Blue):
-        self.modifiers: list[DecodedModifier] = []
-        self.properties: list[ItemProperty] = []
         self.rarity: Rarity = Rarity(rarity) if isinstance(rarity, int) else rarity
+        self.parsed: ParsedModifiers = ItemModifierParser.parse(runtime_modifiers, self.rarity)
+        self.modifiers: list[DecodedModifier] = list(self.parsed.modifiers)
+        self.properties: list[ItemProperty] = list(self.parsed.properties)
+
+    @staticmethod
+    def modifier_set_key(runtime_modifiers: list[ItemModifier], rarity: Rarity | int) -> ModifierSetKey:
+        '''
+        Cache key of a modifier set: the raw identifier, bits and args of every valid modifier, plus the rarity.
+        '''
+        return int(rarity), tuple(
+            (mod.GetIdentifier(), mod.GetModBits(), mod.GetArg1(), mod.GetArg2())
+            for mod in runtime_modifiers
+            if mod is not None and mod.IsValid()
+        )
+
+    @staticmethod
+    def parse(runtime_modifiers: list[ItemModifier], rarity: Rarity | int = Rarity.Blue) -> ParsedModifiers:
+        '''
+        Decodes and parses a modifier set, returning the shared cached result when the same set was parsed before.
+        '''
+        global _parse_hits, _parse_misses
+        key = ItemModifierParser.modifier_set_key(runtime_modifiers, rarity)
+        parsed = _parse_cache.pop(key, None)
+        if parsed is not None:
+            _parse_hits += 1
+            _parse_cache[key] = parsed  # re-insert as most recently used
+            return parsed
+
+        _parse_misses += 1
+        rarity = Rarity(rarity) if isinstance(rarity, int) else rarity
+        modifiers = _decode(runtime_modifiers)
+        parsed = ParsedModifiers(tuple(modifiers), tuple(_build_properties(modifiers, rarity)), rarity)
+
+        if len(_parse_cache) >= _PARSE_CACHE_LIMIT:
+            del _parse_cache[next(iter(_parse_cache))]
+        _parse_cache[key] = parsed
+        return parsed
+
+    @staticmethod
+    def parse_many(items: Iterable[tuple[list[ItemModifier], Rarity | int]]) -> list[ParsedModifiers]:
+        '''
+        Parses a batch of (runtime_modifiers, rarity) pairs, e.g. a whole bag. Identical sets are parsed once.
+        '''
+        parse = ItemModifierParser.parse
+        return [parse(runtime_modifiers, rarity) for runtime_modifiers, rarity in items]
+
+    @staticmethod
+    def clear_cache():
+        global _parse_hits, _parse_misses
+        _parse_cache.clear()
+        _parse_hits = 0
+        _parse_misses = 0
+
+    @staticmethod
+    def cache_info() -> dict[str, int]:
+        return {"size": len(_parse_cache), "limit": _PARSE_CACHE_LIMIT, "hits": _parse_hits, "misses": _parse_misses}
 
-        self._decode(runtime_modifiers)
-        self._build_properties()
-
-    def _decode(self, runtime_modifiers: list[ItemModifier]):        
-        for mod in runtime_modifiers:
-            decoded = DecodedModifier.from_runtime(mod)
-            if decoded is not None:
-                self.modifiers.append(decoded)
-
-    def _build_properties(self):
-        from Py4GWCoreLib.item_mods_src.upgrades import _INHERENT_UPGRADES
-        from Py4GWCoreLib.item_mods_src.upgrade_parser import get_property_factory
-        handled_modifiers : list[DecodedModifier] = []    
-        
-        try:
-            for mod in self.modifiers:
-                factory = get_property_factory().get(mod.identifier)
-                if factory:
-                    prop = factory(mod, self.modifiers, self.rarity)
-                        
-                    if prop:
-                        if isinstance(prop, (PrefixProperty, SuffixProperty, InscriptionProperty)):
-                            handled_modifiers.append(prop.modifier)
-                            
-                            if isinstance(prop, PrefixProperty) and (prefix := cast(PrefixProperty, prop)).upgrade:
-                                for p in prefix.upgrade.properties.values():
-                                    if p and p not in handled_modifiers:
-                                        handled_modifiers.append(p.modifier)
-                            
-                            if isinstance(prop, SuffixProperty) and (suffix := cast(SuffixProperty, prop)).upgrade:
-                                for p in suffix.upgrade.properties.values():
-                                    if p and p not in handled_modifiers:
-                                        handled_modifiers.append(p.modifier)
-                            
-                            if isinstance(prop, InscriptionProperty) and (inscription := cast(InscriptionProperty, prop)).upgrade:
-                                for p in inscription.upgrade.properties.values():
-                                    if p and p not in handled_modifiers:
-                                        handled_modifiers.append(p.modifier)
-                        
-                        
-                        #only add if no property of that type already exists, since some modifiers have multiple entries with the same identifier but different args
-                        # if not any(isinstance(p, type(prop)) and p.modifier.arg == prop.modifier.arg for p in self.properties):
-                        self.properties.append(prop)
-                    else:
-                        self.properties.append(ItemProperty(mod, rarity=self.rarity))
-                else:
-                    self.properties.append(ItemProperty(mod, rarity=self.rarity))
-            
-            unhandled_modifiers = [mod for mod in self.modifiers if mod not in handled_modifiers]
-            inherent_types = sorted(_INHERENT_UPGRADES, key=lambda u: len(u.upgrade_info), reverse=True)
-        
-            for inherent_type in inherent_types:
-                matched_modifiers = inherent_type._match_property_modifiers(unhandled_modifiers)
-
-                if matched_modifiers is None:
-                    continue
-                
-                try:
-                    matched_property_modifiers = [prop_mod for _, prop_mod in matched_modifiers]
-                    if not matched_property_modifiers:
-                        continue
-
-                    upgrade = inherent_type.compose_from_modifiers(matched_property_modifiers[0], unhandled_modifiers, self.modifiers, self.rarity)
-                    if upgrade is not None:
-                        self.properties.append(InherentProperty(modifier=matched_property_modifiers[0], rarity=self.rarity, upgrade=upgrade))
-                        unhandled_modifiers = [mod for mod in unhandled_modifiers if mod not in matched_property_modifiers]
-                        
-                except Exception as e:
-                    print(f"Error composing inherent upgrade {inherent_type.__name__}: {e}")
-                    continue
-        
-        except Exception as e:
-            print(f"Error building properties: {e}")
-            
     def get_properties(self) -> list[ItemProperty]:
         return self.properties
+
+
+def _decode(runtime_modifiers: list[ItemModifier]) -> list[DecodedModifier]:
+    modifiers: list[DecodedModifier] = []
+    for mod in runtime_modifiers:
+        decoded = DecodedModifier.from_runtime(mod)
+        if decoded is not None:
+            modifiers.append(decoded)
+    return modifiers
+
+
+def _build_properties(modifiers: list[DecodedModifier], rarity: Rarity) -> list[ItemProperty]:
+    from Py4GWCoreLib.item_mods_src.upgrades import _INHERENT_UPGRADE_REQUIREMENTS
+    from Py4GWCoreLib.item_mods_src.upgrade_parser import get_property_factory
+    property_factory = get_property_factory()
+    properties: list[ItemProperty] = []
+    handled_modifiers : list[DecodedModifier] = []
+
+    try:
+        for mod in modifiers:
+            factory = property_factory.get(mod.identifier)
+            if factory:
+                prop = factory(mod, modifiers, rarity)
+
+                if prop:
+                    if isinstance(prop, (PrefixProperty, SuffixProperty, InscriptionProperty)):
+                        handled_modifiers.append(prop.modifier)
+
+                        if isinstance(prop, PrefixProperty) and (prefix := cast(PrefixProperty, prop)).upgrade:
+                            for p in prefix.upgrade.properties.values():
+                                if p and p not in handled_modifiers:
+                                    handled_modifiers.append(p.modifier)
+
+                        if isinstance(prop, SuffixProperty) and (suffix := cast(SuffixProperty, prop)).upgrade:
+                            for p in suffix.upgrade.properties.values():
+                                if p and p not in handled_modifiers:
+                                    handled_modifiers.append(p.modifier)
+
+                        if isinstance(prop, InscriptionProperty) and (inscription := cast(InscriptionProperty, prop)).upgrade:
+                            for p in inscription.upgrade.properties.values():
+                                if p and p not in handled_modifiers:
+                                    handled_modifiers.append(p.modifier)
+
+
+                    #only add if no property of that type already exists, since some modifiers have multiple entries with the same identifier but different args
+                    # if not any(isinstance(p, type(prop)) and p.modifier.arg == prop.modifier.arg for p in properties):
+                    properties.append(prop)
+                else:
+                    properties.append(ItemProperty(mod, rarity=rarity))
+            else:
+                properties.append(ItemProperty(mod, rarity=rarity))
+
+        unhandled_modifiers = [mod for mod in modifiers if mod not in handled_modifiers]
+        present_identifiers = {mod.identifier for mod in unhandled_modifiers}
+
+        for inherent_type, required_identifiers in _INHERENT_UPGRADE_REQUIREMENTS:
+            if not required_identifiers or any(present_identifiers.isdisjoint(options) for options in required_identifiers):
+                continue
+
+            matched_modifiers = inherent_type._match_property_modifiers(unhandled_modifiers)
+
+            if matched_modifiers is None:
+                continue
+
+            try:
+                matched_property_modifiers = [prop_mod for _, prop_mod in matched_modifiers]
+                if not matched_property_modifiers:
+                    continue
+
+                upgrade = inherent_type.compose_from_modifiers(matched_property_modifiers[0], unhandled_modifiers, modifiers, rarity)
+                if upgrade is not None:
+                    properties.append(InherentProperty(modifier=matched_property_modifiers[0], rarity=rarity, upgrade=upgrade))
+                    unhandled_modifiers = [mod for mod in unhandled_modifiers if mod not in matched_property_modifiers]
+                    present_identifiers = {mod.identifier for mod in unhandled_modifiers}
+
+            except Exception as e:
+                print(f"Error composing inherent upgrade {inherent_type.__name__}: {e}")
+                continue
+
+    except Exception as e:
+        print(f"Error building properties: {e}")
+
+    return properties
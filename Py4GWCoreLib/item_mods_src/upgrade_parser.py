@@ -4,7 +4,7 @@ from Py4GWCoreLib.enums_src.GameData_enums import _ATTRIBUTE_TO_PROFESSION, Ailm
 from Py4GWCoreLib.enums_src.Item_enums import ItemType
 from Py4GWCoreLib.item_mods_src.decoded_modifier import DecodedModifier
 from Py4GWCoreLib.item_mods_src.properties import *
-from Py4GWCoreLib.item_mods_src.types import ItemBaneSpecies, ItemUpgradeType, ModifierIdentifier
+from Py4GWCoreLib.item_mods_src.types import ItemBaneSpecies, ItemUpgradeId, ItemUpgradeType, ModifierIdentifier
 from Py4GWCoreLib.item_mods_src.upgrades import Upgrade, UnknownUpgrade, _UPGRADES
 
 def get_profession_from_attribute(attribute: Attribute) -> Optional[Profession]:
@@ -42,8 +42,17 @@ def get_upgrade_property(modifier: DecodedModifier, all_modifiers: list[DecodedM
     
     return None
 
+# upgrade id -> upgrade types that can be composed from it, filled on first use
+_CREATOR_TYPES: dict[ItemUpgradeId, tuple[type[Upgrade], ...]] = {}
+
+def _get_creator_types(upgrade_id: ItemUpgradeId) -> tuple[type[Upgrade], ...]:
+    creator_types = _CREATOR_TYPES.get(upgrade_id)
+    if creator_types is None:
+        creator_types = _CREATOR_TYPES[upgrade_id] = tuple(t for t in _UPGRADES if t.has_id(upgrade_id))
+    return creator_types
+
 def get_upgrade(modifier : DecodedModifier, remaining_modifiers: list[DecodedModifier], all_modifiers: list[DecodedModifier], upgrade_type: ItemUpgradeType | None = None, rarity: Rarity = Rarity.Blue) -> tuple["Upgrade", ItemUpgradeType]:
-    creator_types = [t for t in _UPGRADES if t.has_id(modifier.upgrade_id) and (upgrade_type is None or t.mod_type == upgrade_type)]
+    creator_types = [t for t in _get_creator_types(modifier.upgrade_id) if upgrade_type is None or t.mod_type == upgrade_type]
     matches: list[tuple[type[Upgrade], Upgrade]] = []
 
     for creator_type in creator_types:
@@ -78,7 +87,13 @@ def get_item_requirement(modifiers: list[DecodedModifier]) -> Attribute:
     return Attribute.None_
 
 
-def get_property_factory() -> dict[ModifierIdentifier, Callable[[DecodedModifier, list[DecodedModifier], Rarity], ItemProperty]]:
+PropertyFactory = Callable[[DecodedModifier, list[DecodedModifier], Rarity], ItemProperty]
+
+def get_property_factory() -> dict[ModifierIdentifier, PropertyFactory]:
+    '''Shared identifier -> property factory table, built once at import. Do not mutate.'''
+    return _PROPERTY_FACTORY
+
+def _build_property_factory() -> dict[ModifierIdentifier, PropertyFactory]:
     return {
         ModifierIdentifier.Empty: lambda m, _, rarity: EmptyProperty(modifier=m, rarity=rarity),
         ModifierIdentifier.Armor1: lambda m, _, rarity: ArmorProperty(modifier=m, armor=m.arg1, rarity=rarity),
@@ -174,3 +189,5 @@ def get_property_factory() -> dict[ModifierIdentifier, Callable[[DecodedModifier
                                                             get_upgrade_property(m, mods, ItemUpgradeType.AppliesToRune, rarity) or
                                                             UnknownUpgradeProperty(modifier=m, upgrade_id=m.upgrade_id, rarity=rarity),
     }
+
+_PROPERTY_FACTORY = _build_property_factory()
@@ -9692,3 +9692,15 @@ _INHERENT_UPGRADES: list[type[Upgrade]] = _get_concrete_upgrade_types(
         HalvesRechargeTimeAttributeUpgrade,
     ),
 )
+
+# Inherent types with the most property instructions first, so the most specific match wins
+_INHERENT_UPGRADES_BY_SIZE: tuple[type[Upgrade], ...] = tuple(
+    sorted(_INHERENT_UPGRADES, key=lambda u: len(u.upgrade_info), reverse=True)
+)
+
+# Same order, with the identifier options each instruction needs; a type can only match
+# modifiers that contain one of the options of every instruction.
+_INHERENT_UPGRADE_REQUIREMENTS: tuple[tuple[type[Upgrade], tuple[frozenset[ModifierIdentifier], ...]], ...] = tuple(
+    (upgrade_type, tuple(frozenset(Upgrade._normalize_property_identifier_spec(inst.identifier)) for inst in upgrade_type.upgrade_info or ()))
+    for upgrade_type in _INHERENT_UPGRADES_BY_SIZE
+)
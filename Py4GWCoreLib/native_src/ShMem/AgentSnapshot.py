@@ -0,0 +1,285 @@
+"""Per-frame struct-of-arrays snapshot of the shared-memory agent array.
+
+The shared-memory agent array only stores (agent_id, agent pointer) pairs, so
+every Agent.GetXY / GetHealth / IsAlive call walks ctypes attributes of the
+live AgentLivingStruct.  AgentSnapshot copies the raw bytes of every agent
+once (one string_at per struct block), unpacks the fields it needs with a
+precompiled struct.Struct and stores them column-wise.  Range, allegiance and
+alive filters and distance sorting then run as list comprehensions over the
+columns instead of per-agent getter calls.
+
+The snapshot is tied to the AgentArraySHMemWrapper it was built from; the
+shared-memory manager creates a new wrapper every frame, so
+AgentSnapshot.current() rebuilds at most once per frame, and spatial grids
+requested through alive_grid() are shared by every caller in that frame.
+"""
+import ctypes
+import math
+import struct
+from typing import Iterable, Optional
+
+from ..context.AgentContext import AgentStruct, AgentLivingStruct
+from ..internals.types import GamePos
+from .structs.AgentArraySSM import AgentArraySHMemWrapper
+from .AgentSpatialGrid import AgentSpatialGrid, DEFAULT_CELL_SIZE
+
+# Mirrors Agent.DEAD_HEALTH_EPSILON
+_DEAD_HEALTH_EPSILON = 1.0 / 400.0
+_LIVING_TYPE_MASK = 0xDB
+_EFFECT_USED_CORPSE = 0x0004
+_EFFECT_DEAD = 0x0010
+_TYPE_MAP_DEAD = 0x0008
+
+
+def _row_struct(fields: list[tuple[str, int, str]], base_offset: int = 0) -> struct.Struct:
+    """Compile (name, offset, struct code) fields into one Struct reading from base_offset.
+
+    Fields are unpacked in offset order, with pad bytes for the gaps.
+    """
+    fmt = "<"
+    pos = base_offset
+    for _name, offset, code in sorted(fields, key=lambda f: f[1]):
+        if offset > pos:
+            fmt += f"{offset - pos}x"
+        fmt += code
+        pos = offset + struct.calcsize("<" + code)
+    return struct.Struct(fmt)
+
+
+_POS = AgentStruct.pos.offset
+_BASE_ROW = _row_struct([
+    ("z", AgentStruct.z.offset, "f"),
+    ("x", _POS + GamePos.x.offset, "f"),
+    ("y", _POS + GamePos.y.offset, "f"),
+    ("zplane", _POS + GamePos.zplane.offset, "I"),
+    ("type", AgentStruct.type.offset, "I"),
+])
+
+_LIVING_OFFSET = ctypes.sizeof(AgentStruct)
+_LIVING_ROW = _row_struct([
+    ("model_id", AgentLivingStruct.player_number.offset, "H"),
+    ("hp", AgentLivingStruct.hp.offset, "f"),
+    ("max_hp", AgentLivingStruct.max_hp.offset, "I"),
+    ("effects", AgentLivingStruct.effects.offset, "I"),
+    ("type_map", AgentLivingStruct.type_map.offset, "I"),
+    ("allegiance", AgentLivingStruct.allegiance.offset, "B"),
+    ("skill", AgentLivingStruct.skill.offset, "H"),
+], base_offset=_LIVING_OFFSET)
+
+
+class AgentSnapshot:
+    """Column-wise copy of every agent in one shared-memory agent array.
+
+    Columns are parallel lists indexed by row; index_of maps agent_id -> row.
+    Agent ids that are not in the snapshot resolve to a trailing sentinel row
+    holding the same defaults the Agent getters return for a missing agent
+    (position (0, 0), hp 0, allegiance 0, not living, not alive).
+    """
+
+    _current: Optional["AgentSnapshot"] = None
+    _current_source: Optional[AgentArraySHMemWrapper] = None
+
+    __slots__ = (
+        "ids", "index_of", "x", "y", "z", "zplane", "type", "living", "alive",
+        "allegiance", "hp", "max_hp", "effects", "type_map", "model_id", "skill", "_grids",
+    )
+
+    def __init__(self):
+        self.ids: list[int] = []
+        self.index_of: dict[int, int] = {}
+        self.x: list[float] = []
+        self.y: list[float] = []
+        self.z: list[float] = []
+        self.zplane: list[int] = []
+        self.type: list[int] = []
+        self.living: list[bool] = []
+        self.alive: list[bool] = []
+        self.allegiance: list[int] = []
+        self.hp: list[float] = []
+        self.max_hp: list[int] = []
+        self.effects: list[int] = []
+        self.type_map: list[int] = []
+        self.model_id: list[int] = []
+        self.skill: list[int] = []
+        self._grids: dict[tuple[Optional[int], float], AgentSpatialGrid] = {}
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_wrapper(cls, wrapper: Optional[AgentArraySHMemWrapper]) -> "AgentSnapshot":
+        """Build a snapshot from a shared-memory agent array (or an empty one for None)."""
+        snap = cls()
+        if wrapper is not None:
+            for agent_id, entry in wrapper.to_dict().items():
+                if entry.ptr:
+                    snap._append(agent_id, entry.ptr)
+        snap._append_sentinel()
+        return snap
+
+    @classmethod
+    def current(cls) -> "AgentSnapshot":
+        """Return the snapshot of this frame's shared-memory agent array, building it on first use."""
+        from .SysShaMem import SystemShaMemMgr
+        wrapper = SystemShaMemMgr.get_agent_array_wrapper()
+        if cls._current is None or cls._current_source is not wrapper:
+            cls._current = cls.from_wrapper(wrapper)
+            cls._current_source = wrapper
+        return cls._current
+
+    def _append(self, agent_id: int, ptr: int):
+        z, x, y, zplane, agent_type = _BASE_ROW.unpack(ctypes.string_at(ptr, _BASE_ROW.size))
+        living = (agent_type & _LIVING_TYPE_MASK) != 0
+        if living:
+            model_id, hp, max_hp, effects, type_map, allegiance, skill = _LIVING_ROW.unpack(
+                ctypes.string_at(ptr + _LIVING_OFFSET, _LIVING_ROW.size))
+            alive = (
+                hp > _DEAD_HEALTH_EPSILON
+                and not effects & (_EFFECT_DEAD | _EFFECT_USED_CORPSE)
+                and not type_map & _TYPE_MAP_DEAD
+            )
+        else:
+            model_id = max_hp = effects = type_map = allegiance = skill = 0
+            hp = 0.0
+            alive = False
+
+        self.index_of[agent_id] = len(self.ids)
+        self.ids.append(agent_id)
+        self.x.append(x)
+        self.y.append(y)
+        self.z.append(z)
+        self.zplane.append(zplane)
+        self.type.append(agent_type)
+        self.living.append(living)
+        self.alive.append(alive)
+        self.allegiance.append(allegiance)
+        self.hp.append(hp)
+        self.max_hp.append(max_hp)
+        self.effects.append(effects)
+        self.type_map.append(type_map)
+        self.model_id.append(model_id)
+        self.skill.append(skill)
+
+    def _append_sentinel(self):
+        # Not registered in index_of: it is the fallback row for unknown ids.
+        for column, value in (
+            (self.x, 0.0), (self.y, 0.0), (self.z, 0.0), (self.zplane, 0), (self.type, 0),
+            (self.living, False), (self.alive, False), (self.allegiance, 0), (self.hp, 0.0),
+            (self.max_hp, 0), (self.effects, 0), (self.type_map, 0), (self.model_id, 0), (self.skill, 0),
+        ):
+            column.append(value)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, agent_id: int) -> bool:
+        return agent_id in self.index_of
+
+    def row(self, agent_id: int) -> int:
+        """Return the row of agent_id, or the sentinel row when it is not in the snapshot."""
+        return self.index_of.get(agent_id, len(self.ids))
+
+    def get_xy(self, agent_id: int) -> tuple[float, float]:
+        r = self.row(agent_id)
+        return self.x[r], self.y[r]
+
+    def get_xyz(self, agent_id: int) -> tuple[float, float, float]:
+        r = self.row(agent_id)
+        return self.x[r], self.y[r], self.z[r]
+
+    def get_health(self, agent_id: int) -> float:
+        return self.hp[self.row(agent_id)]
+
+    def get_allegiance(self, agent_id: int) -> int:
+        return self.allegiance[self.row(agent_id)]
+
+    def get_model_id(self, agent_id: int) -> int:
+        return self.model_id[self.row(agent_id)]
+
+    def is_alive(self, agent_id: int) -> bool:
+        return self.alive[self.row(agent_id)]
+
+    def is_living(self, agent_id: int) -> bool:
+        return self.living[self.row(agent_id)]
+
+    # ------------------------------------------------------------------
+    # Column-wise filters and sorts
+    # ------------------------------------------------------------------
+    def _pairs(self, agent_ids: Optional[Iterable[int]]) -> list[tuple[int, int]]:
+        if agent_ids is None:
+            return list(zip(self.ids, range(len(self.ids))))
+        index_of = self.index_of
+        sentinel = len(self.ids)
+        return [(a, index_of.get(a, sentinel)) for a in agent_ids]
+
+    def filter(
+        self,
+        agent_ids: Optional[Iterable[int]] = None,
+        *,
+        allegiance: Optional[int] = None,
+        alive: Optional[bool] = None,
+        living: Optional[bool] = None,
+        center: Optional[tuple[float, float]] = None,
+        max_distance: Optional[float] = None,
+        min_distance: Optional[float] = None,
+    ) -> list[int]:
+        """Return the agent ids (all agents when agent_ids is None) matching every given criterion.
+
+        Input order is preserved.  Distances are measured from center and are
+        inclusive for max_distance and exclusive for min_distance, matching
+        AgentArray.Filter.ByDistance and its negate form.
+        """
+        pairs = self._pairs(agent_ids)
+        if allegiance is not None:
+            column = self.allegiance
+            pairs = [p for p in pairs if column[p[1]] == allegiance]
+        if alive is not None:
+            column = self.alive
+            pairs = [p for p in pairs if column[p[1]] == alive]
+        if living is not None:
+            column = self.living
+            pairs = [p for p in pairs if column[p[1]] == living]
+        if center is not None and (max_distance is not None or min_distance is not None):
+            cx, cy = center[0], center[1]
+            xs, ys = self.x, self.y
+            if max_distance is not None:
+                r2 = max_distance * max_distance
+                pairs = [p for p in pairs if (xs[p[1]] - cx) ** 2 + (ys[p[1]] - cy) ** 2 <= r2]
+            if min_distance is not None:
+                r2 = min_distance * min_distance
+                pairs = [p for p in pairs if (xs[p[1]] - cx) ** 2 + (ys[p[1]] - cy) ** 2 > r2]
+        return [p[0] for p in pairs]
+
+    def distances(self, agent_ids: Iterable[int], pos: tuple[float, float]) -> list[float]:
+        """Return the distance from pos for each agent id, in input order."""
+        px, py = pos[0], pos[1]
+        xs, ys = self.x, self.y
+        return [math.hypot(xs[r] - px, ys[r] - py) for _, r in self._pairs(agent_ids)]
+
+    def sort_by_distance(self, agent_ids: Iterable[int], pos: tuple[float, float], descending: bool = False) -> list[int]:
+        px, py = pos[0], pos[1]
+        xs, ys = self.x, self.y
+        pairs = self._pairs(agent_ids)
+        pairs.sort(key=lambda p: (xs[p[1]] - px) ** 2 + (ys[p[1]] - py) ** 2, reverse=descending)
+        return [p[0] for p in pairs]
+
+    def sort_by_health(self, agent_ids: Iterable[int], descending: bool = False) -> list[int]:
+        hp = self.hp
+        pairs = self._pairs(agent_ids)
+        pairs.sort(key=lambda p: hp[p[1]], reverse=descending)
+        return [p[0] for p in pairs]
+
+    # ------------------------------------------------------------------
+    # Spatial grids
+    # ------------------------------------------------------------------
+    def alive_grid(self, allegiance: Optional[int] = None, cell_size: float = DEFAULT_CELL_SIZE) -> AgentSpatialGrid:
+        """Return the (cached) spatial grid of alive agents, optionally restricted to one allegiance."""
+        key = (allegiance, float(cell_size))
+        grid = self._grids.get(key)
+        if grid is None:
+            grid = AgentSpatialGrid.from_snapshot(self, self.filter(allegiance=allegiance, alive=True), cell_size)
+            self._grids[key] = grid
+        return grid
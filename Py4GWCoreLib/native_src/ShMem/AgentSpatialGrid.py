@@ -0,0 +1,171 @@
+"""Uniform-grid spatial hash over agent positions.
+
+Agents are bucketed into square cells (Earshot-sized by default) so radius
+queries only visit the cells overlapping the query circle instead of every
+agent.  The grid answers the three questions the targeting helpers keep
+asking: "which agents are within R of a point", "how many neighbours does
+each agent have" and "which agent sits at the centre of the densest cluster".
+
+Grids are cheap to build and are normally obtained per frame through
+AgentSnapshot.alive_grid(), which caches them for the lifetime of the
+snapshot so every Targeting helper in the same frame shares one grid.
+"""
+import math
+from typing import Iterable, Optional, Sequence
+
+# Range.Earshot; duplicated to keep this module free of game imports.
+DEFAULT_CELL_SIZE = 1012.0
+
+
+class AgentSpatialGrid:
+    """Spatial hash of (agent_id, x, y) points.
+
+    Query results are returned in build order (the order of the ids passed
+    in), matching what the equivalent AgentArray.Filter chains return.
+    """
+
+    __slots__ = ("ids", "xs", "ys", "cell_size", "_inv_cell", "_cells", "_index_of")
+
+    def __init__(self, ids: Sequence[int], xs: Sequence[float], ys: Sequence[float], cell_size: float = DEFAULT_CELL_SIZE):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.ids = list(ids)
+        self.xs = list(xs)
+        self.ys = list(ys)
+        self.cell_size = float(cell_size)
+        self._inv_cell = 1.0 / self.cell_size
+        self._index_of = {agent_id: i for i, agent_id in enumerate(self.ids)}
+        cells: dict[tuple[int, int], list[int]] = {}
+        inv = self._inv_cell
+        for i, (x, y) in enumerate(zip(self.xs, self.ys)):
+            key = (math.floor(x * inv), math.floor(y * inv))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [i]
+            else:
+                bucket.append(i)
+        self._cells = cells
+
+    @classmethod
+    def from_snapshot(cls, snapshot, agent_ids: Optional[Iterable[int]] = None, cell_size: float = DEFAULT_CELL_SIZE) -> "AgentSpatialGrid":
+        """Build a grid from an AgentSnapshot over agent_ids (default: every agent in it)."""
+        ids = snapshot.ids if agent_ids is None else list(dict.fromkeys(agent_ids))
+        rows = [snapshot.row(agent_id) for agent_id in ids]
+        return cls(ids, [snapshot.x[r] for r in rows], [snapshot.y[r] for r in rows], cell_size)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, agent_id: int) -> bool:
+        return agent_id in self._index_of
+
+    # ------------------------------------------------------------------
+    # Radius queries
+    # ------------------------------------------------------------------
+    def _indices_within(self, x: float, y: float, radius: float) -> list[int]:
+        if radius < 0:
+            return []
+        inv = self._inv_cell
+        ix0, ix1 = math.floor((x - radius) * inv), math.floor((x + radius) * inv)
+        iy0, iy1 = math.floor((y - radius) * inv), math.floor((y + radius) * inv)
+        cells = self._cells
+        xs, ys = self.xs, self.ys
+        r2 = radius * radius
+        found = []
+        if (ix1 - ix0 + 1) * (iy1 - iy0 + 1) > len(cells):
+            # Query covers more cells than are occupied: walk the occupied ones.
+            for (cx, cy), bucket in cells.items():
+                if ix0 <= cx <= ix1 and iy0 <= cy <= iy1:
+                    found.extend(i for i in bucket if (xs[i] - x) ** 2 + (ys[i] - y) ** 2 <= r2)
+        else:
+            for cx in range(ix0, ix1 + 1):
+                for cy in range(iy0, iy1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket:
+                        found.extend(i for i in bucket if (xs[i] - x) ** 2 + (ys[i] - y) ** 2 <= r2)
+        return found
+
+    def query_radius(self, x: float, y: float, radius: float) -> list[int]:
+        """Return the ids within radius (inclusive) of (x, y), in build order."""
+        ids = self.ids
+        return [ids[i] for i in sorted(self._indices_within(x, y, radius))]
+
+    def count_within(self, x: float, y: float, radius: float) -> int:
+        """Return how many agents lie within radius (inclusive) of (x, y)."""
+        return len(self._indices_within(x, y, radius))
+
+    def neighbor_counts(self, radius: float, agent_ids: Optional[Iterable[int]] = None) -> dict[int, int]:
+        """Return {agent_id: number of other grid agents within radius} for agent_ids (default: all)."""
+        xs, ys = self.xs, self.ys
+        if agent_ids is None:
+            return {a: self.count_within(xs[i], ys[i], radius) - 1 for i, a in enumerate(self.ids)}
+        index_of = self._index_of
+        result = {}
+        for agent_id in agent_ids:
+            i = index_of.get(agent_id)
+            if i is not None:
+                result[agent_id] = self.count_within(xs[i], ys[i], radius) - 1
+        return result
+
+    # ------------------------------------------------------------------
+    # Clusters
+    # ------------------------------------------------------------------
+    def clusters(self, radius: float) -> list[list[int]]:
+        """Group agents into connected clusters where linked agents are within radius.
+
+        Links are found by comparing each occupied cell with itself and its
+        forward neighbour cells (union-find), so every pair closer than
+        radius is tested exactly once.  Clusters and their members are
+        ordered by first appearance in build order.
+        """
+        n = len(self.ids)
+        parent = list(range(n))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        if radius >= 0:
+            xs, ys, cells = self.xs, self.ys, self._cells
+            r2 = radius * radius
+            span = math.ceil(radius * self._inv_cell)
+            forward = [(dx, dy) for dx in range(0, span + 1) for dy in range(-span, span + 1) if dx > 0 or dy > 0]
+            for (cx, cy), bucket in cells.items():
+                for k, i in enumerate(bucket):
+                    xi, yi = xs[i], ys[i]
+                    for j in bucket[k + 1:]:
+                        if (xs[j] - xi) ** 2 + (ys[j] - yi) ** 2 <= r2:
+                            ri, rj = find(i), find(j)
+                            if ri != rj:
+                                parent[max(ri, rj)] = min(ri, rj)
+                for dx, dy in forward:
+                    other = cells.get((cx + dx, cy + dy))
+                    if not other:
+                        continue
+                    for i in bucket:
+                        xi, yi = xs[i], ys[i]
+                        for j in other:
+                            if (xs[j] - xi) ** 2 + (ys[j] - yi) ** 2 <= r2:
+                                ri, rj = find(i), find(j)
+                                if ri != rj:
+                                    parent[max(ri, rj)] = min(ri, rj)
+
+        groups: dict[int, list[int]] = {}
+        ids = self.ids
+        for i in range(n):
+            groups.setdefault(find(i), []).append(ids[i])
+        return list(groups.values())
+
+    def densest_cluster_center(self, radius: float) -> int:
+        """Return the agent closest to the centre of mass of the largest cluster (0 when empty)."""
+        if not self.ids:
+            return 0
+        largest = max(self.clusters(radius), key=len)
+        index_of, xs, ys = self._index_of, self.xs, self.ys
+        rows = [index_of[agent_id] for agent_id in largest]
+        cx = sum(xs[i] for i in rows) / len(rows)
+        cy = sum(ys[i] for i in rows) / len(rows)
+        best = min(rows, key=lambda i: (xs[i] - cx) ** 2 + (ys[i] - cy) ** 2)
+        return self.ids[best]
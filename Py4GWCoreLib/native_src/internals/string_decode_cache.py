@@ -0,0 +1,203 @@
+"""Bounded, persistent cache of decoded string-table text.
+
+One cache holds the decoded display strings of a single language, keyed by the
+raw encoded bytes (the wchar_t buffer passed to string_table.decode).  It is
+tied to a fingerprint of the string table it was decoded from, so a cache
+written before a game update (different dat files) is discarded on load.
+
+Entries are kept in least-recently-used order and the oldest are dropped once
+the limit is reached.  The cache is shared between the game thread and the
+background decode thread, so every access takes the lock.
+
+File layout (little-endian):
+
+    header      _HEADER (magic, version, language, fingerprint length,
+                entry count, payload crc32)
+    fingerprint utf-8 bytes
+    entries     [u16 raw length | raw bytes | u32 text length | utf-8 text] * count
+
+Entries are written oldest first, so a loaded cache keeps its LRU order.
+
+This module only depends on the standard library.
+"""
+from __future__ import annotations
+
+import os
+import struct
+import threading
+import zlib
+from typing import Iterable, Optional
+
+STRING_CACHE_MAGIC = b"P4SC"
+STRING_CACHE_FORMAT_VERSION = 1
+DEFAULT_CACHE_LIMIT = 50_000
+
+# magic, version, language, fingerprint length, entry count, payload crc
+_HEADER = struct.Struct("<4sHHHII")
+_RAW_LEN = struct.Struct("<H")
+_TEXT_LEN = struct.Struct("<I")
+
+
+def table_fingerprint(language: int, entries_per_file: int, crc: int, entry_count: int) -> str:
+    """Fingerprint of a loaded string table: language, layout and a crc32 of the dat file data."""
+    return f"{language}:{entries_per_file}:{entry_count}:{crc & 0xFFFFFFFF:08x}"
+
+
+class StringDecodeCache:
+    """LRU map of raw encoded bytes -> decoded text for one language / table fingerprint."""
+
+    def __init__(self, language: int, fingerprint: str = "", limit: int = DEFAULT_CACHE_LIMIT):
+        self.language = language
+        self.fingerprint = fingerprint
+        self.limit = max(1, limit)
+        self._entries: dict[bytes, str] = {}
+        self._lock = threading.Lock()
+        self.unsaved = 0          # entries added since the last load / save
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, raw: bytes) -> bool:
+        return raw in self._entries
+
+    def get(self, raw: bytes) -> Optional[str]:
+        with self._lock:
+            text = self._entries.pop(raw, None)
+            if text is None:
+                self.misses += 1
+                return None
+            self._entries[raw] = text  # re-insert as most recently used
+            self.hits += 1
+            return text
+
+    def put(self, raw: bytes, text: str) -> None:
+        with self._lock:
+            entries = self._entries
+            if entries.pop(raw, None) is None:
+                self.unsaved += 1
+                while len(entries) >= self.limit:
+                    del entries[next(iter(entries))]
+                    self.evictions += 1
+            entries[raw] = text
+
+    def update(self, items: Iterable[tuple[bytes, str]]) -> None:
+        for raw, text in items:
+            self.put(raw, text)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.unsaved = 0
+
+    def items(self) -> list[tuple[bytes, str]]:
+        """Snapshot of the entries, least recently used first."""
+        with self._lock:
+            return list(self._entries.items())
+
+    def info(self) -> dict:
+        return {
+            "language": self.language,
+            "fingerprint": self.fingerprint,
+            "size": len(self._entries),
+            "limit": self.limit,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "unsaved": self.unsaved,
+        }
+
+    # ─── Persistence ───────────────────────────────────────────────────
+
+    def save(self, filepath: str) -> bool:
+        """Write the cache to filepath (atomically). Returns False when there is nothing to write."""
+        if not self.fingerprint:
+            return False
+        with self._lock:
+            items = list(self._entries.items())
+            self.unsaved = 0
+
+        parts: list[bytes] = []
+        pack_raw, pack_text = _RAW_LEN.pack, _TEXT_LEN.pack
+        count = 0
+        for raw, text in items:
+            if len(raw) > 0xFFFF:
+                continue
+            encoded = text.encode("utf-8")
+            parts.append(pack_raw(len(raw)))
+            parts.append(raw)
+            parts.append(pack_text(len(encoded)))
+            parts.append(encoded)
+            count += 1
+        payload = b"".join(parts)
+        fingerprint = self.fingerprint.encode("utf-8")
+        header = _HEADER.pack(
+            STRING_CACHE_MAGIC, STRING_CACHE_FORMAT_VERSION, self.language & 0xFFFF,
+            len(fingerprint), count, zlib.crc32(payload),
+        )
+
+        folder = os.path.dirname(filepath)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp_path = f"{filepath}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.write(fingerprint)
+            f.write(payload)
+        os.replace(tmp_path, filepath)
+        return True
+
+    @classmethod
+    def load(cls, filepath: str, language: int, fingerprint: str, limit: int = DEFAULT_CACHE_LIMIT) -> "StringDecodeCache":
+        """Load a saved cache; returns an empty cache when the file is missing, corrupt or from another table."""
+        cache = cls(language, fingerprint, limit)
+        entries = read_string_cache(filepath, language, fingerprint)
+        if entries:
+            # keep the most recently used entries when the limit shrank
+            with cache._lock:
+                cache._entries.update(entries[-cache.limit:])
+        return cache
+
+
+def read_string_cache(filepath: str, language: int, fingerprint: str) -> list[tuple[bytes, str]]:
+    """Entries of a saved cache, oldest first; [] when the file does not match language / fingerprint."""
+    try:
+        with open(filepath, "rb") as f:
+            data = f.read()
+    except OSError:
+        return []
+    if len(data) < _HEADER.size:
+        return []
+
+    magic, version, file_language, fp_len, count, payload_crc = _HEADER.unpack_from(data, 0)
+    if magic != STRING_CACHE_MAGIC or version != STRING_CACHE_FORMAT_VERSION or file_language != (language & 0xFFFF):
+        return []
+    pos = _HEADER.size
+    if data[pos:pos + fp_len] != fingerprint.encode("utf-8"):
+        return []
+    pos += fp_len
+    payload = memoryview(data)[pos:]
+    if zlib.crc32(payload) != payload_crc:
+        return []
+
+    entries: list[tuple[bytes, str]] = []
+    unpack_raw, unpack_text = _RAW_LEN.unpack_from, _TEXT_LEN.unpack_from
+    end = len(data)
+    try:
+        for _ in range(count):
+            (raw_len,) = unpack_raw(data, pos)
+            pos += 2
+            raw = data[pos:pos + raw_len]
+            pos += raw_len
+            (text_len,) = unpack_text(data, pos)
+            pos += 4
+            text = data[pos:pos + text_len].decode("utf-8")
+            pos += text_len
+            if pos > end:
+                return []
+            entries.append((raw, text))
+    except (struct.error, UnicodeDecodeError):
+        return []
+    return entries
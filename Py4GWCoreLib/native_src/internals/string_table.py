@@ -19,19 +19,26 @@ Pipeline (encoded codepoints → display text):
   4. Player names bypass all of this — codepoint prefix 0xBA9 followed
      by inline ASCII.
 
-  5. Results are cached by codepoint tuple. Grammar tags ([M], [F], etc.)
-     are stripped in postprocessing.
+  5. Results are cached per language by the raw encoded bytes, in a bounded
+     StringDecodeCache tied to a fingerprint of the loaded table. Caches are
+     saved under data/string_cache and warm-loaded with the table, so names
+     decoded in a previous session are available on the first frame.
+     Grammar tags ([M], [F], etc.) are stripped in postprocessing.
 """
 
+import atexit
 import ctypes
 import ctypes.wintypes
+import os
 import re
 import struct
-from typing import Optional
+import zlib
+from typing import Iterable, Optional
 
 from Py4GWCoreLib.native_src.context.TextContext import TextParser
 from Py4GWCoreLib.native_src.internals.helpers import read_wstr
 from Py4GWCoreLib.native_src.methods.DatFileMethods import read_dat_file_by_hash
+from Py4GWCoreLib.native_src.internals.string_decode_cache import DEFAULT_CACHE_LIMIT, StringDecodeCache, table_fingerprint
 
 
 # ─── Codepoint parsing (base-0x7F00 encoding) ────────────────────────────
@@ -95,6 +102,7 @@ _unpack_hdr = struct.Struct('<HHB').unpack_from
 _pack_Q = struct.Struct('<Q').pack
 _pack_5I = struct.Struct('<5I').pack
 _unpack_5I = struct.Struct('<5I').unpack
+_unpack_H = struct.Struct('<H').unpack_from
 
 # Cached (base_char, bpc) → full char lookup table. Merges the <0x20 char
 # table with the base_char offset range into one flat tuple, eliminating a
@@ -119,10 +127,36 @@ def _rc4_python(key: bytes, data: bytes) -> bytes:
     return bytes(out)
 
 
+def _derive_rc4_key(key: int, _packQ=_pack_Q, _pack5I=_pack_5I, _unpack5I=_unpack_5I) -> bytes:
+    """Key derivation: uint64 → 20-byte pad → custom hash → 20-byte RC4 key."""
+    kb = _packQ(key & 0xFFFFFFFFFFFFFFFF)
+    buf20 = kb + kb + kb[:4]
+
+    w0, w1, w2, w3, w4 = _unpack5I(buf20)
+    M = 0xFFFFFFFF
+
+    a = (w0 + 0x9fb498b3) & M
+    b = (w1 + 0x66b0cd0d + (((a << 5) | (a >> 27)) & M)) & M
+    a30 = ((a << 30) | (a >> 2)) & M
+
+    f_a = (~(a & 0x22222222) & 0x7bf36ae2) & M
+    c = ((((b << 5) | (b >> 27)) & M) + w2 + f_a + 0xf33d5697) & M
+    b30 = ((b << 30) | (b >> 2)) & M
+
+    g = (((a30 ^ 0x59d148c0) & b) ^ 0x59d148c0) & M
+    d = (w3 + (((c << 5) | (c >> 27)) & M) + g + 0xd675e47b) & M
+
+    c30 = ((c << 30) | (c >> 2)) & M
+    h = (((a30 ^ b30) & c) ^ a30) & M
+    e = (h + w4 + (((d << 5) | (d >> 27)) & M) + 0xb453c259 + w0) & M
+
+    return _pack5I(e, (w1 + d) & M, (w2 + c30) & M, (b30 + w3) & M, (a30 + w4) & M)
+
+
 def _decode_entry(
     entry_data: bytes, key: int,
     _CT=_CHAR_TUPLE,
-    _hdr=_unpack_hdr, _packQ=_pack_Q, _pack5I=_pack_5I, _unpack5I=_unpack_5I,
+    _hdr=_unpack_hdr,
     _ct_cache=_char_table_cache,
 ) -> Optional[str]:
     """Decode a string table entry (key derivation + RC4 decrypt + bit-unpack)."""
@@ -136,30 +170,7 @@ def _decode_entry(
     payload_len = total_size - 6
 
     if key != 0:
-        # Key derivation: uint64 → 20-byte pad → custom hash → 20-byte RC4 key
-        kb = _packQ(key & 0xFFFFFFFFFFFFFFFF)
-        buf20 = kb + kb + kb[:4]
-
-        w0, w1, w2, w3, w4 = _unpack5I(buf20)
-        M = 0xFFFFFFFF
-
-        a = (w0 + 0x9fb498b3) & M
-        b = (w1 + 0x66b0cd0d + (((a << 5) | (a >> 27)) & M)) & M
-        a30 = ((a << 30) | (a >> 2)) & M
-
-        f_a = (~(a & 0x22222222) & 0x7bf36ae2) & M
-        c = ((((b << 5) | (b >> 27)) & M) + w2 + f_a + 0xf33d5697) & M
-        b30 = ((b << 30) | (b >> 2)) & M
-
-        g = (((a30 ^ 0x59d148c0) & b) ^ 0x59d148c0) & M
-        d = (w3 + (((c << 5) | (c >> 27)) & M) + g + 0xd675e47b) & M
-
-        c30 = ((c << 30) | (c >> 2)) & M
-        h = (((a30 ^ b30) & c) ^ a30) & M
-        e = (h + w4 + (((d << 5) | (d >> 27)) & M) + 0xb453c259 + w0) & M
-
-        rc4_key = _pack5I(e, (w1 + d) & M, (w2 + c30) & M, (b30 + w3) & M, (a30 + w4) & M)
-        payload = _rc4_decrypt(rc4_key, entry_data[6:total_size])
+        payload = _rc4_decrypt(_derive_rc4_key(key), entry_data[6:total_size])
     else:
         payload = entry_data[6:total_size]
 
@@ -201,11 +212,18 @@ def _decode_entry(
 _string_table: dict[int, bytes] = {}
 _string_table_loaded: bool = False
 _load_enqueued: bool = False
-_loaded_language: int = 0
+_loaded_language: int = 0              # requested language; set when the load is enqueued
+_string_table_language: Optional[int] = None   # language _string_table actually holds
 _string_tables_by_language: dict[int, dict[int, bytes]] = {}
 
-_decode_cache: dict[bytes, str] = {}
-_decode_cache_by_language: dict[tuple[int, bytes], str] = {}
+_table_fingerprints: dict[int, str] = {}
+
+# Decoded text per language (see string_decode_cache.py)
+_DECODE_CACHE_LIMIT = DEFAULT_CACHE_LIMIT
+_SAVE_EVERY = 256           # new entries before a background save is scheduled
+_decode_caches: dict[int, StringDecodeCache] = {}
+_decode_cache_folder: Optional[str] = None  # defaults to <projects>/data/string_cache
+_save_scheduled: set[int] = set()
 _pending: set[bytes] = set()
 
 from concurrent.futures import ThreadPoolExecutor as _TPE
@@ -213,7 +231,6 @@ _decode_pool = _TPE(max_workers=1)
 
 
 
-
 # ─── Postprocessing ──────────────────────────────────────────────────────
 
 _BRACKET_SUBS = {
@@ -668,18 +685,18 @@ def _load_dat_file(file_hash: str) -> Optional[bytes]:
 def _parse_string_file(file_data: bytes, start_index: int, target_table: Optional[dict[int, bytes]] = None) -> int:
     """Parse all entries from a string file into _string_table. Returns count."""
     table = target_table if target_table is not None else _string_table
-    count = 0
+    unpack_H = _unpack_H
     pos = 0
     idx = start_index
-    while pos < len(file_data) - 2:
-        entry_size = struct.unpack_from('<H', file_data, pos)[0]
+    end = len(file_data) - 2
+    while pos < end:
+        entry_size = unpack_H(file_data, pos)[0]
         if entry_size < 6 or entry_size > 8192:
             break
         table[idx] = file_data[pos:pos + entry_size]
         pos += entry_size
         idx += 1
-        count += 1
-    return count
+    return idx - start_index
 
 
 def _load_table_for_language(language: int) -> dict[int, bytes]:
@@ -697,6 +714,7 @@ def _load_table_for_language(language: int) -> dict[int, bytes]:
 
     lang_slot = tp.language_slots[language]
     table: dict[int, bytes] = {}
+    crc = 0
 
     for slot_idx in range(lang_slot.slot_count):
         file_slot = tp.get_file_slot(slot_idx, language)
@@ -708,14 +726,22 @@ def _load_table_for_language(language: int) -> dict[int, bytes]:
             continue
         if not file_data:
             continue
+        crc = zlib.crc32(file_data, zlib.crc32(slot_idx.to_bytes(4, 'little'), crc))
         _parse_string_file(file_data, slot_idx * epf, table)
 
     if table:
-        _string_tables_by_language[language] = table
+        _register_table(language, table, table_fingerprint(language, epf, crc, len(table)))
 
     return table
 
 
+def _register_table(language: int, table: dict[int, bytes], fingerprint: str) -> None:
+    """Keep a parsed table and warm-load the decode cache saved for it."""
+    _string_tables_by_language[language] = table
+    _table_fingerprints[language] = fingerprint
+    _attach_decode_cache(language, fingerprint)
+
+
 def _do_load_string_table(language: int) -> None:
     """Synchronous load — must run on the game thread.
 
@@ -723,15 +749,16 @@ def _do_load_string_table(language: int) -> None:
     DatFileMethods, and parses all entries into _string_table.
     Caller must ensure TextParser context is fresh (e.g. _update_ptr ran).
     """
-    global _string_table_loaded, _loaded_language
+    global _string_table, _string_table_loaded, _loaded_language, _string_table_language
     if _string_table_loaded and _loaded_language == language:
         return
     table = _load_table_for_language(language)
     if not table:
         return
 
-    _string_table.clear()
-    _string_table.update(table)
+    # Rebind rather than update in place: background decodes keep the table they started with.
+    _string_table = table
+    _string_table_language = language
     _string_table_loaded = True
     _loaded_language = language
 
@@ -761,9 +788,9 @@ def _get_client_language() -> int:
     return tp.language_id
 
 def switch_language(language: int) -> None:
-    global _string_table, _decode_cache, _decode_cache_by_language, _string_table_loaded, _load_enqueued, _loaded_language
-    _decode_cache.clear()
-    _decode_cache_by_language.clear()
+    global _string_table_loaded, _load_enqueued, _loaded_language
+    # Decode caches are per language and stay valid; persist what the old language decoded.
+    _schedule_save(_loaded_language, force=True)
     _string_table_loaded = False
     _load_enqueued = False
     _loaded_language = language
@@ -870,21 +897,126 @@ def _decode_sync(raw: bytes, table: dict[int, bytes]) -> str:
     return legacy_text
 
 
-def _decode_and_cache(raw: bytes) -> None:
-    """Unpack, parse, decode, postprocess in background thread, cache result."""
+def _decode_and_cache(raw: bytes, language: int, table: dict[int, bytes], table_language: Optional[int]) -> None:
+    """Unpack, parse, decode, postprocess in background thread, cache result.
+
+    *table* is the string table snapshot taken when the decode was queued and
+    *table_language* the language it holds; the result is only cached (and
+    persisted) under *language* when the two match, so a decode racing a
+    switch_language() never stores text of the other language.
+    """
     try:
-        decoded = _decode_sync(raw, _string_table)
-        if decoded:
-            _decode_cache[raw] = decoded
+        decoded = _decode_sync(raw, table)
+        if decoded and table_language == language:
+            _get_decode_cache(language).put(raw, decoded)
+            _schedule_save(language)
     finally:
         _pending.discard(raw)
 
 
+# ─── Decode cache (per language, persisted) ──────────────────────────
+
+def _get_decode_cache(language: int) -> StringDecodeCache:
+    cache = _decode_caches.get(language)
+    if cache is None:
+        cache = StringDecodeCache(language, _table_fingerprints.get(language, ""), _DECODE_CACHE_LIMIT)
+        _decode_caches[language] = cache
+    return cache
+
+
+def _decode_cache_path(language: int) -> Optional[str]:
+    folder = _decode_cache_folder
+    if folder is None:
+        try:
+            import Py4GW
+            folder = os.path.join(Py4GW.Console.get_projects_path(), "data", "string_cache")
+        except Exception:
+            return None
+    return os.path.join(folder, f"strings_{language}.bin")
+
+
+def _attach_decode_cache(language: int, fingerprint: str) -> StringDecodeCache:
+    """Bind the language's decode cache to a table fingerprint, warm-loading the saved cache."""
+    current = _decode_caches.get(language)
+    if current is not None and current.fingerprint == fingerprint:
+        return current
+
+    path = _decode_cache_path(language)
+    if path is not None:
+        cache = StringDecodeCache.load(path, language, fingerprint, _DECODE_CACHE_LIMIT)
+    else:
+        cache = StringDecodeCache(language, fingerprint, _DECODE_CACHE_LIMIT)
+    if current is not None and not current.fingerprint:
+        # decoded against this same table before its fingerprint was known
+        cache.update(current.items())
+    _decode_caches[language] = cache
+    return cache
+
+
+def _save_decode_cache(language: int) -> bool:
+    _save_scheduled.discard(language)
+    cache = _decode_caches.get(language)
+    path = _decode_cache_path(language)
+    if cache is None or path is None or not cache.unsaved:
+        return False
+    try:
+        return cache.save(path)
+    except OSError:
+        return False
+
+
+def _schedule_save(language: int, force: bool = False) -> None:
+    """Save a language's cache on the decode thread once enough new entries accumulated."""
+    cache = _decode_caches.get(language)
+    if cache is None or not cache.fingerprint or language in _save_scheduled:
+        return
+    if cache.unsaved >= _SAVE_EVERY or (force and cache.unsaved):
+        _save_scheduled.add(language)
+        _decode_pool.submit(_save_decode_cache, language)
+
+
+def save_decode_caches() -> int:
+    """Write every decode cache with unsaved entries to disk now. Returns the number written."""
+    return sum(1 for language in list(_decode_caches) if _save_decode_cache(language))
+
+
+def clear_decode_caches(delete_files: bool = False) -> None:
+    """Drop decoded text for every language (e.g. after a postprocessing change)."""
+    for language, cache in list(_decode_caches.items()):
+        cache.clear()
+        if delete_files:
+            path = _decode_cache_path(language)
+            if path and os.path.isfile(path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+def decode_cache_info() -> dict[int, dict]:
+    return {language: cache.info() for language, cache in _decode_caches.items()}
+
+
+atexit.register(save_decode_caches)
+
+
 # ─── Public decode API ────────────────────────────────────────────────
 
 _PLAYER_PREFIX = b'\xa9\x0b'  # 0xBA9 as little-endian uint16
 
 
+def _decode_player_name(raw: bytes) -> str:
+    """Player names: prefix 0xBA9, inline ASCII"""
+    chars: list[int] = []
+    for i in range(4, len(raw) - 1, 2):
+        lo = raw[i]
+        hi = raw[i + 1]
+        if lo <= 1 and hi == 0:
+            break
+        chars.append(lo)
+    return bytes(chars).decode('ascii', 'ignore')
+
+
 def decode(raw: bytes, language: Optional[int] = None) -> str:
     """Decode raw encoded-name bytes to a display string.
 
@@ -894,21 +1026,13 @@ def decode(raw: bytes, language: Optional[int] = None) -> str:
     if len(raw) < 2:
         return ""
 
-    # Player names: prefix 0xBA9, inline ASCII
     if raw[0:2] == _PLAYER_PREFIX:
-        chars: list[int] = []
-        for i in range(4, len(raw) - 1, 2):
-            lo = raw[i]
-            hi = raw[i + 1]
-            if lo <= 1 and hi == 0:
-                break
-            chars.append(lo)
-        return bytes(chars).decode('ascii', 'ignore')
+        return _decode_player_name(raw)
 
     requested_language = _loaded_language if language is None else int(language)
     if language is not None and requested_language != _loaded_language:
-        cache_key = (requested_language, raw)
-        cached = _decode_cache_by_language.get(cache_key)
+        cache = _get_decode_cache(requested_language)
+        cached = cache.get(raw)
         if cached is not None:
             return cached
 
@@ -916,13 +1040,15 @@ def decode(raw: bytes, language: Optional[int] = None) -> str:
         if not table:
             return ""
 
+        cache = _get_decode_cache(requested_language)
         decoded = _decode_sync(raw, table)
         if decoded:
-            _decode_cache_by_language[cache_key] = decoded
+            cache.put(raw, decoded)
+            _schedule_save(requested_language)
         return decoded
 
     # Cache hit
-    cached = _decode_cache.get(raw)
+    cached = _get_decode_cache(requested_language).get(raw)
     if cached is not None:
         return cached
 
@@ -930,18 +1056,68 @@ def decode(raw: bytes, language: Optional[int] = None) -> str:
     if not _string_table_loaded and not _load_enqueued:
         load_string_table(_get_client_language())
 
-    if not _string_table or raw in _pending:
+    # After switch_language() the old table stays in place until the queued load runs
+    table, table_language = _string_table, _string_table_language
+    if not _string_table_loaded or table_language != requested_language or not table or raw in _pending:
         return ""
 
     # Submit decode to background thread — return "" now, cache hit next frame
     _pending.add(raw)
-    _decode_pool.submit(_decode_and_cache, raw)
+    _decode_pool.submit(_decode_and_cache, raw, requested_language, table, table_language)
     return ""
 
 
+def decode_many(raws: Iterable[bytes], language: Optional[int] = None) -> list[str]:
+    """Decode a batch of raw encoded names synchronously, in input order.
+
+    Unlike decode(), cache misses are decoded on the calling thread, so a UI
+    list of hundreds of names resolves in one frame instead of trickling in.
+    Entries that cannot be decoded yet (string table still loading) are "".
+    """
+    raws = list(raws)
+    requested_language = _loaded_language if language is None else int(language)
+    if requested_language == _loaded_language:
+        if not _string_table_loaded and not _load_enqueued:
+            load_string_table(_get_client_language())
+        # Nothing to decode with until the requested language's table is in place
+        table = _string_table if _string_table_loaded and _string_table_language == requested_language else {}
+    else:
+        table = _load_table_for_language(requested_language)
+
+    cache = _get_decode_cache(requested_language)
+    results: list[str] = []
+    batch: dict[bytes, str] = {}
+    added = False
+    for raw in raws:
+        if len(raw) < 2:
+            results.append("")
+            continue
+        text = batch.get(raw)
+        if text is None:
+            if raw[0:2] == _PLAYER_PREFIX:
+                text = _decode_player_name(raw)
+            else:
+                text = cache.get(raw)
+                if text is None:
+                    text = _decode_sync(raw, table) if table else ""
+                    if text:
+                        cache.put(raw, text)
+                        added = True
+            batch[raw] = text
+        results.append(text)
+
+    if added:
+        _schedule_save(requested_language)
+    return results
+
+
 def decode_plain(raw: bytes, language: Optional[int] = None) -> str:
     text = decode(raw, language=language)
     if not text:
         return ""
 
     return _normalize_plain_text(text)
+
+
+def decode_plain_many(raws: Iterable[bytes], language: Optional[int] = None) -> list[str]:
+    return [_normalize_plain_text(text) if text else "" for text in decode_many(raws, language=language)]
@@ -0,0 +1 @@
+from . import navmesh_cache
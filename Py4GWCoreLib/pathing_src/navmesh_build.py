@@ -0,0 +1,402 @@
+"""NavMesh construction from pathing-map data: BSP arrays, portal graph, cache packing.
+
+NavMesh (Py4GWCoreLib/Pathing.py) builds a mesh in-process with these
+functions, and a build worker runs the same code on a plain-data snapshot
+of the pathing maps so the game thread only pays for taking the snapshot
+and restoring the result:
+
+    snapshot = snapshot_pathing_maps(pathing_maps, map_id)   # game thread
+    blob = build_navmesh_bytes(snapshot)                      # anywhere
+    NavMesh.from_cache_bytes(pathing_maps, map_id, blob)      # game thread
+
+A snapshot is (map_id, layers) with one (trapezoids, portals) pair per
+pathing map:
+
+    trapezoids  [(id, XTL, XTR, YT, XBL, XBR, YB, [neighbor ids...]), ...]
+    portals     [(left_layer_id, right_layer_id, (trapezoid ids...)), ...]
+
+Only tuples, lists, ints and floats, so it pickles without any class
+definitions.  The result is a NavMeshCacheData in the binary cache layout
+(navmesh_cache.py), byte-identical to what NavMesh.to_cache_data produces
+for the same maps.
+
+Like navmesh_cache, this module only depends on the standard library.  Run
+as a script it is the build worker (see navmesh_worker.py): a pickled
+snapshot on stdin, the serialized cache on stdout.  The worker is started
+with python -I and loads navmesh_cache by path, so neither the Py4GWCoreLib
+package nor the game modules it imports are loaded in the worker process.
+"""
+from __future__ import annotations
+
+import math
+import operator
+import os
+import sys
+from array import array
+from collections import defaultdict
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+if __package__:
+    from .navmesh_cache import NavMeshCacheData, geometry_crc, navmesh_cache_to_bytes
+else:
+    import importlib.util
+
+    _spec = importlib.util.spec_from_file_location(
+        "navmesh_cache", os.path.join(os.path.dirname(os.path.abspath(__file__)), "navmesh_cache.py"))
+    _navmesh_cache = importlib.util.module_from_spec(_spec)
+    sys.modules["navmesh_cache"] = _navmesh_cache
+    _spec.loader.exec_module(_navmesh_cache)
+    NavMeshCacheData = _navmesh_cache.NavMeshCacheData
+    geometry_crc = _navmesh_cache.geometry_crc
+    navmesh_cache_to_bytes = _navmesh_cache.navmesh_cache_to_bytes
+
+# Leaf size balances construction speed vs query performance
+_BSP_LEAF_SIZE = 16
+_BSP_MAX_DEPTH = 24
+
+# Portal creation tolerances
+_PORTAL_TOLERANCE = 32.0
+_PORTAL_VERT_TOL = 100.2
+_PORTAL_HORIZ_TOL = 100.6
+
+# Planes' cross-layer portals as (left_layer_id, right_layer_id, trapezoid ids)
+PlanePortals = List[List[Tuple[int, int, Sequence[int]]]]
+
+
+class SnapshotTrapezoid:
+    """The PathingTrapezoid fields NavMesh construction reads, rebuilt from a snapshot row."""
+    __slots__ = ("id", "XTL", "XTR", "YT", "XBL", "XBR", "YB", "neighbor_ids")
+
+    def __init__(self, t_id: int, xtl: float, xtr: float, yt: float, xbl: float, xbr: float, yb: float,
+                 neighbor_ids: Sequence[int]):
+        self.id = t_id
+        self.XTL = xtl
+        self.XTR = xtr
+        self.YT = yt
+        self.XBL = xbl
+        self.XBR = xbr
+        self.YB = yb
+        self.neighbor_ids = neighbor_ids
+
+
+_SNAPSHOT_FIELDS = operator.attrgetter("id", "XTL", "XTR", "YT", "XBL", "XBR", "YB", "neighbor_ids")
+
+
+def snapshot_pathing_maps(pathing_maps, map_id: int) -> tuple:
+    """Copy what NavMesh construction needs out of pathing_maps into plain data.
+
+    neighbor_ids lists are shared with the pathing maps, not copied; the
+    snapshots MapContext hands out are never modified.
+    """
+    layers = []
+    for pmap in pathing_maps:
+        layers.append((list(map(_SNAPSHOT_FIELDS, pmap.trapezoids)), snapshot_portals([pmap])[0]))
+    return int(map_id), layers
+
+
+def snapshot_portals(pathing_maps) -> PlanePortals:
+    return [[(p.left_layer_id, p.right_layer_id, tuple(p.trapezoid_indices)) for p in pmap.portals]
+            for pmap in pathing_maps]
+
+
+# ─── BSP ────────────────────────────────────────────────────────────────────
+
+class BSPArrays:
+    """Flat node/leaf arrays of a Y-split BSP over a trapezoid list (see TrapezoidBSP)."""
+
+    def __init__(self):
+        self.node_split_y = array('d')
+        self.node_above = array('i')
+        self.node_below = array('i')
+        self.node_leaf = array('i')
+        self.node_count = array('i')
+        self.leaf_items = array('i')
+
+    def _add_leaf(self, indices: list) -> int:
+        node = len(self.node_leaf)
+        self.node_split_y.append(0.0)
+        self.node_above.append(-1)
+        self.node_below.append(-1)
+        self.node_leaf.append(len(self.leaf_items))
+        self.node_count.append(len(indices))
+        self.leaf_items.extend(indices)
+        return node
+
+    def _add_split(self, split_y: float) -> int:
+        node = len(self.node_leaf)
+        self.node_split_y.append(split_y)
+        self.node_above.append(-1)
+        self.node_below.append(-1)
+        self.node_leaf.append(-1)
+        self.node_count.append(0)
+        return node
+
+
+def _build_trap_bsp(bsp: BSPArrays, traps: list, sorted_indices: list, depth: int = 0) -> int:
+    """Build BSP recursively using pre-sorted trapezoid indices. Returns the node index."""
+    n = len(sorted_indices)
+    if n <= _BSP_LEAF_SIZE or depth >= _BSP_MAX_DEPTH:
+        return bsp._add_leaf(sorted_indices)
+
+    mid = n >> 1
+    mid_idx = sorted_indices[mid]
+    mid_prev_idx = sorted_indices[mid - 1]
+    split_y = (traps[mid_prev_idx].YT + traps[mid_idx].YB) * 0.5
+
+    above = [i for i in sorted_indices if traps[i].YT >= split_y]
+    below = [i for i in sorted_indices if traps[i].YB <= split_y]
+
+    if len(above) == n and len(below) == n:
+        return bsp._add_leaf(sorted_indices)
+
+    node = bsp._add_split(split_y)
+    bsp.node_above[node] = _build_trap_bsp(bsp, traps, above, depth + 1)
+    bsp.node_below[node] = _build_trap_bsp(bsp, traps, below, depth + 1)
+    return node
+
+
+def build_bsp(bsp: BSPArrays, traps: list) -> BSPArrays:
+    """Fill the (empty) arrays of bsp with a tree over traps; node 0 is the root."""
+    if traps:
+        sorted_indices = sorted(range(len(traps)), key=lambda i: (traps[i].YT + traps[i].YB) * 0.5)
+        _build_trap_bsp(bsp, traps, sorted_indices)
+    return bsp
+
+
+# ─── Portals ────────────────────────────────────────────────────────────────
+
+def trapezoid_centroids(trapezoids: Dict[int, object]) -> Dict[int, Tuple[float, float]]:
+    return {
+        t_id: ((t.XTL + t.XTR + t.XBL + t.XBR) / 4, (t.YT + t.YB) / 2)
+        for t_id, t in trapezoids.items()
+    }
+
+
+def adjacent_side(a, b) -> Optional[str]:
+    if abs(a.YB - b.YT) < 1.0: return 'bottom_top'
+    if abs(a.YT - b.YB) < 1.0: return 'top_bottom'
+    if abs(a.XBR - b.XBL) < 1.0: return 'right_left'
+    if abs(a.XBL - b.XBR) < 1.0: return 'left_right'
+    return None
+
+
+def portal_is_valid(pt1, pt2, side: Optional[str]) -> bool:
+    """Geometric check of a same-layer portal on the given side; cross-layer (None) always passes."""
+    def is_close(a, b): return abs(a - b) < _PORTAL_TOLERANCE
+
+    if side == 'bottom_top':
+        if not pt1.YB == pt2.YT:
+            return False
+        x_min = max(pt1.XBL, pt2.XBR)
+        x_max = min(pt1.XBR, pt2.XBL)
+        if is_close(x_max, x_min): return False
+
+    elif side == 'top_bottom':
+        if not pt1.YT == pt2.YB:
+            return False
+        x_min = max(pt1.XTL, pt2.XTR)
+        x_max = min(pt1.XTR, pt2.XTL)
+        if is_close(x_max, x_min): return False
+
+    elif side == 'left_right':
+        if not pt1.XTR == pt2.XTL:
+            return False
+        y_min = max(pt1.YT, pt2.YT)
+        y_max = min(pt1.YB, pt2.YB)
+        if is_close(y_max, y_min): return False
+
+    elif side == 'right_left':
+        if not pt1.XTL == pt2.XTR:
+            return False
+        y_min = max(pt1.YT, pt2.YT)
+        y_max = min(pt1.YB, pt2.YB)
+        if is_close(y_max, y_min): return False
+
+    elif side is not None:
+        return False
+
+    return True
+
+
+def trapezoids_touching(a, b, vert_tol: float = _PORTAL_VERT_TOL, horiz_tol: float = _PORTAL_HORIZ_TOL) -> bool:
+    """Check if two trapezoids' bounding boxes are geometrically adjacent."""
+    # Same vertical alignment
+    if abs(a.YB - b.YT) < vert_tol or abs(a.YT - b.YB) < vert_tol:
+        left_a = min(a.XBL, a.XTL)
+        right_a = max(a.XBR, a.XTR)
+        left_b = min(b.XBL, b.XTL)
+        right_b = max(b.XBR, b.XTR)
+        if right_a >= left_b and right_b >= left_a:
+            return True
+
+    # Same horizontal alignment
+    if abs(a.XBR - b.XBL) < horiz_tol or abs(a.XBL - b.XBR) < horiz_tol:
+        top_a = max(a.YT, a.YB)
+        bottom_a = min(a.YT, a.YB)
+        top_b = max(b.YT, b.YB)
+        bottom_b = min(b.YT, b.YB)
+        if top_a >= bottom_b and top_b >= bottom_a:
+            return True
+
+    return False
+
+
+def local_portal_pairs(trapezoids: Dict[int, object], trap_layer: Dict[int, int]) -> Iterator[tuple]:
+    """Yield (ti, tj, side) for every same-layer neighbor pair that shares a side."""
+    zplane_traps = defaultdict(list)
+    for trap_id, z in trap_layer.items():
+        zplane_traps[z].append(trapezoids[trap_id])
+
+    for traps in zplane_traps.values():
+        trap_by_id = {t.id: t for t in traps}
+
+        for ti in traps:
+            for nid in ti.neighbor_ids:
+                tj = trap_by_id.get(nid)
+                if not tj or ti.id == tj.id:
+                    continue
+                side = adjacent_side(ti, tj)
+                if side:
+                    yield ti, tj, side
+
+
+def cross_layer_portal_pairs(trapezoids: Dict[int, object], plane_portals: PlanePortals) -> Iterator[tuple]:
+    """Yield (ti, tj) for touching trapezoids on the two planes of a cross-layer portal."""
+    cross_groups: Dict[Tuple[int, int], Dict[int, list]] = defaultdict(lambda: defaultdict(list))
+
+    for plane_idx, portals in enumerate(plane_portals):
+        for left_layer_id, right_layer_id, trapezoid_indices in portals:
+            if left_layer_id == right_layer_id:
+                continue
+
+            layer_pair = (min(left_layer_id, right_layer_id), max(left_layer_id, right_layer_id))
+
+            for trap_id in trapezoid_indices:
+                trap = trapezoids.get(trap_id)
+                if trap:
+                    cross_groups[layer_pair][plane_idx].append(trap)
+
+    for plane_map in cross_groups.values():
+        planes = list(plane_map.keys())
+        if len(planes) < 2:
+            continue
+
+        for i in range(len(planes)):
+            for j in range(i + 1, len(planes)):
+                traps_j = plane_map[planes[j]]
+                for ti in plane_map[planes[i]]:
+                    for tj in traps_j:
+                        if ti.id != tj.id and trapezoids_touching(ti, tj):
+                            yield ti, tj
+
+
+def add_portal(graph: Dict[int, List[int]], costs: Dict[int, Dict[int, float]],
+               centroids: Dict[int, Tuple[float, float]], pt1, pt2, side: Optional[str]) -> None:
+    """Add the bidirectional edge pt1 <-> pt2; cross-layer portals (side None) cost nothing."""
+    graph.setdefault(pt1.id, []).append(pt2.id)
+    graph.setdefault(pt2.id, []).append(pt1.id)
+    transition_cost = 0.0 if side is None else math.hypot(
+        centroids[pt2.id][0] - centroids[pt1.id][0],
+        centroids[pt2.id][1] - centroids[pt1.id][1],
+    )
+    costs.setdefault(pt1.id, {})[pt2.id] = transition_cost
+    costs.setdefault(pt2.id, {})[pt1.id] = transition_cost
+
+
+# ─── Cache packing and the worker build ────────────────────────────────────
+
+def pack_cache_data(map_id: int, trapezoids: Dict[int, object], trap_layer: Dict[int, int],
+                    centroids: Dict[int, Tuple[float, float]], bsp: BSPArrays,
+                    graph: Dict[int, List[int]], costs: Dict[int, Dict[int, float]]) -> NavMeshCacheData:
+    """Flatten the derived mesh data into the binary cache layout."""
+    traps = list(trapezoids.values())
+    index_of = {t.id: i for i, t in enumerate(traps)}
+
+    flat_centroids = array('d')
+    adj_offset = array('i', [0])
+    adj_target = array('i')
+    adj_cost = array('d')
+    for t in traps:
+        flat_centroids.extend(centroids[t.id])
+        edge_costs = costs.get(t.id, {})
+        for nid in graph.get(t.id, ()):
+            adj_target.append(index_of[nid])
+            adj_cost.append(edge_costs.get(nid, 0.0))
+        adj_offset.append(len(adj_target))
+
+    return NavMeshCacheData(
+        map_id=map_id,
+        geometry_crc=geometry_crc(traps, trap_layer),
+        trap_ids=array('i', (t.id for t in traps)),
+        trap_layer=array('i', (trap_layer.get(t.id, 0) for t in traps)),
+        centroids=flat_centroids,
+        bsp_split=bsp.node_split_y,
+        bsp_above=bsp.node_above,
+        bsp_below=bsp.node_below,
+        bsp_leaf=bsp.node_leaf,
+        bsp_count=bsp.node_count,
+        bsp_items=bsp.leaf_items,
+        adj_offset=adj_offset,
+        adj_target=adj_target,
+        adj_cost=adj_cost,
+    )
+
+
+def build_navmesh_data(snapshot: tuple, cancelled: Optional[Callable[[], bool]] = None) -> Optional[NavMeshCacheData]:
+    """Build the mesh of a snapshot exactly like NavMesh(pathing_maps, map_id) would.
+
+    cancelled is polled between steps (and every few thousand portals);
+    returns None once it reports True.
+    """
+    def stop(k: int = 0) -> bool:
+        return cancelled is not None and not (k & 0xFFF) and cancelled()
+
+    map_id, layers = snapshot
+    trapezoids: Dict[int, SnapshotTrapezoid] = {}
+    trap_layer: Dict[int, int] = {}
+    for i, (rows, _) in enumerate(layers):
+        traps = [SnapshotTrapezoid(*row) for row in rows]
+        trapezoids.update({t.id: t for t in traps})
+        trap_layer.update({t.id: i for t in traps})
+    if stop():
+        return None
+
+    centroids = trapezoid_centroids(trapezoids)
+    bsp = build_bsp(BSPArrays(), list(trapezoids.values()))
+    if stop():
+        return None
+
+    graph: Dict[int, List[int]] = {}
+    costs: Dict[int, Dict[int, float]] = {}
+    for k, (ti, tj, side) in enumerate(local_portal_pairs(trapezoids, trap_layer)):
+        if stop(k):
+            return None
+        if portal_is_valid(ti, tj, side):
+            add_portal(graph, costs, centroids, ti, tj, side)
+    for k, (ti, tj) in enumerate(cross_layer_portal_pairs(trapezoids, [portals for _, portals in layers])):
+        if stop(k):
+            return None
+        add_portal(graph, costs, centroids, ti, tj, None)
+    if stop():
+        return None
+
+    return pack_cache_data(map_id, trapezoids, trap_layer, centroids, bsp, graph, costs)
+
+
+def build_navmesh_bytes(snapshot: tuple, cancelled: Optional[Callable[[], bool]] = None) -> Optional[bytes]:
+    """build_navmesh_data serialized with navmesh_cache_to_bytes, or None when cancelled."""
+    data = build_navmesh_data(snapshot, cancelled)
+    return None if data is None else navmesh_cache_to_bytes(data)
+
+
+def _worker_main() -> int:
+    import pickle
+
+    snapshot = pickle.load(sys.stdin.buffer)
+    sys.stdout.buffer.write(build_navmesh_bytes(snapshot))
+    sys.stdout.buffer.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_worker_main())
@@ -0,0 +1,242 @@
+"""Versioned flat binary format for persisted NavMesh data.
+
+The file stores everything NavMesh derives from the raw trapezoids (BSP
+arrays, portal graph, portal costs, layer map and centroids) so a cached map
+can be restored without re-running BSP construction or portal derivation.
+
+Layout (little-endian):
+
+    header      _HEADER (magic, version, map id, checksums, section counts)
+    trap_ids    int32   [T]        trapezoid id per dense index
+    trap_layer  int32   [T]        layer index per dense index
+    centroids   float64 [2T]       interleaved (x, y) per dense index
+    bsp_split   float64 [N]        split plane per BSP node
+    bsp_above   int32   [N]        child above the split, -1 for leaves
+    bsp_below   int32   [N]        child below the split, -1 for leaves
+    bsp_leaf    int32   [N]        offset into bsp_items for leaves, -1 for splits
+    bsp_count   int32   [N]        number of bsp_items entries for leaves
+    bsp_items   int32   [L]        dense trapezoid indices referenced by leaves
+    adj_offset  int32   [T + 1]    CSR offsets into adj_target / adj_cost
+    adj_target  int32   [E]        neighbor dense index (portal_graph order)
+    adj_cost    float64 [E]        portal_costs entry for the edge
+
+The header carries a CRC32 of the source trapezoid geometry (so a cache built
+from a different map revision is rejected) and a CRC32 of the payload (so a
+truncated or corrupted file is rejected).
+
+This module only depends on the standard library so it can be imported by
+tooling and worker processes that do not run inside the game client.
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, Optional, Tuple
+
+NAVMESH_MAGIC = b"P4NM"
+NAVMESH_FORMAT_VERSION = 1
+
+# magic, version, header size, map id, geometry crc, payload crc,
+# trap count, bsp node count, bsp item count, edge count
+_HEADER = struct.Struct("<4sHHiIIIIII")
+
+_SWAP_BYTES = sys.byteorder != "little"
+
+
+@dataclass(slots=True)
+class NavMeshCacheData:
+    """Flat arrays read from (or about to be written to) a navmesh cache file."""
+    map_id: int
+    geometry_crc: int
+    trap_ids: array
+    trap_layer: array
+    centroids: array
+    bsp_split: array
+    bsp_above: array
+    bsp_below: array
+    bsp_leaf: array
+    bsp_count: array
+    bsp_items: array
+    adj_offset: array
+    adj_target: array
+    adj_cost: array
+
+
+# (attribute name, typecode, length key) in on-disk order.
+_SECTIONS: Tuple[Tuple[str, str, str], ...] = (
+    ("trap_ids", "i", "T"),
+    ("trap_layer", "i", "T"),
+    ("centroids", "d", "2T"),
+    ("bsp_split", "d", "N"),
+    ("bsp_above", "i", "N"),
+    ("bsp_below", "i", "N"),
+    ("bsp_leaf", "i", "N"),
+    ("bsp_count", "i", "N"),
+    ("bsp_items", "i", "L"),
+    ("adj_offset", "i", "T1"),
+    ("adj_target", "i", "E"),
+    ("adj_cost", "d", "E"),
+)
+
+
+def geometry_crc(trapezoids: Iterable, trap_layer: Optional[dict] = None) -> int:
+    """CRC32 over trapezoid ids, layers and corner coordinates.
+
+    Two pathing snapshots produce the same value only if they describe the
+    same trapezoids in the same order, which is what the cached BSP and
+    dense-index graph depend on.
+    """
+    traps = list(trapezoids)
+    layers = trap_layer if trap_layer is not None else {}
+    ids = array("i", [v for t in traps for v in (t.id, layers.get(t.id, -1))])
+    coords = array("d", [v for t in traps for v in (t.XTL, t.XTR, t.YT, t.XBL, t.XBR, t.YB)])
+    if _SWAP_BYTES:
+        ids.byteswap()
+        coords.byteswap()
+    return zlib.crc32(coords.tobytes(), zlib.crc32(ids.tobytes())) & 0xFFFFFFFF
+
+
+def _section_lengths(trap_count: int, node_count: int, item_count: int, edge_count: int) -> dict:
+    return {
+        "T": trap_count,
+        "2T": trap_count * 2,
+        "T1": trap_count + 1,
+        "N": node_count,
+        "L": item_count,
+        "E": edge_count,
+    }
+
+
+def navmesh_cache_to_bytes(data: NavMeshCacheData) -> bytes:
+    """Serialize data into the cache file layout (header + payload)."""
+    trap_count = len(data.trap_ids)
+    lengths = _section_lengths(trap_count, len(data.bsp_split), len(data.bsp_items), len(data.adj_target))
+
+    chunks = []
+    for name, typecode, key in _SECTIONS:
+        values = getattr(data, name)
+        if values.typecode != typecode or len(values) != lengths[key]:
+            raise ValueError(f"navmesh cache section {name} has wrong type or length")
+        if _SWAP_BYTES:
+            values = array(typecode, values)
+            values.byteswap()
+        chunks.append(values.tobytes())
+    payload = b"".join(chunks)
+
+    header = _HEADER.pack(
+        NAVMESH_MAGIC,
+        NAVMESH_FORMAT_VERSION,
+        _HEADER.size,
+        data.map_id,
+        data.geometry_crc & 0xFFFFFFFF,
+        zlib.crc32(payload) & 0xFFFFFFFF,
+        trap_count,
+        len(data.bsp_split),
+        len(data.bsp_items),
+        len(data.adj_target),
+    )
+    return header + payload
+
+
+def write_navmesh_cache(filepath: str, data: NavMeshCacheData) -> None:
+    """Write data to filepath atomically (temp file + rename)."""
+    write_navmesh_cache_bytes(filepath, navmesh_cache_to_bytes(data))
+
+
+def write_navmesh_cache_bytes(filepath: str, blob: bytes) -> None:
+    """Write an already serialized cache (navmesh_cache_to_bytes) atomically."""
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(blob)
+    os.replace(tmp_path, filepath)
+
+
+def read_navmesh_cache(
+    filepath: str,
+    map_id: Optional[int] = None,
+    expected_geometry_crc: Optional[int] = None,
+) -> Tuple[Optional[NavMeshCacheData], str]:
+    """Read a navmesh cache file through a memory map.
+
+    Returns (data, "") on success or (None, reason) when the file is missing,
+    was written by another format version, belongs to a different map or
+    geometry, or fails its checksum.
+
+    Each section is copied out of the mapping into an array with a single
+    memcpy and the mapping is closed before returning, so the file is never
+    held open (on Windows a live mapping would block rewriting the cache).
+    """
+    try:
+        f = open(filepath, "rb")
+    except OSError as e:
+        return None, f"cannot open cache: {e}"
+
+    with f:
+        try:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                return None, "cache file is truncated"
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            return None, f"cannot map cache: {e}"
+
+        with mm:
+            return _parse_navmesh_cache(mm, size, map_id, expected_geometry_crc)
+
+
+def navmesh_cache_from_bytes(
+    blob: bytes,
+    map_id: Optional[int] = None,
+    expected_geometry_crc: Optional[int] = None,
+) -> Tuple[Optional[NavMeshCacheData], str]:
+    """read_navmesh_cache for a cache held in memory (e.g. returned by a build worker)."""
+    if len(blob) < _HEADER.size:
+        return None, "cache file is truncated"
+    return _parse_navmesh_cache(blob, len(blob), map_id, expected_geometry_crc)
+
+
+def _parse_navmesh_cache(
+    buffer,
+    size: int,
+    map_id: Optional[int],
+    expected_geometry_crc: Optional[int],
+) -> Tuple[Optional[NavMeshCacheData], str]:
+    (magic, version, header_size, file_map_id, file_geometry_crc, payload_crc,
+     trap_count, node_count, item_count, edge_count) = _HEADER.unpack_from(buffer, 0)
+
+    if magic != NAVMESH_MAGIC:
+        return None, "not a navmesh cache (legacy or foreign file)"
+    if version != NAVMESH_FORMAT_VERSION or header_size != _HEADER.size:
+        return None, f"cache format version {version} != {NAVMESH_FORMAT_VERSION}"
+    if map_id is not None and file_map_id != map_id:
+        return None, f"cache belongs to map {file_map_id}"
+    if expected_geometry_crc is not None and file_geometry_crc != (expected_geometry_crc & 0xFFFFFFFF):
+        return None, "cache geometry checksum does not match current pathing maps"
+
+    lengths = _section_lengths(trap_count, node_count, item_count, edge_count)
+    payload_size = sum(lengths[key] * array(typecode).itemsize for _, typecode, key in _SECTIONS)
+    if size != header_size + payload_size:
+        return None, "cache size does not match header"
+
+    with memoryview(buffer) as view, view[header_size:header_size + payload_size] as payload:
+        if zlib.crc32(payload) & 0xFFFFFFFF != payload_crc:
+            return None, "cache payload checksum mismatch"
+
+        sections = {}
+        offset = 0
+        for name, typecode, key in _SECTIONS:
+            values = array(typecode)
+            nbytes = lengths[key] * values.itemsize
+            with payload[offset:offset + nbytes] as chunk:
+                values.frombytes(chunk)
+            if _SWAP_BYTES:
+                values.byteswap()
+            sections[name] = values
+            offset += nbytes
+
+    return NavMeshCacheData(map_id=file_map_id, geometry_crc=file_geometry_crc, **sections), ""
@@ -0,0 +1,136 @@
+"""Background NavMesh builds: a navmesh_build.py worker process per map.
+
+NavMeshBuildJob takes a snapshot (navmesh_build.snapshot_pathing_maps) and
+returns the serialized cache (navmesh_cache layout) without blocking the
+caller, which polls done() once per frame:
+
+    job = NavMeshBuildJob(snapshot)
+    ...
+    if job.done():
+        blob = job.result()          # None if the build failed or was cancelled
+
+The snapshot is pickled to the worker's stdin and the cache read from its
+stdout on a helper thread that waits on the pipes, so neither pickling nor
+waiting runs on the caller's thread.  cancel() kills the worker.
+
+Inside the game client sys.executable is the game itself, so the worker
+interpreter is looked up next to the Python installation the client runs
+on.  When none is found the build runs on the helper thread instead (still
+cancellable between build steps, but sharing the GIL with the game thread).
+
+Standard library only, like navmesh_build and navmesh_cache.
+"""
+from __future__ import annotations
+
+import os
+import pickle
+import subprocess
+import sys
+import threading
+import time
+from typing import Optional
+
+from .navmesh_build import build_navmesh_bytes
+
+BUILD_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "navmesh_build.py")
+
+_PYTHON_NAMES = ("pythonw.exe", "python.exe", "python3", "python") if os.name == "nt" else ("python3", "python")
+
+# No console window for the worker on Windows
+_CREATION_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+
+def find_python_executable() -> Optional[str]:
+    """A Python interpreter able to run the worker script, or None."""
+    for exe in (sys.executable, getattr(sys, "_base_executable", None)):
+        if exe and os.path.basename(exe).lower().startswith("python") and os.path.isfile(exe):
+            return exe
+    for prefix in dict.fromkeys((sys.exec_prefix, sys.base_exec_prefix, sys.prefix, sys.base_prefix)):
+        for folder in (prefix, os.path.join(prefix, "bin")):
+            for name in _PYTHON_NAMES:
+                exe = os.path.join(folder, name)
+                if os.path.isfile(exe):
+                    return exe
+    return None
+
+
+class NavMeshBuildJob:
+    """One background build of a snapshot; see the module docstring."""
+
+    def __init__(self, snapshot: tuple, python_executable: Optional[str] = None, use_process: bool = True):
+        self.map_id: int = snapshot[0]
+        self.error: str = ""
+        self.started = time.perf_counter()
+        self.elapsed: float = 0.0
+        self._snapshot = snapshot
+        self._result: Optional[bytes] = None
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+
+        self.python_executable = (python_executable or find_python_executable()) if use_process else None
+        self.backend = "process" if self.python_executable else "thread"
+        target = self._run_process if self.python_executable else self._run_thread
+        threading.Thread(target=self._run, args=(target,), name=f"navmesh-build-{self.map_id}", daemon=True).start()
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """Stop the build; result() will be None.  Safe to call at any time."""
+        self._cancelled.set()
+        with self._lock:
+            if self._process is not None and self._process.poll() is None:
+                self._process.kill()
+
+    def result(self) -> Optional[bytes]:
+        """The serialized cache once done(), or None (see error)."""
+        return self._result if self._done.is_set() and not self._cancelled.is_set() else None
+
+    def _run(self, target):
+        try:
+            self._result = target()
+            if self._cancelled.is_set():
+                self.error = "cancelled"
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+        finally:
+            self._snapshot = None
+            self.elapsed = time.perf_counter() - self.started
+            self._done.set()
+
+    def _run_thread(self) -> Optional[bytes]:
+        return build_navmesh_bytes(self._snapshot, self._cancelled.is_set)
+
+    def _run_process(self) -> Optional[bytes]:
+        payload = pickle.dumps(self._snapshot, protocol=4)     # readable by any Python 3 worker
+        with self._lock:
+            if self._cancelled.is_set():
+                return None
+            # -I: no user site, PYTHONPATH or script-folder imports in the worker
+            self._process = subprocess.Popen(
+                [self.python_executable, "-I", BUILD_SCRIPT],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                creationflags=_CREATION_FLAGS,
+            )
+        try:
+            out, err = self._process.communicate(payload)
+        except (BrokenPipeError, OSError):
+            if self._cancelled.is_set():
+                return None
+            raise
+        if self._cancelled.is_set():
+            return None
+        if self._process.returncode != 0:
+            lines = err.decode(errors="replace").strip().splitlines()
+            self.error = f"worker exited with {self._process.returncode}: {lines[-1] if lines else ''}"
+            return None
+        return out
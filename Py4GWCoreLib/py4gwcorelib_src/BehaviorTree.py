@@ -51,16 +51,35 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from enum import Enum, auto
 from typing import Any, Callable, List, Optional, Sequence, cast
-import uuid
+import itertools
 import inspect
 
 import PyImGui
 from .Color import Color, ColorPalette
 from .Utils import Utils
+from .Profiling import ProfilingRegistry
 from ..Py4GWcorelib import ConsoleLog, Console
 from ..ImGui_src.IconsFontAwesome5 import IconsFontAwesome5
 
 
+# Node ids only need to be unique within the process (ImGui ids, debugging).
+_node_ids = itertools.count(1)
+
+
+class _TickContext:
+    """Per tree-tick settings shared by every node ticked beneath BehaviorTree.tick()."""
+    __slots__ = ("trace", "timed", "now")
+
+    def __init__(self, trace: bool, timed: bool, now: int):
+        self.trace = trace    # BT_TRACE, read once from the tree blackboard
+        self.timed = timed    # measure per-node CPU time on this tick
+        self.now = now        # tree-tick timestamp, used for run tracking when not timed
+
+
+# Context of the outermost BehaviorTree.tick() in progress; None when a node is ticked on its own.
+_tick_context: Optional[_TickContext] = None
+
+
 # --------------------------------------------------------
 # Behavior Tree
 # --------------------------------------------------------
@@ -117,7 +136,7 @@ class BehaviorTree:
             icon: str = "",
             color: Color = ColorPalette.GetColor("white"),
         ):
-            self.id: str = uuid.uuid4().hex
+            self.id: int = next(_node_ids)
             self.name: str = name or self.__class__.__name__
             self.node_type: str = node_type or self.__class__.__name__
             self.node_category: str = node_category
@@ -129,9 +148,12 @@ class BehaviorTree:
             self.blackboard: dict = {}
 
             # ---- execution timing ----
+            # Sampled when the owning tree uses timing_sample_rate != 1; the
+            # average is over timed_tick_count, the ticks that were measured.
             self.last_tick_time_ms: float = 0.0
             self.total_time_ms: float = 0.0
             self.avg_time_ms: float = 0.0
+            self.timed_tick_count: int = 0
             
             self._run_start_time_ms: Optional[int] = None
             self.run_last_duration_ms: float = 0.0
@@ -153,9 +175,21 @@ class BehaviorTree:
             - Calls child implementation
             - Ends timer
             - Updates metadata
+
+            Under BehaviorTree.tick() the trace flag and whether this tick is
+            timed come from the tree-tick context; a node ticked on its own
+            reads BT_TRACE from its blackboard and is always timed.
             """
-            start = Utils.GetBaseTimestamp()
-            trace_enabled = bool(self.blackboard.get("BT_TRACE", False)) if isinstance(self.blackboard, dict) else False
+            ctx = _tick_context
+            if ctx is None:
+                trace_enabled = bool(self.blackboard.get("BT_TRACE", False)) if isinstance(self.blackboard, dict) else False
+                timed = True
+            else:
+                trace_enabled = ctx.trace
+                timed = ctx.timed
+
+            if timed:
+                start = Utils.GetBaseTimestamp()
             if trace_enabled:
                 ConsoleLog("BT", f"ENTER {self.node_type}:{self.name}", Console.MessageType.Debug, log=True)
 
@@ -168,18 +202,18 @@ class BehaviorTree:
                 )
             result = normalized
 
-            end = Utils.GetBaseTimestamp()
-            
-            elapsed_cpu = float(end - start)
-            self.last_tick_time_ms = elapsed_cpu
-            self.total_time_ms += elapsed_cpu
             self.tick_count += 1
-            if self.tick_count > 0:
-                self.avg_time_ms = self.total_time_ms / self.tick_count
+            if timed:
+                now = Utils.GetBaseTimestamp()
+                elapsed_cpu = float(now - start)
+                self.last_tick_time_ms = elapsed_cpu
+                self.total_time_ms += elapsed_cpu
+                self.timed_tick_count += 1
+                self.avg_time_ms = self.total_time_ms / self.timed_tick_count
+            else:
+                now = ctx.now
                 
             # ========= REAL "LOGICAL RUNTIME" TRACKING =========
-            now = Utils.GetBaseTimestamp()
-
             if result == BehaviorTree.NodeState.RUNNING:
                 # First time entering RUNNING
                 if self._run_start_time_ms is None:
@@ -2017,9 +2051,32 @@ class BehaviorTree:
     # --------------------------------------------------------
     #region BehaviorTree Class
     # --------------------------------------------------------
-    def __init__(self, root: Node):
+    # Default for trees that do not pass timing_sample_rate (see __init__).
+    default_timing_sample_rate: int = 1
+
+    def __init__(self, root: Node, timing_sample_rate: Optional[int] = None):
+        """
+        timing_sample_rate controls per-node CPU timing:
+          1  - time every node on every tick (default)
+          N  - time one tree tick in N
+          0  - only time while the profiler (ProfilingRegistry) is enabled
+        Node states, tick counts and RUNNING durations are kept on every tick
+        regardless; durations of untimed ticks use the tree-tick timestamp.
+        """
         self.root: BehaviorTree.Node = root
         self.blackboard = {} # Shared data storage for the tree
+        self.timing_sample_rate: int = (
+            BehaviorTree.default_timing_sample_rate if timing_sample_rate is None else max(0, int(timing_sample_rate))
+        )
+        self._tree_tick_count: int = 0
+
+    def _is_timed_tick(self) -> bool:
+        rate = self.timing_sample_rate
+        if rate == 1:
+            return True
+        if rate > 1 and self._tree_tick_count % rate == 0:
+            return True
+        return ProfilingRegistry().enabled
 
     def _ensure_blackboard_data(self) -> None:
         """
@@ -2047,17 +2104,33 @@ class BehaviorTree:
         Assigns this tree’s blackboard to `node` and all its descendants.
         Ensures every node reads/writes the same shared dictionary.
         """
-        node.blackboard = self.blackboard
-        for child in node.get_children():
-            self._propagate_blackboard(child)
+        blackboard = self.blackboard
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            current.blackboard = blackboard
+            stack.extend(current.get_children())
 
     def tick(self) -> BehaviorTree.NodeState:
         """
         Ticks the root node once and returns its resulting NodeState.
         """
+        global _tick_context
         self._ensure_blackboard_data()
         self._propagate_blackboard(self.root)
-        result = self.Node._normalize_state(self.root.tick())
+
+        outer = _tick_context
+        if outer is None:
+            # Resolve the per-tick settings once for every node in the tree
+            # (trees nested through SwitchNode / SubtreeNode share the outer ones).
+            trace = bool(self.blackboard.get("BT_TRACE", False)) if isinstance(self.blackboard, dict) else False
+            timed = self._is_timed_tick()
+            _tick_context = _TickContext(trace, timed, 0 if timed else Utils.GetBaseTimestamp())
+        self._tree_tick_count += 1
+        try:
+            result = self.Node._normalize_state(self.root.tick())
+        finally:
+            _tick_context = outer
         if result is None:
             raise TypeError("BehaviorTree root returned a non-NodeState result.")
         return result
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from functools import wraps
-from typing import Any, Callable, Hashable, ParamSpec, TypeVar
+from typing import Any, Callable, Hashable, Iterable, ParamSpec, TypeVar
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -16,12 +18,67 @@ class FrameCacheKey:
     key: Hashable = ""
 
 
+@dataclass
+class FrameCacheStats:
+    """Counters for one cached function (category, source_lib, function_name), over all of its keys."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    compute_ns: int = 0
+    max_compute_ns: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def mean_compute_ms(self) -> float:
+        return self.compute_ns / self.misses / 1e6 if self.misses else 0.0
+
+
+@dataclass(eq=False, slots=True)
+class FrameCacheWatcher:
+    """A probe registered with FrameCache.watch; pass it to FrameCache.unwatch to remove it."""
+    tag: str
+    probe: Callable[[], Hashable]
+    last_value: Any = None
+    primed: bool = False
+
+
+@dataclass(slots=True)
+class _TimedEntry:
+    value: Any
+    expires_frame: int | None
+    expires_ms: float | None
+    tags: tuple[str, ...]
+
+
 class FrameCache:
+    """Values cached per frame, or for longer when a lifetime or tags are given.
+
+    Plain entries live until the next PreUpdate, which clears them.  Entries
+    with a lifetime in frames and/or milliseconds, or with invalidation tags,
+    live in a separate least-recently-used store bounded by ``max_entries``;
+    they expire when either lifetime runs out (checked against the frame
+    counter and the time taken at PreUpdate, so a value never expires
+    mid-frame) or when one of their tags is invalidated.  ``watch`` turns a
+    cheap probe into a tag that fires whenever the probe's value changes.
+    """
+
     _instance: "FrameCache | None" = None
     _values: dict[FrameCacheKey, Any]
+    _timed: "OrderedDict[FrameCacheKey, _TimedEntry]"
+    _tag_keys: dict[str, set[FrameCacheKey]]
+    _watchers: dict[str, list[FrameCacheWatcher]]
+    _stats: dict[tuple[str, str, str], FrameCacheStats]
     _callback_name: str
     _callback_registered: bool
 
+    DEFAULT_MAX_ENTRIES = 4096
+    SWEEP_INTERVAL_FRAMES = 64
+
     def __new__(cls) -> "FrameCache":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -30,6 +87,14 @@ class FrameCache:
     def __init__(self) -> None:
         if not hasattr(self, "_values"):
             self._values = {}
+            self._timed = OrderedDict()
+            self._tag_keys = {}
+            self._watchers = {}
+            self._stats = {}
+            self.frame = 0
+            self.frame_ms = time.monotonic() * 1000.0
+            self.max_entries = self.DEFAULT_MAX_ENTRIES
+            self.collect_stats = False
         if not hasattr(self, "_callback_name"):
             self._callback_name = "FrameCache.ResetCache"
         if not hasattr(self, "_callback_registered"):
@@ -42,6 +107,9 @@ class FrameCache:
         factory: Callable[[], T],
         source_lib: str = "",
         key: Any = "",
+        frames: int | None = 1,
+        ms: float | None = None,
+        tags: tuple[str, ...] = (),
     ) -> T:
         cache_key = FrameCacheKey(
             category=str(category),
@@ -49,18 +117,157 @@ class FrameCache:
             function_name=str(function_name),
             key=self._normalize_key(key),
         )
-        if cache_key not in self._values:
-            self._values[cache_key] = factory()
-        return self._values[cache_key]
+        if frames == 1 and ms is None and not tags:
+            if cache_key in self._values:
+                if self.collect_stats:
+                    self._stats_for(cache_key).hits += 1
+                return self._values[cache_key]
+            value = self._compute(cache_key, factory)
+            self._values[cache_key] = value
+            return value
+
+        entry = self._timed.get(cache_key)
+        if entry is not None:
+            if (entry.expires_frame is None or self.frame < entry.expires_frame) and (
+                entry.expires_ms is None or self.frame_ms < entry.expires_ms
+            ):
+                self._timed.move_to_end(cache_key)
+                if self.collect_stats:
+                    self._stats_for(cache_key).hits += 1
+                return entry.value
+            self._remove(cache_key)
+
+        value = self._compute(cache_key, factory)
+        self._timed[cache_key] = _TimedEntry(
+            value=value,
+            expires_frame=None if frames is None else self.frame + max(1, int(frames)),
+            expires_ms=None if ms is None else self.frame_ms + float(ms),
+            tags=tags,
+        )
+        for tag in tags:
+            self._tag_keys.setdefault(tag, set()).add(cache_key)
+        while len(self._timed) > self.max_entries:
+            oldest = next(iter(self._timed))
+            self._remove(oldest)
+            if self.collect_stats:
+                self._stats_for(oldest).evictions += 1
+        return value
+
+    def _compute(self, cache_key: FrameCacheKey, factory: Callable[[], T]) -> T:
+        if not self.collect_stats:
+            return factory()
+        start = time.perf_counter_ns()
+        value = factory()
+        elapsed = time.perf_counter_ns() - start
+        stats = self._stats_for(cache_key)
+        stats.misses += 1
+        stats.compute_ns += elapsed
+        if elapsed > stats.max_compute_ns:
+            stats.max_compute_ns = elapsed
+        return value
+
+    def _stats_for(self, cache_key: FrameCacheKey) -> FrameCacheStats:
+        site = (cache_key.category, cache_key.source_lib, cache_key.function_name)
+        stats = self._stats.get(site)
+        if stats is None:
+            stats = self._stats[site] = FrameCacheStats()
+        return stats
+
+    def _remove(self, cache_key: FrameCacheKey) -> None:
+        entry = self._timed.pop(cache_key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(cache_key)
+
+    def on_pre_update(self, now_ms: float | None = None) -> None:
+        """Start a new frame: drop per-frame values, advance the lifetimes and run the tag watchers."""
+        self.frame += 1
+        self.frame_ms = time.monotonic() * 1000.0 if now_ms is None else float(now_ms)
+        self._values.clear()
+        for watchers in list(self._watchers.values()):
+            for watcher in list(watchers):
+                try:
+                    value = watcher.probe()
+                except Exception:
+                    continue
+                if watcher.primed and value != watcher.last_value:
+                    self.invalidate(watcher.tag)
+                watcher.last_value = value
+                watcher.primed = True
+        if self.frame % self.SWEEP_INTERVAL_FRAMES == 0:
+            self._sweep_expired()
+
+    def _sweep_expired(self) -> None:
+        expired = [
+            cache_key
+            for cache_key, entry in self._timed.items()
+            if (entry.expires_frame is not None and self.frame >= entry.expires_frame)
+            or (entry.expires_ms is not None and self.frame_ms >= entry.expires_ms)
+        ]
+        for cache_key in expired:
+            self._remove(cache_key)
+
+    def invalidate(self, tag: str) -> int:
+        """Drop every entry carrying ``tag``; returns how many were dropped."""
+        keys = self._tag_keys.pop(tag, None)
+        if not keys:
+            return 0
+        for cache_key in keys:
+            self._remove(cache_key)
+            if self.collect_stats:
+                self._stats_for(cache_key).invalidations += 1
+        return len(keys)
+
+    def watch(self, tag: str, probe: Callable[[], Hashable]) -> FrameCacheWatcher:
+        """Invalidate ``tag`` at PreUpdate whenever ``probe()`` returns something different from last frame.
+
+        A tag can have any number of watchers; the returned handle removes
+        only this one (``unwatch``).
+        """
+        watcher = FrameCacheWatcher(tag, probe)
+        self._watchers.setdefault(tag, []).append(watcher)
+        return watcher
+
+    def unwatch(self, watcher: FrameCacheWatcher) -> bool:
+        """Remove a watcher returned by ``watch``; False if it was already removed."""
+        watchers = self._watchers.get(watcher.tag)
+        if not watchers or watcher not in watchers:
+            return False
+        watchers.remove(watcher)
+        if not watchers:
+            del self._watchers[watcher.tag]
+        return True
 
     def reset_cache(self) -> None:
         self._values.clear()
+        self._timed.clear()
+        self._tag_keys.clear()
 
     def clear(self) -> None:
         self.reset_cache()
 
     def items(self) -> list[tuple[FrameCacheKey, Any]]:
-        return list(self._values.items())
+        return list(self._values.items()) + [(cache_key, entry.value) for cache_key, entry in self._timed.items()]
+
+    def stats(self) -> dict[tuple[str, str, str], FrameCacheStats]:
+        return dict(self._stats)
+
+    def reset_stats(self) -> None:
+        self._stats.clear()
+
+    def tags(self) -> dict[str, int]:
+        """Known tags (watched or in use) and how many live entries carry each."""
+        counts = {tag: 0 for tag in self._watchers}
+        for tag, keys in self._tag_keys.items():
+            counts[tag] = len(keys)
+        return counts
+
+    def entry_counts(self) -> tuple[int, int]:
+        """(per-frame entries, timed entries)."""
+        return len(self._values), len(self._timed)
 
     @staticmethod
     def _normalize_key(key: Any) -> Hashable:
@@ -102,7 +309,7 @@ class FrameCache:
         PyCallback.PyCallback.Register(
             self._callback_name,
             PyCallback.Phase.PreUpdate,
-            self.reset_cache,
+            self.on_pre_update,
             priority=7,
         )
         self._callback_registered = True
@@ -132,7 +339,22 @@ def frame_cache(
     category: str,
     source_lib: str = "",
     key: Any = None,
+    frames: int | None = 1,
+    ms: float | None = None,
+    tags: Iterable[str] = (),
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    """Cache a function's result per key.
+
+    By default the value lives for the current frame.  ``frames`` and ``ms``
+    extend that (the value expires when the first of the two runs out;
+    ``frames=None`` means no frame limit), and ``tags`` lets
+    ``FRAME_CACHE.invalidate(tag)`` or a ``FRAME_CACHE.watch`` probe drop it
+    early, e.g. ``tags=("map_change",)``.
+    """
+    tag_tuple = tuple(str(tag) for tag in tags)
+    if frames is None and ms is None and not tag_tuple:
+        raise ValueError(f"frame_cache({category!r}, {source_lib!r}): a value with no lifetime needs tags to be invalidated")
+
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
@@ -153,6 +375,9 @@ def frame_cache(
                 factory=lambda: func(*args, **kwargs),
                 source_lib=source_lib,
                 key=resolved_key,
+                frames=frames,
+                ms=ms,
+                tags=tag_tuple,
             )
 
         return wrapper
@@ -1,38 +1,65 @@
 import os
+import time
 import configparser
 from datetime import datetime
 
 #region IniHandler
 class IniHandler:
-    def __init__(self, filename: str):
+    # How often reads may stat the file for external edits (milliseconds).
+    DEFAULT_RELOAD_CHECK_MS = 250
+
+    def __init__(self, filename: str, reload_check_ms: int | None = None):
         """
         Initialize the handler with the given INI file.
+
+        The parsed file is kept in memory: reads are served from it and only
+        stat the file (mtime + size) once every reload_check_ms to pick up
+        external edits.  set_key() stages writes in memory; flush() (or any
+        immediate write such as write_key()) rewrites the whole file once
+        through a temp file and rename.
         """
         self.filename = filename
         self.last_modified = 0
+        self.last_size = -1
+        self.reload_check_ms = self.DEFAULT_RELOAD_CHECK_MS if reload_check_ms is None else max(0, int(reload_check_ms))
         self.config = configparser.ConfigParser()
-        self.reload()  # Load the config initially
+        self._next_check = 0.0
+        self._pending: dict[tuple[str, str], str] = {}
+        self._dirty = False  # a staged value differs from the in-memory config
+        self.reload(force=True)  # Load the config initially
 
     # ----------------------------
     # Core Methods
     # ----------------------------
     
-    def reload(self) -> configparser.ConfigParser:
+    def reload(self, force: bool = False) -> configparser.ConfigParser:
         """Reload the INI file only if it has changed.
-        
+
+        The file is stat'ed at most once per reload_check_ms unless *force*
+        is set; it is re-read only when its mtime or size changed.  Staged
+        (unflushed) writes are re-applied on top of the re-read content.
         If the file doesn't exist, create an empty file.
         """
+        now = time.monotonic()
+        if not force and now < self._next_check:
+            return self.config
+        self._next_check = now + self.reload_check_ms / 1000.0
+
         if not os.path.exists(self.filename):
             # Create an empty file if it doesn't exist.
             with open(self.filename, 'w') as f:
                 f.write("")
             # Update last_modified since a new file was created.
-            self.last_modified = os.path.getmtime(self.filename)
+            self._remember_file_state()
             return self.config
 
-        current_mtime = os.path.getmtime(self.filename)
-        if current_mtime != self.last_modified:
-            self.last_modified = current_mtime
+        try:
+            stat = os.stat(self.filename)
+        except OSError:
+            return self.config
+        if stat.st_mtime != self.last_modified or stat.st_size != self.last_size:
+            self.last_modified = stat.st_mtime
+            self.last_size = stat.st_size
             try:
                 self.config.read(self.filename, encoding="utf-8")
             except (configparser.Error, UnicodeDecodeError, OSError) as exc:
@@ -50,21 +77,87 @@ class IniHandler:
                     f.write("")
 
                 self.config = configparser.ConfigParser()
-                self.last_modified = os.path.getmtime(self.filename)
+                self._remember_file_state()
                 print(f"[IniHandler] Recovered corrupted INI file: {self.filename} ({exc})")
+            self._apply_pending(self.config)
         return self.config
 
     def save(self, config: configparser.ConfigParser) -> None:
         """
         Save changes to the INI file.
+
+        The file is written to a temporary sibling and renamed over the
+        original, so readers never see a half-written file.
         """
-        with open(self.filename, 'w', encoding="utf-8") as configfile:
-            config.write(configfile)
+        self._write_atomic(config)
         self.config = config
+        self._pending.clear()
+        self._dirty = False
+        self._remember_file_state()
+
+    def flush(self) -> bool:
+        """
+        Write all staged set_key() changes in one atomic save.
+        Returns True if the file was written.
+        """
+        if not self._pending:
+            return False
+        # Merge any external edit before rewriting the whole file.
+        self.reload(force=True)
+        if not self._dirty and self._pending_on_disk():
+            # Every staged value matched the (possibly stale) in-memory config
+            # and the file still holds them all: nothing to write.
+            self._pending.clear()
+            return False
+        self.save(self.config)
+        return True
+
+    def has_pending_writes(self) -> bool:
+        """
+        True while set_key() changes are waiting for flush().
+        """
+        return bool(self._pending)
+
+    def _write_atomic(self, config: configparser.ConfigParser) -> None:
+        tmp_name = f"{self.filename}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_name, 'w', encoding="utf-8") as configfile:
+                config.write(configfile)
+            os.replace(tmp_name, self.filename)
+        except OSError:
+            try:
+                os.remove(tmp_name)
+            except OSError:
+                pass
+            # The rename can be refused while another process holds the file
+            # open (Windows); fall back to rewriting it in place.
+            with open(self.filename, 'w', encoding="utf-8") as configfile:
+                config.write(configfile)
+
+    def _pending_on_disk(self) -> bool:
+        on_disk = configparser.ConfigParser()
+        try:
+            on_disk.read(self.filename, encoding="utf-8")
+        except (configparser.Error, UnicodeDecodeError, OSError):
+            return False
+        return all(
+            on_disk.get(section, key, raw=True, fallback=None) == value
+            for (section, key), value in self._pending.items()
+        )
+
+    def _remember_file_state(self) -> None:
         try:
-            self.last_modified = os.path.getmtime(self.filename)
+            stat = os.stat(self.filename)
         except OSError:
-            pass
+            return
+        self.last_modified = stat.st_mtime
+        self.last_size = stat.st_size
+
+    def _apply_pending(self, config: configparser.ConfigParser) -> None:
+        for (section, key), value in self._pending.items():
+            if not config.has_section(section):
+                config.add_section(section)
+            config.set(section, key, value)
 
     # ----------------------------
     # Read Methods
@@ -118,11 +211,23 @@ class IniHandler:
         """
         Write or update a key-value pair.
         """
+        self.set_key(section, key, value)
+        self.flush()
+
+    def set_key(self, section: str, key: str, value) -> None:
+        """
+        Stage a key-value pair in memory; it is written by the next flush().
+        """
         config = self.reload()
         if not config.has_section(section):
             config.add_section(section)
-        config.set(section, key, str(value))
-        self.save(config)
+        value = str(value)
+        # Always staged: the in-memory config may be up to reload_check_ms
+        # stale, so an equal value is only skipped once flush() has checked the file.
+        if config.get(section, key, raw=True, fallback=None) != value:
+            self._dirty = True
+            config.set(section, key, value)
+        self._pending[(section, key)] = value
 
     # ----------------------------
     # Delete Methods
@@ -132,7 +237,7 @@ class IniHandler:
         """
         Delete a specific key.
         """
-        config = self.reload()
+        config = self.reload(force=True)
         if config.has_section(section) and config.has_option(section, key):
             config.remove_option(section, key)
             self.save(config)
@@ -141,7 +246,7 @@ class IniHandler:
         """
         Delete an entire section.
         """
-        config = self.reload()
+        config = self.reload(force=True)
         if config.has_section(section):
             config.remove_section(section)
             self.save(config)
@@ -177,7 +282,7 @@ class IniHandler:
         """
         Clone all keys from one section to another.
         """
-        config = self.reload()
+        config = self.reload(force=True)
         if config.has_section(source_section):
             if not config.has_section(target_section):
                 config.add_section(target_section)
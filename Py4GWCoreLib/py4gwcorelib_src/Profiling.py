@@ -1,7 +1,11 @@
 import sys
+import os
+import json
+import math
 import time
 import cProfile
-from typing import Optional
+from collections import deque
+from typing import NamedTuple, Optional
 
 
 class SimpleProfiler:
@@ -107,15 +111,263 @@ class SimpleProfiler:
             self.disable()
 
 
+class ScopeStats(NamedTuple):
+    """Timing distribution of one scope over a window of frames, in milliseconds."""
+    count: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class Hitch(NamedTuple):
+    frame_index: int
+    frame_ms: float
+    threshold_ms: float
+    top_scopes: tuple  # ((category, name, ms), ...) slowest first
+
+
+class TimelineFrame:
+    __slots__ = ('index', 'start_ns', 'end_ns', 'scopes')
+
+    def __init__(self, index: int, start_ns: int):
+        self.index = index
+        self.start_ns = start_ns
+        self.end_ns = start_ns
+        self.scopes: list[tuple[str, str, int, int]] = []  # (category, name, start_ns, duration_ns)
+
+    @property
+    def duration_ns(self) -> int:
+        return self.end_ns - self.start_ns
+
+
+def _percentile(sorted_values: list, p: float):
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0
+    rank = max(1, math.ceil(p * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class ProfileTimeline:
+    """
+    Ring buffer of the last `capacity` frames of scope timings.
+
+    Scopes are recorded into the current frame; begin_frame() closes it and
+    flags it as a hitch when it took longer than hitch_ms or hitch_factor x
+    the median of the recent frames.  Captures can be exported as Chrome
+    trace-event JSON (chrome://tracing, Perfetto) or speedscope JSON.
+    """
+
+    def __init__(self, capacity: int = 600, hitch_ms: float = 50.0, hitch_factor: float = 2.5,
+                 hitch_capacity: int = 100):
+        self.capacity = max(1, capacity)
+        self.hitch_ms = hitch_ms
+        self.hitch_factor = hitch_factor
+        self.frames: deque[TimelineFrame] = deque(maxlen=self.capacity)
+        self.hitches: deque[Hitch] = deque(maxlen=max(1, hitch_capacity))
+        self._frame_index = 0
+        self._current: Optional[TimelineFrame] = None
+        self._recent_frame_ns: deque[int] = deque(maxlen=120)
+
+    def record(self, category: str, name: str, start_ns: int, duration_ns: int):
+        current = self._current
+        if current is None:
+            current = self._current = TimelineFrame(self._frame_index, start_ns)
+        current.scopes.append((category, name, start_ns, duration_ns))
+
+    def begin_frame(self, now_ns: Optional[int] = None):
+        """Close the current frame (if any) at now_ns and start the next one."""
+        if now_ns is None:
+            now_ns = time.perf_counter_ns()
+        current = self._current
+        if current is not None:
+            current.end_ns = max(now_ns, current.start_ns)
+            for _, _, start, duration in current.scopes:
+                if start + duration > current.end_ns:
+                    current.end_ns = start + duration
+            self.frames.append(current)
+            self._check_hitch(current)
+        self._frame_index += 1
+        self._current = TimelineFrame(self._frame_index, now_ns)
+
+    def _check_hitch(self, frame: TimelineFrame):
+        duration = frame.duration_ns
+        recent = self._recent_frame_ns
+        threshold_ns = self.hitch_ms * 1_000_000
+        if len(recent) >= 10:
+            threshold_ns = min(threshold_ns, self.hitch_factor * _percentile(sorted(recent), 0.5))
+        recent.append(duration)
+        if duration <= threshold_ns:
+            return
+        totals: dict[tuple[str, str], int] = {}
+        for category, name, _, scope_ns in frame.scopes:
+            totals[(category, name)] = totals.get((category, name), 0) + scope_ns
+        top = sorted(totals.items(), key=lambda kv: kv[1], reverse=True)[:5]
+        self.hitches.append(Hitch(
+            frame.index, duration / 1_000_000, threshold_ns / 1_000_000,
+            tuple((category, name, ns / 1_000_000) for (category, name), ns in top),
+        ))
+
+    def clear(self):
+        self.frames.clear()
+        self.hitches.clear()
+        self._recent_frame_ns.clear()
+        self._current = None
+
+    def _window(self, window: Optional[int]) -> list[TimelineFrame]:
+        frames = list(self.frames)
+        if window is not None and window < len(frames):
+            frames = frames[-window:] if window > 0 else []
+        return frames
+
+    # ─── Statistics ───────────────────────────────────────────────────
+
+    def scope_stats(self, window: Optional[int] = None) -> dict[tuple[str, str], ScopeStats]:
+        """Per (category, name) stats over the last `window` frames (all buffered frames by default).
+        A scope recorded more than once in a frame counts once, with the frame total."""
+        per_scope: dict[tuple[str, str], list[int]] = {}
+        for frame in self._window(window):
+            totals: dict[tuple[str, str], int] = {}
+            for category, name, _, duration in frame.scopes:
+                key = (category, name)
+                totals[key] = totals.get(key, 0) + duration
+            for key, duration in totals.items():
+                per_scope.setdefault(key, []).append(duration)
+        return {key: self._stats(values) for key, values in per_scope.items()}
+
+    def frame_stats(self, window: Optional[int] = None) -> ScopeStats:
+        """Wall time between begin_frame() calls over the last `window` frames."""
+        return self._stats([frame.duration_ns for frame in self._window(window)])
+
+    @staticmethod
+    def _stats(values_ns: list[int]) -> ScopeStats:
+        if not values_ns:
+            return ScopeStats(0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        ordered = sorted(values_ns)
+        ms = 1_000_000
+        return ScopeStats(
+            len(ordered),
+            sum(ordered) / len(ordered) / ms,
+            _percentile(ordered, 0.50) / ms,
+            _percentile(ordered, 0.95) / ms,
+            _percentile(ordered, 0.99) / ms,
+            ordered[-1] / ms,
+        )
+
+    # ─── Export ───────────────────────────────────────────────────────
+
+    def to_chrome_trace(self) -> dict:
+        """Chrome trace-event format: frames on tid 0, scopes on tid 1, hitches as instant events."""
+        frames = list(self.frames)
+        origin = frames[0].start_ns if frames else 0
+        hitch_frames = {hitch.frame_index for hitch in self.hitches}
+        events: list[dict] = [
+            {"name": "process_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": "Py4GW"}},
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": "Frames"}},
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": 1, "args": {"name": "Scopes"}},
+        ]
+        for frame in frames:
+            ts = (frame.start_ns - origin) / 1000.0
+            events.append({
+                "name": f"Frame {frame.index}", "cat": "frame", "ph": "X", "pid": 1, "tid": 0,
+                "ts": ts, "dur": frame.duration_ns / 1000.0,
+            })
+            if frame.index in hitch_frames:
+                events.append({
+                    "name": "Hitch", "cat": "hitch", "ph": "i", "s": "g", "pid": 1, "tid": 0, "ts": ts,
+                    "args": {"frame_ms": frame.duration_ns / 1_000_000},
+                })
+            for category, name, start, duration in frame.scopes:
+                events.append({
+                    "name": name, "cat": category, "ph": "X", "pid": 1, "tid": 1,
+                    "ts": (start - origin) / 1000.0, "dur": duration / 1000.0,
+                })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_speedscope(self, name: str = "Py4GW frames") -> dict:
+        """speedscope evented profile; each frame is a parent of the scopes recorded in it."""
+        frames = list(self.frames)
+        names: dict[str, int] = {}
+        shared_frames: list[dict] = []
+
+        def frame_id(label: str) -> int:
+            idx = names.get(label)
+            if idx is None:
+                idx = names[label] = len(shared_frames)
+                shared_frames.append({"name": label})
+            return idx
+
+        events: list[dict] = []
+        origin = frames[0].start_ns if frames else 0
+        end_value = 0
+        for frame in frames:
+            start = frame.start_ns - origin
+            end = max(start, frame.end_ns - origin)
+            root = frame_id("Frame")
+            events.append({"type": "O", "frame": root, "at": start})
+            # keep events properly nested: clamp scopes to their open parent
+            stack: list[tuple[int, int]] = []  # (frame id, end)
+            cursor = start
+            for category, scope_name, scope_start, duration in sorted(frame.scopes, key=lambda s: s[2]):
+                s0 = max(scope_start - origin, cursor, start)
+                while stack and stack[-1][1] <= s0:
+                    fid, close_at = stack.pop()
+                    events.append({"type": "C", "frame": fid, "at": close_at})
+                limit = stack[-1][1] if stack else end
+                s0 = min(s0, limit)
+                s1 = min(max(scope_start - origin + duration, s0), limit)
+                fid = frame_id(f"{category}/{scope_name}")
+                events.append({"type": "O", "frame": fid, "at": s0})
+                stack.append((fid, s1))
+                cursor = s0
+            while stack:
+                fid, close_at = stack.pop()
+                events.append({"type": "C", "frame": fid, "at": close_at})
+            events.append({"type": "C", "frame": root, "at": end})
+            end_value = end
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": shared_frames},
+            "profiles": [{
+                "type": "evented", "name": name, "unit": "nanoseconds",
+                "startValue": 0, "endValue": end_value, "events": events,
+            }],
+            "name": name,
+            "exporter": "Py4GW ProfileTimeline",
+        }
+
+    def export(self, filepath: str, format: str = "chrome") -> str:
+        """Write the capture as 'chrome' or 'speedscope' JSON (atomically); returns the path."""
+        if format == "chrome":
+            data = self.to_chrome_trace()
+        elif format == "speedscope":
+            data = self.to_speedscope()
+        else:
+            raise ValueError(f"Unknown timeline export format: {format}")
+        folder = os.path.dirname(filepath)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp_path = f"{filepath}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, filepath)
+        return filepath
+
+
 class ProfileScope:
-    __slots__ = ('timings', 'category', 'name', 'cprofiler', 't0')
+    __slots__ = ('timings', 'category', 'name', 'cprofiler', 't0', 'timeline')
 
     def __init__(self, timings: dict, category: str, name: str,
-                 cprofiler: Optional[cProfile.Profile] = None):
+                 cprofiler: Optional[cProfile.Profile] = None,
+                 timeline: Optional[ProfileTimeline] = None):
         self.timings = timings
         self.category = category
         self.name = name
         self.cprofiler = cprofiler
+        self.timeline = timeline
 
     def __enter__(self):
         self.t0 = time.perf_counter_ns()
@@ -129,8 +381,11 @@ class ProfileScope:
     def __exit__(self, *exc):
         if self.cprofiler:
             self.cprofiler.disable()
+        elapsed = time.perf_counter_ns() - self.t0
         cat = self.timings.setdefault(self.category, {})
-        cat[self.name] = time.perf_counter_ns() - self.t0
+        cat[self.name] = elapsed
+        if self.timeline is not None:
+            self.timeline.record(self.category, self.name, self.t0, elapsed)
         return False
 
 
@@ -140,6 +395,7 @@ class ProfilingRegistry:
     enabled: bool
     timings: dict[str, dict[str, int]]
     cprofile_targets: dict[str, cProfile.Profile]
+    timeline: Optional[ProfileTimeline]
 
     def __new__(cls):
         if cls._instance is None:
@@ -147,12 +403,14 @@ class ProfilingRegistry:
             cls._instance.enabled = False
             cls._instance.timings = {}
             cls._instance.cprofile_targets = {}
+            cls._instance.timeline = None
         return cls._instance
 
     def scope(self, category: str, name: str) -> ProfileScope:
         return ProfileScope(
             self.timings, category, name,
-            self.cprofile_targets.get(name)
+            self.cprofile_targets.get(name),
+            self.timeline,
         )
 
     def runcall_scope(self, category: str, name: str, func, *args, **kwargs):
@@ -169,9 +427,30 @@ class ProfilingRegistry:
                 result = func(*args, **kwargs)
         else:
             result = func(*args, **kwargs)
-        self.timings.setdefault(category, {})[name] = time.perf_counter_ns() - t0
+        elapsed = time.perf_counter_ns() - t0
+        self.timings.setdefault(category, {})[name] = elapsed
+        if self.timeline is not None:
+            self.timeline.record(category, name, t0, elapsed)
         return result
 
     def clear_frame(self):
         for cat in self.timings.values():
             cat.clear()
+
+    # ─── Timeline ─────────────────────────────────────────────────────
+
+    def start_timeline(self, capacity: int = 600, hitch_ms: float = 50.0, hitch_factor: float = 2.5) -> ProfileTimeline:
+        """Start recording scope timings per frame (only while `enabled`)."""
+        self.timeline = ProfileTimeline(capacity, hitch_ms, hitch_factor)
+        return self.timeline
+
+    def stop_timeline(self) -> Optional[ProfileTimeline]:
+        """Stop recording; returns the capture so it can still be inspected or exported."""
+        timeline, self.timeline = self.timeline, None
+        return timeline
+
+    def begin_frame(self):
+        """Frame boundary, called once per frame (PreUpdate). Free when no timeline is recording."""
+        timeline = self.timeline
+        if timeline is not None and self.enabled:
+            timeline.begin_frame()
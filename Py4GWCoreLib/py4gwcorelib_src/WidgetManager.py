@@ -25,8 +25,11 @@ from types import ModuleType
 from typing import Callable, Iterable, Literal, Optional
 
 from Py4GWCoreLib.py4gwcorelib_src.Color import Color
+from Py4GWCoreLib.py4gwcorelib_src.WidgetScheduler import WidgetScheduler, WidgetPriority, CallbackStats, DEFAULT_MAX_INTERVAL
+from Py4GWCoreLib.py4gwcorelib_src.WidgetMetadata import WidgetMetadata, WidgetManifest, CONSTANT_NAMES
 
 _profiling_registry = None
+_widget_scheduler: WidgetScheduler | None = None
 base_path = Py4GW.Console.get_projects_path()
 
 def _get_profiling():
@@ -34,8 +37,29 @@ def _get_profiling():
     if _profiling_registry is None:
         from Py4GWCoreLib.py4gwcorelib_src.Profiling import ProfilingRegistry
         _profiling_registry = ProfilingRegistry()
+        # Frame boundary for the profiling timeline (a no-op unless one is recording)
+        PyCallback.PyCallback.Register(
+            "ProfilingRegistry.BeginFrame",
+            PyCallback.Phase.PreUpdate,
+            _profiling_registry.begin_frame,
+            priority=0,
+            context=PyCallback.Context.Update
+        )
     return _profiling_registry
 
+def _get_scheduler() -> WidgetScheduler:
+    global _widget_scheduler
+    if _widget_scheduler is None:
+        _widget_scheduler = WidgetScheduler()
+        PyCallback.PyCallback.Register(
+            "WidgetScheduler.BeginFrame",
+            PyCallback.Phase.PreUpdate,
+            _widget_scheduler.begin_frame,
+            priority=1,
+            context=PyCallback.Context.Update
+        )
+    return _widget_scheduler
+
 #region Py4GW Library
 class LayoutMode(IntEnum):
     Library = 0
@@ -297,6 +321,7 @@ class WidgetCatalog:
 class Py4GWLibrary:
     CATEGORY_COLUMN_MAX_WIDTH = 200
     SYSTEM_COLOR = Color(255, 0, 0, 255)
+    THROTTLED_COLOR = Color(255, 165, 0, 255)
     TEXT_TINTED = Color(128, 128, 128, 255)
     IMAGE_SIZE = 40
     PADDING = 10
@@ -306,7 +331,7 @@ class Py4GWLibrary:
     
     def __init__(self, ini_key: str, module_name: str, widget_manager : "WidgetHandler"):
         self.ini_key = ini_key
-        self.module_name = module_name
+        self._module_name = module_name
         self.widget_manager = widget_manager
         self.widget_filter = ""
         
@@ -803,7 +828,7 @@ class Py4GWLibrary:
         if self.focus_search:
             PyImGui.set_next_window_focus()
              
-        if ImGui.Begin(ini_key=self.ini_key, name=self.module_name, flags=PyImGui.WindowFlags(PyImGui.WindowFlags.NoResize|PyImGui.WindowFlags.NoTitleBar|PyImGui.WindowFlags.NoScrollbar|PyImGui.WindowFlags.NoScrollWithMouse)):   
+        if ImGui.Begin(ini_key=self.ini_key, name=self._module_name, flags=PyImGui.WindowFlags(PyImGui.WindowFlags.NoResize|PyImGui.WindowFlags.NoTitleBar|PyImGui.WindowFlags.NoScrollbar|PyImGui.WindowFlags.NoScrollWithMouse)):   
             self._consume_pending_window_pos()
             win_size = PyImGui.get_window_size()
             self._current_window_pos = PyImGui.get_window_pos()
@@ -862,7 +887,7 @@ class Py4GWLibrary:
         if self.focus_search:
             PyImGui.set_next_window_focus()
              
-        if ImGui.Begin(ini_key=self.ini_key, name=self.module_name, flags=PyImGui.WindowFlags.NoResize | PyImGui.WindowFlags.NoTitleBar):   
+        if ImGui.Begin(ini_key=self.ini_key, name=self._module_name, flags=PyImGui.WindowFlags.NoResize | PyImGui.WindowFlags.NoTitleBar):   
             self._consume_pending_window_pos()
             window_hovered = PyImGui.is_window_hovered()
             win_size = PyImGui.get_window_size()
@@ -1111,7 +1136,7 @@ class Py4GWLibrary:
         if self.win_size:
             PyImGui.set_next_window_size(self.win_size, PyImGui.ImGuiCond.Always)
         self._apply_pending_window_pos()
-        window_open = ImGui.Begin(ini_key=self.ini_key, name=self.module_name, flags=PyImGui.WindowFlags.MenuBar)
+        window_open = ImGui.Begin(ini_key=self.ini_key, name=self._module_name, flags=PyImGui.WindowFlags.MenuBar)
         
         if window_open:            
             self._consume_pending_window_pos()
@@ -1697,6 +1722,12 @@ class Py4GWLibrary:
                     PyImGui.same_line(0, 3)
                     
                 ImGui.text_colored(name, self.name_color.color_tuple if not widget.enabled else self.name_enabled_color.color_tuple)
+                
+                if widget.enabled and widget.is_throttled:
+                    PyImGui.same_line(0, 3)
+                    ImGui.text_colored(IconsFontAwesome5.ICON_HOURGLASS_HALF, self.THROTTLED_COLOR.color_tuple, font_size=10)
+                    if PyImGui.is_item_hovered():
+                        PyImGui.show_tooltip(self.widget_manager.describe_throttling(widget))
 
                 if self.show_separator:
                     PyImGui.set_cursor_pos_y(PyImGui.get_cursor_pos_y() - 4)
@@ -1858,7 +1889,7 @@ class Py4GWLibrary:
         padding = self.single_button_size * 0.05
         ImGui.push_theme(StyleTheme.ImGui)
         style.WindowPadding.push_style_var_direct(padding, padding)
-        win_open = ImGui.Begin(ini_key=self.ini_key, name=self.module_name, flags=PyImGui.WindowFlags(PyImGui.WindowFlags.NoResize|
+        win_open = ImGui.Begin(ini_key=self.ini_key, name=self._module_name, flags=PyImGui.WindowFlags(PyImGui.WindowFlags.NoResize|
                                                                                                       PyImGui.WindowFlags.NoCollapse|
                                                                                                       PyImGui.WindowFlags.NoTitleBar|
                                                                                                       PyImGui.WindowFlags.NoScrollbar|
@@ -1948,7 +1979,8 @@ class Widget:
     on_enable: Optional[Callable] = field(default=None, init=False)
     on_disable: Optional[Callable] = field(default=None, init=False)
     
-    module: Optional[ModuleType] = field(default=None, init=False, repr=False)
+    _module: Optional[ModuleType] = field(default=None, init=False, repr=False)
+    _import_failed: bool = field(default=False, init=False, repr=False)
     __enabled: bool = field(default=False, init=False,)
     __configuring: bool = field(default=False, init=False)
     __paused: bool = field(default=False, init=False)
@@ -1960,6 +1992,13 @@ class Widget:
     aliases : list[str] = field(default_factory=list, init=False)
     category : str = field(default="", init=False)    
     
+    # Update scheduling (MODULE_PRIORITY / MODULE_MAX_UPDATE_INTERVAL)
+    priority : WidgetPriority = field(default=WidgetPriority.NORMAL, init=False)
+    max_update_interval : int = field(default=DEFAULT_MAX_INTERVAL, init=False)
+    
+    # Statically extracted metadata (WidgetMetadata), used until the module is imported
+    metadata : Optional[WidgetMetadata] = field(default=None, repr=False)
+    
     @property
     def is_paused(self) -> bool:
         """Check if the widget is paused"""
@@ -1975,13 +2014,26 @@ class Widget:
         """Check if the widget is in configuring state"""
         return self.__configuring
     
+    @property
+    def module(self) -> Optional[ModuleType]:
+        """The widget's module, imported on first access (catalogued widgets are not imported at startup)"""
+        if self._module is None and not self._import_failed:
+            self.load_module()
+        return self._module
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Check if the widget's module has been imported, without importing it"""
+        return self._module is not None
+    
     def load_module(self) -> bool:
         """Load the module if not already loaded"""
-        if self.module is not None:
+        if self._module is not None:
             return True  # Already loaded
         
         if not os.path.isfile(self.script_path):
             Py4GW.Console.Log("WidgetManager", f"Widget script not found: {self.script_path}", Py4GW.Console.MessageType.Error)
+            self._import_failed = True
             return False
         
         unique_name = f"py4gw_widget_{self.folder_script_name.replace('/', '_').replace('.', '_')}"
@@ -1999,40 +2051,69 @@ class Widget:
             del sys.modules[unique_name]
             self.disable()
             Py4GW.Console.Log("WidgetManager", f"Failed to load widget module '{self.folder_script_name}': {e}", Py4GW.Console.MessageType.Error)
+            self._import_failed = True
             return False
         
-        self.module = module
+        self._module = module
+        self._import_failed = False
         
-        if self.module:                
+        if self._module:                
             # --- capability flags (what exists in the widget module) ---
-            self.has_main_property      = callable(getattr(self.module, "main", None))
-            self.has_configure_property = callable(getattr(self.module, "configure", None))
-            self.has_update_property    = callable(getattr(self.module, "update", None))
-            self.has_draw_property      = callable(getattr(self.module, "draw", None))
-            self.has_tooltip_property   = callable(getattr(self.module, "tooltip", None))
+            self.has_main_property      = callable(getattr(self._module, "main", None))
+            self.has_configure_property = callable(getattr(self._module, "configure", None))
+            self.has_update_property    = callable(getattr(self._module, "update", None))
+            self.has_draw_property      = callable(getattr(self._module, "draw", None))
+            self.has_tooltip_property   = callable(getattr(self._module, "tooltip", None))
             
             # Extract main callback
-            self.main = getattr(self.module, "main", None) if self.has_main_property else None
-            self.configure = getattr(self.module, "configure", None) if self.has_configure_property else None
-            self.update = getattr(self.module, "update", None) if self.has_update_property else None
-            self.draw = getattr(self.module, "draw", None) if self.has_draw_property else None
-            self.tooltip = getattr(self.module, "tooltip", None) if self.has_tooltip_property else None
-            self.minimal = getattr(self.module, "minimal", None) if callable(getattr(self.module, "minimal", None)) else None
-            self.on_enable = getattr(self.module, "on_enable", None) if callable(getattr(self.module, "on_enable", None)) else None
-            self.on_disable = getattr(self.module, "on_disable", None) if callable(getattr(self.module, "on_disable", None)) else None
-            
-            self.name = getattr(self.module, 'MODULE_NAME', "") if hasattr(self.module, 'MODULE_NAME') else self.cleaned_name()
-            self.category = getattr(self.module, 'MODULE_CATEGORY', "") if hasattr(self.module, 'MODULE_CATEGORY') else (self.widget_path.split('/')[0] if self.widget_path else "") #get first folder after Widgets 
-            self.tags = getattr(self.module, 'MODULE_TAGS', []) if hasattr(self.module, 'MODULE_TAGS') else [folder for folder in self.widget_path.split('/') if folder]
-            self.aliases = [str(alias).strip() for alias in getattr(self.module, 'MODULE_ALIASES', []) if str(alias).strip()]
-            self.image = os.path.join(base_path, getattr(self.module, 'MODULE_ICON', "") if hasattr(self.module, 'MODULE_ICON') else "Textures\\missing_texture.png")
-            
-            self.optional = getattr(self.module, 'OPTIONAL', True) if hasattr(self.module, 'OPTIONAL') else self.category not in ["System", "Py4GW"] # System and Py4GW widgets are non-optional by default, all others are optional by default
+            self.main = getattr(self._module, "main", None) if self.has_main_property else None
+            self.configure = getattr(self._module, "configure", None) if self.has_configure_property else None
+            self.update = getattr(self._module, "update", None) if self.has_update_property else None
+            self.draw = getattr(self._module, "draw", None) if self.has_draw_property else None
+            self.tooltip = getattr(self._module, "tooltip", None) if self.has_tooltip_property else None
+            self.minimal = getattr(self._module, "minimal", None) if callable(getattr(self._module, "minimal", None)) else None
+            self.on_enable = getattr(self._module, "on_enable", None) if callable(getattr(self._module, "on_enable", None)) else None
+            self.on_disable = getattr(self._module, "on_disable", None) if callable(getattr(self._module, "on_disable", None)) else None
+            
+            self._apply_constants({name: getattr(self._module, name) for name in CONSTANT_NAMES if hasattr(self._module, name)})
               
         return True
     
+    def _apply_constants(self, constants: dict):
+        """Set display / scheduling properties from the widget's module-level constants"""
+        self.name = constants.get('MODULE_NAME', "") if 'MODULE_NAME' in constants else self.cleaned_name()
+        self.category = constants.get('MODULE_CATEGORY', "") if 'MODULE_CATEGORY' in constants else (self.widget_path.split('/')[0] if self.widget_path else "") #get first folder after Widgets 
+        self.tags = constants.get('MODULE_TAGS', []) if 'MODULE_TAGS' in constants else [folder for folder in self.widget_path.split('/') if folder]
+        self.aliases = [str(alias).strip() for alias in constants.get('MODULE_ALIASES', []) if str(alias).strip()]
+        self.image = os.path.join(base_path, constants.get('MODULE_ICON', "") if 'MODULE_ICON' in constants else "Textures\\missing_texture.png")
+        
+        self.optional = constants.get('OPTIONAL', True) if 'OPTIONAL' in constants else self.category not in ["System", "Py4GW"] # System and Py4GW widgets are non-optional by default, all others are optional by default
+        
+        # Non-optional widgets are never throttled unless they declare otherwise
+        default_priority = WidgetPriority.NORMAL if self.optional else WidgetPriority.CRITICAL
+        self.priority = WidgetPriority.coerce(constants.get('MODULE_PRIORITY', default_priority), default_priority)
+        try:
+            self.max_update_interval = max(1, int(constants.get('MODULE_MAX_UPDATE_INTERVAL', DEFAULT_MAX_INTERVAL)))
+        except (TypeError, ValueError):
+            self.max_update_interval = DEFAULT_MAX_INTERVAL
+    
+    def apply_metadata(self, metadata: WidgetMetadata):
+        """Describe the widget from statically extracted metadata, without importing its module"""
+        self.metadata = metadata
+        if self._module is not None:
+            return  # the loaded module is authoritative
+        
+        self.has_main_property      = metadata.has_callback("main")
+        self.has_configure_property = metadata.has_callback("configure")
+        self.has_update_property    = metadata.has_callback("update")
+        self.has_draw_property      = metadata.has_callback("draw")
+        self.has_tooltip_property   = metadata.has_callback("tooltip")
+        self._apply_constants(metadata.constants)
+    
     def set_configuring(self, state: bool):
         """Set configuring state"""
+        if state and self._module is None and not self.load_module():
+            return  # configure() lives in the module, which is only imported on demand
         self.__configuring = state
         
     def enable_configuring(self):
@@ -2071,23 +2152,42 @@ class Widget:
         if self.main_callback_id:
             PyCallback.PyCallback.ResumeById(self.main_callback_id)
             
+    def schedule_key(self, key: str = "update") -> str:
+        """Scheduler / profiler name of one of this widget's callbacks"""
+        return f"{self.folder_script_name}:{key}"
+    
+    @property
+    def is_throttled(self) -> bool:
+        """Check if the update callback is currently demoted or being deferred"""
+        return _widget_scheduler is not None and _widget_scheduler.is_throttled(self.schedule_key())
+            
     def RegisterCallbacks(self):
         """Register callbacks if they exist in the module"""
+        scheduler = _get_scheduler()
+        scheduler.configure(self.schedule_key(), self.priority, self.max_update_interval)
+        
         def wrap_profiler(key: str, fn: Callable):
             # We return a NEW function (lambda) that the C++ Callback system 
             # will store and execute every frame.
-            def callback_wrapper():
+            name = self.schedule_key(key)
+            budgeted = key == "update"
+            
+            def invoke():
                 profiling = _get_profiling()
                 if profiling.enabled:
                     # Executes fn() inside the profiling scope
-                    return profiling.runcall_scope("widgets", f"{self.folder_script_name}:{key}", fn)
+                    return profiling.runcall_scope("widgets", name, fn)
                 else:
                     # Executes fn() normally
                     return fn()
+                
+            def callback_wrapper():
+                # The scheduler times every call; update calls may be deferred when over budget
+                return scheduler.run(name, invoke, budgeted)
             
             return callback_wrapper
        
-        if self.module is None:
+        if self._module is None:
             return
         
         # 1. Update Callback (Logic Loop)
@@ -2123,8 +2223,12 @@ class Widget:
     def disable(self):
         """Disable the widget"""
         self.PauseCallbacks()
+        if _widget_scheduler is not None:
+            # Start with a fresh cost estimate when re-enabled
+            for key in ("update", "draw", "main"):
+                _widget_scheduler.forget(self.schedule_key(key))
         if self.__enabled:
-            if self.module is not None:
+            if self._module is not None:
                 try:
                     if self.on_disable:
                         self.on_disable()
@@ -2137,7 +2241,7 @@ class Widget:
         
     def enable(self):
         """Enable the widget"""
-        if self.enabled and self.module is not None: 
+        if self.enabled and self._module is not None: 
             return  # Already enabled
         
         # enable widget only if module loads successfully
@@ -2183,9 +2287,15 @@ class Widget:
         self.on_enable : Optional[Callable] = None
         self.on_disable : Optional[Callable] = None
         self.optional = True  
+        self.priority = WidgetPriority.NORMAL
+        self.max_update_interval = DEFAULT_MAX_INTERVAL
         self.__paused = True
         
-        self.load_module()
+        if self.metadata is not None and self.metadata.is_static:
+            # Catalog data only; the module is imported when the widget is enabled
+            self.apply_metadata(self.metadata)
+        else:
+            self.load_module()
         
             
     @property
@@ -2216,7 +2326,9 @@ class Widget:
     @property
     def is_global(self) -> bool:
         """Check if widget is global (works without account)"""
-        return bool(getattr(self.module, 'GLOBAL', False))
+        if self._module is None and self.metadata is not None:
+            return bool(self.metadata.constants.get('GLOBAL', False))
+        return bool(getattr(self._module, 'GLOBAL', False))
     
     def __getitem__(self, item):
         if item in self.__dict__:
@@ -2281,6 +2393,9 @@ class WidgetHandler:
         self.config_vars: list[WidgetConfigVars] = []
         self._pending_disable_widget: Widget | None = None
         
+        # Import-free catalog metadata, keyed by script path + mtime + size
+        self.manifest = WidgetManifest(os.path.join(Py4GW.Console.get_projects_path(), "data", "widget_manifest.json"))
+        
         
         
     # Properties
@@ -2444,6 +2559,12 @@ class WidgetHandler:
             if ".widget" in files:
                 for py_file in [f for f in files if f.endswith(".py")]:
                     self._load_widget_module(current_dir, py_file)
+        
+        self.manifest.prune(widget.script_path for widget in self.widgets.values())
+        try:
+            self.manifest.save()
+        except OSError as e:
+            self._log_error(f"Failed to save widget manifest: {e}")
 
     def _load_widget_module(self, folder: str, filename: str):
         """Load a widget module without INI configuration"""
@@ -2470,6 +2591,7 @@ class WidgetHandler:
                 ini_key="",           # Empty - will be set later
                 ini_path="",          # Empty - will be set later  
                 ini_filename="",      # Empty - will be set later                
+                metadata=self.manifest.get(script_path),  # falls back to importing when not fully static
             )
             
             # 3. Register
@@ -2566,6 +2688,8 @@ class WidgetHandler:
                         PyImGui.table_set_column_index(0)
 
                         display_name = widget.plain_name
+                        if widget.enabled and widget.is_throttled:
+                            display_name = f"{display_name} {IconsFontAwesome5.ICON_HOURGLASS_HALF}"
 
                         label = f"{display_name}##{widget_id}"
                         
@@ -2704,6 +2828,9 @@ class WidgetHandler:
         ImGui.show_tooltip(f"{("Pause" if not self.optional_widgets_paused else "Resume")} all optional widgets")
         ImGui.separator()
         
+        if ImGui.collapsing_header("Frame Budget##WidgetScheduler"):
+            self.draw_frame_budget_ui()
+        
         # ------------------------------------------------------------
         # Folder-based Widgets (TREE UI)
         # ------------------------------------------------------------
@@ -2721,6 +2848,51 @@ class WidgetHandler:
             
         self.draw_node(INI_KEY, tree)
 
+    def draw_frame_budget_ui(self):
+        scheduler = _get_scheduler()
+        
+        enabled = ImGui.checkbox("Enforce update budget", scheduler.enabled)
+        if enabled != scheduler.enabled:
+            scheduler.enabled = enabled
+        ImGui.show_tooltip("Defer and demote slow widget updates so they fit the per-frame budget.\nSystem widgets are never throttled.")
+        
+        PyImGui.push_item_width(150)
+        budget = ImGui.slider_float("Budget (ms)", scheduler.budget_ms, 1.0, 33.0)
+        PyImGui.pop_item_width()
+        if budget != scheduler.budget_ms:
+            scheduler.set_budget_ms(budget)
+        
+        PyImGui.text(f"Frame {scheduler.frame}: updates used {scheduler.spent_ns / 1_000_000:.2f} ms")
+        
+        throttled = self.get_throttled_widgets()
+        if not throttled:
+            PyImGui.text_disabled("No widgets are throttled")
+            return
+        
+        flags = PyImGui.TableFlags.Borders | PyImGui.TableFlags.RowBg | PyImGui.TableFlags.SizingStretchProp
+        if ImGui.begin_table("ThrottledWidgets##WidgetScheduler", 5, flags):
+            PyImGui.table_setup_column("Widget", PyImGui.TableColumnFlags.WidthStretch, 1.0)
+            PyImGui.table_setup_column("Priority", PyImGui.TableColumnFlags.WidthFixed, 60.0)
+            PyImGui.table_setup_column("Cost (ms)", PyImGui.TableColumnFlags.WidthFixed, 60.0)
+            PyImGui.table_setup_column("Every", PyImGui.TableColumnFlags.WidthFixed, 45.0)
+            PyImGui.table_setup_column("Deferred", PyImGui.TableColumnFlags.WidthFixed, 60.0)
+            PyImGui.table_headers_row()
+            
+            for widget, stats in throttled:
+                PyImGui.table_next_row()
+                PyImGui.table_set_column_index(0)
+                PyImGui.text(widget.name or widget.plain_name)
+                PyImGui.table_set_column_index(1)
+                PyImGui.text(stats.priority.name.title())
+                PyImGui.table_set_column_index(2)
+                PyImGui.text(f"{stats.cost_ms:.2f}")
+                PyImGui.table_set_column_index(3)
+                PyImGui.text(f"{stats.interval}/{stats.max_interval}")
+                PyImGui.table_set_column_index(4)
+                PyImGui.text(str(stats.deferred))
+                
+            ImGui.end_table()
+
     def prepare_discover(self):
         self.discovered = False
         self.ini_applied = False
@@ -2730,7 +2902,8 @@ class WidgetHandler:
     def execute_enabled_widgets_update(self):
         profiling = _get_profiling()
         profiling_enabled = profiling.enabled
-        pause_optional = self.pause_optional_widgets
+        scheduler = _get_scheduler()
+        pause_optional = self.optional_widgets_paused
 
         for widget_name, widget_info in self.widgets.items():
             if not widget_info.enabled or widget_info.is_paused:
@@ -2742,9 +2915,9 @@ class WidgetHandler:
             if widget_info.update is not None:
                 try:
                     if profiling_enabled:
-                        profiling.runcall_scope("widgets", f"{widget_name}:update", widget_info.update)
+                        scheduler.run(f"{widget_name}:update", lambda: profiling.runcall_scope("widgets", f"{widget_name}:update", widget_info.update))
                     else:
-                        widget_info.update()
+                        scheduler.run(f"{widget_name}:update", widget_info.update)
                 except Exception as e:
                     Py4GW.Console.Log("WidgetHandler", f"Error executing widget {widget_name}: {str(e)}", Py4GW.Console.MessageType.Error)
                     Py4GW.Console.Log("WidgetHandler", f"Stack trace: {traceback.format_exc()}", Py4GW.Console.MessageType.Error)
@@ -2904,6 +3077,29 @@ class WidgetHandler:
     def list_enabled_widgets(self) -> list[str]:
         return [name for name, info in self.widgets.items() if info.enabled]
     
+    def get_throttled_widgets(self) -> list[tuple[Widget, CallbackStats]]:
+        """Enabled widgets whose update is demoted or was deferred recently, most expensive first"""
+        result = []
+        for stats in _get_scheduler().throttled():
+            widget = self.widgets.get(stats.key.rsplit(":", 1)[0])
+            if widget and widget.enabled:
+                result.append((widget, stats))
+        return result
+    
+    def describe_throttling(self, widget: Widget) -> str:
+        stats = _get_scheduler().get_stats(widget.schedule_key())
+        if stats is None:
+            return "Not throttled"
+        return (
+            f"Throttled by the frame budget\n"
+            f"Update cost: {stats.cost_ms:.2f} ms (max {stats.max_ns / 1_000_000:.2f} ms)\n"
+            f"Runs every {stats.interval} frame(s), at least every {stats.max_interval}\n"
+            f"Deferred {stats.deferred} time(s), priority {stats.priority.name.title()}"
+        )
+    
+    def set_update_budget_ms(self, budget_ms: float):
+        _get_scheduler().set_budget_ms(budget_ms)
+    
     def enable_widget(self, name: str):
         self._set_widget_state(self.MANAGER_INI_KEY,name, True)
         if name == "HeroAI" or str(name).replace("\\", "/").endswith("/HeroAI.py"):
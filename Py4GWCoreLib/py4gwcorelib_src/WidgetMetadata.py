@@ -0,0 +1,351 @@
+"""
+Import-free widget metadata.
+
+The widget catalog only needs a widget's module-level constants (MODULE_NAME,
+MODULE_CATEGORY, MODULE_TAGS, MODULE_ICON, OPTIONAL, ...) and to know which
+callbacks it defines.  Both are read from the script's AST instead of
+executing it, so discovery no longer pays the import cost of every widget;
+modules are imported when a widget is enabled.
+
+Results are kept in a JSON manifest keyed by script path, mtime and size, so
+unchanged scripts are not even parsed on the next start.
+
+Constants are evaluated when they are literals, names bound to literals
+earlier in the module, string concatenation / f-strings of those, or
+os.path.join(...) of those.  Anything else (a value computed at import time,
+or a constant assigned inside an if/try block) is reported in
+``WidgetMetadata.unresolved`` and the caller falls back to importing.
+
+Only depends on the standard library.
+"""
+from __future__ import annotations
+
+import ast
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
+
+MANIFEST_VERSION = 1
+
+# Module-level constants read by Widget.load_module
+CONSTANT_NAMES = (
+    "MODULE_NAME",
+    "MODULE_CATEGORY",
+    "MODULE_TAGS",
+    "MODULE_ALIASES",
+    "MODULE_ICON",
+    "OPTIONAL",
+    "GLOBAL",
+    "MODULE_PRIORITY",
+    "MODULE_MAX_UPDATE_INTERVAL",
+)
+
+# Module-level callbacks picked up by Widget.load_module
+CALLBACK_NAMES = ("main", "update", "draw", "configure", "tooltip", "minimal", "on_enable", "on_disable")
+
+
+@dataclass
+class WidgetMetadata:
+    """Statically extracted description of one widget script"""
+    constants: dict[str, Any] = field(default_factory=dict)   # declared constants that could be evaluated
+    callbacks: tuple[str, ...] = ()                            # CALLBACK_NAMES bound at module level
+    unresolved: tuple[str, ...] = ()                           # declared constants that need an import to evaluate
+    error: str = ""                                            # read / syntax error, if any
+
+    @property
+    def is_static(self) -> bool:
+        """True when the metadata is complete without importing the module"""
+        return not self.unresolved and not self.error
+
+    def has_callback(self, name: str) -> bool:
+        return name in self.callbacks
+
+    def to_dict(self) -> dict:
+        return {
+            "constants": self.constants,
+            "callbacks": list(self.callbacks),
+            "unresolved": list(self.unresolved),
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "WidgetMetadata":
+        return cls(
+            constants=dict(data.get("constants", {})),
+            callbacks=tuple(data.get("callbacks", ())),
+            unresolved=tuple(data.get("unresolved", ())),
+            error=str(data.get("error", "")),
+        )
+
+
+class _Unresolved(Exception):
+    pass
+
+
+def _evaluate(node: ast.AST, env: dict[str, Any]) -> Any:
+    """Evaluate a constant expression; raises _Unresolved for anything that needs execution"""
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Name):
+        if node.id in env:
+            return env[node.id]
+        raise _Unresolved(node.id)
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        items = [_evaluate(elt, env) for elt in node.elts]
+        return items if isinstance(node, ast.List) else tuple(items) if isinstance(node, ast.Tuple) else set(items)
+    if isinstance(node, ast.Dict):
+        if any(key is None for key in node.keys):
+            raise _Unresolved("**")
+        return {_evaluate(k, env): _evaluate(v, env) for k, v in zip(node.keys, node.values)}  # type: ignore[arg-type]
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd, ast.Not)):
+        value = _evaluate(node.operand, env)
+        if isinstance(node.op, ast.Not):
+            return not value
+        return -value if isinstance(node.op, ast.USub) else +value
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        try:
+            return _evaluate(node.left, env) + _evaluate(node.right, env)
+        except TypeError:
+            raise _Unresolved("+")
+    if isinstance(node, ast.JoinedStr):
+        parts = []
+        for value in node.values:
+            if isinstance(value, ast.FormattedValue):
+                if value.conversion != -1 or value.format_spec is not None:
+                    raise _Unresolved("f-string")
+                parts.append(str(_evaluate(value.value, env)))
+            else:
+                parts.append(str(_evaluate(value, env)))
+        return "".join(parts)
+    if isinstance(node, ast.Call) and not node.keywords and _is_os_path_join(node.func):
+        args = [_evaluate(arg, env) for arg in node.args]
+        if not args or not all(isinstance(arg, str) for arg in args):
+            raise _Unresolved("os.path.join")
+        return os.path.join(*args)
+    raise _Unresolved(type(node).__name__)
+
+
+def _is_os_path_join(func: ast.AST) -> bool:
+    # os.path.join(...)
+    return (
+        isinstance(func, ast.Attribute) and func.attr == "join"
+        and isinstance(func.value, ast.Attribute) and func.value.attr == "path"
+        and isinstance(func.value.value, ast.Name) and func.value.value.id == "os"
+    )
+
+
+def _binding_targets(target: ast.AST) -> Iterable[str]:
+    if isinstance(target, ast.Name):
+        yield target.id
+    elif isinstance(target, (ast.Tuple, ast.List)):
+        for elt in target.elts:
+            yield from _binding_targets(elt)
+    elif isinstance(target, ast.Starred):
+        yield from _binding_targets(target.value)
+
+
+def _nested_bodies(stmt: ast.stmt) -> Iterable[list[ast.stmt]]:
+    """Statement lists executed at import time inside a compound module-level statement"""
+    if isinstance(stmt, (ast.If, ast.For, ast.While)):
+        yield stmt.body
+        yield stmt.orelse
+    elif isinstance(stmt, ast.With):
+        yield stmt.body
+    elif isinstance(stmt, ast.Try) or type(stmt).__name__ == "TryStar":
+        yield stmt.body  # type: ignore[attr-defined]
+        for handler in stmt.handlers:  # type: ignore[attr-defined]
+            yield handler.body
+        yield stmt.orelse  # type: ignore[attr-defined]
+        yield stmt.finalbody  # type: ignore[attr-defined]
+
+
+def extract_metadata_from_source(source: str | bytes, filename: str = "<widget>") -> WidgetMetadata:
+    """Extract widget metadata from script source without executing it"""
+    try:
+        tree = ast.parse(source, filename=filename)
+    except (SyntaxError, ValueError) as e:
+        return WidgetMetadata(error=f"{type(e).__name__}: {e}")
+
+    env: dict[str, Any] = {}          # module-level names bound to evaluable values
+    constants: dict[str, Any] = {}
+    unresolved: set[str] = set()
+    callables: dict[str, bool] = {}   # callback name -> callable?
+
+    def bind(name: str, value_node: Optional[ast.AST], conditional: bool, is_callable: Optional[bool] = None):
+        if name in CALLBACK_NAMES:
+            if is_callable is None:
+                # `draw = None` hides a callback; any other expression is assumed to be callable
+                is_callable = not (isinstance(value_node, ast.Constant) and value_node.value is None)
+            callables[name] = is_callable
+        if value_node is None or conditional:
+            env.pop(name, None)
+            if name in CONSTANT_NAMES:
+                constants.pop(name, None)
+                unresolved.add(name)
+            return
+        try:
+            value = _evaluate(value_node, env)
+        except _Unresolved:
+            env.pop(name, None)
+            if name in CONSTANT_NAMES:
+                constants.pop(name, None)
+                unresolved.add(name)
+            return
+        env[name] = value
+        if name in CONSTANT_NAMES:
+            constants[name] = value
+            unresolved.discard(name)
+
+    def visit(body: list[ast.stmt], conditional: bool):
+        for stmt in body:
+            if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                bind(stmt.name, None, True, is_callable=True)
+            elif isinstance(stmt, ast.Assign):
+                for target in stmt.targets:
+                    names = list(_binding_targets(target))
+                    single = isinstance(target, ast.Name)
+                    for name in names:
+                        bind(name, stmt.value if single else None, conditional or not single)
+            elif isinstance(stmt, ast.AnnAssign):
+                if isinstance(stmt.target, ast.Name) and stmt.value is not None:
+                    bind(stmt.target.id, stmt.value, conditional)
+            elif isinstance(stmt, ast.AugAssign):
+                for name in _binding_targets(stmt.target):
+                    bind(name, None, True)
+            elif isinstance(stmt, (ast.Import, ast.ImportFrom)):
+                for alias in stmt.names:
+                    if alias.name == "*":
+                        continue
+                    bound = alias.asname or alias.name.split(".")[0]
+                    bind(bound, None, True, is_callable=True)
+            else:
+                for nested in _nested_bodies(stmt):
+                    visit(nested, True)
+
+    visit(tree.body, False)
+
+    return WidgetMetadata(
+        constants=constants,
+        callbacks=tuple(name for name in CALLBACK_NAMES if callables.get(name)),
+        unresolved=tuple(sorted(unresolved)),
+    )
+
+
+def extract_metadata(script_path: str) -> WidgetMetadata:
+    """Extract widget metadata from a script file without importing it"""
+    try:
+        with open(script_path, "rb") as f:
+            source = f.read()
+    except OSError as e:
+        return WidgetMetadata(error=f"{type(e).__name__}: {e}")
+    return extract_metadata_from_source(source, script_path)
+
+
+def _json_safe(value: Any) -> bool:
+    try:
+        json.dumps(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+class WidgetManifest:
+    """
+    Metadata cache for widget scripts, persisted as JSON.
+    Entries are reused while a script's mtime and size are unchanged.
+    """
+
+    def __init__(self, manifest_path: Optional[str] = None):
+        self.manifest_path = manifest_path
+        self._entries: dict[str, dict] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        if manifest_path:
+            self.load()
+
+    @staticmethod
+    def _key(script_path: str) -> str:
+        return os.path.normcase(os.path.abspath(script_path))
+
+    def load(self) -> bool:
+        """Load the manifest file; a missing, corrupt or outdated file starts an empty manifest"""
+        self._entries = {}
+        self._dirty = False
+        if not self.manifest_path or not os.path.isfile(self.manifest_path):
+            return False
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION or not isinstance(data.get("entries"), dict):
+            return False
+        self._entries = data["entries"]
+        return True
+
+    def get(self, script_path: str) -> WidgetMetadata:
+        """Metadata for a script, parsing it only when it changed since the manifest entry was written"""
+        key = self._key(script_path)
+        try:
+            st = os.stat(script_path)
+        except OSError as e:
+            return WidgetMetadata(error=f"{type(e).__name__}: {e}")
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+            self.hits += 1
+            return WidgetMetadata.from_dict(entry["metadata"])
+
+        self.misses += 1
+        metadata = extract_metadata(script_path)
+        # Values that cannot round-trip through JSON are resolved by importing instead
+        for name in [n for n, v in metadata.constants.items() if not _json_safe(v)]:
+            del metadata.constants[name]
+            metadata.unresolved = tuple(sorted(set(metadata.unresolved) | {name}))
+        self._entries[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "metadata": metadata.to_dict()}
+        self._dirty = True
+        return metadata
+
+    def prune(self, script_paths: Iterable[str]) -> int:
+        """Drop entries for scripts that are no longer present; returns the number removed"""
+        keep = {self._key(p) for p in script_paths}
+        stale = [key for key in self._entries if key not in keep]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            self._dirty = True
+        return len(stale)
+
+    def clear(self):
+        self._entries.clear()
+        self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def save(self) -> bool:
+        """Write the manifest if it changed; the file is replaced atomically"""
+        if not self._dirty or not self.manifest_path:
+            return False
+        directory = os.path.dirname(self.manifest_path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".widget_manifest_", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": MANIFEST_VERSION, "entries": self._entries}, f, separators=(",", ":"))
+            os.replace(tmp_path, self.manifest_path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._dirty = False
+        return True
@@ -0,0 +1,223 @@
+"""Per-frame time budget for widget callbacks.
+
+Every widget callback runs through the wrapper installed by
+Widget.RegisterCallbacks, which passes it to WidgetScheduler.run.  The
+scheduler times each call and keeps a rolling (EMA) cost per callback key
+("folder/script.py:update").  Update callbacks are budgeted:
+
+    - a widget demoted to every Nth frame only runs once N frames have
+      passed since its last run;
+    - once the frame's update time is spent, callbacks whose estimated cost
+      does not fit the share of the budget left for their priority are
+      deferred to a later frame;
+    - a widget never waits longer than its max interval, and CRITICAL
+      widgets are never deferred or demoted.
+
+After every budgeted run the interval adapts: a widget whose amortised cost
+(cost / interval) is above its share of the budget is demoted (interval
+doubled, up to its max interval), and one that would stay well below it at
+half the interval is promoted again.  Draw/main callbacks are only timed.
+
+Widgets declare their scheduling with module attributes, read by
+Widget.load_module:
+
+    MODULE_PRIORITY = "low"              # WidgetPriority name or value
+    MODULE_MAX_UPDATE_INTERVAL = 8       # run update at least every 8th frame
+
+begin_frame() must run once per frame (WidgetManager registers it as a
+PreUpdate callback).  This module only depends on the standard library so it
+can be loaded by path (see tests/test_widget_scheduler.py).
+"""
+import time
+from enum import IntEnum
+from typing import Any, Callable, Optional
+
+DEFAULT_BUDGET_MS = 8.0
+DEFAULT_MAX_INTERVAL = 16
+
+_EMA_ALPHA = 0.2
+# Fraction of the frame budget one widget may cost per frame before it is demoted.
+_DEMOTE_FRACTION = 0.25
+# Frames a deferral keeps a widget listed as throttled.
+_THROTTLE_DISPLAY_FRAMES = 60
+
+
+class WidgetPriority(IntEnum):
+    LOW = 0
+    NORMAL = 1
+    HIGH = 2
+    CRITICAL = 3
+
+    @classmethod
+    def coerce(cls, value: Any, default: Optional["WidgetPriority"] = None) -> "WidgetPriority":
+        """Accept a WidgetPriority, its int value or its (case-insensitive) name."""
+        fallback = cls.NORMAL if default is None else default
+        if isinstance(value, str):
+            return cls.__members__.get(value.strip().upper(), fallback)
+        try:
+            return cls(int(value))
+        except (TypeError, ValueError):
+            return fallback
+
+
+# Share of the frame budget a callback of each priority may start into.
+_PRIORITY_SHARE = {
+    WidgetPriority.LOW: 0.5,
+    WidgetPriority.NORMAL: 0.8,
+    WidgetPriority.HIGH: 1.0,
+}
+
+
+class CallbackStats:
+    """Rolling cost and scheduling state of one callback."""
+    __slots__ = (
+        "key", "priority", "max_interval", "interval", "cost_ns", "last_ns", "max_ns",
+        "runs", "deferred", "last_run_frame", "last_deferred_frame", "budgeted",
+    )
+
+    def __init__(self, key: str, priority: WidgetPriority, max_interval: int):
+        self.key = key
+        self.priority = priority
+        self.max_interval = max_interval
+        self.interval = 1
+        self.cost_ns = 0.0
+        self.last_ns = 0
+        self.max_ns = 0
+        self.runs = 0
+        self.deferred = 0
+        self.last_run_frame = -1
+        self.last_deferred_frame = -1
+        self.budgeted = False
+
+    @property
+    def cost_ms(self) -> float:
+        return self.cost_ns / 1_000_000
+
+    @property
+    def amortized_ms(self) -> float:
+        return self.cost_ns / self.interval / 1_000_000
+
+
+class WidgetScheduler:
+    def __init__(self, budget_ms: float = DEFAULT_BUDGET_MS, enabled: bool = True,
+                 clock: Callable[[], int] = time.perf_counter_ns):
+        self.enabled = enabled
+        self.frame = 0
+        self.spent_ns = 0
+        self._budget_ns = int(budget_ms * 1_000_000)
+        self._clock = clock
+        self._stats: dict[str, CallbackStats] = {}
+
+    # ---------------- configuration ----------------
+    @property
+    def budget_ms(self) -> float:
+        return self._budget_ns / 1_000_000
+
+    def set_budget_ms(self, budget_ms: float) -> None:
+        self._budget_ns = max(0, int(budget_ms * 1_000_000))
+
+    def configure(self, key: str, priority: Any = WidgetPriority.NORMAL,
+                  max_interval: int = DEFAULT_MAX_INTERVAL) -> CallbackStats:
+        """Declare priority and max interval for key (keeps its measured cost)."""
+        stats = self._stats_for(key)
+        stats.priority = WidgetPriority.coerce(priority)
+        stats.max_interval = max(1, int(max_interval))
+        stats.interval = min(stats.interval, stats.max_interval)
+        if stats.priority == WidgetPriority.CRITICAL:
+            stats.interval = 1
+        return stats
+
+    def forget(self, key: str) -> None:
+        self._stats.pop(key, None)
+
+    def reset(self) -> None:
+        """Drop all measurements and restart the frame count."""
+        self._stats.clear()
+        self.frame = 0
+        self.spent_ns = 0
+
+    # ---------------- per frame ----------------
+    def begin_frame(self) -> None:
+        self.frame += 1
+        self.spent_ns = 0
+
+    def should_run(self, key: str) -> bool:
+        """Decide whether the budgeted callback key runs this frame."""
+        if not self.enabled:
+            return True
+        stats = self._stats.get(key)
+        if stats is None or stats.priority == WidgetPriority.CRITICAL or stats.last_run_frame < 0:
+            return True
+        waited = self.frame - stats.last_run_frame
+        if waited >= stats.max_interval:
+            return True
+        if waited < stats.interval:
+            return self._defer(stats)
+        share = _PRIORITY_SHARE[stats.priority]
+        if self.spent_ns + stats.cost_ns > self._budget_ns * share and self.spent_ns > 0:
+            return self._defer(stats)
+        return True
+
+    def record(self, key: str, elapsed_ns: int, budgeted: bool = True) -> None:
+        stats = self._stats_for(key)
+        stats.runs += 1
+        stats.last_ns = elapsed_ns
+        if elapsed_ns > stats.max_ns:
+            stats.max_ns = elapsed_ns
+        stats.cost_ns = elapsed_ns if stats.runs == 1 else stats.cost_ns + _EMA_ALPHA * (elapsed_ns - stats.cost_ns)
+        stats.last_run_frame = self.frame
+        stats.budgeted = budgeted
+        if not budgeted:
+            return
+        self.spent_ns += elapsed_ns
+        if self.enabled and stats.priority != WidgetPriority.CRITICAL:
+            self._adapt(stats)
+
+    def run(self, key: str, fn: Callable[[], Any], budgeted: bool = True) -> Optional[Any]:
+        """Run fn under key, timing it; returns None without calling fn when deferred."""
+        if budgeted and not self.should_run(key):
+            return None
+        start = self._clock()
+        try:
+            return fn()
+        finally:
+            self.record(key, self._clock() - start, budgeted)
+
+    # ---------------- inspection ----------------
+    def get_stats(self, key: str) -> Optional[CallbackStats]:
+        return self._stats.get(key)
+
+    def all_stats(self) -> list[CallbackStats]:
+        return list(self._stats.values())
+
+    def is_throttled(self, key: str) -> bool:
+        stats = self._stats.get(key)
+        if stats is None:
+            return False
+        recently_deferred = stats.last_deferred_frame >= 0 and self.frame - stats.last_deferred_frame <= _THROTTLE_DISPLAY_FRAMES
+        return stats.interval > 1 or recently_deferred
+
+    def throttled(self) -> list[CallbackStats]:
+        """Budgeted callbacks that are demoted or were deferred recently, most expensive first."""
+        result = [s for s in self._stats.values() if s.budgeted and self.is_throttled(s.key)]
+        result.sort(key=lambda s: s.cost_ns, reverse=True)
+        return result
+
+    # ---------------- internal ----------------
+    def _stats_for(self, key: str) -> CallbackStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = CallbackStats(key, WidgetPriority.NORMAL, DEFAULT_MAX_INTERVAL)
+        return stats
+
+    def _defer(self, stats: CallbackStats) -> bool:
+        stats.deferred += 1
+        stats.last_deferred_frame = self.frame
+        return False
+
+    def _adapt(self, stats: CallbackStats) -> None:
+        limit = self._budget_ns * _PRIORITY_SHARE[stats.priority] * _DEMOTE_FRACTION
+        if stats.cost_ns / stats.interval > limit:
+            stats.interval = min(stats.interval * 2, stats.max_interval)
+        elif stats.interval > 1 and stats.cost_ns / (stats.interval // 2) < limit / 2:
+            stats.interval //= 2
@@ -7,7 +7,7 @@ class _RProxy:
 
 Routines = _RProxy()
 
-from ..enums_src.GameData_enums import Range
+from ..enums_src.GameData_enums import Range, Allegiance
 from ..Player import Player
 
 #region Targetting
@@ -629,7 +629,6 @@ class Targeting:
         """
         from ..AgentArray import AgentArray
         from ..Agent import Agent
-        from .Agents import Agents
 
         cached_data = Targeting._resolve_cached_data(cached_data)
 
@@ -648,16 +647,14 @@ class Targeting:
         if not corpses:
             return 0
 
+        snapshot = AgentArray.GetSnapshot()
+        enemy_grid = snapshot.alive_grid(Allegiance.Enemy.value)
+
         best_corpse_id = 0
         best_count = -1
         for corpse_id in corpses:
-            corpse_x, corpse_y = Agent.GetXY(corpse_id)
-            enemy_targets = Agents.GetFilteredEnemyArray(corpse_x, corpse_y, cluster_radius)
-            enemy_targets = AgentArray.Filter.ByCondition(
-                enemy_targets,
-                lambda eid: Agent.IsValid(eid) and Agent.IsAlive(eid),
-            )
-            count = len(enemy_targets) if enemy_targets else 0
+            corpse_x, corpse_y = snapshot.get_xy(corpse_id)
+            count = enemy_grid.count_within(corpse_x, corpse_y, cluster_radius)
             if count < min_enemy_targets:
                 continue
             if count > best_count:
@@ -676,21 +673,18 @@ class Targeting:
         available, otherwise the class-level singleton is used.
         """
         from ..AgentArray import AgentArray
-        from ..Agent import Agent
-        from .Agents import Agents
 
         cached_data = Targeting._resolve_cached_data(cached_data)
 
         if not agent_id or cluster_radius <= 0:
             return 0
 
-        target_x, target_y = Agent.GetXY(agent_id)
-        nearby = Agents.GetFilteredEnemyArray(target_x, target_y, cluster_radius)
-        nearby = AgentArray.Filter.ByCondition(
-            nearby,
-            lambda nid: Agent.IsValid(nid) and not Agent.IsDead(nid),
-        )
-        return max(0, len(nearby) - 1)
+        # The alive-enemy grid is cached on this frame's agent snapshot, so
+        # scoring many candidates only pays for the cells each query touches.
+        snapshot = AgentArray.GetSnapshot()
+        target_x, target_y = snapshot.get_xy(agent_id)
+        enemy_grid = snapshot.alive_grid(Allegiance.Enemy.value)
+        return max(0, enemy_grid.count_within(target_x, target_y, cluster_radius) - 1)
 
     @staticmethod
     def PickClusteredTarget(
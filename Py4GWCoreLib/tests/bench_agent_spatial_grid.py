@@ -0,0 +1,118 @@
+"""Benchmark: AgentSpatialGrid vs the previous O(n^2) clustering/targeting routines.
+
+The "old" functions reproduce the previous algorithms of
+AgentArray.Routines.DetectLargestAgentCluster and Targeting.PickClusteredTarget
+(one full enemy range filter per scored candidate), reading positions from a
+dict instead of Agent.GetXY.  In game every GetXY is a ctypes read, so the
+real-world gap is larger than shown here.
+
+NOTE: Requires the game runtime (Py4GW DLLs) because Py4GWCoreLib imports
+depend on PyScanner/PyPathing/etc.  Run from within an injected Python session.
+
+    python bench_agent_spatial_grid.py
+"""
+
+import sys
+import os
+import math
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+AGENT_COUNTS = [200, 300, 600]
+CLUSTER_RADIUS = 322.0   # Range.Area
+FILTER_RADIUS = 1248.0   # Range.Spellcast
+REPEATS = 5
+
+
+def _best_ms(fn, repeats=REPEATS):
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000.0
+
+
+def _make_agents(count, seed=3):
+    rng = random.Random(seed)
+    centres = [(rng.uniform(-3000, 3000), rng.uniform(-3000, 3000)) for _ in range(8)]
+    pos = {}
+    for i in range(count):
+        cx, cy = rng.choice(centres)
+        pos[1000 + i] = (cx + rng.gauss(0.0, 350.0), cy + rng.gauss(0.0, 350.0))
+    return pos
+
+
+def _old_detect_largest_cluster(agent_array, pos, cluster_radius):
+    cluster_radius_sq = cluster_radius ** 2
+
+    def is_in_radius(a, b):
+        (x1, y1), (x2, y2) = pos[a], pos[b]
+        return (x1 - x2) ** 2 + (y1 - y2) ** 2 <= cluster_radius_sq
+
+    unvisited = set(agent_array)
+    clusters = []
+    while unvisited:
+        current = unvisited.pop()
+        cluster, stack = [current], [current]
+        while stack:
+            node = stack.pop()
+            for n in [a for a in list(unvisited) if is_in_radius(node, a)]:
+                unvisited.remove(n)
+                cluster.append(n)
+                stack.append(n)
+        clusters.append(cluster)
+    largest = max(clusters, key=len)
+    cx = sum(pos[a][0] for a in largest) / len(largest)
+    cy = sum(pos[a][1] for a in largest) / len(largest)
+    return min(largest, key=lambda a: math.dist(pos[a], (cx, cy)))
+
+
+def _old_pick_clustered_target(enemies, pos, player_pos, cluster_radius, filter_radius):
+    def count_nearby(agent_id):
+        x, y = pos[agent_id]
+        nearby = [e for e in enemies if math.dist((x, y), pos[e]) <= cluster_radius]
+        return max(0, len(nearby) - 1)
+
+    candidates = [e for e in enemies if math.dist(player_pos, pos[e]) <= filter_radius]
+    scored = sorted(candidates, key=lambda c: (-count_nearby(c), math.dist(player_pos, pos[c])))
+    return scored[0] if scored else 0
+
+
+def _new_pick_clustered_target(grid, pos, player_pos, cluster_radius, filter_radius):
+    candidates = grid.query_radius(player_pos[0], player_pos[1], filter_radius)
+    counts = grid.neighbor_counts(cluster_radius, candidates)
+    scored = sorted(candidates, key=lambda c: (-counts[c], math.dist(player_pos, pos[c])))
+    return scored[0] if scored else 0
+
+
+def main():
+    from Py4GWCoreLib.native_src.ShMem.AgentSpatialGrid import AgentSpatialGrid
+
+    print(f"{'agents':>7} {'routine':>22} {'old ms':>9} {'grid ms':>9} {'speed-up':>9}")
+    for count in AGENT_COUNTS:
+        pos = _make_agents(count)
+        ids = list(pos)
+        xs = [pos[a][0] for a in ids]
+        ys = [pos[a][1] for a in ids]
+        player_pos = (0.0, 0.0)
+
+        old_ms = _best_ms(lambda: _old_detect_largest_cluster(ids, pos, CLUSTER_RADIUS), repeats=2)
+        new_ms = _best_ms(lambda: AgentSpatialGrid(ids, xs, ys, CLUSTER_RADIUS).densest_cluster_center(CLUSTER_RADIUS))
+        print(f"{count:>7} {'largest cluster':>22} {old_ms:>9.2f} {new_ms:>9.2f} {old_ms / new_ms:>8.1f}x")
+
+        old_ms = _best_ms(lambda: _old_pick_clustered_target(ids, pos, player_pos, CLUSTER_RADIUS, FILTER_RADIUS), repeats=2)
+        new_ms = _best_ms(lambda: _new_pick_clustered_target(
+            AgentSpatialGrid(ids, xs, ys), pos, player_pos, CLUSTER_RADIUS, FILTER_RADIUS))
+        print(f"{count:>7} {'pick clustered target':>22} {old_ms:>9.2f} {new_ms:>9.2f} {old_ms / new_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    try:
+        import Py4GWCoreLib.native_src.ShMem.AgentSpatialGrid  # noqa: F401
+    except ImportError as e:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {e}")
+    else:
+        main()
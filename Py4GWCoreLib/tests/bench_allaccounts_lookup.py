@@ -0,0 +1,126 @@
+"""Micro-benchmark: AllAccounts lookups, linear slot scans vs the generation-keyed index.
+
+Both sides read the same fabricated buffer (make_accounts() from
+test_allaccounts_slot_index.py, all 64 slots populated): the legacy view is an
+AllAccounts subclass that keeps the old 64-slot scans, the indexed view is the
+current class.  Timings are per call, with the index warm (no generation
+change), which is the steady state between slot submissions.
+
+NOTE: Requires the game runtime (Py4GW DLLs) because Py4GWCoreLib imports
+depend on PyScanner/PyPathing/etc.  Run from within an injected Python session.
+
+    python bench_allaccounts_lookup.py
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+CALLS = 2000
+REPEATS = 5
+
+
+def _legacy_view(accounts):
+    from Py4GWCoreLib.GlobalCache.shared_memory_src.AllAccounts import AllAccounts
+    from Py4GWCoreLib.GlobalCache.shared_memory_src.Globals import SHMEM_MAX_PLAYERS
+
+    class LegacyAllAccounts(AllAccounts):
+        """The lookups as they were before the index: every call scans all slots."""
+
+        def _account_slots_for_email(self, account_email):
+            return tuple(i for i in range(SHMEM_MAX_PLAYERS)
+                         if self.AccountData[i].AccountEmail == account_email and self.AccountData[i].IsAccount)
+
+        def _find_player_slot_by_key(self, account_email, hwnd):
+            if not account_email or not hwnd:
+                return -1
+            for i in range(SHMEM_MAX_PLAYERS):
+                account = self.AccountData[i]
+                if not account.IsAccount:
+                    continue
+                if account.AccountEmail != account_email:
+                    continue
+                key = self.Keys[i]
+                if key.HWND == hwnd and key.EntityType == 0:
+                    return i
+            return -1
+
+        def _find_slot_by_key(self, hwnd, entity_type, local_index):
+            if not hwnd:
+                return -1
+            for i in range(SHMEM_MAX_PLAYERS):
+                key = self.Keys[i]
+                if key.HWND == hwnd and key.EntityType == entity_type and key.LocalIndex == local_index:
+                    return i
+            return -1
+
+        def GetAllMessages(self):
+            messages = []
+            for index in range(SHMEM_MAX_PLAYERS):
+                message = self.Inbox[index]
+                if message.Active and self._can_communicate(message.SenderEmail, message.ReceiverEmail):
+                    messages.append((index, message))
+            return messages
+
+        def GetNextMessage(self, account_email):
+            for index in range(SHMEM_MAX_PLAYERS):
+                message = self.Inbox[index]
+                if (message.ReceiverEmail == account_email and message.Active and not message.Running
+                        and self._can_communicate(message.SenderEmail, account_email)):
+                    return index, message
+            return -1, None
+
+    return LegacyAllAccounts.from_buffer(accounts)
+
+
+def _time_per_call(fn, args_list):
+    best = float("inf")
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        for args in args_list:
+            fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(args_list) * 1e6
+
+
+def main():
+    from test_allaccounts_slot_index import BASE_HWND, make_accounts
+
+    accounts, emails = make_accounts()
+    legacy = _legacy_view(accounts)
+    keys = [(int(k.HWND), int(k.EntityType), int(k.LocalIndex)) for k in accounts.Keys]
+    email_args = [(emails[i % len(emails)],) for i in range(CALLS)]
+    cases = [
+        ("_find_account_slot_by_email", "_find_account_slot_by_email", email_args),
+        ("_find_player_slot_by_key", "_find_player_slot_by_key",
+         [(emails[i % len(emails)], BASE_HWND + (i % 16) * 4) for i in range(CALLS)]),
+        ("_find_slot_by_key", "_find_slot_by_key", [keys[i % len(keys)] for i in range(CALLS)]),
+        ("_can_communicate", "_can_communicate",
+         [(emails[i % len(emails)], emails[(i * 7) % len(emails)]) for i in range(CALLS)]),
+        ("GetNextMessage", "GetNextMessage", email_args),
+        ("GetAllMessages", "GetAllMessages", [()] * (CALLS // 10)),
+    ]
+    print(f"64 populated slots, {len(accounts.GetAllMessages())} visible messages; us per call")
+    print(f"{'lookup':>30} {'scan':>9} {'indexed':>9} {'speedup':>8}")
+    for label, method, args_list in cases:
+        scan_us = _time_per_call(getattr(legacy, method), args_list)
+        indexed_us = _time_per_call(getattr(accounts, method), args_list)
+        print(f"{label:>30} {scan_us:>9.2f} {indexed_us:>9.2f} {scan_us / indexed_us:>7.1f}x")
+
+    t0 = time.perf_counter()
+    for _ in range(100):
+        accounts.MarkSlotTableChanged()
+        accounts._slot_index()
+    print(f"index rebuild after a slot-table change: {(time.perf_counter() - t0) / 100 * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    try:
+        import Py4GWCoreLib.GlobalCache.shared_memory_src.AllAccounts  # noqa: F401
+    except ImportError as e:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {e}")
+    else:
+        main()
@@ -0,0 +1,64 @@
+"""Tick benchmark: BehaviorTree with per-node timing on every tick vs sampled timing.
+
+A synthetic tree of about 1000 nodes (see synthetic_behavior_tree.py) is
+ticked repeatedly with
+
+    timed      - timing_sample_rate=1, every node timed on every tick (default)
+    sampled    - timing_sample_rate=16, one tree tick in 16 is timed
+    untimed    - timing_sample_rate=0, timed only while the profiler is enabled
+
+NOTE: Requires the game runtime (Py4GW DLLs) because Py4GWCoreLib imports
+depend on PyScanner/PyPathing/etc.  Run from within an injected Python session.
+
+    python bench_behavior_tree_tick.py
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_behavior_tree import build_tree, walk
+
+NODE_COUNT = 1000
+TICKS = 300
+REPEATS = 3
+MODES = [("timed", 1), ("sampled", 16), ("untimed", 0)]
+
+
+def _run(tree, clock, ticks):
+    for tick in range(ticks):
+        clock["tick"] = tick
+        tree.tick()
+
+
+def main():
+    from Py4GWCoreLib.py4gwcorelib_src.BehaviorTree import BehaviorTree
+
+    results = {}
+    for label, rate in MODES:
+        best = float("inf")
+        for _ in range(REPEATS):
+            tree, clock = build_tree(BehaviorTree, NODE_COUNT, timing_sample_rate=rate)
+            t0 = time.perf_counter()
+            _run(tree, clock, TICKS)
+            best = min(best, time.perf_counter() - t0)
+        ticked = sum(node.tick_count for node in walk(tree.root)) / TICKS
+        results[label] = best
+        print(f"{label:>8}: {best / TICKS * 1000:8.3f} ms/tree tick "
+              f"({sum(1 for _ in walk(tree.root))} nodes, {ticked:.0f} node ticks per tree tick)")
+
+    base = results["timed"]
+    for label, _ in MODES[1:]:
+        print(f"{label} speedup vs timed: {base / results[label]:.2f}x")
+
+
+if __name__ == "__main__":
+    try:
+        import Py4GWCoreLib.py4gwcorelib_src.BehaviorTree  # noqa: F401
+    except ImportError as e:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {e}")
+    else:
+        main()
@@ -0,0 +1,80 @@
+"""Benchmark: batch point location (TrapezoidBSP.find_many / contains_many) vs scalar calls.
+
+10k random points over each synthetic mesh (padded so about a third fall
+off the mesh) are located once per point with find / find_with_margin
+("scalar") and in one find_many / contains_many call ("batch").  Times are
+microseconds per point; "x" is the scalar time over the batch time.
+"chunks" repeats the batch in calls of 200 points, the size of a frame's
+worth of follow-point or waypoint checks.  "same" confirms the batch
+answers equal the scalar ones.
+
+NOTE: Requires the game runtime (Py4GW DLLs) because Py4GWCoreLib imports
+depend on PyScanner/PyPathing/etc.  Run from within an injected Python session.
+
+    python bench_bsp_batch.py
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_navmesh import make_pathing_maps, random_points
+
+SIZES = [(20, 30, 1), (40, 60, 1), (80, 100, 2)]
+POINTS = 10_000
+CHUNK = 200
+TOL = 20.0        # find_trapezoid_id_by_coord default
+MARGIN = 20.0     # contains default
+
+
+def _per_point_us(fn, count):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - t0) * 1e6 / count
+
+
+def _chunked(batch_fn, xs, ys):
+    out = []
+    for k in range(0, len(xs), CHUNK):
+        out += batch_fn(xs[k:k + CHUNK], ys[k:k + CHUNK])
+    return out
+
+
+def main():
+    from Py4GWCoreLib.Pathing import NavMesh
+
+    print(f"{'traps':>7} {'query':>9} {'scalar us':>10} {'batch us':>9} {'x':>6} {'chunks us':>10} {'x':>6} {'same':>5}")
+    for cols, rows, layers in SIZES:
+        maps = make_pathing_maps(cols=cols, rows=rows, layers=layers, hole_ratio=0.15, slant=0.5)
+        bsp = NavMesh(maps, 1)._bsp
+        bsp._get_leaf_arrays()          # built once per mesh, like the tree itself
+        points = random_points(maps, POINTS, pad=2000.0, seed=17)
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        n = len(bsp._traps)
+
+        queries = [
+            ("find", lambda: [bsp.find(x, y, TOL) for x, y in points],
+             lambda qx, qy: bsp.find_many(qx, qy, TOL)),
+            ("contains", lambda: [bsp.find_with_margin(x, y, MARGIN) for x, y in points],
+             lambda qx, qy: bsp.contains_many(qx, qy, MARGIN)),
+        ]
+        for name, scalar_fn, batch_fn in queries:
+            scalar, scalar_us = _per_point_us(scalar_fn, POINTS)
+            batch, batch_us = _per_point_us(lambda: batch_fn(xs, ys), POINTS)
+            chunked, chunk_us = _per_point_us(lambda: _chunked(batch_fn, xs, ys), POINTS)
+            same = batch == scalar and chunked == scalar
+            print(f"{n:>7} {name:>9} {scalar_us:>10.2f} {batch_us:>9.2f} {scalar_us / batch_us:>6.1f} "
+                  f"{chunk_us:>10.2f} {scalar_us / chunk_us:>6.1f} {str(same):>5}")
+
+
+if __name__ == "__main__":
+    try:
+        import Py4GWCoreLib.Pathing  # noqa: F401
+    except ImportError as e:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {e}")
+    else:
+        main()
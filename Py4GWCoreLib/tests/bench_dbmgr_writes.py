@@ -0,0 +1,124 @@
+"""Benchmark: DBMgr write paths on a temp-directory database.
+
+Compares 10k single-row inserts on the previous path (open a connection,
+apply the PRAGMAs, execute, commit and close per call — reproduced here the
+way DBMgr._execute used to do it) against the pooled per-thread connection,
+InsertMany (one transaction) and the write-behind worker.
+
+DBMgr.py is loaded by path, so this runs without the game runtime:
+
+    python bench_dbmgr_writes.py
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+import importlib.util
+from pathlib import Path
+
+ROWS = 10_000
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_DBMGR_PATH = os.path.join(_REPO_ROOT, "Py4GWCoreLib", "database_src", "DBMgr.py")
+_CATALOG_SQL = os.path.join(_REPO_ROOT, "data", "db_setup", "001_catalog.sql")
+
+FIELDS = ["id", "name", "qty"]
+COLUMNS = [("id", "INTEGER", "PRIMARY KEY"), ("name", "TEXT"), ("qty", "INTEGER")]
+
+
+def _load_dbmgr():
+    spec = importlib.util.spec_from_file_location("_dbmgr_bench", _DBMGR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.DBMgr
+
+
+def _rows(offset):
+    return [(offset + i, f"item{i}", i % 250) for i in range(ROWS)]
+
+
+def _old_insert(db_path, sql, params):
+    """One write on the previous path: fresh connection + PRAGMAs + commit + close."""
+    conn = sqlite3.connect(str(db_path))
+    conn.row_factory = sqlite3.Row
+    try:
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA busy_timeout = 5000")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA cache_size = -8000")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        cursor = conn.execute(sql, params)
+        conn.commit()
+        return cursor.lastrowid or cursor.rowcount
+    finally:
+        conn.close()
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) * 1000.0
+
+
+def main():
+    cwd = os.getcwd()
+    root = tempfile.mkdtemp(prefix="dbmgr_bench_")
+    try:
+        setup_dir = Path(root) / "data" / "db_setup"
+        setup_dir.mkdir(parents=True)
+        shutil.copy(_CATALOG_SQL, setup_dir / "001_catalog.sql")
+        os.chdir(root)
+
+        DBMgr = _load_dbmgr()
+        DBMgr("PRIMARY").Register("bench", "bench.db")
+        db = DBMgr("bench")
+        db.CreateTable("items", COLUMNS)
+        sql = db._insert_sql("items", FIELDS)
+
+        results = []
+        rows = _rows(0)
+        results.append(("single Insert, per-call connection", _timed(
+            lambda: [_old_insert(db._db_path, sql, r) for r in rows])))
+        rows = _rows(ROWS)
+        results.append(("single Insert, pooled connection", _timed(
+            lambda: [db.Insert("items", FIELDS, list(r)) for r in rows])))
+        rows = _rows(2 * ROWS)
+        results.append(("InsertMany (one transaction)", _timed(
+            lambda: db.InsertMany("items", FIELDS, rows))))
+        rows = _rows(3 * ROWS)
+        results.append(("UpsertMany (one transaction)", _timed(
+            lambda: db.UpsertMany("items", FIELDS, rows))))
+
+        DBMgr.StartWriteBehind(flush_interval_ms=20)
+        rows = _rows(4 * ROWS)
+
+        def deferred():
+            for r in rows:
+                db.InsertDeferred("items", FIELDS, r)
+            DBMgr.FlushWrites()
+
+        results.append(("InsertDeferred + FlushWrites", _timed(deferred)))
+        DBMgr.StopWriteBehind()
+        assert db.Count("items") == 5 * ROWS
+
+        baseline = results[0][1]
+        print(f"{ROWS} rows per run")
+        print(f"{'path':>38} {'ms':>10} {'speed-up':>9}")
+        for label, ms in results:
+            print(f"{label:>38} {ms:>10.1f} {baseline / ms:>8.1f}x")
+        DBMgr.CloseConnections()
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    try:
+        _load_dbmgr()
+    except Exception as e:
+        print(f"SKIP: Cannot load DBMgr.py: {e}")
+    else:
+        main()
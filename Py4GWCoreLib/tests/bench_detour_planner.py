@@ -0,0 +1,109 @@
+"""Benchmark: smart-unstuck slalom planning with and without the DetourPlanner cache.
+
+Replays party detours (every follower of a party planning around the same
+enemy groups within a few hundred ms, enemies jittered a few units per
+client) on a synthetic navmesh, or a JSON-lines file of layouts recorded in
+game with DetourPlanner.record_layouts / save_layouts.  Recorded layouts are
+replayed on the synthetic mesh too (the bench has no client), so only their
+enemy geometry is realistic.
+
+"uncached" is the planning code called directly, "cached" one shared
+DetourPlanner.  Quality columns compare the paths: "planned" is the share of
+layouts that got a detour, "len" the mean detour length over the straight
+distance, "clear" the mean closest approach of a path segment to an enemy in
+touch radii (1.0 = skims the circle), "walkable" the share of paths whose
+every segment passes NavMesh.segment_block with the contains margin.
+
+NOTE: Requires the game runtime (Py4GW DLLs) because Py4GWCoreLib imports
+depend on PyScanner/PyPathing/etc.  Run from within an injected Python session.
+
+    python bench_detour_planner.py [recorded_layouts.jsonl]
+"""
+
+import sys
+import os
+import math
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_navmesh import make_pathing_maps
+from synthetic_enemy_layouts import make_party_detours, plan_layout
+
+EVENTS = 60
+FOLLOWERS = 7
+
+
+def _segment_point_distance(a, b, p):
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    len_sq = dx * dx + dy * dy
+    t = 0.0 if len_sq < 1e-9 else max(0.0, min(1.0, ((p[0] - a[0]) * dx + (p[1] - a[1]) * dy) / len_sq))
+    return math.hypot(p[0] - (a[0] + t * dx), p[1] - (a[1] + t * dy))
+
+
+def _quality(nav, layouts, results):
+    planned = lengths = clearances = walkable = 0.0
+    for layout, (waypoints, *_rest) in zip(layouts, results):
+        if not waypoints:
+            continue
+        planned += 1
+        path = [tuple(layout["current"])] + list(waypoints) + [tuple(layout["follow"])]
+        legs = list(zip(path, path[1:]))
+        direct = math.dist(path[0], path[-1])
+        lengths += sum(math.dist(a, b) for a, b in legs) / max(direct, 1.0)
+        radius = layout["touch_radius"]
+        clearances += min(_segment_point_distance(a, b, e) for a, b in legs[1:-1] or legs for e in layout["enemies"]) / radius
+        margin = layout["navmesh_contains_margin"]
+        walkable += all(nav.segment_block(a, b, margin, end_slack=margin) is None for a, b in zip(waypoints, waypoints[1:]))
+    n = max(planned, 1.0)
+    return planned / len(layouts), lengths / n, clearances / n, walkable / n
+
+
+def _timed(layouts, nav, planner):
+    times = []
+    results = []
+    for layout in layouts:
+        t0 = time.perf_counter()
+        results.append(plan_layout(layout, nav, planner))
+        times.append((time.perf_counter() - t0) * 1e3)
+    times.sort()
+    return results, sum(times) / len(times), times[int(len(times) * 0.95)]
+
+
+def main(recorded_path=None):
+    from Py4GWCoreLib.Pathing import NavMesh
+    from HeroAI.follow.detour_planner import DetourPlanner
+
+    nav = NavMesh(make_pathing_maps(cols=30, rows=40, hole_ratio=0.12, seed=5, slant=0.4), 1)
+    if recorded_path:
+        layouts = DetourPlanner.load_layouts(recorded_path)
+        print(f"{len(layouts)} recorded layouts from {recorded_path}")
+    else:
+        layouts = make_party_detours(nav, events=EVENTS, followers=FOLLOWERS)
+        print(f"{len(layouts)} synthetic layouts ({EVENTS} party detours x {FOLLOWERS} followers)")
+
+    print(f"\n{'planner':>9} {'mean ms':>8} {'p95 ms':>7} {'planned':>8} {'len':>5} {'clear':>6} {'walkable':>9}")
+    uncached, mean_ms, p95_ms = _timed(layouts, nav, None)
+    planned, length, clear, walkable = _quality(nav, layouts, uncached)
+    print(f"{'uncached':>9} {mean_ms:>8.2f} {p95_ms:>7.2f} {planned:>8.0%} {length:>5.2f} {clear:>6.2f} {walkable:>9.0%}")
+
+    planner = DetourPlanner()
+    cached, mean_ms, p95_ms = _timed(layouts, nav, planner)
+    planned, length, clear, walkable = _quality(nav, layouts, cached)
+    print(f"{'cached':>9} {mean_ms:>8.2f} {p95_ms:>7.2f} {planned:>8.0%} {length:>5.2f} {clear:>6.2f} {walkable:>9.0%}")
+
+    stats = planner.stats
+    same = sum(a == b for a, b in zip(uncached, cached))
+    print(f"\noutline hits {stats.boundary_hits}/{stats.boundary_hits + stats.boundary_misses}, "
+          f"side path hits {stats.path_hits}/{stats.path_hits + stats.path_misses}, "
+          f"identical plans {same}/{len(layouts)}")
+
+
+if __name__ == "__main__":
+    try:
+        import Py4GWCoreLib.Pathing  # noqa: F401
+    except ImportError as e:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {e}")
+    else:
+        main(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,121 @@
+"""Benchmark: IniHandler batched flush vs the previous write-per-key path.
+
+Simulates a widget-heavy session: WIDGETS INI files, each receiving
+KEYS_PER_FLUSH dirty keys per flush (what IniManager._flush_callback
+collects across a throttle period), plus the per-frame reads widgets make.
+The "old" handler reproduces the previous behaviour: every write reloads
+the file (mtime check) and rewrites it in place, every read stats the file.
+
+IniHandler is loaded by path, so this runs without the game runtime:
+
+    python bench_ini_flush.py
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import configparser
+import importlib.util
+
+WIDGETS = 12
+KEYS_PER_FLUSH = 300
+FLUSHES = 5
+READS_PER_FLUSH = 2000
+
+_INI_HANDLER_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "py4gwcorelib_src", "IniHandler.py",
+)
+
+
+def _load_ini_handler():
+    spec = importlib.util.spec_from_file_location("_ini_handler_bench", _INI_HANDLER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.IniHandler
+
+
+class _OldIniHandler:
+    """The previous IniHandler read/write path (reload on every call, in-place save)."""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.last_modified = 0
+        self.config = configparser.ConfigParser()
+        if not os.path.exists(filename):
+            open(filename, "w").close()
+        self.reload()
+
+    def reload(self):
+        current_mtime = os.path.getmtime(self.filename)
+        if current_mtime != self.last_modified:
+            self.last_modified = current_mtime
+            self.config.read(self.filename, encoding="utf-8")
+        return self.config
+
+    def save(self, config):
+        with open(self.filename, "w", encoding="utf-8") as f:
+            config.write(f)
+        self.config = config
+        self.last_modified = os.path.getmtime(self.filename)
+
+    def write_key(self, section, key, value):
+        config = self.reload()
+        if not config.has_section(section):
+            config.add_section(section)
+        config.set(section, key, str(value))
+        self.save(config)
+
+    def read_key(self, section, key, default=""):
+        try:
+            return self.reload().get(section, key)
+        except (configparser.NoOptionError, configparser.NoSectionError):
+            return default
+
+
+def _session(handlers, write, end_flush):
+    for round_no in range(FLUSHES):
+        for handler in handlers:
+            for _ in range(READS_PER_FLUSH // len(handlers)):
+                handler.read_key("Section1", "key1", "")
+            for i in range(KEYS_PER_FLUSH):
+                write(handler, f"Section{i % 10}", f"key{i}", round_no * 1000 + i)
+            end_flush(handler)
+
+
+def main():
+    IniHandler = _load_ini_handler()
+    root = tempfile.mkdtemp(prefix="ini_bench_")
+    try:
+        old = [_OldIniHandler(os.path.join(root, f"old_{w}.ini")) for w in range(WIDGETS)]
+        t0 = time.perf_counter()
+        _session(old, lambda h, s, k, v: h.write_key(s, k, v), lambda h: None)
+        old_ms = (time.perf_counter() - t0) * 1000.0
+
+        new = [IniHandler(os.path.join(root, f"new_{w}.ini")) for w in range(WIDGETS)]
+        t0 = time.perf_counter()
+        _session(new, lambda h, s, k, v: h.set_key(s, k, v), lambda h: h.flush())
+        new_ms = (time.perf_counter() - t0) * 1000.0
+
+        for w in range(WIDGETS):
+            with open(os.path.join(root, f"old_{w}.ini"), encoding="utf-8") as a, \
+                    open(os.path.join(root, f"new_{w}.ini"), encoding="utf-8") as b:
+                assert a.read() == b.read()
+
+        writes = WIDGETS * KEYS_PER_FLUSH * FLUSHES
+        print(f"{WIDGETS} files x {KEYS_PER_FLUSH} keys x {FLUSHES} flushes = {writes} key writes, "
+              f"{READS_PER_FLUSH * FLUSHES} reads")
+        print(f"{'write per key (old)':>26} {old_ms:>10.1f} ms")
+        print(f"{'batched atomic flush':>26} {new_ms:>10.1f} ms   {old_ms / new_ms:.1f}x")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    try:
+        _load_ini_handler()
+    except Exception as e:
+        print(f"SKIP: Cannot load IniHandler.py: {e}")
+    else:
+        main()
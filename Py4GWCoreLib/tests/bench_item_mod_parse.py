@@ -0,0 +1,76 @@
+"""Parse benchmark: cached ItemModifierParser vs re-parsing every item.
+
+A fixture of loot-like weapon modifier sets (see synthetic_item_mods.py) is
+parsed three ways:
+
+    uncached   - decode + build properties for every item (what every
+                 ItemModifierParser / ItemMod.get_item_upgrades call did)
+    cold       - ItemModifierParser.parse_many on an empty cache
+                 (identical sets inside the batch are parsed once)
+    warm       - the same bag again, e.g. the next frame or the next rule pass
+
+NOTE: Requires the game runtime (Py4GW DLLs) because Py4GWCoreLib imports
+depend on PyScanner/PyPathing/etc.  Run from within an injected Python session.
+
+    python bench_item_mod_parse.py
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_item_mods import loot_fixture
+
+SIZES = [500, 2000, 5000]
+REPEATS = 3
+
+
+def _best_ms(fn, setup=None, repeats=REPEATS):
+    best = float("inf")
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000.0
+
+
+def main():
+    from Py4GWCoreLib.enums_src.Item_enums import Rarity
+    from Py4GWCoreLib.item_mods_src import item_modifier_parser
+    from Py4GWCoreLib.item_mods_src.item_modifier_parser import ItemModifierParser
+    from Py4GWCoreLib.item_mods_src.item_mod import ItemMod
+
+    def uncached(items):
+        for runtime_modifiers, rarity in items:
+            modifiers = item_modifier_parser._decode(runtime_modifiers)
+            item_modifier_parser._build_properties(modifiers, Rarity(rarity))
+
+    def cached_upgrades(items):
+        for parsed in ItemModifierParser.parse_many(items):
+            ItemMod.get_item_upgrades_from_parsed(parsed)
+
+    print(f"{'items':>6} {'unique':>7} {'uncached ms':>12} {'cold ms':>9} {'warm ms':>9} {'warm us/item':>13} {'speedup':>8}")
+    for count in SIZES:
+        items = loot_fixture(count)
+        t_uncached = _best_ms(lambda: uncached(items), repeats=1)
+        t_cold = _best_ms(lambda: cached_upgrades(items), setup=ItemModifierParser.clear_cache)
+        ItemModifierParser.clear_cache()
+        cached_upgrades(items)
+        unique = ItemModifierParser.cache_info()["size"]
+        t_warm = _best_ms(lambda: cached_upgrades(items))
+        print(f"{count:>6} {unique:>7} {t_uncached:>12.1f} {t_cold:>9.1f} {t_warm:>9.1f} "
+              f"{t_warm * 1000.0 / count:>13.2f} {t_uncached / t_warm:>7.0f}x")
+
+
+if __name__ == "__main__":
+    try:
+        import Py4GWCoreLib.item_mods_src.item_modifier_parser  # noqa: F401
+    except ImportError as e:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {e}")
+    else:
+        main()
@@ -0,0 +1,86 @@
+"""Load-time benchmark: binary NavMesh cache vs the previous pickle cache vs a full rebuild.
+
+The pickle path reproduces what NavMesh.load_from_file used to do: unpickle
+the portal dictionaries and rebuild the TrapezoidBSP from the trapezoids.
+
+NOTE: Requires the game runtime (Py4GW DLLs) because Py4GWCoreLib imports
+depend on PyScanner/PyPathing/etc.  Run from within an injected Python session.
+
+    python bench_navmesh_cache.py
+"""
+
+import sys
+import os
+import pickle
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_navmesh import make_pathing_maps
+
+SIZES = [(20, 20, 1), (50, 40, 2), (80, 60, 3)]
+REPEATS = 5
+
+
+def _best_ms(fn, repeats=REPEATS):
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000.0
+
+
+def _pickle_save(nav, path):
+    data = {
+        "map_id": nav.map_id,
+        "portal_graph": nav.portal_graph,
+        "portal_costs": nav.portal_costs,
+        "trap_id_to_layer": nav.trap_id_to_layer,
+    }
+    with open(path, "wb") as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _pickle_load(pathing_maps, path):
+    from Py4GWCoreLib.Pathing import TrapezoidBSP
+
+    trapezoids = {}
+    trap_id_to_layer = {}
+    for i, layer in enumerate(pathing_maps):
+        trapezoids.update({t.id: t for t in layer.trapezoids})
+        trap_id_to_layer.update({t.id: i for t in layer.trapezoids})
+    bsp = TrapezoidBSP(list(trapezoids.values()))
+    with open(path, "rb") as f:
+        data = pickle.load(f)
+    return bsp, data
+
+
+def main():
+    from Py4GWCoreLib.Pathing import NavMesh
+
+    folder = tempfile.mkdtemp()
+    print(f"{'traps':>7} {'rebuild ms':>11} {'pickle ms':>10} {'binary ms':>10} {'speed-up':>9}")
+    for cols, rows, layers in SIZES:
+        maps = make_pathing_maps(cols=cols, rows=rows, layers=layers, hole_ratio=0.1)
+        map_id = cols * 1000 + rows
+        nav = NavMesh(maps, map_id)
+        nav.save_to_file(folder)
+        pickle_path = os.path.join(folder, f"navmesh_{map_id}.pkl")
+        _pickle_save(nav, pickle_path)
+
+        rebuild_ms = _best_ms(lambda: NavMesh(maps, map_id), repeats=2)
+        pickle_ms = _best_ms(lambda: _pickle_load(maps, pickle_path))
+        binary_ms = _best_ms(lambda: NavMesh.load_from_file(maps, map_id, folder))
+        print(f"{len(nav.trapezoids):>7} {rebuild_ms:>11.1f} {pickle_ms:>10.1f} {binary_ms:>10.1f} {pickle_ms / binary_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    try:
+        import Py4GWCoreLib.Pathing  # noqa: F401
+    except ImportError as e:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {e}")
+    else:
+        main()
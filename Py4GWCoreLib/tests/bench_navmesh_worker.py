@@ -0,0 +1,106 @@
+"""Benchmark: navmesh construction on the game thread vs in a background build.
+
+For synthetic multi-layer maps: "inline ms" is NavMesh(pathing_maps) on the
+calling thread, what a map arrival cost before.  With a background build
+the game thread only takes the snapshot ("snapshot ms") and restores the
+finished cache ("restore ms"); "process ms" / "thread ms" are the wall
+times until the result is ready with each NavMeshBuildJob backend.
+
+"frame" is the mean / longest simulated frame while the build runs: a
+done() poll plus a fixed amount of Python work that takes about 2 ms on an
+idle interpreter.  With the thread backend the frame shares the GIL with
+the build; with the process backend only the snapshot pickling does, but on
+a machine with a single free core the worker competes with the frame for CPU.
+
+NOTE: Requires the game runtime (Py4GW DLLs) because Py4GWCoreLib imports
+depend on PyScanner/PyPathing/etc.  Run from within an injected Python session.
+
+    python bench_navmesh_worker.py
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_navmesh import make_pathing_maps
+
+SIZES = [(30, 40, 2), (50, 60, 3), (60, 80, 4)]
+FRAME_WORK_MS = 2.0
+
+
+def _timed_ms(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - t0) * 1e3
+
+
+def _frame_work(n):
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+
+def _calibrate_frame():
+    n = 10_000
+    while True:
+        _, ms = _timed_ms(lambda: _frame_work(n))
+        if ms >= FRAME_WORK_MS:
+            return n
+        n = int(n * FRAME_WORK_MS / max(ms, 0.05)) + 1
+
+
+def _run_frames(job, work):
+    """Simulated frames until the job is done; returns (wall ms, mean frame ms, longest frame ms)."""
+    frames = []
+    t_start = time.perf_counter()
+    while True:
+        t0 = time.perf_counter()
+        finished = job.done()
+        _frame_work(work)
+        frames.append((time.perf_counter() - t0) * 1e3)
+        if finished:
+            return (time.perf_counter() - t_start) * 1e3, sum(frames) / len(frames), max(frames)
+        time.sleep(0.001)
+
+
+def main():
+    from Py4GWCoreLib.Pathing import NavMesh
+    from Py4GWCoreLib.pathing_src.navmesh_build import snapshot_pathing_maps
+    from Py4GWCoreLib.pathing_src.navmesh_worker import NavMeshBuildJob, find_python_executable
+
+    work = _calibrate_frame()
+    print(f"worker interpreter: {find_python_executable()}, {os.cpu_count()} cores")
+    print(f"\n{'traps':>7} {'layers':>6} {'inline ms':>10} {'snapshot ms':>12} {'restore ms':>11} "
+          f"{'process ms':>11} {'frame':>11} {'thread ms':>10} {'frame':>11}")
+    for cols, rows, layers in SIZES:
+        maps = make_pathing_maps(cols=cols, rows=rows, layers=layers, hole_ratio=0.1, slant=0.5)
+        nav, inline_ms = _timed_ms(lambda: NavMesh(maps, 1))
+        snapshot, snapshot_ms = _timed_ms(lambda: snapshot_pathing_maps(maps, 1))
+
+        columns = []
+        blob = None
+        for use_process in (True, False):
+            job = NavMeshBuildJob(snapshot, use_process=use_process)
+            wall_ms, frame_mean, frame_max = _run_frames(job, work)
+            assert job.result() is not None, job.error
+            blob = job.result()
+            columns.append((wall_ms, f"{frame_mean:.1f}/{frame_max:.1f}"))
+        restored, restore_ms = _timed_ms(lambda: NavMesh.from_cache_bytes(maps, 1, blob, verify_geometry=False))
+        assert restored is not None and restored.portal_graph == nav.portal_graph
+
+        (process_ms, process_frame), (thread_ms, thread_frame) = columns
+        print(f"{len(nav.trapezoids):>7} {layers:>6} {inline_ms:>10.0f} {snapshot_ms:>12.1f} {restore_ms:>11.1f} "
+              f"{process_ms:>11.0f} {process_frame:>11} {thread_ms:>10.0f} {thread_frame:>11}")
+
+
+if __name__ == "__main__":
+    try:
+        import Py4GWCoreLib.Pathing  # noqa: F401
+    except ImportError as e:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {e}")
+    else:
+        main()
@@ -0,0 +1,183 @@
+"""Benchmark: exact closest-point projection vs the centroid snap it replaced.
+
+Part 1 projects random off-mesh points (margin 20, the
+find_nearest_reachable default) and reports the cost per query and how far
+each answer is from the query point: the former centroid snap lands in the
+middle of the closest trapezoid, the projection on its nearest walkable
+point.  Part 2 mimics one follow-formation publish: 7 slots near a wall, each
+with the fallback candidates leader_publish generates (party midpoints, four
+spots around each member, the raw point).  "scan" resolves them one by one
+with contains + centroid snap until one is accepted; "batch" settles
+on-mesh candidates with contains and snaps the off-mesh ones that come
+before each slot's first accepted candidate in one find_nearest_reachable_many
+call.  "snapped" counts those projections per publish, "drift" is how far a
+replaced FollowPos ends up from its formation spot.
+
+NOTE: Requires the game runtime (Py4GW DLLs) because Py4GWCoreLib imports
+depend on PyScanner/PyPathing/etc.  Run from within an injected Python session.
+
+    python bench_nearest_reachable.py
+"""
+
+import sys
+import os
+import math
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_navmesh import make_pathing_maps, random_points
+
+SIZES = [(40, 60, 1), (80, 100, 2)]
+QUERIES = 2000
+MARGIN = 20.0
+PUBLISHES = 200
+ADJACENT = 156.0       # Range.Adjacent
+SPELLCAST = 1248.0     # Range.Spellcast
+
+
+def centroid_snap(nav, point, margin):
+    """find_nearest_reachable before the projection: the centroid of the closest trapezoid."""
+    if nav.contains(point[0], point[1], margin):
+        return point
+    t_id = nav.find_nearest_trapezoid_id(point[0], point[1])
+    return None if t_id is None else nav.get_position(t_id)
+
+
+def formation_candidates(raw, members):
+    """The fallback candidate order of FollowFormationPublisher._followpos_candidates."""
+    candidates = sorted(
+        (((a[0] + b[0]) / 2.0, (a[1] + b[1]) / 2.0) for i, a in enumerate(members) for b in members[i + 1:]),
+        key=lambda p: math.dist(p, raw),
+    )
+    for cx, cy in sorted(members, key=lambda p: math.dist(p, raw)):
+        length = math.hypot(raw[0] - cx, raw[1] - cy)
+        nx, ny = ((raw[0] - cx) / length, (raw[1] - cy) / length) if length > 0.001 else (0.0, -1.0)
+        candidates += [(cx + nx * ADJACENT, cy + ny * ADJACENT), (cx - nx * ADJACENT, cy - ny * ADJACENT),
+                       (cx - ny * ADJACENT, cy + nx * ADJACENT), (cx + ny * ADJACENT, cy - nx * ADJACENT), (cx, cy)]
+    return candidates + [raw]
+
+
+def _publish_scenarios(nav, maps, rng):
+    """(anchor, [(raw, fallback members)]) with the anchor near the mesh border and raws off-mesh."""
+    anchors = [p for p in random_points(maps, PUBLISHES * 20, pad=0.0, seed=5)
+               if nav.contains(p[0], p[1], MARGIN) and not nav.contains(p[0], p[1], 400.0)]
+    scenarios = []
+    for anchor in anchors[:PUBLISHES]:
+        party = [anchor] + [(anchor[0] + rng.uniform(-400, 400), anchor[1] + rng.uniform(-400, 400)) for _ in range(7)]
+        slots = []
+        for k in range(1, 8):
+            angle = rng.uniform(0.0, 2.0 * math.pi)
+            raw = (anchor[0] + math.cos(angle) * 600.0, anchor[1] + math.sin(angle) * 600.0)
+            slots.append((raw, [p for j, p in enumerate(party) if j != k]))
+        scenarios.append((anchor, slots))
+    return scenarios
+
+
+def scan_publish(nav, anchor, slots):
+    out = []
+    for raw, members in slots:
+        if nav.contains(raw[0], raw[1], MARGIN):
+            out.append(raw)
+            continue
+        for candidate in formation_candidates(raw, members):
+            snapped = centroid_snap(nav, candidate, MARGIN)
+            if snapped is not None and math.dist(snapped, anchor) <= SPELLCAST:
+                out.append(snapped)
+                break
+        else:
+            out.append(anchor)
+    return out
+
+
+def batch_publish(nav, anchor, slots):
+    out = [raw for raw, _ in slots]
+    pending = [k for k, (raw, _) in enumerate(slots) if not nav.contains(raw[0], raw[1], MARGIN)]
+    index, chains = {}, []
+    for k in pending:
+        to_snap, accepted = [], None
+        for c in formation_candidates(slots[k][0], slots[k][1]):
+            if not nav.contains(c[0], c[1], MARGIN):
+                to_snap.append(index.setdefault(c, len(index)))
+            elif math.dist(c, anchor) <= SPELLCAST:
+                accepted = c
+                break
+        chains.append((to_snap, accepted))
+    snapped = nav.find_nearest_reachable_many(list(index), MARGIN) if index else []
+    for k, (to_snap, accepted) in zip(pending, chains):
+        out[k] = next((snapped[i] for i in to_snap
+                       if snapped[i] is not None and math.dist(snapped[i], anchor) <= SPELLCAST),
+                      accepted if accepted is not None else anchor)
+    return out
+
+
+def _count_snaps(nav, scenarios):
+    calls = []
+    original = nav.find_nearest_reachable_many
+    nav.find_nearest_reachable_many = lambda points, margin: calls.append(len(points)) or original(points, margin)
+    try:
+        for anchor, slots in scenarios:
+            batch_publish(nav, anchor, slots)
+    finally:
+        del nav.find_nearest_reachable_many
+    return sum(calls) / len(scenarios)
+
+
+def main():
+    from Py4GWCoreLib.Pathing import NavMesh
+
+    print(f"{'traps':>7} {'centroid us':>12} {'exact us':>9} {'batch us':>9} {'centroid dist':>14} {'exact dist':>11}")
+    meshes = []
+    for cols, rows, layers in SIZES:
+        maps = make_pathing_maps(cols=cols, rows=rows, layers=layers, hole_ratio=0.15, slant=0.5)
+        nav = NavMesh(maps, 1)
+        nav.get_spatial_index()
+        meshes.append((nav, maps))
+        points = [p for p in random_points(maps, QUERIES * 3, pad=1500.0, seed=13)
+                  if not nav.contains(p[0], p[1], MARGIN)][:QUERIES]
+
+        t0 = time.perf_counter()
+        old = [centroid_snap(nav, p, MARGIN) for p in points]
+        centroid_us = (time.perf_counter() - t0) * 1e6 / len(points)
+        t0 = time.perf_counter()
+        new = [nav.find_nearest_reachable(p, MARGIN) for p in points]
+        exact_us = (time.perf_counter() - t0) * 1e6 / len(points)
+        t0 = time.perf_counter()
+        nav.find_nearest_reachable_many(points, MARGIN)
+        batch_us = (time.perf_counter() - t0) * 1e6 / len(points)
+
+        old_dist = sum(math.dist(p, q) for p, q in zip(points, old)) / len(points)
+        new_dist = sum(math.dist(p, q) for p, q in zip(points, new)) / len(points)
+        print(f"{len(nav.trapezoids):>7} {centroid_us:>12.1f} {exact_us:>9.1f} {batch_us:>9.1f} "
+              f"{old_dist:>14.0f} {new_dist:>11.0f}")
+
+    print(f"\n{'traps':>7} {'scan us':>9} {'batch us':>9} {'snapped':>9} {'scan drift':>11} {'batch drift':>12}")
+    for nav, maps in meshes:
+        scenarios = _publish_scenarios(nav, maps, random.Random(8))
+        t0 = time.perf_counter()
+        scan = [scan_publish(nav, anchor, slots) for anchor, slots in scenarios]
+        scan_us = (time.perf_counter() - t0) * 1e6 / len(scenarios)
+        t0 = time.perf_counter()
+        batch = [batch_publish(nav, anchor, slots) for anchor, slots in scenarios]
+        batch_us = (time.perf_counter() - t0) * 1e6 / len(scenarios)
+        snaps = _count_snaps(nav, scenarios)
+
+        def drift(results):
+            # mean distance of a replaced FollowPos from the formation spot it replaces
+            moved = [math.dist(pos, raw) for (_, slots), out in zip(scenarios, results)
+                     for (raw, _), pos in zip(slots, out) if pos != raw]
+            return sum(moved) / max(len(moved), 1)
+
+        print(f"{len(nav.trapezoids):>7} {scan_us:>9.0f} {batch_us:>9.0f} {snaps:>9.1f} "
+              f"{drift(scan):>11.0f} {drift(batch):>12.0f}")
+
+
+if __name__ == "__main__":
+    try:
+        import Py4GWCoreLib.Pathing  # noqa: F401
+    except ImportError as e:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {e}")
+    else:
+        main()
@@ -0,0 +1,67 @@
+"""Benchmark: exact segment walk vs the sampled walkability check it replaced.
+
+Random on-mesh segments of increasing length on synthetic meshes with holes
+(margin 100, the has_line_of_sight default).  "sampled" is the former
+has_line_of_sight loop (one BSP lookup every 200 units), "dense" the same
+loop every 20 units, "exact" NavMesh.segment_block.  "missed" counts segments
+the 200-unit sampling calls walkable although the exact walk finds a block.
+
+NOTE: Requires the game runtime (Py4GW DLLs) because Py4GWCoreLib imports
+depend on PyScanner/PyPathing/etc.  Run from within an injected Python session.
+
+    python bench_segment_walk.py
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_navmesh import make_pathing_maps
+
+SIZES = [(40, 60, 1), (80, 100, 2)]
+LENGTHS = [1000.0, 4000.0, 12000.0]
+SEGMENTS = 300
+MARGIN = 100.0
+
+
+def _per_segment_us(fn, segments):
+    t0 = time.perf_counter()
+    for a, b in segments:
+        fn(a, b)
+    return (time.perf_counter() - t0) * 1e6 / len(segments)
+
+
+def main():
+    from Py4GWCoreLib.Pathing import NavMesh
+    from test_segment_walk import random_segments, sampled_walkable
+
+    print(f"{'traps':>7} {'length':>7} {'sampled us':>11} {'dense us':>9} {'exact us':>9} "
+          f"{'vs sampled':>10} {'vs dense':>9} {'missed':>7}")
+    for cols, rows, layers in SIZES:
+        maps = make_pathing_maps(cols=cols, rows=rows, layers=layers, hole_ratio=0.15, slant=0.5)
+        nav = NavMesh(maps, 1)
+        nav.get_search_graph()
+        for length in LENGTHS:
+            segments = [s for s in random_segments(nav, maps, SEGMENTS * 3, MARGIN, max_len=length)
+                        if s[0] != s[1]][:SEGMENTS]
+            sampled_us = _per_segment_us(lambda a, b: sampled_walkable(nav, a, b, MARGIN, 200.0), segments)
+            dense_us = _per_segment_us(lambda a, b: sampled_walkable(nav, a, b, MARGIN, 20.0), segments)
+            exact_us = _per_segment_us(lambda a, b: nav.segment_block(a, b, MARGIN, end_slack=MARGIN), segments)
+            missed = sum(
+                1 for a, b in segments
+                if sampled_walkable(nav, a, b, MARGIN, 200.0) and nav.segment_block(a, b, MARGIN) is not None
+            )
+            print(f"{len(nav.trapezoids):>7} {length:>7.0f} {sampled_us:>11.1f} {dense_us:>9.1f} {exact_us:>9.1f} "
+                  f"{sampled_us / exact_us:>9.1f}x {dense_us / exact_us:>8.1f}x {missed:>7}")
+
+
+if __name__ == "__main__":
+    try:
+        import Py4GWCoreLib.Pathing  # noqa: F401
+    except ImportError as e:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {e}")
+    else:
+        main()
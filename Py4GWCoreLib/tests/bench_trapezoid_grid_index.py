@@ -0,0 +1,78 @@
+"""Micro-benchmark: grid-indexed nearest-trapezoid / radius queries vs linear scans.
+
+NOTE: Requires the game runtime (Py4GW DLLs) because Py4GWCoreLib imports
+depend on PyScanner/PyPathing/etc.  Run from within an injected Python session.
+
+    python bench_trapezoid_grid_index.py
+"""
+
+import sys
+import os
+import math
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_navmesh import make_pathing_maps, random_points
+
+SIZES = [(30, 30, 1), (80, 60, 2), (120, 100, 3)]
+QUERIES = 500
+RADIUS = 1000.0
+
+
+def _linear_nearest(centroids, x, y):
+    best_id, best_dist = None, float("inf")
+    for t_id, (cx, cy) in centroids.items():
+        d = math.hypot(cx - x, cy - y)
+        if d < best_dist:
+            best_dist, best_id = d, t_id
+    return best_id
+
+
+def _linear_within(trapezoids, x, y, radius, closest_point):
+    out = []
+    for t_id, t in trapezoids.items():
+        px, py = closest_point(x, y, t)
+        if math.hypot(px - x, py - y) <= radius:
+            out.append(t_id)
+    return out
+
+
+def _per_query_us(fn, points):
+    t0 = time.perf_counter()
+    for x, y in points:
+        fn(x, y)
+    return (time.perf_counter() - t0) * 1e6 / len(points)
+
+
+def main():
+    from Py4GWCoreLib.Pathing import NavMesh, _closest_point_on_trapezoid
+
+    print(f"{'traps':>7} {'build ms':>9} {'scan us':>9} {'grid us':>9} {'x':>6} "
+          f"{'r-scan us':>10} {'r-grid us':>10} {'x':>6}")
+    for cols, rows, layers in SIZES:
+        maps = make_pathing_maps(cols=cols, rows=rows, layers=layers, hole_ratio=0.1)
+        nav = NavMesh(maps, 1)
+        points = random_points(maps, QUERIES, pad=2000.0)
+
+        t0 = time.perf_counter()
+        nav.get_spatial_index()
+        build_ms = (time.perf_counter() - t0) * 1000.0
+
+        scan_us = _per_query_us(lambda x, y: _linear_nearest(nav._centroids, x, y), points)
+        grid_us = _per_query_us(nav.find_nearest_trapezoid_id, points)
+        few = points[:50]
+        rscan_us = _per_query_us(lambda x, y: _linear_within(nav.trapezoids, x, y, RADIUS, _closest_point_on_trapezoid), few)
+        rgrid_us = _per_query_us(lambda x, y: nav.find_trapezoids_within(x, y, RADIUS), few)
+        print(f"{len(nav.trapezoids):>7} {build_ms:>9.1f} {scan_us:>9.1f} {grid_us:>9.1f} {scan_us / grid_us:>5.0f}x "
+              f"{rscan_us:>10.1f} {rgrid_us:>10.1f} {rscan_us / rgrid_us:>5.0f}x")
+
+
+if __name__ == "__main__":
+    try:
+        import Py4GWCoreLib.Pathing  # noqa: F401
+    except ImportError as e:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {e}")
+    else:
+        main()
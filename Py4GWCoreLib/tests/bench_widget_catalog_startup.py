@@ -0,0 +1,130 @@
+"""Startup benchmark: widget catalog discovery from AST metadata vs importing every widget.
+
+Walks the repository's real Widgets tree the way WidgetHandler._scan_widget_folders
+does (folders marked with a .widget file) and builds the catalog data four ways:
+
+    walk       - folder scan only
+    ast cold   - WidgetMetadata.extract_metadata for every script, empty manifest
+    warm       - manifest loaded from disk, every script unchanged (stat only)
+    import     - spec_from_file_location + exec_module for every script, what
+                 Widget.__post_init__ did before (game runtime only)
+
+The walk and metadata phases only need the standard library.  The import phase
+needs the Py4GW DLLs because widgets import Py4GWCoreLib; it is skipped offline.
+
+    python bench_widget_catalog_startup.py [widgets_path]
+"""
+
+import sys
+import os
+import time
+import tempfile
+import importlib.util
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, REPO_ROOT)
+
+_METADATA_PATH = os.path.join(REPO_ROOT, "Py4GWCoreLib", "py4gwcorelib_src", "WidgetMetadata.py")
+REPEATS = 3
+
+
+def _load_metadata_module():
+    spec = importlib.util.spec_from_file_location("_widget_metadata_bench", _METADATA_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def scan_widget_scripts(widgets_path):
+    scripts = []
+    for current_dir, dirs, files in os.walk(widgets_path):
+        if ".widget" in files:
+            scripts.extend(os.path.join(current_dir, f) for f in files if f.endswith(".py"))
+    return scripts
+
+
+def _import_all(scripts):
+    failed = 0
+    for i, path in enumerate(scripts):
+        name = f"py4gw_widget_bench_{i}"
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except Exception:
+            failed += 1
+        finally:
+            sys.modules.pop(name, None)
+    return failed
+
+
+def _best_ms(fn, repeats=REPEATS):
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000.0
+
+
+def main(widgets_path=None):
+    metadata_module = _load_metadata_module()
+    WidgetManifest = metadata_module.WidgetManifest
+    widgets_path = widgets_path or os.path.join(REPO_ROOT, "Widgets")
+
+    scripts = scan_widget_scripts(widgets_path)
+    size_kb = sum(os.path.getsize(p) for p in scripts) / 1024
+    print(f"{len(scripts)} widget scripts ({size_kb:.0f} KB) under {widgets_path}\n")
+
+    t_walk = _best_ms(lambda: scan_widget_scripts(widgets_path))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest_path = os.path.join(tmp, "widget_manifest.json")
+
+        def cold():
+            if os.path.exists(manifest_path):
+                os.remove(manifest_path)
+            manifest = WidgetManifest(manifest_path)
+            for p in scan_widget_scripts(widgets_path):
+                manifest.get(p)
+            manifest.save()
+
+        def warm():
+            manifest = WidgetManifest(manifest_path)
+            for p in scan_widget_scripts(widgets_path):
+                manifest.get(p)
+            manifest.save()
+
+        t_cold = _best_ms(cold, repeats=1)
+        warm()
+        t_warm = _best_ms(warm)
+        manifest_kb = os.path.getsize(manifest_path) / 1024 if os.path.exists(manifest_path) else 0.0
+
+    manifest = WidgetManifest()
+    metadata = [manifest.get(p) for p in scripts]
+    needs_import = sum(1 for m in metadata if not m.is_static)
+
+    print(f"{'phase':<12} {'ms':>9} {'us/widget':>10}")
+    print(f"{'walk':<12} {t_walk:>9.1f} {t_walk * 1000 / max(1, len(scripts)):>10.0f}")
+    print(f"{'ast cold':<12} {t_cold:>9.1f} {t_cold * 1000 / max(1, len(scripts)):>10.0f}")
+    print(f"{'warm':<12} {t_warm:>9.1f} {t_warm * 1000 / max(1, len(scripts)):>10.0f}")
+
+    try:
+        import Py4GWCoreLib  # noqa: F401
+    except ImportError as e:
+        print(f"{'import':<12} {'skipped':>9}  (game runtime not available: {e})")
+    else:
+        t0 = time.perf_counter()
+        failed = _import_all(scripts)
+        t_import = (time.perf_counter() - t0) * 1000.0
+        print(f"{'import':<12} {t_import:>9.1f} {t_import * 1000 / max(1, len(scripts)):>10.0f}  ({failed} failed)")
+        print(f"\nwarm manifest is {t_import / t_warm:.0f}x faster than importing every widget")
+
+    print(f"\nmanifest {manifest_kb:.0f} KB; {needs_import} scripts still imported at discovery "
+          f"(computed constants or parse errors)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,66 @@
+"""Synthetic behavior trees for BehaviorTree tick tests and benchmarks.
+
+build_tree() returns a tree of about node_count nodes: a Parallel root over
+groups of Condition and Action leaves under Sequence / Selector composites.
+Leaf outcomes are a deterministic function of a shared tick counter
+(clock["tick"]), so two trees built with the same seed go through exactly the
+same states when ticked in lockstep, and the mix of SUCCESS / FAILURE /
+RUNNING keeps composites resuming, short-circuiting and resetting like a real
+botting tree does.
+
+The BehaviorTree class is passed in, so this module has no Py4GWCoreLib
+imports of its own.
+"""
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, List, Tuple
+
+
+def _condition(clock: Dict[str, int], offset: int, period: int):
+    return lambda: (clock["tick"] + offset) % period != 0
+
+
+def _action(bt: Any, clock: Dict[str, int], offset: int, period: int):
+    def action():
+        phase = (clock["tick"] + offset) % period
+        if phase == 0:
+            return bt.NodeState.FAILURE
+        if phase == 1:
+            return bt.NodeState.RUNNING
+        return bt.NodeState.SUCCESS
+    return action
+
+
+def build_tree(bt: Any, node_count: int = 1000, fanout: int = 8, seed: int = 7,
+               timing_sample_rate=None) -> Tuple[Any, Dict[str, int]]:
+    """(tree, clock) with about node_count nodes; advance clock["tick"] between ticks."""
+    rng = random.Random(seed)
+    clock = {"tick": 0}
+    nodes_left = max(5, node_count) - 1   # minus the root
+    groups: List[Any] = []
+    while nodes_left >= 4:
+        # group: Selector(Sequence(leaves...), Succeeder) never fails, so the
+        # root Parallel ticks every group on every tick
+        size = min(fanout, nodes_left - 3)
+        leaves = []
+        for i in range(size):
+            name = f"leaf_{len(groups)}_{i}"
+            if rng.random() < 0.75:
+                leaves.append(bt.ConditionNode(_condition(clock, rng.randrange(64), rng.randrange(24, 80)), name=name))
+            else:
+                leaves.append(bt.ActionNode(_action(bt, clock, rng.randrange(64), rng.randrange(5, 20)), name=name))
+        body = bt.SequenceNode(leaves, name=f"body_{len(groups)}")
+        groups.append(bt.SelectorNode([body, bt.SucceederNode(name=f"fallback_{len(groups)}")], name=f"group_{len(groups)}"))
+        nodes_left -= size + 3
+    root = bt.ParallelNode(groups, name="root")
+    return bt(root, timing_sample_rate=timing_sample_rate), clock
+
+
+def walk(node: Any):
+    """Pre-order traversal of a node and its current children."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        stack.extend(reversed(current.get_children()))
@@ -0,0 +1,111 @@
+"""Synthetic enemy layouts for smart-unstuck detour planning tests and benchmarks.
+
+A layout has the same shape as the ones DetourPlanner.record_layouts keeps
+in game (HeroAI/follow/detour_planner.py), so recorded JSON-lines files and
+these generated ones replay through the same code:
+
+    {"current": [x, y], "follow": [x, y], "enemies": [[x, y], ...],
+     "touch_radius": r, "navmesh_contains_margin": m,
+     "navmesh_snap_tolerance": s, "t_ms": t}
+
+make_party_detours builds "events": one or two enemy groups sitting between
+a party and its formation spots on a synthetic navmesh.  Every follower of
+the party plans a detour a few milliseconds after the others, seeing the
+enemies jittered by a few units (client lag), which is the case the
+planner's cache is meant for.
+"""
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Dict, List
+
+
+@dataclass(slots=True)
+class LayoutConfig:
+    """The SmartUnstuckConfig fields a layout records."""
+
+    touch_radius: float = 120.0
+    navmesh_contains_margin: float = 50.0
+    navmesh_snap_tolerance: float = 80.0
+
+
+def layout_config(layout: Dict) -> LayoutConfig:
+    return LayoutConfig(
+        float(layout["touch_radius"]),
+        float(layout["navmesh_contains_margin"]),
+        float(layout["navmesh_snap_tolerance"]),
+    )
+
+
+def make_party_detours(
+    navmesh,
+    events: int = 40,
+    followers: int = 6,
+    seed: int = 3,
+    jitter: float = 4.0,
+    cfg: LayoutConfig | None = None,
+) -> List[Dict]:
+    """Return followers * events layouts, grouped by event and ordered in time.
+
+    Party and goal are placed on the mesh (navmesh.contains with the
+    contains margin) on opposite sides of the enemy groups.
+    """
+    cfg = cfg or LayoutConfig()
+    rng = random.Random(seed)
+    ids = list(navmesh.trapezoids)
+    margin = cfg.navmesh_contains_margin
+    layouts: List[Dict] = []
+    t_ms = 0.0
+    made = 0
+    while made < events:
+        cx, cy = navmesh.get_position(rng.choice(ids))
+        if not navmesh.contains(cx, cy, margin):
+            continue
+        heading = rng.uniform(0.0, 2.0 * math.pi)
+        ux, uy = math.cos(heading), math.sin(heading)
+        vx, vy = -uy, ux
+        party = (cx - ux * 450.0, cy - uy * 450.0)
+        goal = (cx + ux * 550.0, cy + uy * 550.0)
+        if not (navmesh.contains(party[0], party[1], margin) and navmesh.contains(goal[0], goal[1], margin)):
+            continue
+
+        enemies = []
+        for group in range(rng.choice((1, 1, 2))):
+            gx = cx + vx * rng.uniform(-150.0, 150.0) + ux * group * 260.0
+            gy = cy + vy * rng.uniform(-150.0, 150.0) + uy * group * 260.0
+            for _ in range(rng.randint(2, 6)):
+                enemies.append((gx + rng.uniform(-140.0, 140.0), gy + rng.uniform(-140.0, 140.0)))
+
+        for k in range(followers):
+            side = (k - (followers - 1) / 2.0) * 70.0
+            current = (party[0] + vx * side + rng.uniform(-20.0, 20.0), party[1] + vy * side + rng.uniform(-20.0, 20.0))
+            follow = (goal[0] + vx * side * 1.5, goal[1] + vy * side * 1.5)
+            seen = [[ex + rng.uniform(-jitter, jitter), ey + rng.uniform(-jitter, jitter)] for ex, ey in enemies]
+            seen.sort(key=lambda e: math.hypot(e[0] - current[0], e[1] - current[1]))
+            layouts.append({
+                "current": [current[0], current[1]],
+                "follow": [follow[0], follow[1]],
+                "enemies": seen,
+                "touch_radius": cfg.touch_radius,
+                "navmesh_contains_margin": cfg.navmesh_contains_margin,
+                "navmesh_snap_tolerance": cfg.navmesh_snap_tolerance,
+                "t_ms": t_ms + k * 40.0,
+            })
+        t_ms += 5000.0
+        made += 1
+    return layouts
+
+
+def plan_layout(layout: Dict, navmesh, planner=None):
+    """Run one layout through planner.plan, or the uncached planning code without a planner."""
+    from HeroAI.follow.detour_planner import _generate_slalom_waypoints
+
+    current = tuple(layout["current"])
+    follow = tuple(layout["follow"])
+    enemies = tuple(tuple(e) for e in layout["enemies"])
+    cfg = layout_config(layout)
+    if planner is None:
+        return _generate_slalom_waypoints(current, follow, enemies, cfg, navmesh)
+    return planner.plan(current, follow, enemies, cfg, navmesh, now_ms=layout["t_ms"])
@@ -0,0 +1,102 @@
+"""Synthetic item-modifier fixtures for item_mods_src tests and benchmarks.
+
+FakeItemModifier mirrors the PyItem.ItemModifier accessors DecodedModifier
+reads (IsValid, GetIdentifier, GetModBits, GetArg1, GetArg2), so loot-like
+modifier sets can be generated without the game runtime.
+
+Each generated item is a martial weapon: damage range, damage type and
+attribute requirement, optionally a prefix and a suffix (an Upgrade modifier
+followed by the property modifiers it composes) and, for golds/greens, an
+inherent "Strength and Honor" style bonus.  Values are drawn from the small
+ranges real drops use, so a few thousand items contain many identical sets,
+as in a real bag or merchant window.
+"""
+from __future__ import annotations
+
+import random
+from typing import List, Tuple
+
+# ModifierIdentifier values (item_mods_src/types.py)
+ARMOR_PENETRATION = 0x23F
+ATTRIBUTE_REQUIREMENT = 0x279
+DAMAGE = 0x27A
+DAMAGE_PLUS_WHILE_ABOVE = 0x227
+DAMAGE_TYPE = 0x24B
+FURIOUS = 0x23B
+HEALTH_PLUS = 0x234
+INCREASE_ENCHANTMENT_DURATION = 0x22B
+UPGRADE = 0x240
+
+# weapon -> (attribute, damage type, (min, max) damage, prefix upgrade ids, suffix upgrade ids)
+WEAPONS = {
+    "Axe": (18, 2, (6, 28), {"Furious": 0x0099, "Sundering": 0x00AB}, {"OfFortitude": 0x00D9, "OfEnchanting": 0x00DE}),
+    "Sword": (20, 2, (15, 22), {"Furious": 0x009B, "Sundering": 0x00AE}, {"OfFortitude": 0x00DD, "OfEnchanting": 0x00E2}),
+    "Hammer": (19, 0, (19, 35), {"Furious": 0x009A, "Sundering": 0x00AC}, {"OfFortitude": 0x00DB, "OfEnchanting": 0x00E0}),
+    "Spear": (37, 1, (14, 27), {"Furious": 0x0180, "Sundering": 0x017A}, {"OfFortitude": 0x0192, "OfEnchanting": 0x0191}),
+    "Scythe": (41, 2, (9, 41), {"Furious": 0x0179, "Sundering": 0x0173}, {"OfFortitude": 0x018C, "OfEnchanting": 0x018B}),
+}
+
+RARITIES = (0, 1, 2, 3, 4)   # White, Blue, Purple, Gold, Green
+_RARITY_WEIGHTS = (30, 30, 20, 15, 5)
+
+
+class FakeItemModifier:
+    __slots__ = ("identifier", "mod_bits", "arg1", "arg2")
+
+    def __init__(self, identifier: int, arg1: int = 0, arg2: int = 0, upgrade_id: int = 0, param: int = 0, flags: int = 0):
+        self.identifier = (identifier << 4) | (param << 16)
+        self.mod_bits = (flags << 30) | (upgrade_id & 0xFFFF)
+        self.arg1 = arg1
+        self.arg2 = arg2
+
+    def IsValid(self) -> bool:
+        return True
+
+    def GetIdentifier(self) -> int:
+        return self.identifier
+
+    def GetModBits(self) -> int:
+        return self.mod_bits
+
+    def GetArg1(self) -> int:
+        return self.arg1
+
+    def GetArg2(self) -> int:
+        return self.arg2
+
+
+def weapon_modifiers(weapon: str, rarity: int, rng: random.Random) -> List[FakeItemModifier]:
+    attribute, damage_type, (min_damage, max_damage), prefixes, suffixes = WEAPONS[weapon]
+    mods = [
+        FakeItemModifier(DAMAGE, arg1=max_damage, arg2=min_damage),
+        FakeItemModifier(DAMAGE_TYPE, arg1=damage_type),
+        FakeItemModifier(ATTRIBUTE_REQUIREMENT, arg1=attribute, arg2=rng.choice((9, 9, 10, 11, 12, 13))),
+    ]
+    if rarity >= 1 and rng.random() < 0.7:
+        name = rng.choice(tuple(prefixes))
+        mods.append(FakeItemModifier(UPGRADE, upgrade_id=prefixes[name]))
+        if name == "Furious":
+            mods.append(FakeItemModifier(FURIOUS, arg2=rng.choice((7, 8, 9, 10, 10, 10))))
+        else:
+            mods.append(FakeItemModifier(ARMOR_PENETRATION, arg1=rng.choice((10, 20)), arg2=20))
+    if rarity >= 1 and rng.random() < 0.6:
+        name = rng.choice(tuple(suffixes))
+        mods.append(FakeItemModifier(UPGRADE, upgrade_id=suffixes[name]))
+        if name == "OfFortitude":
+            mods.append(FakeItemModifier(HEALTH_PLUS, arg1=rng.choice((20, 25, 30, 30))))
+        else:
+            mods.append(FakeItemModifier(INCREASE_ENCHANTMENT_DURATION, arg2=rng.choice((15, 20, 20))))
+    if rarity >= 3 and rng.random() < 0.5:
+        mods.append(FakeItemModifier(DAMAGE_PLUS_WHILE_ABOVE, arg1=50, arg2=rng.choice((10, 15))))
+    return mods
+
+
+def loot_fixture(count: int, seed: int = 7) -> List[Tuple[List[FakeItemModifier], int]]:
+    """count (modifiers, rarity) pairs; every item gets its own modifier objects."""
+    rng = random.Random(seed)
+    weapons = tuple(WEAPONS)
+    items = []
+    for _ in range(count):
+        rarity = rng.choices(RARITIES, _RARITY_WEIGHTS)[0]
+        items.append((weapon_modifiers(rng.choice(weapons), rarity, rng), rarity))
+    return items
@@ -0,0 +1,172 @@
+"""Synthetic pathing-map fixtures for NavMesh tests and benchmarks.
+
+The objects mirror the attributes NavMesh reads from the MapContext
+snapshots (PathingTrapezoid, Portal, PathingMap) without depending on the
+game runtime, so meshes of any size can be generated offline.
+
+Layout: each layer is a "brick wall" of rectangular trapezoids.  Even rows
+hold `cols` full-width cells, odd rows are shifted by half a cell (with half
+cells at both ends), so every cell overlaps two cells above and two below and
+the layer forms one connected walkable area.  Layers are placed side by side
+along X and joined with cross-layer portals on their shared edge.  With
+slant > 0 the inner cell walls lean by a random amount, so cells become
+true trapezoids while neighbours in a row still share their side exactly.
+"""
+from __future__ import annotations
+
+import random
+from typing import List, Optional, Set, Tuple
+
+
+class SyntheticTrapezoid:
+    __slots__ = ("id", "portal_left", "portal_right", "XTL", "XTR", "YT", "XBL", "XBR", "YB", "neighbor_ids")
+
+    def __init__(self, t_id: int, x_left: float, x_right: float, y_bottom: float, y_top: float):
+        self.id = t_id
+        self.portal_left = 0
+        self.portal_right = 0
+        self.XTL = x_left
+        self.XTR = x_right
+        self.YT = y_top
+        self.XBL = x_left
+        self.XBR = x_right
+        self.YB = y_bottom
+        self.neighbor_ids: List[int] = []
+
+
+class SyntheticPortal:
+    __slots__ = ("left_layer_id", "right_layer_id", "flags", "pair_index", "count", "trapezoid_indices")
+
+    def __init__(self, left_layer_id: int, right_layer_id: int, trapezoid_indices: List[int]):
+        self.left_layer_id = left_layer_id
+        self.right_layer_id = right_layer_id
+        self.flags = 0
+        self.pair_index = 0xFFFFFFFF
+        self.count = len(trapezoid_indices)
+        self.trapezoid_indices = trapezoid_indices
+
+
+class SyntheticPathingMap:
+    __slots__ = ("zplane", "trapezoids", "portals")
+
+    def __init__(self, zplane: int, trapezoids: List[SyntheticTrapezoid]):
+        self.zplane = zplane
+        self.trapezoids = trapezoids
+        self.portals: List[SyntheticPortal] = []
+
+
+def _brick_layer(
+    zplane: int,
+    first_id: int,
+    cols: int,
+    rows: int,
+    cell_w: float,
+    cell_h: float,
+    origin: Tuple[float, float],
+    holes: Set[Tuple[int, int]],
+    slant: float = 0.0,
+    rng: Optional[random.Random] = None,
+) -> Tuple[SyntheticPathingMap, List[int], List[int]]:
+    ox, oy = origin
+    width = cols * cell_w
+    grid: List[List[Optional[SyntheticTrapezoid]]] = []
+    next_id = first_id
+
+    for r in range(rows):
+        y0 = oy + r * cell_h
+        y1 = y0 + cell_h
+        if r % 2 == 0:
+            edges = [ox + c * cell_w for c in range(cols + 1)]
+        else:
+            edges = [ox] + [ox + (c + 0.5) * cell_w for c in range(cols)] + [ox + width]
+        # (bottom x, top x) of each wall; the outer walls stay vertical
+        walls = [(x, x) for x in edges]
+        if slant > 0 and rng is not None:
+            lean = slant * cell_w * 0.25
+            walls = [walls[0]] + [(x + rng.uniform(-lean, lean), x + rng.uniform(-lean, lean)) for x in edges[1:-1]] + [walls[-1]]
+        row: List[Optional[SyntheticTrapezoid]] = []
+        for c in range(len(edges) - 1):
+            if (r, c) in holes:
+                row.append(None)
+                continue
+            trap = SyntheticTrapezoid(next_id, walls[c][0], walls[c + 1][0], y0, y1)
+            trap.XTL, trap.XTR = walls[c][1], walls[c + 1][1]
+            row.append(trap)
+            next_id += 1
+        grid.append(row)
+
+    for r in range(rows - 1):
+        for lower in grid[r]:
+            if lower is None:
+                continue
+            for upper in grid[r + 1]:
+                if upper is None:
+                    continue
+                if min(lower.XTR, upper.XBR) - max(lower.XTL, upper.XBL) > 1.0:
+                    lower.neighbor_ids.append(upper.id)
+                    upper.neighbor_ids.append(lower.id)
+
+    traps = [t for row in grid for t in row if t is not None]
+    left_edge = [row[0].id for row in grid if row and row[0] is not None]
+    right_edge = [row[-1].id for row in grid if row and row[-1] is not None]
+    return SyntheticPathingMap(zplane, traps), left_edge, right_edge
+
+
+def make_pathing_maps(
+    cols: int = 20,
+    rows: int = 20,
+    layers: int = 1,
+    cell_w: float = 1000.0,
+    cell_h: float = 500.0,
+    hole_ratio: float = 0.0,
+    seed: int = 1,
+    slant: float = 0.0,
+) -> List[SyntheticPathingMap]:
+    """Return a list of synthetic pathing maps (one per layer).
+
+    hole_ratio removes that fraction of cells at random (never the layer
+    border cells) to create obstacles for line-of-sight and detour tests.
+    slant (0..1) leans the inner cell walls by up to slant * cell_w / 4.
+    """
+    rng = random.Random(seed)
+    slant_rng = random.Random(seed + 1000)
+    maps: List[SyntheticPathingMap] = []
+    edges: List[Tuple[List[int], List[int]]] = []
+    next_id = 0
+
+    for z in range(layers):
+        holes: Set[Tuple[int, int]] = set()
+        if hole_ratio > 0:
+            for r in range(1, rows - 1):
+                for c in range(1, cols - 1):
+                    if rng.random() < hole_ratio:
+                        holes.add((r, c))
+        pmap, left_edge, right_edge = _brick_layer(
+            z, next_id, cols, rows, cell_w, cell_h, (z * cols * cell_w, 0.0), holes, slant, slant_rng)
+        next_id += len(pmap.trapezoids)
+        maps.append(pmap)
+        edges.append((left_edge, right_edge))
+
+    for z in range(layers - 1):
+        maps[z].portals.append(SyntheticPortal(z, z + 1, edges[z][1]))
+        maps[z + 1].portals.append(SyntheticPortal(z, z + 1, edges[z + 1][0]))
+
+    return maps
+
+
+def mesh_bounds(pathing_maps: List[SyntheticPathingMap]) -> Tuple[float, float, float, float]:
+    """Return (min_x, min_y, max_x, max_y) over every trapezoid."""
+    traps = [t for pmap in pathing_maps for t in pmap.trapezoids]
+    return (
+        min(min(t.XBL, t.XTL) for t in traps),
+        min(t.YB for t in traps),
+        max(max(t.XBR, t.XTR) for t in traps),
+        max(t.YT for t in traps),
+    )
+
+
+def random_points(pathing_maps: List[SyntheticPathingMap], count: int, pad: float = 500.0, seed: int = 7) -> List[Tuple[float, float]]:
+    """Uniform random points over the mesh bounds, padded so some fall off-mesh."""
+    rng = random.Random(seed)
+    min_x, min_y, max_x, max_y = mesh_bounds(pathing_maps)
+    return [(rng.uniform(min_x - pad, max_x + pad), rng.uniform(min_y - pad, max_y + pad)) for _ in range(count)]
@@ -0,0 +1,127 @@
+"""Synthetic string-table fixtures for string_table / string_decode_cache tests.
+
+Builds a string file blob in the gw.dat layout _parse_string_file reads
+(consecutive [u16 size | u16 base_char | u8 bits_per_char | u8 flags | payload]
+entries) and the encoded codepoint buffers decode() receives, so the decode
+path can be exercised without the game client.
+
+Entries alternate between the two payload encodings the decoder handles:
+bit-packed text (7 bits per char over a base_char range) and raw UTF-16LE.
+Encrypted entries take the RC4 helpers as arguments (pass
+string_table._derive_rc4_key and string_table._rc4_python); RC4 is
+symmetric, so encrypting with the derived key is what the decoder undoes.
+"""
+from __future__ import annotations
+
+import random
+import struct
+from typing import Callable, List, Optional, Sequence, Tuple
+
+_BASE = 0x0100
+_MORE = 0x8000
+_RANGE = _MORE - _BASE
+
+# string_table._CHAR_TUPLE
+CHAR_TUPLE = (
+    '\x00', '0', '1', '2', '3', '4', '5', '6',
+    's', 't', 'r', 'n', 'u', 'm', '(', ')',
+    '[', ']', '<', '>', '%', '#', '/', ':',
+    '-', "'", '"', ' ', ',', '.', '!', '\n',
+)
+_PACKED_BASE_CHAR = ord('A')
+_PACKED_BPC = 7
+
+_WORDS = (
+    "Grawl", "Centaur", "Mursaat", "Ettin", "Jade", "Wind", "Stone", "Summit",
+    "Charr", "Shaman", "Hunter", "Warrior", "Elementalist", "Ranger", "Monk",
+    "Bone", "Fiend", "Minotaur", "Wurm", "Oni", "Kappa", "Naga", "Dredge",
+)
+
+
+def _digits(value: int) -> List[int]:
+    digits = [value % _RANGE]
+    value //= _RANGE
+    while value:
+        digits.append(value % _RANGE)
+        value //= _RANGE
+    return digits[::-1]
+
+
+def encode_value(value: int) -> List[int]:
+    """base-0x7F00 digits; every digit but the last carries the MORE flag."""
+    digits = _digits(value)
+    return [(_MORE | (d + _BASE)) for d in digits[:-1]] + [digits[-1] + _BASE]
+
+
+def encode_reference(index: int, key: int = 0) -> Tuple[int, ...]:
+    """Codepoints for (string index, key). A key needs at least two digits to be parsed."""
+    codepoints = encode_value(index)
+    if key:
+        key_cp = encode_value(key)
+        if len(key_cp) < 2:
+            key_cp = [_MORE | _BASE] + key_cp
+        codepoints += key_cp
+    return tuple(codepoints)
+
+
+def to_raw(codepoints: Sequence[int]) -> bytes:
+    """Raw wchar_t buffer (little-endian uint16 with null terminator)."""
+    return struct.pack(f'<{len(codepoints) + 1}H', *codepoints, 0)
+
+
+def _pack_bits(text: str) -> bytes:
+    bits = 0
+    for i, ch in enumerate(text):
+        if ch in CHAR_TUPLE[1:]:
+            value = CHAR_TUPLE.index(ch)
+        else:
+            value = ord(ch) - _PACKED_BASE_CHAR + 0x20
+            if not 0x20 <= value < (1 << _PACKED_BPC):
+                raise ValueError(f"character {ch!r} cannot be bit-packed")
+        bits |= value << (i * _PACKED_BPC)
+    nbytes = (len(text) * _PACKED_BPC + 7) // 8 + 1  # room for the 0 terminator
+    return bits.to_bytes(nbytes, 'little')
+
+
+def build_entry(
+    text: str,
+    key: int = 0,
+    packed: bool = True,
+    derive_key: Optional[Callable[[int], bytes]] = None,
+    rc4: Optional[Callable[[bytes, bytes], bytes]] = None,
+) -> bytes:
+    if packed:
+        base_char, bpc, payload = _PACKED_BASE_CHAR, _PACKED_BPC, _pack_bits(text)
+    else:
+        base_char, bpc, payload = 0, 0x10, text.encode('utf-16-le') + b'\x00\x00'
+    if key:
+        if derive_key is None or rc4 is None:
+            raise ValueError("encrypted entries need derive_key and rc4")
+        payload = rc4(derive_key(key), payload)
+    return struct.pack('<HHBB', 6 + len(payload), base_char, bpc, 0) + payload
+
+
+def synthetic_names(count: int, seed: int = 11) -> List[str]:
+    rng = random.Random(seed)
+    return [f"{rng.choice(_WORDS)} {rng.choice(_WORDS)}" for _ in range(count)]
+
+
+def build_string_file(
+    texts: Sequence[str],
+    derive_key: Callable[[int], bytes],
+    rc4: Callable[[bytes, bytes], bytes],
+    start_index: int = 1,
+    seed: int = 5,
+) -> Tuple[bytes, List[Tuple[int, int, str]]]:
+    """
+    String file blob plus (index, key, text) per entry, to be parsed at start_index
+    (index 0 never decodes).  About half the entries are encrypted.
+    """
+    rng = random.Random(seed)
+    parts = []
+    entries = []
+    for i, text in enumerate(texts):
+        key = rng.getrandbits(48) | (1 << 40) if i % 2 else 0
+        parts.append(build_entry(text, key, packed=i % 3 != 0, derive_key=derive_key, rc4=rc4))
+        entries.append((start_index + i, key, text))
+    return b''.join(parts), entries
@@ -0,0 +1,168 @@
+"""Unit tests for the columnar AgentSnapshot (native_src/ShMem/AgentSnapshot.py).
+
+The shared-memory agent array is fabricated in-process: its entries point at
+ctypes-allocated AgentStruct / AgentLivingStruct instances, so no game memory
+is touched.
+
+NOTE: These tests require the game runtime (Py4GW DLLs) because
+Py4GWCoreLib imports depend on PyScanner/PyPathing/etc.
+Run from within an injected Python session or skip offline.
+"""
+
+import sys
+import os
+import ctypes
+import math
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+try:
+    from Py4GWCoreLib.native_src.context.AgentContext import AgentStruct, AgentLivingStruct
+    from Py4GWCoreLib.native_src.ShMem.structs.AgentArraySSM import AgentArraySHMemStruct, AgentArraySHMemWrapper
+    from Py4GWCoreLib.native_src.ShMem.AgentSnapshot import AgentSnapshot
+    IMPORT_OK = True
+except ImportError as e:
+    IMPORT_OK = False
+    _import_error = e
+
+ALLY, NEUTRAL, ENEMY = 1, 2, 3
+
+# agent_id: (x, y, allegiance, hp, effects, type_map)
+LIVING = {
+    11: (0.0, 0.0, ALLY, 1.0, 0, 0),
+    12: (300.0, 400.0, ENEMY, 0.5, 0, 0),
+    13: (-1000.0, 0.0, ENEMY, 0.25, 0, 0),
+    14: (100.0, 0.0, ENEMY, 0.0, 0, 0),        # hp at zero
+    15: (50.0, 50.0, ENEMY, 0.8, 0x0010, 0),   # dead effect flag
+    16: (60.0, 60.0, ALLY, 0.9, 0, 0x0008),    # dead by type map
+    17: (5000.0, 5000.0, NEUTRAL, 1.0, 0, 0),
+}
+ITEM = {21: (200.0, 0.0)}
+
+
+def _make_wrapper():
+    """Return (wrapper, keepalive) with every entry pointing at a ctypes struct."""
+    raw = AgentArraySHMemStruct()
+    keepalive = []
+    slot = 0
+    for agent_id, (x, y, allegiance, hp, effects, type_map) in LIVING.items():
+        agent = AgentLivingStruct()
+        agent.type = 0xDB
+        agent.pos.x, agent.pos.y, agent.pos.zplane = x, y, 1
+        agent.z = -10.0
+        agent.player_number = 1000 + agent_id
+        agent.allegiance = allegiance
+        agent.hp = hp
+        agent.max_hp = 480
+        agent.effects = effects
+        agent.type_map = type_map
+        keepalive.append(agent)
+        raw.AgentArray[slot].ptr = ctypes.addressof(agent)
+        raw.AgentArray[slot].agent_id = agent_id
+        slot += 1
+    for agent_id, (x, y) in ITEM.items():
+        item = AgentStruct()
+        item.type = 0x400
+        item.pos.x, item.pos.y = x, y
+        keepalive.append(item)
+        raw.AgentArray[slot].ptr = ctypes.addressof(item)
+        raw.AgentArray[slot].agent_id = agent_id
+        slot += 1
+    raw.AgentArrayCount = slot
+    keepalive.append(raw)
+    return AgentArraySHMemWrapper(raw), keepalive
+
+
+def _snapshot():
+    wrapper, keepalive = _make_wrapper()
+    return AgentSnapshot.from_wrapper(wrapper), keepalive
+
+
+def test_columns_match_structs():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    snap, _keep = _snapshot()
+    assert snap.ids == list(LIVING) + list(ITEM)
+    for agent_id, (x, y, allegiance, hp, _, _) in LIVING.items():
+        assert snap.get_xy(agent_id) == (x, y)
+        assert snap.get_xyz(agent_id) == (x, y, -10.0)
+        assert snap.get_allegiance(agent_id) == allegiance
+        assert math.isclose(snap.get_health(agent_id), hp, abs_tol=1e-6)
+        assert snap.get_model_id(agent_id) == 1000 + agent_id
+        assert snap.is_living(agent_id)
+    assert snap.get_xy(21) == (200.0, 0.0)
+    assert not snap.is_living(21) and snap.get_health(21) == 0.0
+
+
+def test_alive_matches_agent_rules():
+    assert IMPORT_OK
+    snap, _keep = _snapshot()
+    assert [a for a in snap.ids if snap.is_alive(a)] == [11, 12, 13, 17]
+
+
+def test_missing_agent_uses_getter_defaults():
+    assert IMPORT_OK
+    snap, _keep = _snapshot()
+    assert 999 not in snap
+    assert snap.get_xy(999) == (0.0, 0.0)
+    assert snap.get_health(999) == 0.0
+    assert not snap.is_alive(999)
+    assert snap.filter([999, 12], max_distance=10.0, center=(0.0, 0.0)) == [999]
+
+
+def test_filters_preserve_input_order():
+    assert IMPORT_OK
+    snap, _keep = _snapshot()
+    assert snap.filter(allegiance=ENEMY, alive=True) == [12, 13]
+    assert snap.filter([13, 12, 11], allegiance=ENEMY) == [13, 12]
+    assert snap.filter(living=False) == [21]
+
+
+def test_distance_filter_matches_brute_force():
+    assert IMPORT_OK
+    snap, _keep = _snapshot()
+    center = (0.0, 0.0)
+    for radius in (0.0, 100.0, 500.0, 1000.0, 10000.0):
+        expected = [a for a in snap.ids if math.dist(snap.get_xy(a), center) <= radius]
+        assert snap.filter(center=center, max_distance=radius) == expected
+        outside = [a for a in snap.ids if math.dist(snap.get_xy(a), center) > radius]
+        assert snap.filter(center=center, min_distance=radius) == outside
+
+
+def test_sorts():
+    assert IMPORT_OK
+    snap, _keep = _snapshot()
+    ids = list(LIVING)
+    assert snap.sort_by_distance(ids, (0.0, 0.0)) == sorted(ids, key=lambda a: math.dist(snap.get_xy(a), (0.0, 0.0)))
+    assert snap.sort_by_distance(ids, (0.0, 0.0), descending=True)[0] == 17
+    assert snap.sort_by_health(ids)[:2] == [14, 13]
+    assert snap.distances([12, 999], (0.0, 0.0)) == [500.0, 0.0]
+
+
+def test_empty_wrapper():
+    assert IMPORT_OK
+    snap = AgentSnapshot.from_wrapper(None)
+    assert len(snap) == 0
+    assert snap.filter() == []
+    assert snap.get_xy(1) == (0.0, 0.0)
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {_import_error}")
+        print(f"\n{len(tests)} tests skipped — run from within injected Python session.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
@@ -0,0 +1,144 @@
+"""Unit tests for AgentSpatialGrid (native_src/ShMem/AgentSpatialGrid.py).
+
+Results are checked against brute-force O(n^2) scans over random agent
+layouts, including clustered packs and radii smaller and larger than a cell.
+
+NOTE: These tests require the game runtime (Py4GW DLLs) because
+Py4GWCoreLib imports depend on PyScanner/PyPathing/etc.
+Run from within an injected Python session or skip offline.
+"""
+
+import sys
+import os
+import math
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+try:
+    from Py4GWCoreLib.native_src.ShMem.AgentSpatialGrid import AgentSpatialGrid
+    IMPORT_OK = True
+except ImportError as e:
+    IMPORT_OK = False
+    _import_error = e
+
+
+def _random_agents(count, seed=5, packs=6, spread=6000.0):
+    """Agents scattered around a few pack centres, like enemy groups on a map."""
+    rng = random.Random(seed)
+    centres = [(rng.uniform(-spread, spread), rng.uniform(-spread, spread)) for _ in range(packs)]
+    ids, xs, ys = [], [], []
+    for i in range(count):
+        cx, cy = rng.choice(centres)
+        ids.append(1000 + i)
+        xs.append(cx + rng.gauss(0.0, 400.0))
+        ys.append(cy + rng.gauss(0.0, 400.0))
+    return ids, xs, ys
+
+
+def _brute_within(ids, xs, ys, x, y, radius):
+    return [a for a, ax, ay in zip(ids, xs, ys) if math.dist((ax, ay), (x, y)) <= radius]
+
+
+def _brute_clusters(ids, xs, ys, radius):
+    pos = dict(zip(ids, zip(xs, ys)))
+    unvisited = set(ids)
+    clusters = []
+    for seed in ids:
+        if seed not in unvisited:
+            continue
+        unvisited.remove(seed)
+        cluster, stack = {seed}, [seed]
+        while stack:
+            node = stack.pop()
+            near = [a for a in unvisited if math.dist(pos[node], pos[a]) <= radius]
+            for a in near:
+                unvisited.remove(a)
+                cluster.add(a)
+                stack.append(a)
+        clusters.append(frozenset(cluster))
+    return clusters
+
+
+def test_query_radius_matches_brute_force():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    ids, xs, ys = _random_agents(300)
+    grid = AgentSpatialGrid(ids, xs, ys, cell_size=1012.0)
+    rng = random.Random(11)
+    for radius in (0.0, 144.0, 1012.0, 2500.0, 20000.0):
+        for _ in range(50):
+            x, y = rng.uniform(-7000, 7000), rng.uniform(-7000, 7000)
+            assert grid.query_radius(x, y, radius) == _brute_within(ids, xs, ys, x, y, radius)
+            assert grid.count_within(x, y, radius) == len(_brute_within(ids, xs, ys, x, y, radius))
+
+
+def test_points_on_cell_boundaries_and_negative_coords():
+    assert IMPORT_OK
+    ids = [1, 2, 3, 4]
+    xs = [0.0, 1012.0, -1012.0, -0.5]
+    ys = [0.0, 0.0, -1012.0, 1011.9]
+    grid = AgentSpatialGrid(ids, xs, ys)
+    assert grid.query_radius(0.0, 0.0, 1012.0) == [1, 2, 4]
+    assert grid.query_radius(-1012.0, -1012.0, 0.0) == [3]
+
+
+def test_neighbor_counts_exclude_self():
+    assert IMPORT_OK
+    ids, xs, ys = _random_agents(250, seed=9)
+    grid = AgentSpatialGrid(ids, xs, ys)
+    counts = grid.neighbor_counts(600.0)
+    for a, x, y in zip(ids, xs, ys):
+        assert counts[a] == len(_brute_within(ids, xs, ys, x, y, 600.0)) - 1
+    assert grid.neighbor_counts(600.0, [ids[0], -1]) == {ids[0]: counts[ids[0]]}
+
+
+def test_clusters_match_brute_force():
+    assert IMPORT_OK
+    for seed in (1, 2, 3):
+        ids, xs, ys = _random_agents(220, seed=seed)
+        for radius in (300.0, 800.0, 2000.0):
+            grid = AgentSpatialGrid(ids, xs, ys, cell_size=radius)
+            got = {frozenset(c) for c in grid.clusters(radius)}
+            assert got == set(_brute_clusters(ids, xs, ys, radius))
+
+
+def test_densest_cluster_center_is_closest_to_centroid():
+    assert IMPORT_OK
+    ids, xs, ys = _random_agents(240, seed=4)
+    grid = AgentSpatialGrid(ids, xs, ys, cell_size=700.0)
+    largest = max(_brute_clusters(ids, xs, ys, 700.0), key=len)
+    pos = dict(zip(ids, zip(xs, ys)))
+    cx = sum(pos[a][0] for a in largest) / len(largest)
+    cy = sum(pos[a][1] for a in largest) / len(largest)
+    expected = min(largest, key=lambda a: math.dist(pos[a], (cx, cy)))
+    assert grid.densest_cluster_center(700.0) == expected
+
+
+def test_empty_grid():
+    assert IMPORT_OK
+    grid = AgentSpatialGrid([], [], [])
+    assert grid.query_radius(0.0, 0.0, 5000.0) == []
+    assert grid.clusters(100.0) == []
+    assert grid.densest_cluster_center(100.0) == 0
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {_import_error}")
+        print(f"\n{len(tests)} tests skipped — run from within injected Python session.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
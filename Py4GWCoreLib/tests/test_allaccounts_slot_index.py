@@ -0,0 +1,215 @@
+"""Tests for the AllAccounts slot/inbox lookup index (GlobalCache/shared_memory_src/AllAccounts.py).
+
+make_accounts() fabricates an AllAccounts buffer with all 64 slots in use
+(accounts, stale duplicates of some emails, heroes, pets) and a partly full
+inbox.  The indexed lookups are compared with the linear scans they replaced,
+then slots and messages are rewritten to check that a SlotTableGeneration /
+InboxGeneration bump is picked up and that a slot rewritten without a bump is
+caught when its stale index entry is hit.
+
+NOTE: These tests require the game runtime (Py4GW DLLs) because
+Py4GWCoreLib imports depend on PyScanner/PyPathing/etc.
+Run from within an injected Python session or skip offline.
+"""
+
+import sys
+import os
+import ctypes
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+try:
+    import Py4GW
+    from Py4GWCoreLib.GlobalCache.shared_memory_src.AllAccounts import AllAccounts
+    from Py4GWCoreLib.GlobalCache.shared_memory_src.Globals import SHMEM_MAX_PLAYERS
+    IMPORT_OK = True
+except ImportError as e:
+    IMPORT_OK = False
+    _import_error = e
+
+BASE_HWND = 0x7000_0000
+
+
+def make_accounts(seed: int = 5, messages: int = 24):
+    """AllAccounts with every slot populated: 32 account slots (some emails twice), 16 heroes, 16 pets."""
+    rng = random.Random(seed)
+    accounts = AllAccounts()
+    accounts.reset()
+    now = int(Py4GW.Game.get_tick_count64())
+    emails = [f"account{n:02d}@example.invalid" for n in range(24)]
+    for i in range(SHMEM_MAX_PLAYERS):
+        account = accounts.AccountData[i]
+        kind = i % 4
+        account.IsSlotActive = True
+        account.LastUpdated = max(0, now - rng.choice((0, 50, 200, 60_000)))
+        if kind < 2:
+            # 32 account slots over 24 emails: the repeats are older sessions of the same account
+            account.IsAccount = True
+            account.AccountEmail = emails[(i // 4 * 2 + kind) % len(emails)]
+            account.IsolationGroupID = rng.choice((0, 0, 0, 1, 2))
+            account.IsIsolated = rng.random() < 0.1
+            account.AgentPartyData.PartyID = rng.choice((0, 7, 9))
+            accounts.Keys[i].AsPlayerKey(BASE_HWND + i)
+        elif kind == 2:
+            account.IsHero = True
+            account.AccountEmail = emails[i % len(emails)]
+            accounts.Keys[i].AsHeroKey(BASE_HWND + i - 2, 1 + i % 7)
+        else:
+            account.IsPet = True
+            account.AccountEmail = emails[i % len(emails)]
+            accounts.Keys[i].AsPetKey(BASE_HWND + i - 3, 0)
+    for i in rng.sample(range(SHMEM_MAX_PLAYERS), messages):
+        message = accounts.Inbox[i]
+        message.SenderEmail = rng.choice(emails)
+        message.ReceiverEmail = rng.choice(emails[:10])
+        message.Command = 1 + i % 5
+        message.Running = rng.random() < 0.3
+        message.Active = True
+    accounts.MarkSlotTableChanged()
+    accounts._bump_generation("InboxGeneration")
+    return accounts, emails
+
+
+# Linear scans the index replaced, kept as the reference.
+
+def scan_account_candidates(accounts, email):
+    return tuple(i for i in range(SHMEM_MAX_PLAYERS)
+                 if accounts.AccountData[i].AccountEmail == email and accounts.AccountData[i].IsAccount)
+
+
+def scan_player_slot_by_key(accounts, email, hwnd):
+    for i in range(SHMEM_MAX_PLAYERS):
+        account = accounts.AccountData[i]
+        key = accounts.Keys[i]
+        if account.IsAccount and account.AccountEmail == email and key.HWND == hwnd and key.EntityType == 0:
+            return i
+    return -1
+
+
+def scan_slot_by_key(accounts, hwnd, entity_type, local_index):
+    if not hwnd:
+        return -1
+    for i in range(SHMEM_MAX_PLAYERS):
+        key = accounts.Keys[i]
+        if key.HWND == hwnd and key.EntityType == entity_type and key.LocalIndex == local_index:
+            return i
+    return -1
+
+
+def scan_all_messages(accounts):
+    return [i for i in range(SHMEM_MAX_PLAYERS)
+            if accounts.Inbox[i].Active
+            and accounts._can_communicate(accounts.Inbox[i].SenderEmail, accounts.Inbox[i].ReceiverEmail)]
+
+
+def scan_next_message(accounts, email):
+    for i in range(SHMEM_MAX_PLAYERS):
+        message = accounts.Inbox[i]
+        if (message.ReceiverEmail == email and message.Active and not message.Running
+                and accounts._can_communicate(message.SenderEmail, email)):
+            return i
+    return -1
+
+
+def _assert_matches_scan(accounts, emails):
+    for email in emails + ["nobody@example.invalid"]:
+        assert accounts._account_slots_for_email(email) == scan_account_candidates(accounts, email)
+        assert accounts.GetNextMessage(email)[0] == scan_next_message(accounts, email)
+        for i in range(0, SHMEM_MAX_PLAYERS, 4):
+            hwnd = BASE_HWND + i
+            assert accounts._find_player_slot_by_key(email, hwnd) == scan_player_slot_by_key(accounts, email, hwnd)
+    for i in range(SHMEM_MAX_PLAYERS):
+        key = accounts.Keys[i]
+        lookup = (int(key.HWND), int(key.EntityType), int(key.LocalIndex))
+        assert accounts._find_slot_by_key(*lookup) == scan_slot_by_key(accounts, *lookup)
+    assert accounts._find_slot_by_key(BASE_HWND + 1, 1, 99) == -1
+    assert [i for i, _ in accounts.GetAllMessages()] == scan_all_messages(accounts)
+
+
+def test_indexed_lookups_match_linear_scans():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    accounts, emails = make_accounts()
+    _assert_matches_scan(accounts, emails)
+    assert any(len(scan_account_candidates(accounts, e)) > 1 for e in emails)   # duplicates exercised
+    assert accounts.GetAllMessages()                                               # messages exercised
+
+
+def test_generation_bumps_rebuild_the_index():
+    assert IMPORT_OK
+    accounts, emails = make_accounts(seed=11)
+    generation = accounts.GetSlotTableGeneration()
+    accounts._find_account_slot_by_email(emails[0])
+
+    moved = scan_account_candidates(accounts, emails[0])[0]
+    accounts.AccountData[moved].AccountEmail = "renamed@example.invalid"
+    accounts.Keys[moved].AsPlayerKey(BASE_HWND + 500)
+    accounts.MarkSlotTableChanged()
+    assert accounts.GetSlotTableGeneration() == generation + 1
+    assert accounts._account_slots_for_email("renamed@example.invalid") == (moved,)
+    assert accounts._find_slot_by_key(BASE_HWND + 500, 0, 0) == moved
+    _assert_matches_scan(accounts, emails + ["renamed@example.invalid"])
+
+    # inbox: finish one message, send another, bump InboxGeneration
+    index, _ = accounts.GetAllMessages()[0]
+    accounts.Inbox[index].Active = False
+    free = next(i for i in range(SHMEM_MAX_PLAYERS) if not accounts.Inbox[i].Active and i != index)
+    accounts.Inbox[free].SenderEmail = emails[3]
+    accounts.Inbox[free].ReceiverEmail = emails[3]
+    accounts.Inbox[free].Running = False
+    accounts.Inbox[free].Active = True
+    accounts._bump_generation("InboxGeneration")
+    _assert_matches_scan(accounts, emails)
+
+
+def test_rewrite_without_bump_is_caught_on_a_stale_hit():
+    assert IMPORT_OK
+    accounts, emails = make_accounts(seed=17)
+    email = emails[5]
+    slots = accounts._account_slots_for_email(email)
+    accounts.AccountData[slots[0]].AccountEmail = "other@example.invalid"   # no MarkSlotTableChanged()
+    assert accounts._account_slots_for_email(email) == scan_account_candidates(accounts, email)
+    assert accounts._account_slots_for_email("other@example.invalid") == (slots[0],)
+
+    key = accounts.Keys[2]
+    lookup = (int(key.HWND), int(key.EntityType), int(key.LocalIndex))
+    key.AsHeroKey(BASE_HWND + 900, 3)   # no bump either
+    assert accounts._find_slot_by_key(*lookup) == scan_slot_by_key(accounts, *lookup)
+
+
+def test_reset_bumps_every_generation():
+    assert IMPORT_OK
+    from Py4GWCoreLib.GlobalCache.shared_memory_src.AllAccounts import _INBOX_INDEX
+    accounts, emails = make_accounts(seed=23)
+    assert accounts.GetAllMessages()
+    address = ctypes.addressof(accounts)
+    stale_inbox = _INBOX_INDEX[address]                 # what another process still holds
+    before = (accounts.GetWhiteboardGeneration(), accounts.GetInboxGeneration(), accounts.GetSlotTableGeneration())
+
+    accounts.reset()
+    after = (accounts.GetWhiteboardGeneration(), accounts.GetInboxGeneration(), accounts.GetSlotTableGeneration())
+    assert all(a == b + 1 for a, b in zip(after, before))
+    _INBOX_INDEX[address] = stale_inbox
+    assert accounts.GetAllMessages() == [] == scan_all_messages(accounts)
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {_import_error}")
+        print(f"\n{len(tests)} tests skipped — run from within injected Python session.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
@@ -0,0 +1,160 @@
+"""Unit tests for the array-backed A* engine and path cache in Pathing.py.
+
+NOTE: These tests require the game runtime (Py4GW DLLs) because
+Py4GWCoreLib imports depend on PyScanner/PyPathing/etc.
+Run from within an injected Python session or skip offline.
+"""
+
+import sys
+import os
+import heapq
+import math
+import random
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_navmesh import make_pathing_maps
+
+try:
+    from Py4GWCoreLib.Pathing import NavMesh, AStar
+    IMPORT_OK = True
+except ImportError as e:
+    IMPORT_OK = False
+    _import_error = e
+
+
+def _reference_route_cost(nav, start_id, goal_id):
+    """Cost of the cheapest route using the dict-based graph (no closed set)."""
+    dist = {start_id: 0.0}
+    heap = [(0.0, start_id)]
+    while heap:
+        d, cur = heapq.heappop(heap)
+        if cur == goal_id:
+            return d
+        if d > dist[cur]:
+            continue
+        for nb in nav.get_neighbors(cur):
+            nd = d + nav.get_transition_cost(cur, nb)
+            if nd < dist.get(nb, math.inf):
+                dist[nb] = nd
+                heapq.heappush(heap, (nd, nb))
+    return None
+
+
+def _route_cost(nav, route):
+    return sum(nav.get_transition_cost(a, b) for a, b in zip(route, route[1:]))
+
+
+def _pairs(nav, count, seed=3):
+    rng = random.Random(seed)
+    ids = list(nav.trapezoids.keys())
+    return [(rng.choice(ids), rng.choice(ids)) for _ in range(count)]
+
+
+def test_routes_are_optimal_on_single_layer():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    nav = NavMesh(make_pathing_maps(cols=15, rows=12, layers=1, hole_ratio=0.2), 1)
+    for s, g in _pairs(nav, 60):
+        expected = _reference_route_cost(nav, s, g)
+        route = nav.get_search_graph().search(s, g)
+        if expected is None:
+            assert route is None
+            continue
+        assert route[0] == s and route[-1] == g
+        assert abs(_route_cost(nav, route) - expected) < 1e-6
+
+
+def test_routes_follow_portals_across_layers():
+    # Zero-cost cross-layer portals make the centroid heuristic inadmissible,
+    # so only route validity and reachability are checked here.
+    assert IMPORT_OK
+    nav = NavMesh(make_pathing_maps(cols=10, rows=10, layers=3, hole_ratio=0.2), 1)
+    for s, g in _pairs(nav, 60):
+        expected = _reference_route_cost(nav, s, g)
+        route = nav.get_search_graph().search(s, g)
+        assert (route is None) == (expected is None)
+        if route is not None:
+            assert route[0] == s and route[-1] == g
+            assert all(b in nav.get_neighbors(a) for a, b in zip(route, route[1:]))
+
+
+def test_cache_load_graph_matches_built_graph():
+    assert IMPORT_OK
+    maps = make_pathing_maps(cols=10, rows=10, layers=2, hole_ratio=0.1)
+    nav = NavMesh(maps, 2)
+    folder = tempfile.mkdtemp()
+    nav.save_to_file(folder)
+    loaded = NavMesh.load_from_file(maps, 2, folder)
+    for s, g in _pairs(nav, 40):
+        a = nav.get_search_graph().search(s, g)
+        b = loaded.get_search_graph().search(s, g)
+        assert (a is None) == (b is None)
+        if a is not None:
+            assert abs(_route_cost(nav, a) - _route_cost(nav, b)) < 1e-6
+
+
+def test_repeated_route_is_a_cache_hit():
+    assert IMPORT_OK
+    nav = NavMesh(make_pathing_maps(cols=8, rows=8), 3)
+    s, g = _pairs(nav, 1)[0]
+    first = nav.find_path_ids(s, g)
+    second = nav.find_path_ids(s, g)
+    assert first == second
+    assert nav.path_cache_misses == 1
+    assert nav.path_cache_hits == 1
+
+
+def test_failed_search_is_cached():
+    assert IMPORT_OK
+    nav = NavMesh(make_pathing_maps(cols=6, rows=6), 4)
+    assert nav.find_path_ids(-1, -2) is None
+    assert nav.find_path_ids(-1, -2) is None
+    assert nav.path_cache_hits == 1
+
+
+def test_mesh_change_invalidates_cache():
+    assert IMPORT_OK
+    nav = NavMesh(make_pathing_maps(cols=6, rows=6), 5)
+    s, g = _pairs(nav, 1)[0]
+    nav.find_path_ids(s, g)
+    version = nav.mesh_version
+    nav.invalidate_path_cache()
+    assert nav.mesh_version == version + 1
+    nav.find_path_ids(s, g)
+    assert nav.path_cache_misses == 2
+
+
+def test_astar_path_wraps_route_with_exact_endpoints():
+    assert IMPORT_OK
+    nav = NavMesh(make_pathing_maps(cols=8, rows=8), 6)
+    start = (500.0, 250.0)
+    goal = (7500.0, 3750.0)
+    astar = AStar(nav)
+    assert astar.search(start, goal)
+    path = astar.get_path()
+    assert path[0] == start and path[-1] == goal
+    assert len(path) >= 3
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {_import_error}")
+        print(f"\n{len(tests)} tests skipped — run from within injected Python session.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
@@ -0,0 +1,131 @@
+"""Tests for the BehaviorTree tick path (py4gwcorelib_src/BehaviorTree.py).
+
+Trees built from synthetic_behavior_tree.py are ticked in lockstep with
+per-node timing on every tick and with sampled timing; node states, tick
+counts and the root results must be identical.  Also covers integer node ids,
+BT_TRACE being read once per tree tick, and the sample-rate bookkeeping.
+
+NOTE: These tests require the game runtime (Py4GW DLLs) because
+Py4GWCoreLib imports depend on PyScanner/PyPathing/etc.
+Run from within an injected Python session or skip offline.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_behavior_tree import build_tree, walk
+
+try:
+    from Py4GWCoreLib.py4gwcorelib_src import BehaviorTree as bt_module
+    from Py4GWCoreLib.py4gwcorelib_src.BehaviorTree import BehaviorTree
+    from Py4GWCoreLib.py4gwcorelib_src.Profiling import ProfilingRegistry
+    IMPORT_OK = True
+except ImportError as e:
+    IMPORT_OK = False
+    _import_error = e
+
+
+def _states(tree):
+    return [(node.name, node.last_state, node.tick_count) for node in walk(tree.root)]
+
+
+def test_sampled_timing_keeps_node_semantics():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    full, full_clock = build_tree(BehaviorTree, 300, timing_sample_rate=1)
+    sampled, sampled_clock = build_tree(BehaviorTree, 300, timing_sample_rate=16)
+    never, never_clock = build_tree(BehaviorTree, 300, timing_sample_rate=0)
+    for tick in range(200):
+        full_clock["tick"] = sampled_clock["tick"] = never_clock["tick"] = tick
+        result = full.tick()
+        assert sampled.tick() == result
+        assert never.tick() == result
+        expected = _states(full)
+        assert _states(sampled) == expected
+        assert _states(never) == expected
+    assert len({state for _, state, _ in _states(full)}) > 2   # the fixture exercises every state
+
+
+def test_timed_tick_counts_follow_the_sample_rate():
+    assert IMPORT_OK
+    tree, clock = build_tree(BehaviorTree, 40, timing_sample_rate=4)
+    for tick in range(40):
+        clock["tick"] = tick
+        tree.tick()
+    assert tree.root.tick_count == 40
+    assert tree.root.timed_tick_count == 10
+
+    registry = ProfilingRegistry()
+    previous = registry.enabled
+    registry.enabled = True
+    try:
+        quiet, clock = build_tree(BehaviorTree, 40, timing_sample_rate=0)
+        for tick in range(5):
+            clock["tick"] = tick
+            quiet.tick()
+        assert quiet.root.timed_tick_count == 5
+    finally:
+        registry.enabled = previous
+
+
+def test_node_ids_are_unique_integers():
+    assert IMPORT_OK
+    tree, _ = build_tree(BehaviorTree, 200)
+    ids = [node.id for node in walk(tree.root)]
+    assert all(isinstance(node_id, int) for node_id in ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_trace_flag_is_read_once_per_tree_tick():
+    assert IMPORT_OK
+    tree, clock = build_tree(BehaviorTree, 30)
+
+    class CountingBlackboard(dict):
+        reads = 0
+
+        def get(self, key, default=None):
+            if key == "BT_TRACE":
+                CountingBlackboard.reads += 1
+            return super().get(key, default)
+
+    logged = []
+    original_log = bt_module.ConsoleLog
+    bt_module.ConsoleLog = lambda *args, **kwargs: logged.append(args[1])
+    try:
+        tree.blackboard = CountingBlackboard(BT_TRACE=True)
+        tree.tick()
+        assert CountingBlackboard.reads == 1
+        ticked = sum(1 for node in walk(tree.root) if node.tick_count)
+        assert len(logged) == 2 * ticked   # ENTER + EXIT for every ticked node
+        # A node ticked on its own still honours its blackboard
+        logged.clear()
+        leaf = tree.root.get_children()[0]
+        leaf.tick()
+        assert logged and logged[0].startswith("ENTER")
+    finally:
+        bt_module.ConsoleLog = original_log
+    assert bt_module._tick_context is None
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {_import_error}")
+        print(f"\n{len(tests)} tests skipped — run from within injected Python session.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
@@ -0,0 +1,132 @@
+"""Tests for the batch point-location queries (TrapezoidBSP.find_many / contains_many).
+
+Every batch answer must equal the scalar find / find_with_margin answer for
+the same point: random points on and off synthetic meshes, points exactly
+on cell edges and split planes, overlapping layers (the first trapezoid in
+the scalar walk order wins) and zero-height trapezoids.
+
+NOTE: These tests require the game runtime (Py4GW DLLs) because
+Py4GWCoreLib imports depend on PyScanner/PyPathing/etc.
+Run from within an injected Python session or skip offline.
+"""
+
+import sys
+import os
+import random
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_navmesh import SyntheticPathingMap, SyntheticTrapezoid, make_pathing_maps, random_points
+
+try:
+    from Py4GWCoreLib.Pathing import NavMesh, TrapezoidBSP
+    IMPORT_OK = True
+except ImportError as e:
+    IMPORT_OK = False
+    _import_error = e
+
+
+def _check_batch(bsp, points, tols=(0.0, 20.0), margins=(0.0, 20.0, 150.0, -30.0)):
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    for tol in tols:
+        assert bsp.find_many(xs, ys, tol) == [bsp.find(x, y, tol) for x, y in points], f"tol {tol}"
+    for margin in margins:
+        assert bsp.contains_many(xs, ys, margin) == [bsp.find_with_margin(x, y, margin) for x, y in points], \
+            f"margin {margin}"
+    per_point = [margins[i % len(margins)] for i in range(len(points))]
+    assert bsp.contains_many(xs, ys, per_point) == [bsp.find_with_margin(x, y, m) for (x, y), m in zip(points, per_point)]
+
+
+def _edge_points(maps, count, seed=3):
+    """Points on trapezoid corners, side walls and bottom/top edges."""
+    rng = random.Random(seed)
+    traps = [t for pmap in maps for t in pmap.trapezoids]
+    points = []
+    for _ in range(count):
+        t = rng.choice(traps)
+        u = rng.choice((0.0, 0.5, 1.0))
+        y = t.YB + (t.YT - t.YB) * u
+        points += [(t.XBL + (t.XTL - t.XBL) * u, y), (t.XBR + (t.XTR - t.XBR) * u, y), (t.XBL, t.YB), (t.XTR, t.YT)]
+    return points
+
+
+def test_batch_matches_scalar_on_random_points():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    for maps in (make_pathing_maps(cols=12, rows=18, hole_ratio=0.2, seed=4),
+                 make_pathing_maps(cols=8, rows=20, layers=3, hole_ratio=0.15, seed=9, slant=0.8)):
+        bsp = NavMesh(maps, 1)._bsp
+        _check_batch(bsp, random_points(maps, 3000, pad=800.0, seed=12))
+
+
+def test_batch_matches_scalar_on_edges_and_splits():
+    assert IMPORT_OK
+    maps = make_pathing_maps(cols=10, rows=16, hole_ratio=0.1, seed=6, slant=0.5)
+    bsp = NavMesh(maps, 1)._bsp
+    points = _edge_points(maps, 400)
+    # exactly on, and just around, every split plane of the tree
+    split_ys = [bsp.node_split_y[k] for k in range(len(bsp.node_leaf)) if bsp.node_leaf[k] < 0]
+    rng = random.Random(8)
+    for y in split_ys:
+        for dy in (0.0, 19.999, 20.0, -20.0, 1e-9):
+            points.append((rng.uniform(-200.0, 10200.0), y + dy))
+    _check_batch(bsp, points)
+
+
+def test_overlapping_layers_and_degenerate_trapezoids():
+    assert IMPORT_OK
+    # two overlapping planes (a bridge over a room) and a zero-height sliver
+    lower = [SyntheticTrapezoid(i, i * 100.0, i * 100.0 + 100.0, 0.0, 500.0) for i in range(40)]
+    upper = SyntheticTrapezoid(40, 0.0, 4000.0, 200.0, 300.0)
+    upper.XTL, upper.XTR = 300.0, 3700.0
+    sliver = SyntheticTrapezoid(41, 500.0, 900.0, 250.0, 250.0)
+    traps = lower + [upper, sliver]
+    rng = random.Random(2)
+    for order in range(4):
+        rng.shuffle(traps)
+        bsp = TrapezoidBSP(traps)
+        points = [(rng.uniform(-100.0, 4100.0), rng.uniform(-100.0, 600.0)) for _ in range(1500)]
+        points += [(x * 50.0, y) for x in range(82) for y in (0.0, 200.0, 250.0, 300.0, 500.0)]
+        _check_batch(bsp, points)
+
+
+def test_restored_tree_and_empty_inputs():
+    assert IMPORT_OK
+    maps = make_pathing_maps(cols=12, rows=10, layers=2, hole_ratio=0.1, slant=0.3)
+    nav = NavMesh(maps, 7)
+    folder = tempfile.mkdtemp()
+    nav.save_to_file(folder)
+    loaded = NavMesh.load_from_file(maps, 7, folder)
+    assert loaded is not None
+    points = random_points(maps, 1000, seed=5)
+    assert loaded.find_trapezoid_ids_by_coord(points) == [nav.find_trapezoid_id_by_coord(p) for p in points]
+    assert loaded.contains_many(points, 50.0) == [nav.contains(x, y, 50.0) for x, y in points]
+
+    assert nav.contains_many([]) == [] and nav.find_trapezoid_ids_by_coord([]) == []
+    empty = TrapezoidBSP([])
+    assert empty.find_many([1.0], [2.0]) == [None]
+    assert empty.contains_many([1.0], [2.0], 0.0) == [False]
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {_import_error}")
+        print(f"\n{len(tests)} tests skipped — run from within injected Python session.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
@@ -0,0 +1,209 @@
+"""Replay tests for the CombatEvents cast index (CombatEventQueue_src/helpers.py).
+
+Random event streams are fed through helpers._process_event under a fake
+clock, and after every event the indexed cast queries are compared against
+the previous implementation, which rescanned the whole event deque.  The
+streams cover the 30s window, out-of-order timestamps, repeated CASTTIME
+events and events rotating out of the 2000-entry deque.
+
+NOTE: These tests require the game runtime (Py4GW DLLs) because
+Py4GWCoreLib imports depend on PyScanner/PyPathing/etc.
+Run from within an injected Python session or skip offline.
+"""
+
+import sys
+import os
+import random
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+try:
+    from Py4GWCoreLib.CombatEventQueue_src import helpers
+    from Py4GWCoreLib.enums import EventType
+    IMPORT_OK = True
+except ImportError as e:
+    IMPORT_OK = False
+    _import_error = e
+
+AGENTS = (11, 12, 13, 14)
+
+
+def _scan_find_cast(agent_id, now):
+    """The pre-index _find_cast: walk the deque newest to oldest."""
+    cast_start = None
+    skill_id = target_id = 0
+    duration = 0.0
+    for ts, etype, agent, val, target, fval in reversed(list(helpers._events)):
+        if agent != agent_id:
+            continue
+        if now - ts > 30000:
+            break
+        if etype in (
+            EventType.SKILL_FINISHED,
+            EventType.ATTACK_SKILL_FINISHED,
+            EventType.SKILL_STOPPED,
+            EventType.ATTACK_SKILL_STOPPED,
+            EventType.INTERRUPTED,
+        ):
+            return None
+        if etype in (EventType.SKILL_ACTIVATED, EventType.ATTACK_SKILL_ACTIVATED):
+            cast_start, skill_id, target_id = ts, val, target
+            break
+        if etype == EventType.CASTTIME:
+            duration = fval
+    if cast_start is None:
+        return None
+    if duration > 0 and now - cast_start > duration * 1000:
+        return None
+    return (skill_id, target_id, cast_start, duration)
+
+
+def _scan_pending_skill(agent_id):
+    """The pre-index _get_pending_skill."""
+    for _, etype, agent, val, _, _ in reversed(list(helpers._events)):
+        if agent == agent_id and etype in (
+            EventType.SKILL_ACTIVATED, EventType.ATTACK_SKILL_ACTIVATED, EventType.SKILL_ACTIVATE_PACKET
+        ):
+            return val
+    return 0
+
+
+class _Replay:
+    """Drives helpers with a fake clock and restores the module state afterwards."""
+
+    def __init__(self):
+        self.now = 100000
+        self._saved_clock = helpers._get_tick_count
+        self._saved_active = helpers._is_callback_active()
+
+    def __enter__(self):
+        helpers._get_tick_count = lambda: self.now
+        helpers._set_callback_active(True)
+        helpers._clear_events()
+        return self
+
+    def __exit__(self, *exc):
+        helpers._clear_events()
+        helpers._get_tick_count = self._saved_clock
+        helpers._set_callback_active(self._saved_active)
+
+    def event(self, etype, agent, val=0, target=0, fval=0.0, ts=None):
+        helpers._process_event(SimpleNamespace(
+            timestamp=self.now if ts is None else ts,
+            event_type=int(etype), agent_id=agent, value=val, target_id=target, float_value=fval,
+        ))
+
+    def check(self):
+        for agent in AGENTS:
+            expected = _scan_find_cast(agent, self.now)
+            assert helpers._find_cast(agent) == expected, (agent, self.now, expected)
+            assert helpers._is_casting(agent) == (expected is not None)
+            assert helpers._casting_skill_id(agent) == (expected[0] if expected else 0)
+            assert helpers._get_pending_skill(agent) == _scan_pending_skill(agent)
+
+
+def _random_stream(replay, rng, count, max_step_ms, jitter_ms=0):
+    kinds = [
+        EventType.SKILL_ACTIVATED, EventType.ATTACK_SKILL_ACTIVATED, EventType.SKILL_ACTIVATE_PACKET,
+        EventType.CASTTIME, EventType.CASTTIME,
+        EventType.SKILL_FINISHED, EventType.ATTACK_SKILL_FINISHED, EventType.SKILL_STOPPED,
+        EventType.ATTACK_SKILL_STOPPED, EventType.INTERRUPTED,
+        EventType.ATTACK_STARTED, EventType.ATTACK_STOPPED, EventType.EFFECT_RENEWED,
+    ]
+    for _ in range(count):
+        replay.now += rng.randint(0, max_step_ms)
+        ts = replay.now - rng.randint(0, jitter_ms) if jitter_ms else None
+        replay.event(
+            rng.choice(kinds), rng.choice(AGENTS),
+            val=rng.randint(1, 40), target=rng.choice(AGENTS), fval=rng.choice((0.0, 0.25, 1.0, 2.0, 3.0)), ts=ts,
+        )
+        replay.check()
+        # Also probe later points in time without new events (window expiry).
+        saved = replay.now
+        for later in (500, 2500, 31000):
+            replay.now = saved + later
+            replay.check()
+        replay.now = saved
+
+
+def test_replay_matches_scan():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    with _Replay() as replay:
+        _random_stream(replay, random.Random(1), 1500, max_step_ms=400)
+
+
+def test_replay_with_out_of_order_timestamps():
+    assert IMPORT_OK
+    with _Replay() as replay:
+        _random_stream(replay, random.Random(2), 1500, max_step_ms=300, jitter_ms=35000)
+
+
+def test_replay_past_deque_capacity():
+    assert IMPORT_OK
+    with _Replay() as replay:
+        # Long quiet stretch for one caster while other agents flood the deque.
+        replay.event(EventType.SKILL_ACTIVATED, 11, val=7, target=12)
+        replay.event(EventType.CASTTIME, 11, fval=0.0)
+        for i in range(helpers._events.maxlen - 2):
+            replay.event(EventType.ATTACK_STARTED, 12 + i % 3, target=11)
+        replay.check()
+        assert helpers._casting_skill_id(11) == 7
+        replay.event(EventType.ATTACK_STARTED, 13)
+        replay.check()
+        assert not helpers._is_casting(11)
+        assert helpers._get_pending_skill(11) == 0
+        _random_stream(replay, random.Random(3), 2600, max_step_ms=30)
+
+
+def test_cast_window_and_duration():
+    assert IMPORT_OK
+    with _Replay() as replay:
+        replay.event(EventType.SKILL_ACTIVATED, 11, val=5, target=12)
+        replay.event(EventType.CASTTIME, 11, fval=2.0)
+        replay.event(EventType.CASTTIME, 11, fval=9.0)  # only the first CASTTIME counts
+        replay.now += 1000
+        assert helpers._find_cast(11) == (5, 12, replay.now - 1000, 2.0)
+        assert helpers._get_remaining_cast_time(11) == 1000
+        assert abs(helpers._cast_progress(11) - 0.5) < 1e-9
+        replay.now += 1500
+        assert not helpers._is_casting(11)
+
+        replay.event(EventType.ATTACK_SKILL_ACTIVATED, 12, val=6)
+        replay.now += 29999
+        assert helpers._casting_skill_id(12) == 6
+        replay.now += 2
+        assert not helpers._is_casting(12)
+
+
+def test_clear_events_resets_index():
+    assert IMPORT_OK
+    with _Replay() as replay:
+        replay.event(EventType.SKILL_ACTIVATED, 11, val=5)
+        assert helpers._is_casting(11)
+        helpers._clear_events()
+        assert not helpers._is_casting(11)
+        assert helpers._get_pending_skill(11) == 0
+        replay.check()
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {_import_error}")
+        print(f"\n{len(tests)} tests skipped — run from within injected Python session.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
@@ -0,0 +1,215 @@
+"""Tests for DBMgr pooled connections, batch writes and write-behind (database_src/DBMgr.py).
+
+DBMgr.py only depends on the standard library (Py4GW is imported lazily for
+logging and the projects path), so it is loaded by path and run against a
+temporary data directory seeded with the repo's catalog setup script.  These
+tests do not need the game runtime.
+"""
+
+import sys
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import importlib.util
+from pathlib import Path
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_DBMGR_PATH = os.path.join(_REPO_ROOT, "Py4GWCoreLib", "database_src", "DBMgr.py")
+_CATALOG_SQL = os.path.join(_REPO_ROOT, "data", "db_setup", "001_catalog.sql")
+
+
+def _load_dbmgr_module():
+    spec = importlib.util.spec_from_file_location("_dbmgr_pooling_test", _DBMGR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+try:
+    _load_dbmgr_module()
+    IMPORT_OK = True
+except Exception as e:
+    IMPORT_OK = False
+    _import_error = e
+
+
+class _TempDatabase:
+    """Fresh DBMgr module bound to a throwaway 'bench' database under a temp cwd."""
+
+    def __enter__(self):
+        self._cwd = os.getcwd()
+        self.root = tempfile.mkdtemp(prefix="dbmgr_test_")
+        setup_dir = Path(self.root) / "data" / "db_setup"
+        setup_dir.mkdir(parents=True)
+        shutil.copy(_CATALOG_SQL, setup_dir / "001_catalog.sql")
+        os.chdir(self.root)
+        self.module = _load_dbmgr_module()
+        DBMgr = self.module.DBMgr
+        DBMgr("PRIMARY").Register("bench", "bench.db")
+        self.db = DBMgr("bench")
+        self.db.CreateTable("items", [("id", "INTEGER", "PRIMARY KEY"), ("name", "TEXT"), ("qty", "INTEGER")])
+        return self
+
+    def __exit__(self, *exc):
+        DBMgr = self.module.DBMgr
+        DBMgr.StopWriteBehind()
+        DBMgr.CloseConnections()
+        os.chdir(self._cwd)
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+def test_auto_commit_reuses_one_connection_per_thread():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    with _TempDatabase() as t:
+        db = t.db
+        db.Insert("items", ["id", "name"], [1, "a"])
+        conn = db._pooled_write_connection()
+        db.Insert("items", ["id", "name"], [2, "b"])
+        assert db._pooled_write_connection() is conn
+        assert db.Count("items") == 2
+
+        seen = []
+        worker = threading.Thread(target=lambda: (seen.append(db._pooled_write_connection()), t.module.DBMgr.CloseConnections()))
+        worker.start()
+        worker.join()
+        assert seen and seen[0] is not conn
+
+
+def test_failed_write_leaves_pool_usable():
+    assert IMPORT_OK
+    with _TempDatabase() as t:
+        db = t.db
+        db.Insert("items", ["id", "name"], [1, "a"])
+        try:
+            db.Insert("items", ["id", "name"], [1, "dup"])
+            raise AssertionError("duplicate primary key accepted")
+        except sqlite3.IntegrityError:
+            pass
+        db.Insert("items", ["id", "name"], [2, "b"])
+        assert [r["name"] for r in db.Select("items", order_by="id")] == ["a", "b"]
+
+
+def test_insert_many_and_upsert_many():
+    assert IMPORT_OK
+    with _TempDatabase() as t:
+        db = t.db
+        assert db.InsertMany("items", ["id", "name", "qty"], [(i, f"n{i}", i) for i in range(100)]) == 100
+        assert db.UpsertMany("items", ["id", "name", "qty"], [(i, f"u{i}", -i) for i in range(90, 110)]) == 20
+        assert db.Count("items") == 110
+        assert db.GetFirstEntry("items", "id", 95)["name"] == "u95"
+        assert db.InsertMany("items", ["id"], []) == 0
+        try:
+            db.InsertMany("items", ["id", "name"], [(500, "x"), (501,)])
+            raise AssertionError("ragged rows accepted")
+        except ValueError:
+            pass
+        assert db.Count("items") == 110
+
+
+def test_batch_inside_transaction_rolls_back():
+    assert IMPORT_OK
+    with _TempDatabase() as t:
+        db = t.db
+        db.BeginTransaction()
+        db.InsertMany("items", ["id", "name"], [(i, "tx") for i in range(10)], commit=False)
+        db.EndTransaction("ROLLBACK")
+        assert db.Count("items") == 0
+
+
+def test_upsert_sql_follows_schema_changes():
+    assert IMPORT_OK
+    with _TempDatabase() as t:
+        db = t.db
+        db.Merge("items", ["id", "name"], [1, "a"])
+        db.Merge("items", ["id", "name"], [1, "b"])
+        assert db.Count("items") == 1
+        db.DropTable("items")
+        db.CreateTable("items", [("id", "INTEGER"), ("name", "TEXT")])   # no primary key any more
+        db.Merge("items", ["id", "name"], [1, "a"])
+        db.Merge("items", ["id", "name"], [1, "b"])
+        assert db.Count("items") == 2
+
+
+def test_write_behind_coalesces_and_flushes():
+    assert IMPORT_OK
+    with _TempDatabase() as t:
+        DBMgr = t.module.DBMgr
+        db = t.db
+        DBMgr.StartWriteBehind(flush_interval_ms=20)
+        assert DBMgr.IsWriteBehindActive()
+        for i in range(2000):
+            db.InsertDeferred("items", ["id", "name"], [i, "w"])
+        db.UpsertDeferred("items", ["id", "name"], [5, "upserted"])
+        db.InsertDeferred("items", ["id", "name"], [0, "duplicate"])   # fails, logged, does not stop the worker
+        db.InsertDeferred("items", ["id", "name"], [5000, "after"])
+        assert DBMgr.FlushWrites(timeout=10.0)
+        assert db.Count("items") == 2001
+        assert db.GetFirstEntry("items", "id", 5)["name"] == "upserted"
+        assert DBMgr.GetWriteBehindErrors() == 1
+        DBMgr.StopWriteBehind()
+        assert not DBMgr.IsWriteBehindActive()
+        db.InsertDeferred("items", ["id", "name"], [6000, "direct"])   # runs synchronously when stopped
+        assert db.EntryExists("items", "id", 6000)
+
+
+def test_unregister_closes_other_threads_connections():
+    assert IMPORT_OK
+    with _TempDatabase() as t:
+        DBMgr = t.module.DBMgr
+        db = t.db
+        DBMgr.StartWriteBehind(flush_interval_ms=5)
+        db.InsertDeferred("items", ["id", "name"], [1, "deferred"])
+        assert DBMgr.FlushWrites(timeout=10.0)
+
+        opened, release = threading.Event(), threading.Event()
+        held = []
+
+        def reader():
+            assert DBMgr("bench").Count("items") == 1
+            held.append(DBMgr("bench")._pooled_write_connection())
+            opened.set()
+            release.wait(10)
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        assert opened.wait(10)
+        db_key = db._db_key
+        others = set(DBMgr._pool_open[db_key])        # the worker's, the reader thread's and this thread's
+        assert held[0] in others and len(others) >= 3
+
+        db_path = Path(db._db_path)
+        assert DBMgr("PRIMARY").Unregister("bench", delete_file=True)
+        assert db_key not in DBMgr._pool_open
+        for conn in others:                           # closed, so the files are no longer held open (Windows)
+            try:
+                conn.execute("SELECT 1")
+                assert False, "pooled connection left open"
+            except sqlite3.ProgrammingError:
+                pass
+        assert not db_path.exists()
+        release.set()
+        thread.join()
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot load DBMgr.py: {_import_error}")
+        print(f"\n{len(tests)} tests skipped.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
@@ -0,0 +1,146 @@
+"""Tests for the cached slalom detour planner (HeroAI/follow/detour_planner.py).
+
+Party detours from synthetic_enemy_layouts are planned on a synthetic
+navmesh.  A cache hit must hand back exactly what the uncached planning code
+builds for the same cluster, followers of one party must share the cluster
+outline, and entries must expire after the TTL or when the navmesh changes.
+
+NOTE: These tests require the game runtime (Py4GW DLLs) because
+Py4GWCoreLib imports depend on PyScanner/PyPathing/etc.
+Run from within an injected Python session or skip offline.
+"""
+
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_navmesh import make_pathing_maps
+from synthetic_enemy_layouts import LayoutConfig, make_party_detours, plan_layout
+
+try:
+    from Py4GWCoreLib.Pathing import NavMesh
+    from HeroAI.follow.detour_planner import DetourPlanner, _cluster_enemy_indices
+    IMPORT_OK = True
+except ImportError as e:
+    IMPORT_OK = False
+    _import_error = e
+
+
+def _navmesh(seed=2):
+    return NavMesh(make_pathing_maps(cols=10, rows=16, hole_ratio=0.1, seed=seed, slant=0.4), 1)
+
+
+def test_cached_plans_match_uncached_planning():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    nav = _navmesh()
+    layouts = make_party_detours(nav, events=15, followers=1, jitter=0.0)
+    planned = 0
+    for layout in layouts:
+        planner = DetourPlanner()
+        expected = plan_layout(layout, nav)
+        assert plan_layout(layout, nav, planner) == expected        # cold cache
+        assert plan_layout(layout, nav, planner) == expected        # every piece from the cache
+        if expected[0]:
+            planned += 1
+            assert planner.stats.boundary_hits >= 1 and planner.stats.path_hits >= 2
+    assert planned > 5
+
+
+def test_party_shares_cluster_outlines():
+    assert IMPORT_OK
+    nav = _navmesh()
+    followers = 6
+    layouts = make_party_detours(nav, events=10, followers=followers)
+    planner = DetourPlanner()
+    for event in range(10):
+        group = layouts[event * followers:(event + 1) * followers]
+        misses_before = planner.stats.boundary_misses
+        for layout in group:
+            plan_layout(layout, nav, planner)
+        # every follower saw the same groups, jittered by a few units
+        clusters = len(_cluster_enemy_indices(tuple(tuple(e) for e in group[0]["enemies"]), LayoutConfig()))
+        assert planner.stats.boundary_misses - misses_before <= clusters + 1
+    assert planner.stats.boundary_hits > planner.stats.boundary_misses * 3
+
+
+def test_ttl_navmesh_change_and_eviction():
+    assert IMPORT_OK
+    nav = _navmesh()
+    layout = next(l for l in make_party_detours(nav, events=10, followers=1, jitter=0.0) if plan_layout(l, nav)[0])
+    planner = DetourPlanner(ttl_ms=1000.0)
+    plan_layout(layout, nav, planner)
+    misses = planner.stats.boundary_misses
+    layout = dict(layout, t_ms=layout["t_ms"] + 999.0)
+    plan_layout(layout, nav, planner)
+    assert planner.stats.boundary_misses == misses
+    layout = dict(layout, t_ms=layout["t_ms"] + 2.0)
+    plan_layout(layout, nav, planner)
+    assert planner.stats.boundary_misses > misses               # expired
+
+    misses = planner.stats.boundary_misses
+    other = _navmesh(seed=2)                                     # same layout, new navmesh object
+    plan_layout(layout, other, planner)
+    assert planner.stats.boundary_misses > misses
+
+    small = DetourPlanner(max_entries=2)
+    for l in make_party_detours(nav, events=10, followers=1):
+        plan_layout(l, nav, small)
+    assert max(small.entry_counts()) <= 2
+
+
+def test_expired_outlines_behind_recent_hits_are_dropped():
+    assert IMPORT_OK
+    planner = DetourPlanner(ttl_ms=1000.0)
+    first = (((0.0, 0.0), 150.0), ((200.0, 0.0), 150.0))
+    second = (((5000.0, 0.0), 150.0), ((5200.0, 0.0), 150.0))
+    first_id = planner.cluster_boundary(first, None, now_ms=0.0)[0]
+    planner.cluster_boundary(second, None, now_ms=500.0)
+    assert planner.cluster_boundary(first, None, now_ms=600.0)[0] == first_id   # hit: now most recently used
+    assert planner.stats.boundary_hits == 1
+    planner.cluster_boundary(second, None, now_ms=1200.0)                       # first expired at 1000
+    assert planner.entry_counts()[0] == 1
+    assert planner.cluster_boundary(first, None, now_ms=1200.0)[0] != first_id
+    planner.clear()
+    assert planner.entry_counts() == (0, 0)
+
+
+def test_layout_recording_round_trip():
+    assert IMPORT_OK
+    nav = _navmesh()
+    layouts = make_party_detours(nav, events=3, followers=2)
+    planner = DetourPlanner()
+    planner.record_layouts(max_layouts=4)
+    for layout in layouts:
+        plan_layout(layout, nav, planner)
+    recorded = planner.recorded_layouts()
+    assert len(recorded) == 4
+    assert recorded == [dict(l, t_ms=float(l["t_ms"])) for l in layouts[-4:]]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "layouts.jsonl")
+        assert planner.save_layouts(path) == 4
+        assert DetourPlanner.load_layouts(path) == recorded
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {_import_error}")
+        print(f"\n{len(tests)} tests skipped — run from within injected Python session.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
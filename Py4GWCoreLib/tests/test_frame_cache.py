@@ -0,0 +1,199 @@
+"""Tests for FrameCache lifetimes, tags, eviction and statistics (py4gwcorelib_src/FrameCache.py).
+
+The PreUpdate callback is driven by hand: every FRAME_CACHE.on_pre_update(now_ms)
+call is one game frame at the given time, so frame and millisecond lifetimes
+can be checked without the game loop.  FRAME_CACHE is the process-wide
+singleton, so entry counts are compared with the counts right after
+_fresh(): other modules (e.g. Map's "map_change" watcher) add their own
+entries every frame.
+
+NOTE: These tests require the game runtime (Py4GW DLLs) because
+Py4GWCoreLib imports depend on PyScanner/PyPathing/etc.
+Run from within an injected Python session or skip offline.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+try:
+    from Py4GWCoreLib.py4gwcorelib_src.FrameCache import FRAME_CACHE, frame_cache
+    IMPORT_OK = True
+except ImportError as e:
+    IMPORT_OK = False
+    _import_error = e
+
+
+class Counter:
+    """A cached function's body: returns how many times it has run."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, *args):
+        self.calls += 1
+        return self.calls
+
+
+def _fresh(now_ms: float = 0.0):
+    """Empty the cache and start a frame; returns the entry counts other modules leave in it."""
+    FRAME_CACHE.clear()
+    FRAME_CACHE.reset_stats()
+    FRAME_CACHE.max_entries = FRAME_CACHE.DEFAULT_MAX_ENTRIES
+    FRAME_CACHE.collect_stats = True
+    FRAME_CACHE.on_pre_update(now_ms)
+    return FRAME_CACHE.entry_counts()
+
+
+def _cached(counter, **options):
+    @frame_cache(category="Test", source_lib=f"counter{id(counter)}", **options)
+    def compute(*args):
+        return counter(*args)
+    return compute
+
+
+def test_default_lifetime_is_one_frame():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    per_frame, timed = _fresh()
+    counter = Counter()
+    compute = _cached(counter)
+    assert compute() == 1 and compute() == 1
+    assert compute(5) == 2 and compute(5) == 2      # separate key
+    FRAME_CACHE.on_pre_update(16)
+    assert compute() == 3
+    stats = FRAME_CACHE.stats()[("Test", f"counter{id(counter)}", "compute")]
+    assert (stats.hits, stats.misses) == (2, 3)
+    assert FRAME_CACHE.entry_counts() == (per_frame + 1, timed)
+
+
+def test_frame_and_ms_lifetimes():
+    assert IMPORT_OK
+    _fresh()
+    by_frames, by_ms, both = Counter(), Counter(), Counter()
+    every_3_frames = _cached(by_frames, frames=3)
+    every_100_ms = _cached(by_ms, frames=None, ms=100)
+    first_of_both = _cached(both, frames=10, ms=50)
+
+    seen = []
+    for frame in range(9):
+        FRAME_CACHE.on_pre_update(frame * 20.0)
+        seen.append((every_3_frames(), every_100_ms(), first_of_both()))
+    assert [s[0] for s in seen] == [1, 1, 1, 2, 2, 2, 3, 3, 3]
+    # computed at 0, 100 and 200 ms
+    assert [s[1] for s in seen] == [1, 1, 1, 1, 1, 2, 2, 2, 2]
+    # 50 ms runs out before 10 frames: computed at 0, 60, 120 ms ...
+    assert [s[2] for s in seen] == [1, 1, 1, 2, 2, 2, 3, 3, 3]
+
+
+def test_tags_and_watchers_invalidate():
+    assert IMPORT_OK
+    _fresh()
+    counter, other = Counter(), Counter()
+    map_info = _cached(counter, frames=None, tags=("map_change",))
+    party_info = _cached(other, frames=None, ms=60_000, tags=("party_change",))
+    assert map_info(1) == 1 and map_info(2) == 2 and party_info() == 1
+    for frame in range(1, 5):
+        FRAME_CACHE.on_pre_update(frame * 16.0)
+    assert map_info(1) == 1 and party_info() == 1
+    tags = FRAME_CACHE.tags()
+    assert (tags["map_change"], tags["party_change"]) == (2, 1)
+
+    assert FRAME_CACHE.invalidate("map_change") == 2
+    assert map_info(1) == 3 and party_info() == 1        # recomputed in the same frame
+    assert FRAME_CACHE.invalidate("unknown") == 0
+
+    current_map, current_district = [7], [1]
+    watcher = FRAME_CACHE.watch("map_change", lambda: current_map[0])
+    district_watcher = FRAME_CACHE.watch("map_change", lambda: current_district[0])
+    try:
+        FRAME_CACHE.on_pre_update(100)                    # first probe only records the value
+        assert map_info(1) == 3
+        FRAME_CACHE.on_pre_update(116)
+        assert map_info(1) == 3
+        current_map[0] = 0                                # loading
+        FRAME_CACHE.on_pre_update(132)
+        assert map_info(1) == 4
+        assert party_info() == 1
+
+        # removing one watcher leaves the tag's other watchers (e.g. Map's) in place
+        assert FRAME_CACHE.unwatch(watcher) and not FRAME_CACHE.unwatch(watcher)
+        current_district[0] = 2
+        FRAME_CACHE.on_pre_update(148)
+        assert map_info(1) == 5
+        current_map[0] = 9
+        FRAME_CACHE.on_pre_update(164)
+        assert map_info(1) == 5
+    finally:
+        FRAME_CACHE.unwatch(watcher)
+        FRAME_CACHE.unwatch(district_watcher)
+    stats = FRAME_CACHE.stats()[("Test", f"counter{id(counter)}", "compute")]
+    assert stats.invalidations == 4
+
+
+def test_timed_store_is_bounded_lru():
+    assert IMPORT_OK
+    _fresh()
+    FRAME_CACHE.reset_cache()        # other modules' entries would be the least recently used
+    FRAME_CACHE.max_entries = 4
+    counter = Counter()
+    compute = _cached(counter, frames=1000, tags=("t",))
+    for key in range(4):
+        compute(key)
+    compute(0)                       # 0 becomes most recently used
+    compute(4)                       # evicts 1, the least recently used
+    assert FRAME_CACHE.entry_counts()[1] == 4
+    calls = counter.calls
+    compute(0), compute(2), compute(3), compute(4)
+    assert counter.calls == calls
+    compute(1)
+    assert counter.calls == calls + 1
+    assert FRAME_CACHE.tags()["t"] == 4
+    stats = FRAME_CACHE.stats()[("Test", f"counter{id(counter)}", "compute")]
+    assert stats.evictions == 2
+    FRAME_CACHE.max_entries = FRAME_CACHE.DEFAULT_MAX_ENTRIES
+
+
+def test_expired_entries_are_swept_and_stats_are_optional():
+    assert IMPORT_OK
+    baseline = _fresh()
+    counter = Counter()
+    compute = _cached(counter, frames=2)
+    for key in range(10):
+        compute(key)
+    for frame in range(FRAME_CACHE.SWEEP_INTERVAL_FRAMES):
+        FRAME_CACHE.on_pre_update(frame)
+    assert FRAME_CACHE.entry_counts() == baseline
+
+    FRAME_CACHE.reset_stats()
+    FRAME_CACHE.collect_stats = False
+    compute(1), compute(1)
+    assert FRAME_CACHE.stats() == {}
+
+    try:
+        frame_cache("Test", "forever", frames=None)
+        assert False, "a cache with no lifetime and no tags must be rejected"
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {_import_error}")
+        print(f"\n{len(tests)} tests skipped — run from within injected Python session.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
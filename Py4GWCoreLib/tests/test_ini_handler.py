@@ -0,0 +1,205 @@
+"""Tests for the in-memory IniHandler model (py4gwcorelib_src/IniHandler.py).
+
+IniHandler only depends on the standard library, so it is loaded by path
+and exercised on files in a temporary directory.  These tests do not need
+the game runtime.
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import importlib.util
+
+_INI_HANDLER_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "py4gwcorelib_src", "IniHandler.py",
+)
+
+
+def _load_ini_handler():
+    spec = importlib.util.spec_from_file_location("_ini_handler_test", _INI_HANDLER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+try:
+    _ini_module = _load_ini_handler()
+    IniHandler = _ini_module.IniHandler
+    IMPORT_OK = True
+except Exception as e:
+    IMPORT_OK = False
+    _import_error = e
+
+
+class _TempDir:
+    def __enter__(self):
+        self.path = tempfile.mkdtemp(prefix="ini_handler_test_")
+        return self.path
+
+    def __exit__(self, *exc):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+class _CountingOs:
+    """Counts os.stat / os.replace calls made by the loaded IniHandler module."""
+
+    def __init__(self):
+        self.stats = 0
+        self.replaces = 0
+        self._stat, self._replace = os.stat, os.replace
+
+    def __enter__(self):
+        def stat(*args, **kwargs):
+            self.stats += 1
+            return self._stat(*args, **kwargs)
+
+        def replace(*args, **kwargs):
+            self.replaces += 1
+            return self._replace(*args, **kwargs)
+
+        _ini_module.os.stat, _ini_module.os.replace = stat, replace
+        return self
+
+    def __exit__(self, *exc):
+        _ini_module.os.stat, _ini_module.os.replace = self._stat, self._replace
+
+
+def _bump_mtime(path, seconds=5):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 1_000_000_000))
+
+
+def test_staged_writes_flush_once_atomically():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    with _TempDir() as d:
+        path = os.path.join(d, "widget.ini")
+        ini = IniHandler(path)
+        with _CountingOs() as counter:
+            for i in range(300):
+                ini.set_key(f"Section{i % 7}", f"key{i}", i)
+            assert ini.has_pending_writes()
+            assert counter.replaces == 0
+            assert ini.flush()
+            assert counter.replaces == 1
+            assert not ini.flush()
+        assert not ini.has_pending_writes()
+        assert sorted(os.listdir(d)) == ["widget.ini"]   # no temp file left behind
+        fresh = IniHandler(path)
+        assert fresh.read_int("Section3", "key290", -1) == 290
+
+
+def test_reads_are_served_from_memory_between_checks():
+    assert IMPORT_OK
+    with _TempDir() as d:
+        path = os.path.join(d, "widget.ini")
+        ini = IniHandler(path, reload_check_ms=60_000)
+        ini.write_key("Window config", "x", 10)
+        with _CountingOs() as counter:
+            for _ in range(1000):
+                assert ini.read_int("Window config", "x", 0) == 10
+            assert counter.stats == 0
+
+
+def test_external_edit_is_picked_up_by_mtime_and_size():
+    assert IMPORT_OK
+    with _TempDir() as d:
+        path = os.path.join(d, "widget.ini")
+        ini = IniHandler(path, reload_check_ms=0)
+        ini.write_key("Main", "mode", "a")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("[Main]\nmode = external\n")
+        _bump_mtime(path)
+        assert ini.read_key("Main", "mode") == "external"
+
+        gated = IniHandler(path, reload_check_ms=60_000)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("[Main]\nmode = later\n")
+        _bump_mtime(path, 10)
+        assert gated.read_key("Main", "mode") == "external"     # not re-checked yet
+        assert gated.reload(force=True).get("Main", "mode") == "later"
+
+
+def test_pending_writes_survive_external_reload_and_flush_merges():
+    assert IMPORT_OK
+    with _TempDir() as d:
+        path = os.path.join(d, "widget.ini")
+        ini = IniHandler(path, reload_check_ms=60_000)
+        ini.write_key("Main", "a", 1)
+        ini.set_key("Main", "b", 2)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("[Main]\na = 1\nexternal = yes\n")
+        _bump_mtime(path)
+        assert ini.flush()
+        fresh = IniHandler(path)
+        assert fresh.read_key("Main", "external") == "yes"
+        assert fresh.read_int("Main", "b") == 2
+
+
+def test_unchanged_value_is_not_rewritten():
+    assert IMPORT_OK
+    with _TempDir() as d:
+        ini = IniHandler(os.path.join(d, "widget.ini"))
+        ini.write_key("Main", "a", 1)
+        with _CountingOs() as counter:
+            ini.write_key("Main", "a", 1)
+            assert counter.replaces == 0
+
+
+def test_write_of_stale_equal_value_is_not_dropped():
+    assert IMPORT_OK
+    with _TempDir() as d:
+        path = os.path.join(d, "widget.ini")
+        ini = IniHandler(path, reload_check_ms=60_000)
+        ini.write_key("s", "k", "A")
+        with open(path, "w", encoding="utf-8") as f:       # another process rewrites the key
+            f.write("[s]\nk = B\n")
+        _bump_mtime(path)
+        assert ini.read_key("s", "k") == "A"                  # not re-checked yet
+        ini.write_key("s", "k", "A")
+        assert IniHandler(path).read_key("s", "k") == "A"
+        assert not ini.has_pending_writes()
+
+        with open(path, "w", encoding="utf-8") as f:         # key removed externally
+            f.write("[s]\nother = 1\n")
+        _bump_mtime(path, 10)
+        ini.set_key("s", "k", "A")
+        assert ini.flush()
+        fresh = IniHandler(path)
+        assert fresh.read_key("s", "k") == "A" and fresh.read_key("s", "other") == "1"
+
+
+def test_corrupted_file_is_recovered():
+    assert IMPORT_OK
+    with _TempDir() as d:
+        path = os.path.join(d, "widget.ini")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("no section header\n")
+        ini = IniHandler(path)
+        assert ini.list_sections() == []
+        assert any(name.startswith("widget.ini.corrupt_") for name in os.listdir(d))
+        ini.write_key("Main", "a", 1)
+        assert IniHandler(path).read_int("Main", "a") == 1
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot load IniHandler.py: {_import_error}")
+        print(f"\n{len(tests)} tests skipped.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
@@ -0,0 +1,115 @@
+"""Tests for InventoryCache queries served from the RawItemCache snapshot.
+
+RawItemCache is given a fake bag provider (the bags from
+test_inventory_snapshot.make_bags), refreshed, and every InventoryCache
+query is compared with a brute-force scan of the same bags, including the
+long-standing quirks (GetModelCountInStorage drops Storage_5 when the
+anniversary panel is off, equipped items count at least 1 each).
+
+NOTE: These tests require the game runtime (Py4GW DLLs) because
+Py4GWCoreLib imports depend on PyScanner/PyPathing/etc.
+Run from within an injected Python session or skip offline.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from test_inventory_snapshot import FakeBag, FakeItem, make_bags
+
+try:
+    from Py4GWCoreLib.GlobalCache.ItemCache import RawItemCache, ItemArray
+    from Py4GWCoreLib.GlobalCache.InventoryCache import InventoryCache
+    IMPORT_OK = True
+except ImportError as e:
+    IMPORT_OK = False
+    _import_error = e
+
+INVENTORY = (1, 2, 3, 4)
+
+
+def _cache(bags):
+    def provider(bag_id):
+        if bag_id not in bags:
+            raise ValueError(bag_id)
+        return bags[bag_id]
+
+    raw = RawItemCache(bag_provider=provider)
+    raw.reset()
+    raw.refresh()
+    return raw, InventoryCache(None, raw, None)
+
+
+def _scan(bags, bag_ids):
+    return [item for b in bag_ids if b in bags for item in bags[b].GetItems()]
+
+
+def test_queries_match_a_full_scan():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    bags = make_bags(seed=21)
+    _, inventory = _cache(bags)
+    storage = range(8, 22)
+    for model_id in range(-1, 42):
+        inv = [i for i in _scan(bags, INVENTORY) if i.model_id == model_id]
+        sto = [i for i in _scan(bags, storage) if i.model_id == model_id]
+        sto_no5 = [i for i in _scan(bags, [b for b in storage if b != 12]) if i.model_id == model_id]
+        equipped = [i for i in _scan(bags, [22]) if i.model_id == model_id]
+        positive = model_id > 0
+        assert inventory.GetModelCount(model_id) == (sum(i.quantity for i in inv) if positive else 0)
+        assert inventory.GetModelCountInStorage(model_id) == (sum(i.quantity for i in sto) if positive else 0)
+        assert inventory.GetModelCountInStorage(model_id, False) == (sum(i.quantity for i in sto_no5) if positive else 0)
+        assert inventory.GetModelCountInEquipped(model_id) == (sum(i.quantity or 1 for i in equipped) if positive else 0)
+        assert inventory.GetFirstModelID(model_id) == (inv[0].item_id if inv else 0)
+        assert inventory.GetAllItemIdsByModelID(model_id) == [i.item_id for i in inv]
+        assert inventory.GetfirstModelIDInStorage(model_id) == (sto[0].item_id if sto else 0)
+
+    items = _scan(bags, INVENTORY)
+    assert inventory.GetAllInventoryItemIds() == [i.item_id for i in items]
+    assert inventory.GetInventorySpace() == (len(items), sum(bags[b].GetSize() for b in INVENTORY))
+    assert inventory.GetFreeSlotCount() == sum(bags[b].GetSize() for b in INVENTORY) - len(items)
+    assert inventory.GetStorageSpace(False) == (len(_scan(bags, range(8, 21))), 13 * 25)
+    for item in items[:10]:
+        assert inventory.GetItemCount(item.item_id) == item.quantity
+    storage_item = _scan(bags, storage)[0]
+    assert inventory.GetItemCount(storage_item.item_id) == 0
+    assert inventory.FindItemBagAndSlot(storage_item.item_id) == (None, None)
+    assert len(inventory.GetZeroFilledStorageArray()) == 14 * 25
+
+
+def test_refresh_records_a_diff_and_items_resolve_by_id():
+    assert IMPORT_OK
+    bags = {1: FakeBag(1, 20, [FakeItem(1, 10, 5, 0), FakeItem(2, 11, 1, 3)])}
+    raw, inventory = _cache(bags)
+    assert raw.get_item_by_id(2) is bags[1].items[1]
+    assert ItemArray().GetItemArray([]) == []
+
+    bags[1].items = [FakeItem(1, 10, 6, 0), FakeItem(3, 11, 1, 4)]
+    raw.refresh()
+    diff = inventory.GetInventoryDiff()
+    assert diff.added == (3,) and diff.removed == (2,) and diff.changed == (1,)
+    assert inventory.FindItemBagAndSlot(3) == (1, 4)
+    assert inventory.GetModelCount(10) == 6
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {_import_error}")
+        print(f"\n{len(tests)} tests skipped — run from within injected Python session.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
@@ -0,0 +1,186 @@
+"""Tests for the indexed inventory snapshot (GlobalCache/InventorySnapshot.py).
+
+InventorySnapshot only depends on the standard library, so it is loaded by
+path and built from fake bags exposing the PyInventory.Bag accessors it reads
+(GetItems, GetSize, GetItemCount).  Every lookup is checked against a
+brute-force scan of the same bags.  These tests do not need the game runtime.
+"""
+
+import sys
+import os
+import random
+import importlib.util
+
+_SNAPSHOT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "GlobalCache", "InventorySnapshot.py",
+)
+
+
+def _load_snapshot_module():
+    spec = importlib.util.spec_from_file_location("_inventory_snapshot_test", _SNAPSHOT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+try:
+    _snapshot_module = _load_snapshot_module()
+    InventorySnapshot = _snapshot_module.InventorySnapshot
+    INVENTORY_BAGS = _snapshot_module.INVENTORY_BAGS
+    STORAGE_BAGS = _snapshot_module.STORAGE_BAGS
+    EQUIPPED_BAGS = _snapshot_module.EQUIPPED_BAGS
+    IMPORT_OK = True
+except Exception as e:
+    IMPORT_OK = False
+    _import_error = e
+
+
+class FakeItem:
+    def __init__(self, item_id, model_id, quantity, slot):
+        self.item_id = item_id
+        self.model_id = model_id
+        self.quantity = quantity
+        self.slot = slot
+
+
+class FakeBag:
+    def __init__(self, bag_id, size, items=()):
+        self.id = bag_id
+        self.size = size
+        self.items = list(items)
+
+    def GetItems(self):
+        return list(self.items)
+
+    def GetSize(self):
+        return self.size
+
+    def GetItemCount(self):
+        return len(self.items)
+
+
+def make_bags(seed=3, fill=0.6):
+    """Random inventory over bags 1-4, storage 8-21 and equipped 22."""
+    rng = random.Random(seed)
+    bags = {}
+    next_id = 1000
+    for bag_id, size in [(1, 20), (2, 5), (3, 10), (4, 10)] + [(b, 25) for b in range(8, 22)] + [(22, 9)]:
+        items = []
+        for slot in range(size):
+            if rng.random() < fill:
+                items.append(FakeItem(next_id, rng.randint(1, 40), rng.randint(1, 250), slot))
+                next_id += 1
+        bags[bag_id] = FakeBag(bag_id, size, items)
+    return bags
+
+
+def _scan(bags, bag_ids):
+    for bag_id in bag_ids:
+        if bag_id in bags:
+            yield from ((bag_id, item) for item in bags[bag_id].GetItems())
+
+
+def test_lookups_match_a_full_scan():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    bags = make_bags()
+    snapshot = InventorySnapshot.build(bags, generation=1)
+    for group in (INVENTORY_BAGS, STORAGE_BAGS, EQUIPPED_BAGS):
+        for model_id in range(0, 42):
+            matching = [item for _, item in _scan(bags, group) if item.model_id == model_id]
+            assert snapshot.model_quantity(model_id, group) == sum(item.quantity for item in matching)
+            assert list(snapshot.item_ids_by_model(model_id, group)) == [item.item_id for item in matching]
+            assert snapshot.first_item_by_model(model_id, group) == (matching[0].item_id if matching else 0)
+        assert list(snapshot.item_ids(group)) == [item.item_id for _, item in _scan(bags, group)]
+    for bag_id, item in _scan(bags, bags):
+        assert snapshot.location(item.item_id) == (bag_id, item.slot)
+        assert snapshot.get(item.item_id).item is item
+    assert snapshot.location(1) == (None, None)
+
+
+def test_space_free_slots_and_zero_filled_storage():
+    assert IMPORT_OK
+    bags = make_bags(seed=8)
+    snapshot = InventorySnapshot.build(bags)
+    used = sum(bags[b].GetItemCount() for b in INVENTORY_BAGS)
+    size = sum(bags[b].GetSize() for b in INVENTORY_BAGS)
+    assert snapshot.space(INVENTORY_BAGS) == (used, size)
+    assert snapshot.free_slots(INVENTORY_BAGS) == size - used
+
+    zero_filled = snapshot.zero_filled(range(8, 23 + 2))   # missing bags are skipped
+    expected = []
+    for bag_id in range(8, 23):
+        slots = [0] * bags[bag_id].GetSize()
+        for item in bags[bag_id].GetItems():
+            slots[item.slot] = item.item_id
+        expected.extend(slots)
+    assert zero_filled == expected
+
+
+def test_snapshot_is_immutable_and_ignores_later_bag_changes():
+    assert IMPORT_OK
+    bags = make_bags()
+    snapshot = InventorySnapshot.build(bags)
+    count = len(snapshot)
+    bags[1].items.append(FakeItem(99, 5, 1, 19))
+    assert len(snapshot) == count and 99 not in snapshot
+    for mapping in (snapshot.items, snapshot.bag_items, snapshot.bag_models[1]):
+        try:
+            mapping[1] = None
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("snapshot mapping is writable")
+
+
+def test_diff_reports_added_removed_and_changed():
+    assert IMPORT_OK
+    bags = {1: FakeBag(1, 5, [FakeItem(1, 10, 5, 0), FakeItem(2, 11, 1, 1), FakeItem(3, 12, 1, 2)])}
+    first = InventorySnapshot.build(bags, 1)
+    assert first.diff(None).added == (1, 2, 3)
+    assert first.diff(InventorySnapshot.build(bags, 2)).empty
+
+    bags[1].items = [FakeItem(1, 10, 4, 0), FakeItem(3, 12, 1, 4), FakeItem(7, 10, 1, 1)]
+    second = InventorySnapshot.build(bags, 2)
+    diff = second.diff(first)
+    assert diff.added == (7,)
+    assert diff.removed == (2,)
+    assert set(diff.changed) == {1, 3}      # restacked, moved
+
+
+def test_unreadable_bags_and_empty_item_ids_are_skipped():
+    assert IMPORT_OK
+
+    class BrokenBag(FakeBag):
+        def GetItems(self):
+            raise RuntimeError("bag not loaded")
+
+    bags = {1: FakeBag(1, 3, [FakeItem(0, 1, 1, 0), FakeItem(5, 1, 2, 1)]), 2: BrokenBag(2, 5)}
+    snapshot = InventorySnapshot.build(bags)
+    assert list(snapshot.item_ids()) == [5]
+    assert snapshot.space() == (2, 3)
+    assert snapshot.model_quantity(1) == 2
+    assert InventorySnapshot.empty().free_slots() == 0
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot load InventorySnapshot.py: {_import_error}")
+        print(f"\n{len(tests)} tests skipped.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
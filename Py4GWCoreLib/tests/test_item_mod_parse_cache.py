@@ -0,0 +1,145 @@
+"""Tests for the shared item-modifier parse cache (item_mods_src/item_modifier_parser.py).
+
+Loot-like modifier sets from synthetic_item_mods.py are parsed through the
+cache and compared against a fresh, uncached parse of the same modifiers.
+
+NOTE: These tests require the game runtime (Py4GW DLLs) because
+Py4GWCoreLib imports depend on PyScanner/PyPathing/etc.
+Run from within an injected Python session or skip offline.
+"""
+
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_item_mods import FakeItemModifier, loot_fixture, weapon_modifiers, DAMAGE, FURIOUS, UPGRADE
+
+try:
+    from Py4GWCoreLib.enums_src.Item_enums import Rarity
+    from Py4GWCoreLib.item_mods_src import item_modifier_parser
+    from Py4GWCoreLib.item_mods_src.item_modifier_parser import ItemModifierParser
+    from Py4GWCoreLib.item_mods_src.item_mod import ItemMod
+    from Py4GWCoreLib.item_mods_src.upgrade_parser import get_property_factory
+    from Py4GWCoreLib.item_mods_src.upgrades import _INHERENT_UPGRADES, _INHERENT_UPGRADES_BY_SIZE
+    IMPORT_OK = True
+except ImportError as e:
+    IMPORT_OK = False
+    _import_error = e
+
+
+def _summary(properties):
+    out = []
+    for prop in properties:
+        upgrade = getattr(prop, "upgrade", None)
+        out.append((
+            type(prop).__name__,
+            prop.modifier.raw_identifier,
+            prop.modifier.arg,
+            type(upgrade).__name__ if upgrade is not None else None,
+            upgrade._comparison_data() if upgrade is not None else None,
+        ))
+    return out
+
+
+def _uncached(runtime_modifiers, rarity):
+    modifiers = item_modifier_parser._decode(runtime_modifiers)
+    return item_modifier_parser._build_properties(modifiers, Rarity(rarity))
+
+
+def test_cached_parse_matches_fresh_parse():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    ItemModifierParser.clear_cache()
+    items = loot_fixture(1500)
+    for runtime_modifiers, rarity in items:
+        parsed = ItemModifierParser.parse(runtime_modifiers, rarity)
+        assert _summary(parsed.properties) == _summary(_uncached(runtime_modifiers, rarity))
+    info = ItemModifierParser.cache_info()
+    assert info["hits"] > 0 and info["hits"] + info["misses"] == len(items)
+
+
+def test_identical_sets_share_one_result():
+    assert IMPORT_OK
+    ItemModifierParser.clear_cache()
+    first = [FakeItemModifier(DAMAGE, 22, 15), FakeItemModifier(UPGRADE, upgrade_id=0x009B), FakeItemModifier(FURIOUS, arg2=10)]
+    second = [FakeItemModifier(DAMAGE, 22, 15), FakeItemModifier(UPGRADE, upgrade_id=0x009B), FakeItemModifier(FURIOUS, arg2=10)]
+    a = ItemModifierParser.parse(first, Rarity.Gold)
+    assert ItemModifierParser.parse(second, Rarity.Gold) is a
+    assert isinstance(a.properties, tuple) and isinstance(a.modifiers, tuple)
+    # Rarity and args are part of the key.
+    assert ItemModifierParser.parse(second, Rarity.Blue) is not a
+    second[2].arg2 = 9
+    assert ItemModifierParser.parse(second, Rarity.Gold) is not a
+
+
+def test_parser_instances_get_their_own_lists():
+    assert IMPORT_OK
+    ItemModifierParser.clear_cache()
+    mods = weapon_modifiers("Sword", 3, random.Random(1))
+    parser = ItemModifierParser(mods, Rarity.Gold)
+    parser.get_properties().clear()
+    assert ItemModifierParser(mods, Rarity.Gold).get_properties()
+
+
+def test_upgrades_are_extracted_once_per_set():
+    assert IMPORT_OK
+    ItemModifierParser.clear_cache()
+    mods = [FakeItemModifier(DAMAGE, 22, 15), FakeItemModifier(UPGRADE, upgrade_id=0x009B), FakeItemModifier(FURIOUS, arg2=10)]
+    prefix, suffix, inscription, inherent = ItemMod.get_item_upgrades_from_modifiers(mods, Rarity.Gold)
+    again = ItemMod.get_item_upgrades_from_modifiers(mods, Rarity.Gold)
+    assert prefix is not None and again[0] is prefix
+    assert suffix is None and inscription is None
+    parsed = ItemModifierParser.parse(mods, Rarity.Gold)
+    assert parsed.upgrades is not None
+
+
+def test_batch_parse_matches_single_parse():
+    assert IMPORT_OK
+    ItemModifierParser.clear_cache()
+    items = loot_fixture(400, seed=3)
+    batch = ItemModifierParser.parse_many(items)
+    assert len(batch) == len(items)
+    for parsed, (runtime_modifiers, rarity) in zip(batch, items):
+        assert ItemModifierParser.parse(runtime_modifiers, rarity) is parsed
+
+
+def test_cache_is_bounded():
+    assert IMPORT_OK
+    ItemModifierParser.clear_cache()
+    limit = item_modifier_parser._PARSE_CACHE_LIMIT
+    for i in range(limit + 50):
+        ItemModifierParser.parse([FakeItemModifier(DAMAGE, i % 255, i // 255)], Rarity.White)
+    assert ItemModifierParser.cache_info()["size"] == limit
+    ItemModifierParser.clear_cache()
+
+
+def test_tables_are_built_once():
+    assert IMPORT_OK
+    assert get_property_factory() is get_property_factory()
+    assert sorted(_INHERENT_UPGRADES_BY_SIZE, key=lambda u: u.__name__) == sorted(_INHERENT_UPGRADES, key=lambda u: u.__name__)
+    sizes = [len(u.upgrade_info) for u in _INHERENT_UPGRADES_BY_SIZE]
+    assert sizes == sorted(sizes, reverse=True)
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {_import_error}")
+        print(f"\n{len(tests)} tests skipped — run from within injected Python session.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
@@ -0,0 +1,130 @@
+"""Unit tests for the binary NavMesh cache (Pathing.NavMesh.save_to_file / load_from_file).
+
+NOTE: These tests require the game runtime (Py4GW DLLs) because
+Py4GWCoreLib imports depend on PyScanner/PyPathing/etc.
+Run from within an injected Python session or skip offline.
+"""
+
+import sys
+import os
+import pickle
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_navmesh import make_pathing_maps, random_points
+
+try:
+    from Py4GWCoreLib.Pathing import NavMesh
+    from Py4GWCoreLib.pathing_src.navmesh_cache import NAVMESH_FORMAT_VERSION, _HEADER
+    IMPORT_OK = True
+except ImportError as e:
+    IMPORT_OK = False
+    _import_error = e
+
+
+def _roundtrip(pathing_maps, map_id=7):
+    nav = NavMesh(pathing_maps, map_id)
+    folder = tempfile.mkdtemp()
+    nav.save_to_file(folder)
+    return nav, folder, NavMesh.load_from_file(pathing_maps, map_id, folder)
+
+
+def test_roundtrip_preserves_graph_and_layers():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    maps = make_pathing_maps(cols=12, rows=10, layers=3, hole_ratio=0.1)
+    nav, _, loaded = _roundtrip(maps)
+    assert loaded is not None
+    assert loaded.portal_graph == nav.portal_graph
+    assert loaded.portal_costs == nav.portal_costs
+    assert loaded.trap_id_to_layer == nav.trap_id_to_layer
+    for t_id in nav.trapezoids:
+        assert loaded.get_position(t_id) == nav.get_position(t_id)
+
+
+def test_roundtrip_preserves_bsp_queries():
+    assert IMPORT_OK
+    maps = make_pathing_maps(cols=15, rows=15, layers=2, hole_ratio=0.15)
+    nav, _, loaded = _roundtrip(maps)
+    assert loaded is not None
+    for x, y in random_points(maps, 2000):
+        assert loaded.find_trapezoid_id_by_coord((x, y)) == nav.find_trapezoid_id_by_coord((x, y))
+        assert loaded.contains(x, y, 100) == nav.contains(x, y, 100)
+
+
+def test_missing_cache_returns_none():
+    assert IMPORT_OK
+    maps = make_pathing_maps(cols=4, rows=4)
+    assert NavMesh.load_from_file(maps, 1, tempfile.mkdtemp()) is None
+
+
+def test_changed_geometry_is_rejected():
+    assert IMPORT_OK
+    maps = make_pathing_maps(cols=6, rows=6)
+    _, folder, _ = _roundtrip(maps, map_id=3)
+    maps[0].trapezoids[5].XTR += 10.0
+    assert NavMesh.load_from_file(maps, 3, folder) is None
+
+
+def test_other_map_id_is_rejected():
+    assert IMPORT_OK
+    maps = make_pathing_maps(cols=6, rows=6)
+    _, folder, _ = _roundtrip(maps, map_id=3)
+    os.replace(NavMesh.cache_filepath(folder, 3), NavMesh.cache_filepath(folder, 4))
+    assert NavMesh.load_from_file(maps, 4, folder) is None
+
+
+def test_other_format_version_is_rejected():
+    assert IMPORT_OK
+    maps = make_pathing_maps(cols=6, rows=6)
+    _, folder, _ = _roundtrip(maps, map_id=3)
+    path = NavMesh.cache_filepath(folder, 3)
+    with open(path, "r+b") as f:
+        f.seek(4)
+        f.write((NAVMESH_FORMAT_VERSION + 1).to_bytes(2, "little"))
+    assert NavMesh.load_from_file(maps, 3, folder) is None
+
+
+def test_corrupted_payload_is_rejected():
+    assert IMPORT_OK
+    maps = make_pathing_maps(cols=6, rows=6)
+    _, folder, _ = _roundtrip(maps, map_id=3)
+    path = NavMesh.cache_filepath(folder, 3)
+    with open(path, "r+b") as f:
+        f.seek(_HEADER.size + 3)
+        byte = f.read(1)
+        f.seek(_HEADER.size + 3)
+        f.write(bytes([byte[0] ^ 0xFF]))
+    assert NavMesh.load_from_file(maps, 3, folder) is None
+
+
+def test_legacy_pickle_cache_is_rejected():
+    assert IMPORT_OK
+    maps = make_pathing_maps(cols=4, rows=4)
+    folder = tempfile.mkdtemp()
+    with open(NavMesh.cache_filepath(folder, 9), "wb") as f:
+        pickle.dump({"map_id": 9, "portal_graph": {}}, f)
+    assert NavMesh.load_from_file(maps, 9, folder) is None
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {_import_error}")
+        print(f"\n{len(tests)} tests skipped — run from within injected Python session.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
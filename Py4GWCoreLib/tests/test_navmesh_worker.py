@@ -0,0 +1,130 @@
+"""Tests for background NavMesh builds (pathing_src/navmesh_build.py, navmesh_worker.py).
+
+A build from a plain-data snapshot must serialize to exactly the bytes of
+the in-process NavMesh for the same maps, the worker process must return
+it without importing Py4GWCoreLib, and jobs must be cancellable in both
+backends.
+
+NOTE: These tests require the game runtime (Py4GW DLLs) because
+Py4GWCoreLib imports depend on PyScanner/PyPathing/etc.
+Run from within an injected Python session or skip offline.
+"""
+
+import sys
+import os
+import pickle
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_navmesh import make_pathing_maps, random_points
+
+try:
+    from Py4GWCoreLib.Pathing import NavMesh
+    from Py4GWCoreLib.pathing_src.navmesh_build import build_navmesh_bytes, snapshot_pathing_maps
+    from Py4GWCoreLib.pathing_src.navmesh_cache import navmesh_cache_to_bytes
+    from Py4GWCoreLib.pathing_src.navmesh_worker import BUILD_SCRIPT, NavMeshBuildJob, find_python_executable
+    IMPORT_OK = True
+except ImportError as e:
+    IMPORT_OK = False
+    _import_error = e
+
+
+def _maps(cols=10, rows=12, layers=3):
+    return make_pathing_maps(cols=cols, rows=rows, layers=layers, hole_ratio=0.15, seed=6, slant=0.5)
+
+
+def _assert_same_mesh(built, nav, maps):
+    assert built.portal_graph == nav.portal_graph
+    assert built.portal_costs == nav.portal_costs
+    assert built.trap_id_to_layer == nav.trap_id_to_layer
+    for x, y in random_points(maps, 500):
+        assert built.find_trapezoid_id_by_coord((x, y)) == nav.find_trapezoid_id_by_coord((x, y))
+
+
+def test_snapshot_build_matches_in_process_navmesh():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    for maps in (_maps(), make_pathing_maps(cols=6, rows=6), []):
+        snapshot = snapshot_pathing_maps(maps, 42)
+        assert pickle.loads(pickle.dumps(snapshot)) == snapshot
+        blob = build_navmesh_bytes(snapshot)
+        assert blob == navmesh_cache_to_bytes(NavMesh(maps, 42).to_cache_data())
+
+    maps = _maps()
+    built = NavMesh.from_cache_bytes(maps, 42, build_navmesh_bytes(snapshot_pathing_maps(maps, 42)))
+    _assert_same_mesh(built, NavMesh(maps, 42), maps)
+
+
+def test_process_job_builds_without_py4gwcorelib():
+    assert IMPORT_OK
+    if find_python_executable() is None:
+        return                                  # no interpreter to run the worker on this machine
+    maps = _maps()
+    job = NavMeshBuildJob(snapshot_pathing_maps(maps, 7))
+    assert job.backend == "process"
+    assert job.wait(60) and job.error == ""
+    built = NavMesh.from_cache_bytes(maps, 7, job.result())
+    _assert_same_mesh(built, NavMesh(maps, 7), maps)
+
+    # the worker script only imports the standard library (navmesh_cache is loaded by path)
+    proc = subprocess.run([find_python_executable(), "-I", "-X", "importtime", BUILD_SCRIPT],
+                          input=pickle.dumps(snapshot_pathing_maps(make_pathing_maps(cols=3, rows=3), 1)),
+                          capture_output=True, timeout=60)
+    assert proc.returncode == 0 and proc.stdout
+    imported = proc.stderr.decode()
+    assert "zlib" in imported and "Py4GW" not in imported and "PyPathing" not in imported
+
+
+def test_thread_backend_and_cancellation():
+    assert IMPORT_OK
+    maps = _maps(cols=6, rows=8, layers=2)
+    job = NavMeshBuildJob(snapshot_pathing_maps(maps, 3), use_process=False)
+    assert job.backend == "thread" and job.wait(60)
+    assert job.result() == navmesh_cache_to_bytes(NavMesh(maps, 3).to_cache_data())
+
+    big = snapshot_pathing_maps(make_pathing_maps(cols=60, rows=80, layers=3, slant=0.5), 9)
+    for use_process in (False, True):
+        for delay in (0.0, 0.3):                    # before the worker starts, and mid-build
+            job = NavMeshBuildJob(big, use_process=use_process)
+            job.wait(delay)
+            assert not job.done()
+            job.cancel()
+            assert job.wait(10), f"cancelled {job.backend} build did not stop"
+            assert job.cancelled and job.result() is None and job.error == "cancelled"
+
+
+def test_mismatched_or_corrupt_result_is_rejected():
+    assert IMPORT_OK
+    maps = _maps(cols=5, rows=5, layers=1)
+    blob = build_navmesh_bytes(snapshot_pathing_maps(maps, 5))
+    assert NavMesh.from_cache_bytes(maps, 5, blob) is not None
+    assert NavMesh.from_cache_bytes(maps, 6, blob) is None                        # other map id
+    assert NavMesh.from_cache_bytes(_maps(cols=5, rows=6, layers=1), 5, blob) is None   # other geometry
+    assert NavMesh.from_cache_bytes(maps, 5, blob[:-8]) is None                   # truncated
+    assert NavMesh.from_cache_bytes(maps, 5, blob[:-1] + bytes([blob[-1] ^ 1])) is None
+    # without the geometry checksum (AutoPathing's own builds) the trapezoid count still has to match
+    assert NavMesh.from_cache_bytes(maps, 5, blob, verify_geometry=False) is not None
+    assert NavMesh.from_cache_bytes(_maps(cols=5, rows=6, layers=1), 5, blob, verify_geometry=False) is None
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {_import_error}")
+        print(f"\n{len(tests)} tests skipped — run from within injected Python session.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
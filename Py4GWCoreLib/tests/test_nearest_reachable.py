@@ -0,0 +1,167 @@
+"""Tests for the closest-point projection (NavMesh.find_nearest_reachable / _many).
+
+Off-mesh points must land on the closest point where contains(margin)
+holds.  The grid-index answer is checked against a linear scan over every
+trapezoid's inset region, against a dense sample of walkable points near the
+query (nothing walkable may be closer), and against contains() itself.
+
+NOTE: These tests require the game runtime (Py4GW DLLs) because
+Py4GWCoreLib imports depend on PyScanner/PyPathing/etc.
+Run from within an injected Python session or skip offline.
+"""
+
+import sys
+import os
+import math
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_navmesh import SyntheticPathingMap, SyntheticTrapezoid, make_pathing_maps, random_points
+
+try:
+    from Py4GWCoreLib.Pathing import NavMesh, _closest_point_on_quad, _inset_trapezoid
+    IMPORT_OK = True
+except ImportError as e:
+    IMPORT_OK = False
+    _import_error = e
+
+
+def brute_force_distance(nav, point, margin):
+    """Distance from point to the closest inset region, scanning every trapezoid."""
+    best = math.inf
+    for t in nav.trapezoids.values():
+        quad = _inset_trapezoid(t, margin)
+        if quad is not None:
+            px, py = _closest_point_on_quad(point[0], point[1], quad)
+            best = min(best, math.hypot(px - point[0], py - point[1]))
+    return best
+
+
+def _check_projection(nav, maps, margin, count=300):
+    off_mesh = 0
+    points = random_points(maps, count, pad=1500.0, seed=11)
+    results = nav.find_nearest_reachable_many(points, margin)
+    assert len(results) == len(points)
+    for point, result in zip(points, results):
+        assert result is not None
+        assert nav.contains(result[0], result[1], margin), f"{point} projected to {result}, off the mesh at margin {margin}"
+        if nav.contains(point[0], point[1], margin):
+            assert result == point
+            continue
+        off_mesh += 1
+        dist = math.dist(point, result)
+        assert abs(dist - brute_force_distance(nav, point, margin)) < 0.05
+        assert result == nav.find_nearest_reachable(point, margin)
+    assert off_mesh > count // 5
+    return off_mesh
+
+
+def test_matches_linear_scan_on_rectangular_cells():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    maps = make_pathing_maps(cols=14, rows=20, hole_ratio=0.2, seed=4)
+    nav = NavMesh(maps, 1)
+    for margin in (0.0, 20.0, 150.0):
+        _check_projection(nav, maps, margin)
+
+
+def test_matches_linear_scan_on_slanted_cells_and_layers():
+    assert IMPORT_OK
+    maps = make_pathing_maps(cols=8, rows=20, layers=2, hole_ratio=0.15, seed=9, slant=0.8)
+    nav = NavMesh(maps, 1)
+    for margin in (0.0, 60.0):
+        _check_projection(nav, maps, margin)
+
+
+def test_nothing_walkable_is_closer():
+    assert IMPORT_OK
+    maps = make_pathing_maps(cols=6, rows=10, hole_ratio=0.25, seed=5, slant=0.6)
+    nav = NavMesh(maps, 1)
+    margin = 40.0
+    checked = 0
+    for point in random_points(maps, 60, pad=800.0, seed=21):
+        if nav.contains(point[0], point[1], margin):
+            continue
+        result = nav.find_nearest_reachable(point, margin)
+        dist = math.dist(point, result)
+        # every walkable sample on a 10-unit grid within dist + 20 of the point
+        step = 10.0
+        reach = dist + 20.0
+        n = int(reach / step)
+        for i in range(-n, n + 1):
+            for j in range(-n, n + 1):
+                x, y = point[0] + i * step, point[1] + j * step
+                if nav.contains(x, y, margin):
+                    assert math.hypot(x - point[0], y - point[1]) >= dist - 0.05
+        checked += 1
+    assert checked > 10
+
+
+def test_narrow_corridor_and_margin_fallback():
+    assert IMPORT_OK
+    # a 1000-wide room joined to a 60-wide corridor
+    room = SyntheticTrapezoid(1, 0.0, 1000.0, 0.0, 1000.0)
+    corridor = SyntheticTrapezoid(2, 470.0, 530.0, 1000.0, 3000.0)
+    room.neighbor_ids.append(2)
+    corridor.neighbor_ids.append(1)
+    nav = NavMesh([SyntheticPathingMap(0, [room, corridor])], 1)
+
+    # beside the corridor: projected onto its wall, not the room centroid
+    p = nav.find_nearest_reachable((600.0, 2000.0), margin=0.0)
+    assert abs(p[0] - 530.0) < 0.05 and abs(p[1] - 2000.0) < 1e-6
+    p = nav.find_nearest_reachable((600.0, 2000.0), margin=20.0)
+    assert abs(p[0] - 510.0) < 0.05 and abs(p[1] - 2000.0) < 1e-6
+    # the corridor is too narrow for 50: the closest point with margin is on the room's top
+    # (the margin insets the sides along X only, like contains)
+    p = nav.find_nearest_reachable((600.0, 2000.0), margin=50.0)
+    assert abs(p[0] - 600.0) < 0.05 and abs(p[1] - 1000.0) < 0.05 and nav.contains(p[0], p[1], 50.0)
+    # too narrow everywhere: falls back to the closest walkable point
+    p = nav.find_nearest_reachable((2000.0, 500.0), margin=600.0)
+    assert abs(p[0] - 1000.0) < 0.05 and abs(p[1] - 500.0) < 1e-6
+    # on the mesh: unchanged
+    assert nav.find_nearest_reachable((500.0, 500.0)) == (500.0, 500.0)
+    assert NavMesh([], 1).find_nearest_reachable((0.0, 0.0)) is None
+
+
+def test_slanted_corner_projection():
+    assert IMPORT_OK
+    # narrows from [0, 1000] at y=0 to [400, 600] at y=1000
+    t = SyntheticTrapezoid(1, 0.0, 1000.0, 0.0, 1000.0)
+    t.XTL, t.XTR = 400.0, 600.0
+    nav = NavMesh([SyntheticPathingMap(0, [t])], 1)
+    # perpendicular onto the left side (direction (-1000, 400) normalised)
+    point = (0.0, 500.0)
+    p = nav.find_nearest_reachable(point, margin=0.0)
+    nx, ny = 1000.0 / math.hypot(1000.0, 400.0), -400.0 / math.hypot(1000.0, 400.0)
+    expected_dist = abs((point[0] - 0.0) * nx + (point[1] - 0.0) * ny)
+    assert abs(math.dist(point, p) - expected_dist) < 0.05
+    # above the narrow top: straight down onto it
+    p = nav.find_nearest_reachable((500.0, 1400.0), margin=0.0)
+    assert abs(p[0] - 500.0) < 1e-6 and abs(p[1] - 1000.0) < 0.05
+    # the top is only 200 wide: the inset with margin 150 ends in a point below it
+    quad = _inset_trapezoid(t, 150.0)
+    assert quad is not None and quad[4] == quad[5] and quad[1] < 1000.0
+    p = nav.find_nearest_reachable((500.0, 1400.0), margin=150.0)
+    assert nav.contains(p[0], p[1], 150.0) and abs(p[1] - quad[1]) < 0.05
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {_import_error}")
+        print(f"\n{len(tests)} tests skipped — run from within injected Python session.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
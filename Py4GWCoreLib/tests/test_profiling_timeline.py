@@ -0,0 +1,199 @@
+"""Tests for the profiling timeline (py4gwcorelib_src/Profiling.py).
+
+Profiling.py only depends on the standard library, so it is loaded by path.
+Synthetic scope timings are fed into ProfileTimeline with explicit
+timestamps (and through ProfileScope / ProfilingRegistry.runcall_scope) to
+check the ring buffer, percentile windows, hitch detection and the Chrome
+trace / speedscope exports.  These tests do not need the game runtime.
+"""
+
+import sys
+import os
+import json
+import tempfile
+import importlib.util
+
+_PROFILING_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "py4gwcorelib_src", "Profiling.py",
+)
+
+
+def _load_profiling_module():
+    spec = importlib.util.spec_from_file_location("_profiling_test", _PROFILING_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+try:
+    _profiling = _load_profiling_module()
+    ProfileTimeline = _profiling.ProfileTimeline
+    ProfileScope = _profiling.ProfileScope
+    ProfilingRegistry = _profiling.ProfilingRegistry
+    IMPORT_OK = True
+except Exception as e:
+    IMPORT_OK = False
+    _import_error = e
+
+MS = 1_000_000
+
+
+def _feed(timeline, frame_scopes, frame_ms=16):
+    """frame_scopes: per frame a list of (category, name, duration_ms), recorded back to back."""
+    now = 0
+    timeline.begin_frame(now)
+    for scopes in frame_scopes:
+        cursor = now
+        for category, name, duration in scopes:
+            timeline.record(category, name, cursor, int(duration * MS))
+            cursor += int(duration * MS)
+        now += frame_ms * MS
+        timeline.begin_frame(now)
+    return now
+
+
+def test_percentiles_over_windows():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    timeline = ProfileTimeline(capacity=1000)
+    _feed(timeline, [[("widgets", "a:update", (i % 100) + 1)] for i in range(200)], frame_ms=200)
+    stats = timeline.scope_stats()[("widgets", "a:update")]
+    assert stats.count == 200
+    assert (stats.p50_ms, stats.p95_ms, stats.p99_ms, stats.max_ms) == (50.0, 95.0, 99.0, 100.0)
+    assert abs(stats.mean_ms - 50.5) < 1e-9
+    # last 10 frames only: values 91..100
+    recent = timeline.scope_stats(window=10)[("widgets", "a:update")]
+    assert recent.count == 10 and recent.p50_ms == 95.0 and recent.max_ms == 100.0
+
+
+def test_ring_buffer_keeps_the_last_frames_and_sums_repeated_scopes():
+    assert IMPORT_OK
+    timeline = ProfileTimeline(capacity=50, hitch_ms=10_000)
+    _feed(timeline, [[("bt", "tick", 1), ("bt", "tick", 2)] for _ in range(120)])
+    assert len(timeline.frames) == 50
+    assert timeline.frames[0].index == 71
+    stats = timeline.scope_stats()[("bt", "tick")]
+    assert stats.count == 50 and stats.max_ms == 3.0
+    assert timeline.frame_stats().p50_ms == 16.0
+
+
+def test_hitches_are_flagged_with_their_slowest_scopes():
+    assert IMPORT_OK
+    timeline = ProfileTimeline(capacity=200, hitch_ms=100, hitch_factor=3.0)
+    frames = [[("widgets", "fast", 1)] for _ in range(30)]
+    frames[20] = [("widgets", "fast", 1), ("widgets", "slow", 60)]
+    now = 0
+    timeline.begin_frame(now)
+    for i, scopes in enumerate(frames):
+        cursor = now
+        for category, name, duration in scopes:
+            timeline.record(category, name, cursor, int(duration * MS))
+            cursor += int(duration * MS)
+        now = max(now + 16 * MS, cursor)
+        timeline.begin_frame(now)
+    assert len(timeline.hitches) == 1
+    hitch = timeline.hitches[0]
+    assert hitch.frame_index == 21 and hitch.frame_ms == 61.0
+    assert hitch.threshold_ms == 48.0   # 3 x median 16 ms, below the 100 ms floor
+    assert hitch.top_scopes[0][:2] == ("widgets", "slow")
+
+
+def test_chrome_trace_and_speedscope_exports():
+    assert IMPORT_OK
+    timeline = ProfileTimeline(capacity=100, hitch_ms=40)
+    now = 0
+    timeline.begin_frame(now)
+    for i in range(5):
+        # nested scope inside "outer", then an overlapping sibling that gets clamped
+        timeline.record("widgets", "outer", now, 10 * MS)
+        timeline.record("widgets", "inner", now + 2 * MS, 3 * MS)
+        timeline.record("widgets", "sibling", now + 9 * MS, 4 * MS)
+        now += (50 if i == 3 else 16) * MS
+        timeline.begin_frame(now)
+
+    trace = timeline.to_chrome_trace()
+    complete = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    assert len([e for e in complete if e["cat"] == "frame"]) == 5
+    scopes = [e for e in complete if e["cat"] == "widgets"]
+    assert len(scopes) == 15 and scopes[0]["ts"] == 0.0 and scopes[0]["dur"] == 10_000.0
+    assert any(e["ph"] == "i" and e["cat"] == "hitch" for e in trace["traceEvents"])
+
+    speedscope = timeline.to_speedscope()
+    profile = speedscope["profiles"][0]
+    names = [f["name"] for f in speedscope["shared"]["frames"]]
+    assert {"Frame", "widgets/outer", "widgets/inner", "widgets/sibling"} <= set(names)
+    stack = []
+    last_at = 0
+    for event in profile["events"]:
+        assert event["at"] >= last_at
+        last_at = event["at"]
+        if event["type"] == "O":
+            stack.append(event["frame"])
+        else:
+            assert stack.pop() == event["frame"]   # properly nested
+    assert not stack and profile["endValue"] == last_at
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = timeline.export(os.path.join(tmp, "capture", "frames.json"), "speedscope")
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f)["profiles"][0]["type"] == "evented"
+        path = timeline.export(os.path.join(tmp, "frames.trace.json"))
+        with open(path, encoding="utf-8") as f:
+            assert "traceEvents" in json.load(f)
+
+
+def test_registry_records_scopes_only_while_a_timeline_is_running():
+    assert IMPORT_OK
+    registry = ProfilingRegistry()
+    registry.enabled = True
+    try:
+        registry.begin_frame()                       # no timeline: nothing happens
+        registry.runcall_scope("widgets", "w:update", lambda: None)
+        assert registry.timeline is None
+
+        timeline = registry.start_timeline(capacity=10)
+        registry.begin_frame()
+        with registry.scope("widgets", "w:draw"):
+            pass
+        assert registry.runcall_scope("widgets", "w:update", lambda x: x * 2, 21) == 42
+        registry.begin_frame()
+        assert len(timeline.frames) == 1
+        assert {name for _, name, _, _ in timeline.frames[0].scopes} == {"w:draw", "w:update"}
+        assert registry.timings["widgets"]["w:update"] >= 0
+
+        assert registry.stop_timeline() is timeline
+        registry.runcall_scope("widgets", "w:update", lambda: None)
+        assert timeline._current is not None and not timeline._current.scopes
+
+        # A ProfileScope built directly with a timeline records into it too
+        standalone = ProfileTimeline()
+        with ProfileScope({}, "bt", "tick", timeline=standalone):
+            pass
+        standalone.begin_frame()
+        assert standalone.frames[0].scopes[0][:2] == ("bt", "tick")
+    finally:
+        registry.enabled = False
+        registry.stop_timeline()
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot load Profiling.py: {_import_error}")
+        print(f"\n{len(tests)} tests skipped.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
@@ -0,0 +1,183 @@
+"""Tests for the exact segment walk (NavMesh.segment_block / has_line_of_sight).
+
+The reference is the sampled check the walk replaced: points along the
+segment, each tested with TrapezoidBSP.find_with_margin.  Sampled every 2
+units it is close to exact, so on synthetic meshes (rectangular and slanted
+cells, holes, two layers) a walkable answer from segment_block must agree
+with it, and a blocked answer must be confirmed by the point just past the
+block.  Sampled at the old 200-unit step it misses thin gaps that the walk
+reports.
+
+NOTE: These tests require the game runtime (Py4GW DLLs) because
+Py4GWCoreLib imports depend on PyScanner/PyPathing/etc.
+Run from within an injected Python session or skip offline.
+"""
+
+import sys
+import os
+import math
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_navmesh import SyntheticPathingMap, SyntheticTrapezoid, make_pathing_maps, random_points
+
+try:
+    from Py4GWCoreLib.Pathing import NavMesh
+    IMPORT_OK = True
+except ImportError as e:
+    IMPORT_OK = False
+    _import_error = e
+
+
+def sampled_walkable(nav, p1, p2, margin, step_dist):
+    """The sampled segment check used before the exact walk (interior samples only)."""
+    steps = int(math.dist(p1, p2) / step_dist) + 1
+    dx = (p2[0] - p1[0]) / steps
+    dy = (p2[1] - p1[1]) / steps
+    return all(nav._bsp.find_with_margin(p1[0] + dx * i, p1[1] + dy * i, margin) for i in range(1, steps))
+
+
+def random_segments(nav, pathing_maps, count, margin, seed=3, max_len=6000.0):
+    """Segments between random points that are on the mesh with the given margin."""
+    rng = random.Random(seed)
+    points = [p for p in random_points(pathing_maps, count * 6, pad=0.0, seed=seed) if nav.contains(p[0], p[1], margin)]
+    segments = []
+    while len(segments) < count:
+        a = rng.choice(points)
+        angle = rng.uniform(0.0, 2.0 * math.pi)
+        length = rng.uniform(50.0, max_len)
+        b = (a[0] + math.cos(angle) * length, a[1] + math.sin(angle) * length)
+        if nav.contains(b[0], b[1], margin):
+            segments.append((a, b))
+    return segments
+
+
+def _check_against_dense_sampling(nav, pathing_maps, margin, count=400):
+    blocked = missed = 0
+    for a, b in random_segments(nav, pathing_maps, count, margin):
+        block = nav.segment_block(a, b, margin)
+        dense = sampled_walkable(nav, a, b, margin, 2.0)
+        if block is None:
+            assert dense, f"walk says {a}->{b} is clear but a sample fails (margin {margin})"
+            continue
+        blocked += 1
+        assert block.reason in ("edge", "clearance")
+        assert nav.trapezoids[block.trap_id] is not None and block.edge is not None
+        length = math.dist(a, b)
+        u = block.t + 0.05 / length
+        if u < 1.0:
+            x, y = a[0] + (b[0] - a[0]) * u, a[1] + (b[1] - a[1]) * u
+            assert not nav._bsp.find_with_margin(x, y, margin), f"point past the block of {a}->{b} is walkable"
+        missed += dense
+    assert blocked > count // 10            # obstacles were exercised
+    assert missed <= max(2, blocked // 50)  # dense sampling only misses very short blocked stretches
+    return blocked
+
+
+def test_matches_dense_sampling_on_rectangular_cells():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    maps = make_pathing_maps(cols=16, rows=24, hole_ratio=0.2, seed=4)
+    nav = NavMesh(maps, 1)
+    for margin in (0.0, 60.0):
+        _check_against_dense_sampling(nav, maps, margin)
+
+
+def test_matches_dense_sampling_on_slanted_cells_and_layers():
+    assert IMPORT_OK
+    maps = make_pathing_maps(cols=10, rows=24, layers=2, hole_ratio=0.15, seed=9, slant=0.8)
+    nav = NavMesh(maps, 1)
+    for margin in (0.0, 40.0):
+        _check_against_dense_sampling(nav, maps, margin)
+    # straight across the layer seam: walkable without margin, too close to the seam with one
+    y = 250.0
+    while not (nav.contains(9500.0, y, 0.0) and nav.contains(10500.0, y, 0.0)):
+        y += 500.0
+    assert nav.segment_block((9500.0, y), (10500.0, y)) is None
+    block = nav.segment_block((9500.0, y), (10500.0, y), margin=40.0)
+    assert block is not None and block.reason == "clearance"
+    assert abs(block.point[0] - 9960.0) < 1.0
+
+
+def test_thin_gap_is_reported_where_sampling_misses_it():
+    assert IMPORT_OK
+    left = SyntheticTrapezoid(1, 0.0, 1000.0, 0.0, 500.0)
+    right = SyntheticTrapezoid(2, 1020.0, 2000.0, 0.0, 500.0)
+    nav = NavMesh([SyntheticPathingMap(0, [left, right])], 1)
+    a, b = (100.0, 250.0), (1900.0, 250.0)
+    assert sampled_walkable(nav, a, b, 0.0, 200.0)          # samples land at x=1000 and x=1180
+    block = nav.segment_block(a, b)
+    assert block is not None and block.reason == "edge" and block.trap_id == 1
+    assert block.edge == ((1000.0, 0.0), (1000.0, 500.0))
+    assert abs(block.point[0] - 1000.0) < 1.0 and abs(block.point[1] - 250.0) < 1e-6
+    assert not nav.has_line_of_sight(a, b, margin=0)
+
+
+def test_slanted_side_and_off_mesh_start():
+    assert IMPORT_OK
+    # a waist: the lower trapezoid narrows to [200, 800] at y=500, the upper one widens again
+    lower = SyntheticTrapezoid(1, 0.0, 1000.0, 0.0, 500.0)
+    lower.XTL, lower.XTR = 200.0, 800.0
+    upper = SyntheticTrapezoid(2, 200.0, 800.0, 500.0, 1000.0)
+    upper.XTL, upper.XTR = 0.0, 1000.0
+    lower.neighbor_ids.append(2)
+    upper.neighbor_ids.append(1)
+    nav = NavMesh([SyntheticPathingMap(0, [lower, upper])], 1)
+
+    assert nav.segment_block((500.0, 50.0), (500.0, 950.0), margin=250.0) is None
+    block = nav.segment_block((100.0, 100.0), (100.0, 900.0))
+    assert block is not None and block.reason == "edge" and block.trap_id == 1
+    assert block.edge == ((0.0, 0.0), (200.0, 500.0))
+    assert abs(block.point[1] - 250.0) < 2.0                # exits are found on the edge grown by 0.5
+    # the waist is 600 wide: a 301 margin cannot pass it
+    block = nav.segment_block((500.0, 50.0), (500.0, 950.0), margin=301.0)
+    assert block is not None and block.reason == "clearance"
+
+    block = nav.segment_block((-500.0, 100.0), (500.0, 100.0))
+    assert block is not None and block.reason == "off_mesh" and block.trap_id == -1
+    # end_slack lets an endpoint sit just off the mesh (the side is at x=40 here) or close to a wall
+    assert nav.segment_block((10.0, 100.0), (500.0, 100.0), end_slack=50.0) is None
+    assert nav.has_line_of_sight((60.0, 100.0), (500.0, 100.0), margin=100)
+
+
+def test_smoothed_paths_are_walkable():
+    assert IMPORT_OK
+    maps = make_pathing_maps(cols=12, rows=20, hole_ratio=0.2, seed=6)
+    nav = NavMesh(maps, 1)
+    rng = random.Random(2)
+    ids = list(nav.trapezoids)
+    checked = 0
+    for _ in range(40):
+        route = nav.find_path_ids(rng.choice(ids), rng.choice(ids))
+        if not route or len(route) < 3:
+            continue
+        path = [nav.get_position(t_id) for t_id in route]
+        smoothed = nav.smooth_path_by_los(path, margin=0)
+        assert smoothed[0] == path[0] and smoothed[-1] == path[-1]
+        for p, q in zip(smoothed, smoothed[1:]):
+            assert sampled_walkable(nav, p, q, 0.0, 2.0)
+        checked += 1
+    assert checked > 10
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {_import_error}")
+        print(f"\n{len(tests)} tests skipped — run from within injected Python session.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
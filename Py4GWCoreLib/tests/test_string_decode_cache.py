@@ -0,0 +1,149 @@
+"""Tests for the persistent string decode cache (native_src/internals/string_decode_cache.py).
+
+StringDecodeCache only depends on the standard library, so it is loaded by
+path and exercised directly: LRU bounds, save / warm-load round trips and
+rejection of files written for another language or string table.  These
+tests do not need the game runtime.
+"""
+
+import sys
+import os
+import tempfile
+import importlib.util
+
+_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "native_src", "internals", "string_decode_cache.py",
+)
+
+
+def _load_cache_module():
+    spec = importlib.util.spec_from_file_location("_string_decode_cache_test", _CACHE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+try:
+    _cache_module = _load_cache_module()
+    StringDecodeCache = _cache_module.StringDecodeCache
+    read_string_cache = _cache_module.read_string_cache
+    table_fingerprint = _cache_module.table_fingerprint
+    IMPORT_OK = True
+except Exception as e:
+    IMPORT_OK = False
+    _import_error = e
+
+
+def _raw(i):
+    return (0x8100 + (i >> 8)).to_bytes(2, "little") + (0x100 + (i & 0xFF)).to_bytes(2, "little") + b"\x00\x00"
+
+
+def test_lru_eviction_is_bounded():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    cache = StringDecodeCache(0, "fp", limit=100)
+    for i in range(150):
+        cache.put(_raw(i), f"name {i}")
+    assert len(cache) == 100 and cache.evictions == 50
+    assert cache.get(_raw(0)) is None
+    # Touching an entry keeps it alive through later evictions
+    assert cache.get(_raw(50)) == "name 50"
+    for i in range(150, 190):
+        cache.put(_raw(i), f"name {i}")
+    assert cache.get(_raw(50)) == "name 50"
+    assert cache.get(_raw(51)) is None
+
+
+def test_save_and_warm_load_round_trip():
+    assert IMPORT_OK
+    fingerprint = table_fingerprint(2, 1024, 0xDEADBEEF, 98000)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "string_cache", "strings_2.bin")
+        cache = StringDecodeCache(2, fingerprint)
+        cache.put(_raw(1), "Grawl Shaman")
+        cache.put(_raw(2), "Mursaat Elementalist")
+        cache.put(_raw(3), "Jöttun – Wächter")   # non-ASCII survives
+        assert cache.unsaved == 3
+        assert cache.save(path)
+        assert cache.unsaved == 0
+
+        loaded = StringDecodeCache.load(path, 2, fingerprint)
+        assert loaded.items() == cache.items()
+        assert loaded.unsaved == 0
+        assert loaded.get(_raw(3)) == "Jöttun – Wächter"
+
+
+def test_other_table_or_language_is_rejected():
+    assert IMPORT_OK
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "strings_0.bin")
+        cache = StringDecodeCache(0, table_fingerprint(0, 1024, 1, 10))
+        cache.put(_raw(1), "Charr Hunter")
+        cache.save(path)
+        assert len(StringDecodeCache.load(path, 0, table_fingerprint(0, 1024, 2, 10))) == 0
+        assert len(StringDecodeCache.load(path, 3, table_fingerprint(0, 1024, 1, 10))) == 0
+        assert len(StringDecodeCache.load(path, 0, table_fingerprint(0, 1024, 1, 10))) == 1
+
+
+def test_corrupt_or_missing_file_loads_empty():
+    assert IMPORT_OK
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "strings_0.bin")
+        assert len(StringDecodeCache.load(path, 0, "fp")) == 0
+        cache = StringDecodeCache(0, "fp")
+        for i in range(20):
+            cache.put(_raw(i), f"name {i}")
+        cache.save(path)
+        with open(path, "r+b") as f:
+            f.seek(-3, os.SEEK_END)
+            f.write(b"\xff\xff\xff")
+        assert read_string_cache(path, 0, "fp") == []
+        with open(path, "wb") as f:
+            f.write(b"P4SC")
+        assert len(StringDecodeCache.load(path, 0, "fp")) == 0
+
+
+def test_load_keeps_most_recent_entries_when_limit_shrinks():
+    assert IMPORT_OK
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "strings_0.bin")
+        cache = StringDecodeCache(0, "fp", limit=50)
+        for i in range(50):
+            cache.put(_raw(i), f"name {i}")
+        cache.get(_raw(0))   # most recently used now
+        cache.save(path)
+        small = StringDecodeCache.load(path, 0, "fp", limit=10)
+        assert len(small) == 10
+        assert small.get(_raw(0)) == "name 0"
+        assert small.get(_raw(1)) is None
+
+
+def test_unfingerprinted_cache_is_not_saved():
+    assert IMPORT_OK
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = StringDecodeCache(0)
+        cache.put(_raw(1), "x")
+        assert not cache.save(os.path.join(tmp, "strings_0.bin"))
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot load string_decode_cache.py: {_import_error}")
+        print(f"\n{len(tests)} tests skipped.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
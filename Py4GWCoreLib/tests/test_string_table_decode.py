@@ -0,0 +1,182 @@
+"""Tests for string-table decoding with the persistent decode cache (native_src/internals/string_table.py).
+
+A synthetic string file (synthetic_string_table.py) is parsed with
+_parse_string_file and decoded through the pure-Python RC4 path, then
+decode_many / decode are checked against the known texts, including a warm
+load of the cache saved by a previous "session".
+
+NOTE: These tests require the game runtime (Py4GW DLLs) because
+Py4GWCoreLib imports depend on PyScanner/PyPathing/etc.
+Run from within an injected Python session or skip offline.
+"""
+
+import sys
+import os
+import tempfile
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_string_table import build_entry, build_string_file, encode_reference, synthetic_names, to_raw
+
+try:
+    from Py4GWCoreLib.native_src.internals import string_table
+    IMPORT_OK = True
+except ImportError as e:
+    IMPORT_OK = False
+    _import_error = e
+
+LANGUAGE = 0
+
+
+def _reset(cache_folder):
+    string_table._rc4_decrypt = string_table._rc4_python
+    string_table._decode_cache_folder = cache_folder
+    string_table._decode_caches.clear()
+    string_table._table_fingerprints.clear()
+    string_table._string_tables_by_language.clear()
+    string_table._save_scheduled.clear()
+    string_table._pending.clear()
+    string_table._string_table.clear()
+    string_table._string_table_loaded = False
+    string_table._string_table_language = None
+    string_table._load_enqueued = False
+
+
+def _install(texts, language=LANGUAGE, seed=5):
+    """Parse a synthetic string file as the loaded table; returns [(raw, text)]."""
+    blob, entries = build_string_file(texts, string_table._derive_rc4_key, string_table._rc4_python, seed=seed)
+    table = {}
+    assert string_table._parse_string_file(blob, 1, table) == len(texts)
+    fingerprint = string_table.table_fingerprint(language, 1024, zlib.crc32(blob), len(table))
+    string_table._register_table(language, table, fingerprint)
+    string_table._string_table_loaded = False
+    string_table._do_load_string_table(language)
+    return [(to_raw(encode_reference(index, key)), text) for index, key, text in entries]
+
+
+def test_synthetic_entries_decode_with_python_rc4():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    with tempfile.TemporaryDirectory() as tmp:
+        _reset(tmp)
+        pairs = _install(synthetic_names(60))
+        for raw, text in pairs:
+            assert string_table._decode_sync(raw, string_table._string_table) == text
+        # a single encrypted UTF-16 entry, outside the bulk file
+        entry = build_entry("Mursaat Monk", key=0x1234_5678_9ABC, packed=False,
+                            derive_key=string_table._derive_rc4_key, rc4=string_table._rc4_python)
+        assert string_table._decode_entry(entry, 0x1234_5678_9ABC) == "Mursaat Monk"
+
+
+def test_decode_many_is_synchronous_and_fills_the_cache():
+    assert IMPORT_OK
+    with tempfile.TemporaryDirectory() as tmp:
+        _reset(tmp)
+        pairs = _install(synthetic_names(300))
+        raws = [raw for raw, _ in pairs]
+        assert string_table.decode_many(raws) == [text for _, text in pairs]
+        # decode() now answers from the cache on the same frame
+        assert all(string_table.decode(raw) == text for raw, text in pairs)
+        info = string_table.decode_cache_info()[LANGUAGE]
+        assert info["size"] == len(set(raws))
+        assert not string_table._pending
+
+
+def test_decode_many_handles_duplicates_players_and_garbage():
+    assert IMPORT_OK
+    with tempfile.TemporaryDirectory() as tmp:
+        _reset(tmp)
+        (raw, text), = _install(["Charr Shaman"])
+        player = b"\xa9\x0b\x00\x01" + "Zed".encode("utf-16-le") + b"\x00\x00"
+        out = string_table.decode_many([raw, b"", player, raw, to_raw((0x0105,))])
+        assert out == [text, "", "Zed", text, ""]
+
+
+def test_cache_is_warm_loaded_in_the_next_session():
+    assert IMPORT_OK
+    with tempfile.TemporaryDirectory() as tmp:
+        _reset(tmp)
+        texts = synthetic_names(200)
+        pairs = _install(texts)
+        string_table.decode_many([raw for raw, _ in pairs])
+        assert string_table.save_decode_caches() == 1
+        assert os.path.isfile(os.path.join(tmp, f"strings_{LANGUAGE}.bin"))
+
+        # New session, same dat files: names resolve from the saved cache
+        _reset(tmp)
+        _install(texts)
+        string_table._string_table.clear()   # nothing left to decode from
+        assert all(string_table.decode(raw) == text for raw, text in pairs)
+
+        # A game update (different table data) starts from an empty cache
+        _reset(tmp)
+        _install(texts, seed=6)
+        assert string_table.decode_cache_info()[LANGUAGE]["size"] == 0
+
+
+def test_languages_have_separate_caches():
+    assert IMPORT_OK
+    with tempfile.TemporaryDirectory() as tmp:
+        _reset(tmp)
+        english = _install(["Stone Summit"], language=0)
+        german = _install(["Steingipfel"], language=3)
+        string_table._do_load_string_table(0)
+        raw = english[0][0]
+        assert raw == german[0][0]   # same encoded reference, different tables
+        assert string_table.decode_many([raw]) == ["Stone Summit"]
+        assert string_table.decode_many([raw], language=3) == ["Steingipfel"]
+        assert string_table.decode(raw, language=3) == "Steingipfel"
+        assert string_table.decode(raw) == "Stone Summit"
+
+
+def test_switch_language_never_caches_the_other_languages_text():
+    assert IMPORT_OK
+    with tempfile.TemporaryDirectory() as tmp:
+        _reset(tmp)
+        (raw, english), = _install(["Stone Summit"], language=0)
+        _install(["Steingipfel"], language=3)
+        string_table._do_load_string_table(0)
+        english_table = string_table._string_table
+
+        queued = []
+        load_string_table = string_table.load_string_table
+        string_table.load_string_table = queued.append      # the game thread has not run the load yet
+        try:
+            string_table.switch_language(3)
+        finally:
+            string_table.load_string_table = load_string_table
+        assert queued == [3] and string_table._string_table is english_table
+
+        # the old table is still in place: nothing is decoded or cached for language 3
+        assert string_table.decode(raw) == "" and not string_table._pending
+        assert string_table.decode_many([raw]) == [""]
+        # a decode queued before the switch finishes with the old table
+        string_table._decode_and_cache(raw, 3, english_table, 0)
+        assert string_table._get_decode_cache(3).get(raw) is None
+
+        string_table._do_load_string_table(3)
+        assert string_table.decode_many([raw]) == ["Steingipfel"]
+        assert string_table.decode(raw, language=0) == english
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {_import_error}")
+        print(f"\n{len(tests)} tests skipped — run from within injected Python session.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
@@ -0,0 +1,102 @@
+"""Unit tests for TrapezoidGridIndex (nearest-trapezoid and radius queries).
+
+NOTE: These tests require the game runtime (Py4GW DLLs) because
+Py4GWCoreLib imports depend on PyScanner/PyPathing/etc.
+Run from within an injected Python session or skip offline.
+"""
+
+import sys
+import os
+import math
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_navmesh import make_pathing_maps, random_points
+
+try:
+    from Py4GWCoreLib.Pathing import NavMesh, _closest_point_on_trapezoid, _point_in_trapezoid
+    IMPORT_OK = True
+except ImportError as e:
+    IMPORT_OK = False
+    _import_error = e
+
+
+def _linear_nearest(nav, x, y):
+    best_id, best_dist = None, float("inf")
+    for t_id, (cx, cy) in nav._centroids.items():
+        d = math.hypot(cx - x, cy - y)
+        if d < best_dist:
+            best_dist, best_id = d, t_id
+    return best_id
+
+
+def test_nearest_matches_linear_scan():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    maps = make_pathing_maps(cols=25, rows=20, layers=2, hole_ratio=0.2)
+    nav = NavMesh(maps, 1)
+    for x, y in random_points(maps, 3000, pad=3000.0):
+        assert nav.find_nearest_trapezoid_id(x, y) == _linear_nearest(nav, x, y)
+
+
+def test_nearest_far_outside_mesh():
+    assert IMPORT_OK
+    maps = make_pathing_maps(cols=10, rows=10)
+    nav = NavMesh(maps, 1)
+    for x, y in [(-1e6, -1e6), (1e6, 0.0), (0.0, 1e6), (5000.0, -50000.0)]:
+        assert nav.find_nearest_trapezoid_id(x, y) == _linear_nearest(nav, x, y)
+
+
+def test_nearest_on_empty_mesh():
+    assert IMPORT_OK
+    nav = NavMesh([], 1)
+    assert nav.find_nearest_trapezoid_id(0.0, 0.0) is None
+    assert nav.find_trapezoids_within(0.0, 0.0, 100.0) == []
+
+
+def test_within_radius_matches_brute_force():
+    assert IMPORT_OK
+    maps = make_pathing_maps(cols=20, rows=20, hole_ratio=0.2)
+    nav = NavMesh(maps, 1)
+    for radius in (0.0, 150.0, 1200.0):
+        for x, y in random_points(maps, 300, seed=11):
+            expected = []
+            for t_id, t in nav.trapezoids.items():
+                px, py = _closest_point_on_trapezoid(x, y, t)
+                if math.hypot(px - x, py - y) <= radius:
+                    expected.append(t_id)
+            assert nav.find_trapezoids_within(x, y, radius) == expected
+
+
+def test_closest_point_inside_is_identity():
+    assert IMPORT_OK
+    maps = make_pathing_maps(cols=4, rows=4)
+    t = maps[0].trapezoids[0]
+    cx = (t.XBL + t.XBR) / 2
+    cy = (t.YB + t.YT) / 2
+    assert _closest_point_on_trapezoid(cx, cy, t) == (cx, cy)
+    px, py = _closest_point_on_trapezoid(t.XBL - 100.0, cy, t)
+    assert _point_in_trapezoid(px, py, t, 1e-6)
+    assert abs(px - t.XBL) < 1e-9
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot import Py4GWCoreLib (game not running): {_import_error}")
+        print(f"\n{len(tests)} tests skipped — run from within injected Python session.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
@@ -0,0 +1,189 @@
+"""Tests for the shared-memory slot claim protocol (GlobalCache/shared_memory_src/SlotClaim.py).
+
+SlotClaim.py only depends on the standard library, so it is loaded by path
+and exercised across real processes over a multiprocessing.shared_memory
+block laid out like the whiteboard claim header.  These tests do not need
+the game runtime; the contention test needs a native 32-bit CAS (libatomic
+on Linux, 32-bit kernel32 on Windows) and is skipped without one.
+"""
+
+import sys
+import os
+import ctypes
+import importlib.util
+import multiprocessing
+from ctypes import Structure, c_uint32
+from multiprocessing import shared_memory
+
+_SLOT_CLAIM_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "GlobalCache", "shared_memory_src", "SlotClaim.py",
+)
+
+
+def _load_slot_claim():
+    spec = importlib.util.spec_from_file_location("_shmem_slot_claim", _SLOT_CLAIM_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+try:
+    SlotClaim = _load_slot_claim()
+    IMPORT_OK = True
+except Exception as e:
+    IMPORT_OK = False
+    _import_error = e
+
+SLOTS = 8
+WORKERS = 6
+ROUNDS = 400
+
+if IMPORT_OK:
+    class _Board(Structure):
+        _pack_ = 1
+        _fields_ = [
+            ("Generation", c_uint32),
+            ("Published", c_uint32),
+            ("Violations", c_uint32),
+            ("Claims", SlotClaim.SlotClaimStruct * SLOTS),
+            ("Payload", c_uint32 * SLOTS),
+        ]
+
+
+def _field_address(board, name):
+    return ctypes.addressof(board) + getattr(_Board, name).offset
+
+
+def _contend(shm_name, worker_id, rounds):
+    """Worker: repeatedly claim a slot, stamp it, verify nobody else wrote it, release it."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    board = _Board.from_buffer(shm.buf)
+    try:
+        for _ in range(rounds):
+            token = SlotClaim.new_owner_token()
+            index = -1
+            for i in range(SLOTS):
+                if SlotClaim.try_claim(board.Claims[i], token):
+                    index = i
+                    break
+            if index == -1:
+                continue
+            board.Payload[index] = worker_id
+            for _spin in range(25):
+                if board.Payload[index] != worker_id:
+                    SlotClaim.atomic_increment_u32(_field_address(board, "Violations"))
+                    break
+            SlotClaim.publish(board.Claims[index])
+            SlotClaim.atomic_increment_u32(_field_address(board, "Generation"))
+            SlotClaim.atomic_increment_u32(_field_address(board, "Published"))
+            if board.Payload[index] != worker_id:
+                SlotClaim.atomic_increment_u32(_field_address(board, "Violations"))
+            board.Payload[index] = 0
+            if not SlotClaim.release(board.Claims[index], token):
+                SlotClaim.atomic_increment_u32(_field_address(board, "Violations"))
+    finally:
+        del board
+        shm.close()
+
+
+def _new_board():
+    shm = shared_memory.SharedMemory(create=True, size=ctypes.sizeof(_Board))
+    shm.buf[:ctypes.sizeof(_Board)] = bytes(ctypes.sizeof(_Board))
+    return shm
+
+
+def test_claim_is_exclusive_in_process():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    claim = SlotClaim.SlotClaimStruct()
+    a, b = SlotClaim.new_owner_token(), SlotClaim.new_owner_token()
+    assert a != b and a and b
+    assert SlotClaim.try_claim(claim, a)
+    assert not SlotClaim.try_claim(claim, b)
+    assert not SlotClaim.release(claim, b)
+    assert SlotClaim.publish(claim) == 1
+    assert SlotClaim.release(claim, a)
+    assert claim.Owner == 0 and claim.Generation == 2
+    assert SlotClaim.try_claim(claim, b)
+
+
+def test_take_over_requires_observed_owner():
+    assert IMPORT_OK
+    claim = SlotClaim.SlotClaimStruct()
+    owner, clearer, late = (SlotClaim.new_owner_token() for _ in range(3))
+    assert SlotClaim.try_claim(claim, owner)
+    observed = claim.Owner
+    assert SlotClaim.try_take_over(claim, observed, clearer)
+    # A second clearer that observed the same owner must lose.
+    assert not SlotClaim.try_take_over(claim, observed, late)
+    assert SlotClaim.release(claim, clearer)
+
+
+def test_abandoned_claim_needs_unchanged_state_past_timeout():
+    assert IMPORT_OK
+    claim = SlotClaim.SlotClaimStruct()
+    assert SlotClaim.try_claim(claim, SlotClaim.new_owner_token())
+    assert not SlotClaim.is_abandoned(claim, 1000, 500)   # first sighting starts the timer
+    assert not SlotClaim.is_abandoned(claim, 1400, 500)
+    assert SlotClaim.is_abandoned(claim, 1600, 500)
+    SlotClaim.publish(claim)                              # progress resets the timer
+    assert not SlotClaim.is_abandoned(claim, 1700, 500)
+
+
+def test_atomic_increment_wraps():
+    assert IMPORT_OK
+    value = c_uint32(0xFFFFFFFF)
+    assert SlotClaim.atomic_increment_u32(ctypes.addressof(value)) == 0
+    assert value.value == 0
+
+
+def test_multiprocess_contention_never_double_claims():
+    assert IMPORT_OK
+    if not SlotClaim.ATOMIC_CAS_AVAILABLE:
+        print("    (skipped: no native compare-and-swap on this platform)")
+        return
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+    shm = _new_board()
+    try:
+        procs = [ctx.Process(target=_contend, args=(shm.name, w + 1, ROUNDS)) for w in range(WORKERS)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(60)
+            assert p.exitcode == 0
+        board = _Board.from_buffer(shm.buf)
+        try:
+            assert board.Violations == 0
+            assert board.Published > 0
+            assert board.Generation == board.Published
+            assert all(board.Claims[i].Owner == 0 for i in range(SLOTS))
+            # Every completed claim bumped its slot generation twice (publish + release).
+            assert sum(board.Claims[i].Generation for i in range(SLOTS)) == 2 * board.Published
+        finally:
+            del board
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot load SlotClaim.py: {_import_error}")
+        print(f"\n{len(tests)} tests skipped.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
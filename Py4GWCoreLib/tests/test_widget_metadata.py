@@ -0,0 +1,256 @@
+"""Tests for import-free widget metadata (py4gwcorelib_src/WidgetMetadata.py).
+
+WidgetMetadata only depends on the standard library, so it is loaded by path
+and run against small widget scripts written to a temp folder.  Scripts that
+only use the standard library are also imported, to check the static result
+against what Widget.load_module would read from the module.  These tests do
+not need the game runtime.
+"""
+
+import sys
+import os
+import time
+import tempfile
+import importlib.util
+
+_METADATA_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "py4gwcorelib_src", "WidgetMetadata.py",
+)
+
+
+def _load_metadata_module():
+    spec = importlib.util.spec_from_file_location("_widget_metadata_test", _METADATA_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+try:
+    _metadata_module = _load_metadata_module()
+    WidgetManifest = _metadata_module.WidgetManifest
+    extract_metadata = _metadata_module.extract_metadata
+    extract_metadata_from_source = _metadata_module.extract_metadata_from_source
+    CONSTANT_NAMES = _metadata_module.CONSTANT_NAMES
+    CALLBACK_NAMES = _metadata_module.CALLBACK_NAMES
+    IMPORT_OK = True
+except Exception as e:
+    IMPORT_OK = False
+    _import_error = e
+
+
+STATIC_WIDGET = '''
+import os
+from typing import Optional
+
+BOT_NAME = "Sample Farmer"
+MODULE_NAME = BOT_NAME
+MODULE_CATEGORY = "Automation"
+MODULE_TAGS = ["Farm", "Bots"]
+MODULE_ALIASES = ("farmer", f"{BOT_NAME} v2")
+MODULE_ICON = os.path.join("Textures", "Module_Icons", "Farmer" + ".png")
+OPTIONAL = False
+MODULE_PRIORITY = "low"
+MODULE_MAX_UPDATE_INTERVAL: int = 4
+
+def configure():
+    pass
+
+def tooltip():
+    pass
+
+async def update():
+    pass
+
+class main:
+    pass
+
+draw = None
+
+if __name__ == "__main__":
+    main()
+'''
+
+
+def _import_source(path):
+    spec = importlib.util.spec_from_file_location(f"_widget_src_{abs(hash(path))}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _write(folder, name, source):
+    path = os.path.join(folder, name)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(source)
+    return path
+
+
+def test_static_constants_match_import():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(tmp, "Sample Farmer.py", STATIC_WIDGET)
+        metadata = extract_metadata(path)
+        module = _import_source(path)
+    assert metadata.is_static
+    expected = {name: getattr(module, name) for name in CONSTANT_NAMES if hasattr(module, name)}
+    expected["MODULE_ALIASES"] = list(expected["MODULE_ALIASES"])
+    actual = dict(metadata.constants)
+    actual["MODULE_ALIASES"] = list(actual["MODULE_ALIASES"])
+    assert actual == expected
+    assert set(metadata.callbacks) == {n for n in CALLBACK_NAMES if callable(getattr(module, n, None))}
+    assert not metadata.has_callback("draw")
+
+
+def test_missing_constants_are_left_to_defaults():
+    assert IMPORT_OK
+    metadata = extract_metadata_from_source("def main():\n    pass\n")
+    assert metadata.is_static
+    assert metadata.constants == {}
+    assert metadata.callbacks == ("main",)
+
+
+def test_runtime_values_are_reported_unresolved():
+    assert IMPORT_OK
+    source = (
+        "import os\n"
+        "project_root = os.getcwd()\n"
+        "MODULE_NAME = 'Prep'\n"
+        "MODULE_ICON = os.path.join(project_root, 'icon.png')\n"
+        "try:\n"
+        "    OPTIONAL = False\n"
+        "except Exception:\n"
+        "    pass\n"
+        "from helpers import update\n"
+    )
+    metadata = extract_metadata_from_source(source)
+    assert not metadata.is_static
+    assert metadata.unresolved == ("MODULE_ICON", "OPTIONAL")
+    assert metadata.constants == {"MODULE_NAME": "Prep"}
+    assert metadata.has_callback("update")
+
+
+def test_later_assignment_wins():
+    assert IMPORT_OK
+    metadata = extract_metadata_from_source("MODULE_NAME = 'a'\nMODULE_NAME = 'b'\nMODULE_TAGS = []\nMODULE_TAGS += ['x']\n")
+    assert metadata.constants == {"MODULE_NAME": "b"}
+    assert metadata.unresolved == ("MODULE_TAGS",)
+
+
+def test_syntax_error_is_reported():
+    assert IMPORT_OK
+    metadata = extract_metadata_from_source("def main(:\n")
+    assert not metadata.is_static
+    assert metadata.error.startswith("SyntaxError")
+
+
+def test_manifest_reuses_unchanged_scripts():
+    assert IMPORT_OK
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(tmp, "w.py", "MODULE_NAME = 'One'\ndef main():\n    pass\n")
+        manifest_path = os.path.join(tmp, "data", "widget_manifest.json")
+
+        manifest = WidgetManifest(manifest_path)
+        assert manifest.get(path).constants == {"MODULE_NAME": "One"}
+        assert manifest.misses == 1 and manifest.save()
+        assert not manifest.save()  # nothing changed
+
+        reloaded = WidgetManifest(manifest_path)
+        assert len(reloaded) == 1
+        assert reloaded.get(path).callbacks == ("main",)
+        assert reloaded.hits == 1 and reloaded.misses == 0 and not reloaded.dirty
+
+        # Edits change mtime/size and are re-parsed
+        _write(tmp, "w.py", "MODULE_NAME = 'Two'\n")
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert reloaded.get(path).constants == {"MODULE_NAME": "Two"}
+        assert reloaded.misses == 1 and reloaded.dirty
+
+
+def test_manifest_prunes_removed_scripts():
+    assert IMPORT_OK
+    with tempfile.TemporaryDirectory() as tmp:
+        a = _write(tmp, "a.py", "MODULE_NAME = 'A'\n")
+        b = _write(tmp, "b.py", "MODULE_NAME = 'B'\n")
+        manifest = WidgetManifest(os.path.join(tmp, "manifest.json"))
+        manifest.get(a)
+        manifest.get(b)
+        manifest.save()
+        assert manifest.prune([a]) == 1
+        assert len(manifest) == 1 and manifest.dirty
+
+
+def test_corrupt_manifest_starts_empty():
+    assert IMPORT_OK
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest_path = _write(tmp, "manifest.json", "{not json")
+        manifest = WidgetManifest(manifest_path)
+        assert len(manifest) == 0
+        path = _write(tmp, "w.py", "OPTIONAL = True\n")
+        assert manifest.get(path).constants == {"OPTIONAL": True}
+        assert manifest.save()
+        assert len(WidgetManifest(manifest_path)) == 1
+
+
+def test_warm_manifest_is_faster_than_parsing():
+    assert IMPORT_OK
+    body = STATIC_WIDGET + "".join(f"\ndef helper_{i}(x):\n    return [x * {i} for _ in range(3)]\n" for i in range(300))
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [_write(tmp, f"w{i}.py", body) for i in range(20)]
+        manifest = WidgetManifest(os.path.join(tmp, "manifest.json"))
+        t0 = time.perf_counter()
+        for p in paths:
+            manifest.get(p)
+        cold = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for p in paths:
+            manifest.get(p)
+        warm = time.perf_counter() - t0
+    assert manifest.hits == len(paths)
+    assert warm * 5 < cold
+
+
+def test_catalogued_widget_module_is_imported_on_access():
+    assert IMPORT_OK
+    # Widget needs the game runtime (Py4GW DLLs); only checked from an injected session
+    try:
+        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+        from Py4GWCoreLib.py4gwcorelib_src.WidgetManager import Widget
+    except ImportError:
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(tmp, "Blessed.py", 'MODULE_NAME = "Blessed"\nWIDGET_INSTANCE = object()\n'
+                                         'def Get_Blessed():\n    return "blessed"\ndef main():\n    pass\n')
+        widget = Widget("Test/Blessed.py", "Blessed", "Test", path, metadata=extract_metadata(path))
+        assert not widget.is_loaded and widget.name == "Blessed" and widget.has_main_property
+        # other widgets reach into the module (PyQuishAI -> Blessed, Messaging -> MerchantRules)
+        assert widget.module.Get_Blessed() == "blessed"
+        assert widget.is_loaded and widget.module.WIDGET_INSTANCE is not None and not widget.enabled
+
+        missing = Widget("Test/Missing.py", "Missing", "Test", os.path.join(tmp, "Missing.py"),
+                         metadata=extract_metadata(path))
+        assert missing.module is None and not missing.is_loaded
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot load WidgetMetadata.py: {_import_error}")
+        print(f"\n{len(tests)} tests skipped.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
@@ -0,0 +1,178 @@
+"""Tests for the widget frame-budget scheduler (py4gwcorelib_src/WidgetScheduler.py).
+
+WidgetScheduler only depends on the standard library, so it is loaded by
+path and driven with fake widgets whose update callbacks sleep for controlled
+durations, with begin_frame() standing in for the PreUpdate callback.  These
+tests do not need the game runtime.
+"""
+
+import sys
+import os
+import time
+import importlib.util
+
+_SCHEDULER_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "py4gwcorelib_src", "WidgetScheduler.py",
+)
+
+
+def _load_scheduler():
+    spec = importlib.util.spec_from_file_location("_widget_scheduler_test", _SCHEDULER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+try:
+    _scheduler_module = _load_scheduler()
+    WidgetScheduler = _scheduler_module.WidgetScheduler
+    WidgetPriority = _scheduler_module.WidgetPriority
+    IMPORT_OK = True
+except Exception as e:
+    IMPORT_OK = False
+    _import_error = e
+
+
+class _FakeWidget:
+    """Update callback that sleeps for cost_ms and counts its runs."""
+
+    def __init__(self, name, cost_ms, priority="normal", max_interval=16):
+        self.key = f"Fake/{name}.py:update"
+        self.cost_ms = cost_ms
+        self.priority = priority
+        self.max_interval = max_interval
+        self.runs = 0
+        self.run_frames = []
+
+    def update(self):
+        self.runs += 1
+        if self.cost_ms:
+            time.sleep(self.cost_ms / 1000)
+
+
+def _run_frames(scheduler, widgets, frames):
+    """Run every widget through the scheduler for a number of frames; returns per-frame spent ms."""
+    for w in widgets:
+        scheduler.configure(w.key, w.priority, w.max_interval)
+    spent = []
+    for _ in range(frames):
+        scheduler.begin_frame()
+        for w in widgets:
+            before = w.runs
+            scheduler.run(w.key, w.update)
+            if w.runs != before:
+                w.run_frames.append(scheduler.frame)
+        spent.append(scheduler.spent_ns / 1_000_000)
+    return spent
+
+
+def test_cheap_widgets_run_every_frame():
+    assert IMPORT_OK, f"Import failed: {_import_error}"
+    scheduler = WidgetScheduler(budget_ms=20)
+    widgets = [_FakeWidget(f"cheap{i}", 0) for i in range(10)]
+    _run_frames(scheduler, widgets, 50)
+    assert all(w.runs == 50 for w in widgets)
+    assert scheduler.throttled() == []
+
+
+def test_slow_widget_is_demoted_and_frames_stay_within_budget():
+    assert IMPORT_OK
+    scheduler = WidgetScheduler(budget_ms=10)
+    slow = _FakeWidget("slow", 8, max_interval=8)
+    fast = [_FakeWidget(f"fast{i}", 0.2) for i in range(3)]
+    spent = _run_frames(scheduler, fast + [slow], 80)
+    stats = scheduler.get_stats(slow.key)
+    assert stats.interval == 8
+    assert scheduler.is_throttled(slow.key)
+    assert [s.key for s in scheduler.throttled()] == [slow.key]
+    # Still runs, but never waits longer than its declared max interval.
+    gaps = [b - a for a, b in zip(slow.run_frames, slow.run_frames[1:])]
+    assert max(gaps) <= 8
+    assert slow.runs < 80 // 4
+    assert all(w.runs == 80 for w in fast)
+    # Average update time per frame drops well below the slow widget's cost.
+    assert sum(spent[40:]) / 40 < 5
+
+
+def test_budget_defers_lower_priority_work():
+    assert IMPORT_OK
+    scheduler = WidgetScheduler(budget_ms=6)
+    hog = _FakeWidget("hog", 5, priority="high", max_interval=1)   # runs every frame, fills the budget
+    low = _FakeWidget("low", 1, priority=WidgetPriority.LOW, max_interval=4)
+    _run_frames(scheduler, [hog, low], 40)
+    assert hog.runs == 40
+    # low only gets in when its max interval forces it.
+    assert 8 <= low.runs <= 12
+    assert scheduler.get_stats(low.key).deferred >= 25
+
+
+def test_critical_widgets_are_never_throttled():
+    assert IMPORT_OK
+    scheduler = WidgetScheduler(budget_ms=2)
+    system = _FakeWidget("system", 4, priority="critical")
+    _run_frames(scheduler, [system], 20)
+    assert system.runs == 20
+    assert scheduler.get_stats(system.key).interval == 1
+    assert not scheduler.is_throttled(system.key)
+
+
+def test_widget_recovers_when_it_gets_cheaper():
+    assert IMPORT_OK
+    scheduler = WidgetScheduler(budget_ms=10)
+    widget = _FakeWidget("bursty", 6)
+    _run_frames(scheduler, [widget], 40)
+    assert scheduler.get_stats(widget.key).interval > 1
+    widget.cost_ms = 0
+    _run_frames(scheduler, [widget], 200)
+    assert scheduler.get_stats(widget.key).interval == 1
+
+
+def test_disabled_scheduler_only_measures():
+    assert IMPORT_OK
+    scheduler = WidgetScheduler(budget_ms=1, enabled=False)
+    slow = _FakeWidget("slow", 3)
+    _run_frames(scheduler, [slow], 10)
+    assert slow.runs == 10
+    stats = scheduler.get_stats(slow.key)
+    assert stats.interval == 1 and stats.cost_ms >= 2.5
+
+
+def test_unbudgeted_calls_are_timed_but_not_counted():
+    assert IMPORT_OK
+    scheduler = WidgetScheduler(budget_ms=1)
+    scheduler.begin_frame()
+    assert scheduler.run("Fake/w.py:draw", lambda: "drawn", budgeted=False) == "drawn"
+    assert scheduler.spent_ns == 0
+    assert scheduler.get_stats("Fake/w.py:draw").runs == 1
+    assert scheduler.throttled() == []
+
+
+def test_priority_coercion():
+    assert IMPORT_OK
+    assert WidgetPriority.coerce("Low") == WidgetPriority.LOW
+    assert WidgetPriority.coerce(3) == WidgetPriority.CRITICAL
+    assert WidgetPriority.coerce("bogus") == WidgetPriority.NORMAL
+    assert WidgetPriority.coerce(None, WidgetPriority.CRITICAL) == WidgetPriority.CRITICAL
+
+
+if __name__ == "__main__":
+    import traceback
+    tests = [
+        fn for name, fn in sorted(globals().items())
+        if name.startswith("test_") and callable(fn)
+    ]
+    if not IMPORT_OK:
+        print(f"SKIP: Cannot load WidgetScheduler.py: {_import_error}")
+        print(f"\n{len(tests)} tests skipped.\n")
+    else:
+        passed = 0
+        for test in tests:
+            try:
+                test()
+                print(f"  PASS  {test.__name__}")
+                passed += 1
+            except Exception:
+                print(f"  FAIL  {test.__name__}")
+                traceback.print_exc()
+        print(f"\n{passed}/{len(tests)} tests passed")
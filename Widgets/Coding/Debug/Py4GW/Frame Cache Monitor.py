@@ -0,0 +1,150 @@
+import PyImGui
+
+from Py4GWCoreLib import ImGui, Color, FRAME_CACHE
+from Py4GWCoreLib.IniManager import IniManager
+
+MODULE_NAME = "Frame Cache Monitor"
+
+SORT_COLUMNS = ["Misses", "Hits", "Hit %", "Compute ms"]
+sort_index = 3
+filter_text = ""
+
+
+def _sort_key(item):
+    stats = item[1]
+    if sort_index == 0:
+        return stats.misses
+    if sort_index == 1:
+        return stats.hits
+    if sort_index == 2:
+        return -stats.hit_rate
+    return stats.compute_ns
+
+
+def draw_window():
+    global sort_index, filter_text
+
+    if ImGui.Begin(INI_KEY, "Frame Cache Monitor"):
+        frame_entries, timed_entries = FRAME_CACHE.entry_counts()
+        PyImGui.text(f"Frame: {FRAME_CACHE.frame}")
+        PyImGui.text(f"Per-frame entries: {frame_entries}")
+        PyImGui.text(f"Timed entries: {timed_entries} / {FRAME_CACHE.max_entries}")
+        PyImGui.separator()
+
+        FRAME_CACHE.collect_stats = PyImGui.checkbox("Collect Statistics", FRAME_CACHE.collect_stats)
+        PyImGui.same_line(0, 10)
+        if PyImGui.button("Reset Statistics"):
+            FRAME_CACHE.reset_stats()
+        PyImGui.same_line(0, 10)
+        if PyImGui.button("Clear Cache"):
+            FRAME_CACHE.clear()
+
+        if PyImGui.collapsing_header("Invalidation Tags", PyImGui.TreeNodeFlags.DefaultOpen):
+            tags = FRAME_CACHE.tags()
+            if not tags:
+                PyImGui.text("No tags in use.")
+            for tag, count in sorted(tags.items()):
+                if PyImGui.button(f"Invalidate##{tag}"):
+                    FRAME_CACHE.invalidate(tag)
+                PyImGui.same_line(0, 10)
+                PyImGui.text(f"{tag}: {count} entries")
+
+        if PyImGui.collapsing_header("Cached Functions", PyImGui.TreeNodeFlags.DefaultOpen):
+            if not FRAME_CACHE.collect_stats:
+                PyImGui.text_colored("Statistics are off; enable them above.", Color(255, 200, 100, 255).to_tuple_normalized())
+            sort_index = PyImGui.combo("Sort By", sort_index, SORT_COLUMNS)
+            filter_text = PyImGui.input_text("Filter", filter_text)
+
+            rows = sorted(FRAME_CACHE.stats().items(), key=_sort_key, reverse=True)
+            needle = filter_text.lower()
+            if PyImGui.begin_table("frame_cache_stats", 8, PyImGui.TableFlags.BordersInnerV | PyImGui.TableFlags.RowBg):
+                PyImGui.table_setup_column("Category", PyImGui.TableColumnFlags.WidthFixed, 110)
+                PyImGui.table_setup_column("Function", PyImGui.TableColumnFlags.WidthStretch)
+                PyImGui.table_setup_column("Hits", PyImGui.TableColumnFlags.WidthFixed, 70)
+                PyImGui.table_setup_column("Misses", PyImGui.TableColumnFlags.WidthFixed, 70)
+                PyImGui.table_setup_column("Hit %", PyImGui.TableColumnFlags.WidthFixed, 50)
+                PyImGui.table_setup_column("Mean ms", PyImGui.TableColumnFlags.WidthFixed, 60)
+                PyImGui.table_setup_column("Max ms", PyImGui.TableColumnFlags.WidthFixed, 60)
+                PyImGui.table_setup_column("Evict/Inval", PyImGui.TableColumnFlags.WidthFixed, 75)
+                PyImGui.table_headers_row()
+
+                for (category, source_lib, function_name), stats in rows:
+                    name = source_lib or function_name
+                    if needle and needle not in f"{category} {name}".lower():
+                        continue
+                    PyImGui.table_next_row()
+                    PyImGui.table_next_column()
+                    PyImGui.text(category)
+                    PyImGui.table_next_column()
+                    PyImGui.text(name)
+                    PyImGui.table_next_column()
+                    PyImGui.text(str(stats.hits))
+                    PyImGui.table_next_column()
+                    PyImGui.text(str(stats.misses))
+                    PyImGui.table_next_column()
+                    PyImGui.text(f"{stats.hit_rate * 100:.0f}")
+                    PyImGui.table_next_column()
+                    PyImGui.text(f"{stats.mean_compute_ms:.3f}")
+                    PyImGui.table_next_column()
+                    PyImGui.text(f"{stats.max_compute_ns / 1e6:.3f}")
+                    PyImGui.table_next_column()
+                    PyImGui.text(f"{stats.evictions}/{stats.invalidations}")
+                PyImGui.end_table()
+
+        ImGui.End(INI_KEY)
+
+
+def tooltip():
+    PyImGui.begin_tooltip()
+
+    # Title
+    title_color = Color(255, 200, 100, 255)
+    ImGui.push_font("Regular", 20)
+    PyImGui.text_colored("Frame Cache Monitor", title_color.to_tuple_normalized())
+    ImGui.pop_font()
+    PyImGui.spacing()
+    PyImGui.separator()
+
+    # Description
+    PyImGui.text("A debugging utility for the @frame_cache decorator.")
+    PyImGui.text("It shows how often each cached function is served from the cache")
+    PyImGui.text("and how long it takes to compute when it is not.")
+    PyImGui.spacing()
+
+    # Features
+    PyImGui.text_colored("Features:", title_color.to_tuple_normalized())
+    PyImGui.bullet_text("Hit Rates: Hits, misses and hit percentage per cached function")
+    PyImGui.bullet_text("Compute Cost: Mean and worst compute time on a miss")
+    PyImGui.bullet_text("Lifetimes: Entry counts for per-frame and multi-frame values and the eviction bound")
+    PyImGui.bullet_text("Tags: Live entries per invalidation tag, with a button to fire each tag")
+
+    PyImGui.spacing()
+    PyImGui.separator()
+    PyImGui.spacing()
+
+    # Credits
+    PyImGui.text_colored("Credits:", title_color.to_tuple_normalized())
+    PyImGui.bullet_text("Developed by Apo")
+
+    PyImGui.end_tooltip()
+
+
+INI_KEY = ""
+INI_PATH = "Widgets/FrameCacheMonitor"  # path to save ini key
+INI_FILENAME = "FrameCacheMonitor.ini"  # ini file name
+
+
+def main():
+    global INI_KEY
+    # one time initialization
+    if not INI_KEY:
+        INI_KEY = IniManager().ensure_key(INI_PATH, INI_FILENAME)
+        if not INI_KEY:
+            return
+        IniManager().load_once(INI_KEY)
+
+    draw_window()
+
+
+if __name__ == "__main__":
+    main()
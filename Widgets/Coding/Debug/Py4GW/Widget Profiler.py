@@ -1,6 +1,9 @@
 import collections
+import os
+import time
 from typing import Optional
 
+import Py4GW
 import PyImGui
 from Py4GWCoreLib import ProfilingRegistry, SimpleProfiler, WidgetHandler, IconsFontAwesome5, ThrottledTimer
 
@@ -28,6 +31,11 @@ profile_names: dict[str, dict[tuple, str]] = {}  # wid -> {func_key: display_nam
 profile_callees: dict[str, dict[tuple, list]] = {}  # wid -> {key: [(callee_key, edge_ct)]}
 profile_roots: dict[str, list[tuple]] = {}  # wid -> [(func_key, ct)] sorted
 profile_frames_remaining: dict[str, int] = {}
+
+# Timeline capture (ProfilingRegistry.start_timeline)
+TIMELINE_FRAMES = 1800
+timeline_export_dir = os.path.join(Py4GW.Console.get_projects_path(), "data", "profiles")
+timeline_last_export: str = ""
 icicle_zoom: dict[str, Optional[tuple]] = {}  # wid -> zoomed func_key or None
 icicle_open: set[str] = set()  # wids with open icicle windows
 icicle_sized: set[str] = set()  # wids whose window has been initially sized
@@ -119,6 +127,7 @@ def on_enable():
 def on_disable():
     reg = ProfilingRegistry()
     reg.enabled = False
+    reg.stop_timeline()
     reg.timings.clear()
     for prof in active_profiles.values():
         try:
@@ -482,8 +491,58 @@ def draw():
 
         PyImGui.end_table()
 
+    _draw_timeline_controls()
+
     PyImGui.end()
 
+
+def _export_timeline(fmt: str):
+    global timeline_last_export
+    timeline = ProfilingRegistry().timeline
+    if timeline is None:
+        return
+    suffix = "speedscope.json" if fmt == "speedscope" else "trace.json"
+    path = os.path.join(timeline_export_dir, f"timeline_{time.strftime('%Y%m%d_%H%M%S')}.{suffix}")
+    try:
+        timeline_last_export = timeline.export(path, fmt)
+    except OSError as e:
+        Py4GW.Console.Log(MODULE_NAME, f"Timeline export failed: {e}", Py4GW.Console.MessageType.Error)
+
+
+def _draw_timeline_controls():
+    reg = ProfilingRegistry()
+    timeline = reg.timeline
+
+    PyImGui.spacing()
+    if timeline is None:
+        if PyImGui.button("Record Timeline"):
+            reg.start_timeline(TIMELINE_FRAMES)
+        return
+
+    if PyImGui.button("Stop Timeline"):
+        reg.stop_timeline()
+        return
+    PyImGui.same_line(0, 10)
+    if PyImGui.button("Export Chrome Trace"):
+        _export_timeline("chrome")
+    PyImGui.same_line(0, 4)
+    if PyImGui.button("Export Speedscope"):
+        _export_timeline("speedscope")
+
+    frames = timeline.frame_stats(window)
+    PyImGui.text(
+        f"{len(timeline.frames)}/{timeline.capacity} frames  "
+        f"p50 {frames.p50_ms:.1f}ms  p95 {frames.p95_ms:.1f}ms  p99 {frames.p99_ms:.1f}ms  max {frames.max_ms:.1f}ms"
+    )
+    if timeline_last_export:
+        PyImGui.text_disabled(timeline_last_export)
+
+    hitches = list(timeline.hitches)[-5:]
+    PyImGui.text_colored(f"Hitches: {len(timeline.hitches)}", COLOR_BAD if hitches else COLOR_DEFAULT)
+    for hitch in reversed(hitches):
+        culprits = ", ".join(f"{name} {ms:.1f}ms" for _, name, ms in hitch.top_scopes[:3])
+        PyImGui.text(f"  frame {hitch.frame_index}: {hitch.frame_ms:.1f}ms  {culprits}")
+
     # Profiler icicle popup windows (separate resizable windows)
     for wid in list(icicle_open):
         if wid not in profile_roots:
@@ -1679,7 +1679,8 @@ class WidgetCatalogWindow:
 
     @staticmethod
     def _get_widget_description(widget) -> str:
-        module = getattr(widget, "module", None)
+        # Only describe from a module that is already imported; hovering must not import the widget
+        module = getattr(widget, "module", None) if getattr(widget, "is_loaded", True) else None
         if module is not None:
             for attr_name in ("MODULE_DESCRIPTION", "DESCRIPTION", "description"):
                 value = getattr(module, attr_name, "")
@@ -4,7 +4,7 @@ import threading
 import time
 import uuid
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Generator, NamedTuple
 
 from BridgeRuntime.protocol import (
     PROTOCOL_VERSION,
@@ -28,21 +28,17 @@ class ForwardRecord:
     last_response: dict[str, Any] | None = None
 
 
-@dataclass
-class BridgeClientSession:
-    sock: socket.socket
+class _ClientIdentity:
+    """Handshake and routing identity shared by the threaded and asyncio client sessions."""
+
     addr: tuple[str, int]
     daemon: "BridgeDaemon"
-    session_id: str = field(default_factory=lambda: uuid.uuid4().hex)
-    client_hwnd: int = 0
-    client_pid: int = 0
-    account_email: str = ""
-    character_name: str = ""
-    meta: dict[str, Any] = field(default_factory=dict)
-    alive: bool = True
-    send_lock: threading.Lock = field(default_factory=threading.Lock)
-    pending: dict[str, tuple[threading.Event, dict[str, Any] | None]] = field(default_factory=dict)
-    pending_lock: threading.Lock = field(default_factory=threading.Lock)
+    session_id: str
+    client_hwnd: int
+    client_pid: int
+    account_email: str
+    character_name: str
+    meta: dict[str, Any]
 
     @property
     def key(self) -> str:
@@ -72,6 +68,45 @@ class BridgeClientSession:
         self.meta["connected_at_ms"] = _now_ms()
         self.meta["last_seen_ms"] = self.meta["connected_at_ms"]
 
+    def accept_hello(self, hello: dict[str, Any]) -> dict[str, Any]:
+        """Validate the client hello, record the handshake and return the hello_ack to send."""
+        if hello.get("type") != "hello":
+            raise ProtocolError("expected hello")
+        if int(hello.get("protocol_version", 0)) != PROTOCOL_VERSION:
+            raise ProtocolError("protocol version mismatch")
+        if self.daemon.token and str(hello.get("token") or "") != self.daemon.token:
+            raise ProtocolError("auth token mismatch")
+        self.set_handshake(hello)
+        return {
+            "type": "hello_ack",
+            "protocol_version": PROTOCOL_VERSION,
+            "session_id": self.session_id,
+            "server_time_ms": _now_ms(),
+        }
+
+    def apply_heartbeat(self, msg: dict[str, Any]) -> None:
+        client = msg.get("client", {})
+        if isinstance(client, dict):
+            self.account_email = str(client.get("account_email") or self.account_email)
+            self.character_name = str(client.get("character_name") or self.character_name)
+
+
+@dataclass
+class BridgeClientSession(_ClientIdentity):
+    sock: socket.socket
+    addr: tuple[str, int]
+    daemon: "BridgeDaemon"
+    session_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    client_hwnd: int = 0
+    client_pid: int = 0
+    account_email: str = ""
+    character_name: str = ""
+    meta: dict[str, Any] = field(default_factory=dict)
+    alive: bool = True
+    send_lock: threading.Lock = field(default_factory=threading.Lock)
+    pending: dict[str, tuple[threading.Event, dict[str, Any] | None]] = field(default_factory=dict)
+    pending_lock: threading.Lock = field(default_factory=threading.Lock)
+
     def call_client(
         self,
         command: str,
@@ -102,25 +137,10 @@ class BridgeClientSession:
 
     def recv_loop(self) -> None:
         try:
-            hello = recv_json_message(self.sock, timeout=10.0)
-            if hello.get("type") != "hello":
-                raise ProtocolError("expected hello")
-            if int(hello.get("protocol_version", 0)) != PROTOCOL_VERSION:
-                raise ProtocolError("protocol version mismatch")
-            if self.daemon.token and str(hello.get("token") or "") != self.daemon.token:
-                raise ProtocolError("auth token mismatch")
-            self.set_handshake(hello)
+            hello_ack = self.accept_hello(recv_json_message(self.sock, timeout=10.0))
             self.daemon.register_client(self)
             with self.send_lock:
-                send_json_message(
-                    self.sock,
-                    {
-                        "type": "hello_ack",
-                        "protocol_version": PROTOCOL_VERSION,
-                        "session_id": self.session_id,
-                        "server_time_ms": _now_ms(),
-                    },
-                )
+                send_json_message(self.sock, hello_ack)
             while self.alive:
                 msg = recv_json_message(self.sock, timeout=30.0)
                 self.meta["last_seen_ms"] = _now_ms()
@@ -134,10 +154,7 @@ class BridgeClientSession:
                             self.pending[req_id] = (evt, msg)
                             evt.set()
                 elif mtype == "heartbeat":
-                    client = msg.get("client", {})
-                    if isinstance(client, dict):
-                        self.account_email = str(client.get("account_email") or self.account_email)
-                        self.character_name = str(client.get("character_name") or self.character_name)
+                    self.apply_heartbeat(msg)
         except Exception as exc:
             print(f"[daemon] client disconnected {self.addr}: {exc}")
         finally:
@@ -149,6 +166,24 @@ class BridgeClientSession:
                 pass
 
 
+class ClientCall(NamedTuple):
+    """One request to a widget client, yielded by BridgeDaemon._control_steps.
+
+    The driver performs the call (blocking in BridgeDaemon, awaited in the
+    asyncio daemon) and sends the client response back into the generator, or
+    throws the exception the call raised into it.
+    """
+
+    client: Any
+    command: str
+    params: dict[str, Any]
+    timeout_s: float
+    request_id_override: str | None = None
+
+
+ControlSteps = Generator[ClientCall, dict[str, Any], dict[str, Any]]
+
+
 class BridgeDaemon:
     def __init__(self, widget_host: str, widget_port: int, control_host: str, control_port: int, token: str):
         self.widget_host = widget_host
@@ -212,15 +247,39 @@ class BridgeDaemon:
         bridge_command: str,
         bridge_params: dict[str, Any] | None = None,
         timeout_s: float = 3.0,
-    ) -> tuple[BridgeClientSession | None, dict[str, Any] | None, dict[str, Any] | None]:
+    ) -> Generator[ClientCall, dict[str, Any], tuple[Any, dict[str, Any] | None, dict[str, Any] | None]]:
         client, error = self._resolve_target_client(request_id, params)
         if error is not None or client is None:
             return client, error, None
-        resp = client.call_client(bridge_command, bridge_params or {}, timeout_s=timeout_s)
+        resp = yield ClientCall(client, bridge_command, bridge_params or {}, timeout_s)
         self._record_forward(request_id, client, resp)
         return client, None, resp
 
     def control_dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        steps = self._control_steps(request)
+        try:
+            call = next(steps)
+            while True:
+                try:
+                    resp = call.client.call_client(
+                        call.command,
+                        call.params,
+                        timeout_s=call.timeout_s,
+                        request_id_override=call.request_id_override,
+                    )
+                except Exception as exc:
+                    call = steps.throw(exc)
+                else:
+                    call = steps.send(resp)
+        except StopIteration as done:
+            return done.value
+
+    def _control_steps(self, request: dict[str, Any]) -> ControlSteps:
+        """The control command set, written once for both daemons.
+
+        Every widget round trip is a ``yield ClientCall(...)``; see control_dispatch
+        for the blocking driver and bridge_daemon_async for the asyncio one.
+        """
         request_id = str(request.get("request_id") or uuid.uuid4().hex)
         command = str(request.get("command") or "")
         params = request.get("params", {})
@@ -232,7 +291,7 @@ class BridgeDaemon:
             if command == "system.list_clients":
                 return make_response(request_id, {"clients": self.list_clients()})
             if command == "client.describe_runtime":
-                client, error, resp = self._call_bridge_command(request_id, params, "client.describe")
+                client, error, resp = yield from self._call_bridge_command(request_id, params, "client.describe")
                 if error is not None or client is None or resp is None:
                     return error or make_error_response(request_id, "client_not_found", "target client not connected")
                 if not resp.get("ok"):
@@ -246,7 +305,7 @@ class BridgeDaemon:
                     },
                 )
             if command == "client.get_map_state":
-                client, error, resp = self._call_bridge_command(request_id, params, "map.get_state")
+                client, error, resp = yield from self._call_bridge_command(request_id, params, "map.get_state")
                 if error is not None or client is None or resp is None:
                     return error or make_error_response(request_id, "client_not_found", "target client not connected")
                 if not resp.get("ok"):
@@ -260,7 +319,7 @@ class BridgeDaemon:
                     },
                 )
             if command == "client.get_player_state":
-                client, error, resp = self._call_bridge_command(request_id, params, "player.get_state")
+                client, error, resp = yield from self._call_bridge_command(request_id, params, "player.get_state")
                 if error is not None or client is None or resp is None:
                     return error or make_error_response(request_id, "client_not_found", "target client not connected")
                 if not resp.get("ok"):
@@ -277,7 +336,7 @@ class BridgeDaemon:
                 group = str(params.get("group") or "all").lower()
                 if group not in {"all", "ally", "enemy", "item", "gadget", "npc"}:
                     return make_error_response(request_id, "validation_group", f"unsupported group: {group}")
-                client, error, resp = self._call_bridge_command(request_id, params, "agent.list", {"group": group})
+                client, error, resp = yield from self._call_bridge_command(request_id, params, "agent.list", {"group": group})
                 if error is not None or client is None or resp is None:
                     return error or make_error_response(request_id, "client_not_found", "target client not connected")
                 if not resp.get("ok"):
@@ -295,7 +354,7 @@ class BridgeDaemon:
                     },
                 )
             if command == "client.list_namespaces":
-                client, error, resp = self._call_bridge_command(request_id, params, "system.list_namespaces")
+                client, error, resp = yield from self._call_bridge_command(request_id, params, "system.list_namespaces")
                 if error is not None or client is None or resp is None:
                     return error or make_error_response(request_id, "client_not_found", "target client not connected")
                 if not resp.get("ok"):
@@ -321,7 +380,7 @@ class BridgeDaemon:
                     },
                 )
             if command == "client.list_commands":
-                client, error, resp = self._call_bridge_command(request_id, params, "system.list_commands")
+                client, error, resp = yield from self._call_bridge_command(request_id, params, "system.list_commands")
                 if error is not None or client is None or resp is None:
                     return error or make_error_response(request_id, "client_not_found", "target client not connected")
                 if not resp.get("ok"):
@@ -355,7 +414,7 @@ class BridgeDaemon:
                 payload_params = payload.get("params", {})
                 if not payload_cmd or not isinstance(payload_params, dict):
                     return make_error_response(request_id, "validation_payload", "payload.command and payload.params required")
-                resp = client.call_client(payload_cmd, dict(payload_params), timeout_s=3.0, request_id_override=request_id)
+                resp = yield ClientCall(client, payload_cmd, dict(payload_params), 3.0, request_id_override=request_id)
                 self._record_forward(request_id, client, resp)
                 return make_response(request_id, {"target": client.describe(), "bridge_response": resp})
             if command == "client.get_status":
@@ -365,7 +424,7 @@ class BridgeDaemon:
                 client, error = self._resolve_target_client(request_id, params)
                 if error is not None or client is None:
                     return error or make_error_response(request_id, "client_not_found", "target client not connected")
-                resp = client.call_client("ops.get_status", {"request_id": tracked_request_id}, timeout_s=2.0)
+                resp = yield ClientCall(client, "ops.get_status", {"request_id": tracked_request_id}, 2.0)
                 self._record_forward(tracked_request_id, client, resp)
                 return make_response(request_id, {"target": client.describe(), "bridge_response": resp})
             return make_error_response(request_id, "not_supported", f"unsupported command: {command}")
@@ -429,8 +488,19 @@ def main() -> None:
     parser.add_argument("--control-host", default="127.0.0.1")
     parser.add_argument("--control-port", type=int, default=47812)
     parser.add_argument("--token", default="")
+    parser.add_argument(
+        "--engine",
+        choices=("threaded", "asyncio"),
+        default="threaded",
+        help="threaded: one thread per connection; asyncio: single event loop with pipelined control requests",
+    )
     args = parser.parse_args()
-    BridgeDaemon(
+    daemon_cls = BridgeDaemon
+    if args.engine == "asyncio":
+        from bridge_daemon_async import AsyncBridgeDaemon
+
+        daemon_cls = AsyncBridgeDaemon
+    daemon_cls(
         widget_host=args.widget_host,
         widget_port=args.widget_port,
         control_host=args.control_host,
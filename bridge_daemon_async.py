@@ -0,0 +1,217 @@
+import asyncio
+import uuid
+from dataclasses import dataclass, field
+from typing import Any
+
+from BridgeRuntime.protocol import (
+    ProtocolError,
+    make_error_response,
+    read_json_message,
+    write_json_message,
+)
+from bridge_daemon import BridgeDaemon, ClientCall, ControlSteps, _ClientIdentity, _now_ms
+
+
+def _expire(future: asyncio.Future, command: str) -> None:
+    if not future.done():
+        future.set_exception(TimeoutError(f"client timeout for {command}"))
+
+
+@dataclass
+class AsyncBridgeClientSession(_ClientIdentity):
+    """Widget client connection served on the event loop.
+
+    Any number of requests can be in flight at once; responses are matched to
+    their waiting future by request_id, in whatever order the client answers.
+    """
+
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    addr: tuple[str, int]
+    daemon: "AsyncBridgeDaemon"
+    session_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    client_hwnd: int = 0
+    client_pid: int = 0
+    account_email: str = ""
+    character_name: str = ""
+    meta: dict[str, Any] = field(default_factory=dict)
+    alive: bool = True
+    pending: dict[str, asyncio.Future] = field(default_factory=dict)
+
+    async def call_client(
+        self,
+        command: str,
+        params: dict[str, Any],
+        timeout_s: float = 2.0,
+        request_id_override: str | None = None,
+    ) -> dict[str, Any]:
+        if not self.alive:
+            raise ConnectionError("client disconnected")
+        request_id = request_id_override or uuid.uuid4().hex
+        if request_id in self.pending:
+            raise ProtocolError(f"request_id already in flight: {request_id}")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending[request_id] = future
+        expiry = loop.call_later(timeout_s, _expire, future, command)
+        try:
+            # One write() per frame, so concurrent callers never interleave bytes.
+            await write_json_message(
+                self.writer,
+                {"type": "request", "request_id": request_id, "command": command, "params": params},
+            )
+            return await future
+        finally:
+            expiry.cancel()
+            if self.pending.get(request_id) is future:
+                self.pending.pop(request_id, None)
+
+    def _fail_pending(self, exc: BaseException) -> None:
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(exc)
+        self.pending.clear()
+
+    async def recv_loop(self) -> None:
+        try:
+            hello_ack = self.accept_hello(await read_json_message(self.reader, timeout=10.0))
+            self.daemon.register_client(self)
+            await write_json_message(self.writer, hello_ack)
+            while self.alive:
+                msg = await read_json_message(self.reader, timeout=30.0)
+                self.meta["last_seen_ms"] = _now_ms()
+                mtype = str(msg.get("type") or "")
+                if mtype == "response":
+                    future = self.pending.get(str(msg.get("request_id") or ""))
+                    if future is not None and not future.done():
+                        future.set_result(msg)
+                elif mtype == "heartbeat":
+                    self.apply_heartbeat(msg)
+        except Exception as exc:
+            print(f"[daemon] client disconnected {self.addr}: {exc}")
+        finally:
+            self.alive = False
+            self.daemon.unregister_client(self)
+            # Callers waiting on this client fail now instead of running out their timeout.
+            self._fail_pending(ConnectionError("client disconnected"))
+            self.writer.close()
+
+
+class AsyncBridgeDaemon(BridgeDaemon):
+    """BridgeDaemon on a single asyncio event loop.
+
+    Same protocol framing, client registry and control command set as the
+    threaded daemon (the commands come from BridgeDaemon._control_steps), but
+    a control connection may pipeline requests: each one is dispatched as soon
+    as it is read and its response is written when it completes, tagged with
+    its request_id, so responses can arrive out of order.
+    """
+
+    def __init__(
+        self,
+        widget_host: str,
+        widget_port: int,
+        control_host: str,
+        control_port: int,
+        token: str,
+        max_inflight_per_conn: int = 256,
+    ):
+        super().__init__(widget_host, widget_port, control_host, control_port, token)
+        self.max_inflight_per_conn = max(1, int(max_inflight_per_conn))
+        self._servers: list[asyncio.AbstractServer] = []
+
+    async def control_dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        steps = self._control_steps(request)
+        try:
+            return await self._finish_steps(steps, next(steps))
+        except StopIteration as done:
+            return done.value
+
+    async def _finish_steps(self, steps: ControlSteps, call: ClientCall) -> dict[str, Any]:
+        try:
+            while True:
+                try:
+                    resp = await call.client.call_client(
+                        call.command,
+                        call.params,
+                        timeout_s=call.timeout_s,
+                        request_id_override=call.request_id_override,
+                    )
+                except Exception as exc:
+                    call = steps.throw(exc)
+                else:
+                    call = steps.send(resp)
+        except StopIteration as done:
+            return done.value
+
+    async def _handle_widget_conn(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        addr = writer.get_extra_info("peername") or ("", 0)
+        await AsyncBridgeClientSession(reader=reader, writer=writer, addr=addr[:2], daemon=self).recv_loop()
+
+    async def _handle_control_conn(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        inflight: set[asyncio.Task] = set()
+        slots = asyncio.Semaphore(self.max_inflight_per_conn)
+
+        async def answer(steps: ControlSteps, call: ClientCall) -> None:
+            try:
+                await write_json_message(writer, await self._finish_steps(steps, call))
+            finally:
+                slots.release()
+
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    req = await read_json_message(reader, timeout=300.0)
+                except BaseException:
+                    slots.release()
+                    raise
+                if req.get("type") != "request":
+                    slots.release()
+                    await write_json_message(writer, make_error_response("", "protocol_type", "expected request"))
+                    continue
+                # Commands answered by the daemon itself (ping, list_clients, validation
+                # errors) finish on the first step and are written inline; only the ones
+                # waiting on a widget client get a task.
+                steps = self._control_steps(req)
+                try:
+                    call = next(steps)
+                except StopIteration as done:
+                    slots.release()
+                    await write_json_message(writer, done.value)
+                    continue
+                task = asyncio.create_task(answer(steps, call))
+                inflight.add(task)
+                task.add_done_callback(inflight.discard)
+        except Exception:
+            pass
+        finally:
+            # The peer may half-close after pipelining; finish what it already sent.
+            if inflight:
+                await asyncio.gather(*inflight, return_exceptions=True)
+            writer.close()
+
+    async def start(self) -> None:
+        widget_server = await asyncio.start_server(self._handle_widget_conn, self.widget_host, self.widget_port)
+        control_server = await asyncio.start_server(self._handle_control_conn, self.control_host, self.control_port)
+        self._servers = [widget_server, control_server]
+        print(f"[daemon] widget server {self.widget_host}:{self.widget_port} (asyncio)")
+        print(f"[daemon] control server {self.control_host}:{self.control_port} (asyncio)")
+
+    def close(self) -> None:
+        for server in self._servers:
+            server.close()
+        self._servers = []
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            await asyncio.gather(*(server.serve_forever() for server in self._servers))
+        finally:
+            self.close()
+
+    def run(self) -> None:
+        try:
+            asyncio.run(self.serve_forever())
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,383 @@
+"""Load test for the bridge daemon: threaded engine vs asyncio engine.
+
+For each engine a daemon is started in its own process on free localhost
+ports, a second process connects --clients fake widget clients to it, and
+this process drives the control API from --connections sockets.  Every
+control request is a ``client.request`` routed round-robin to the fake
+clients (or ``system.ping`` with --command ping, which never leaves the
+daemon).  Each scenario keeps up to --window requests in flight per control
+connection; the threaded daemon answers a connection's requests one at a time,
+the asyncio daemon dispatches them concurrently.
+
+The fake widget clients behave like the Bridge Client widget: a socket thread
+queues incoming requests and a frame loop drains the queue every --frame-ms
+(0 answers immediately, 16 models a 60 fps client).
+
+    python bridge_loadtest.py
+    python bridge_loadtest.py --engines asyncio --windows 1 64 --requests 20000
+    python bridge_loadtest.py --frame-ms 16 --clients 8
+"""
+
+import argparse
+import math
+import os
+import queue
+import socket
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from typing import Any, NamedTuple
+
+from BridgeRuntime.protocol import (
+    PROTOCOL_VERSION,
+    make_response,
+    recv_json_message,
+    send_json_message,
+)
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_HOST = "127.0.0.1"
+_FIRST_HWND = 1000
+
+
+class LoadResult(NamedTuple):
+    engine: str
+    window: int
+    completed: int
+    errors: int
+    seconds: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+    @property
+    def throughput(self) -> float:
+        return self.completed / self.seconds if self.seconds > 0 else 0.0
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(pct / 100.0 * len(ordered)) - 1)]
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind((_HOST, 0))
+        return probe.getsockname()[1]
+
+
+def _connect(port: int, timeout: float = 10.0) -> socket.socket:
+    deadline = time.time() + timeout
+    while True:
+        try:
+            sock = socket.create_connection((_HOST, port), timeout=1.0)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            return sock
+        except OSError:
+            if time.time() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+# ---------------------------------------------------------------------------
+# Fake widget clients (run in their own process with --role widgets)
+# ---------------------------------------------------------------------------
+
+
+class FakeWidgetClient:
+    def __init__(self, port: int, index: int, token: str):
+        self.hwnd = _FIRST_HWND + index
+        self.sock = _connect(port)
+        self.inbox: "queue.SimpleQueue[dict[str, Any]]" = queue.SimpleQueue()
+        self.send_lock = threading.Lock()
+        send_json_message(
+            self.sock,
+            {
+                "type": "hello",
+                "protocol_version": PROTOCOL_VERSION,
+                "token": token,
+                "client": {
+                    "hwnd": self.hwnd,
+                    "pid": os.getpid() * 100 + index,
+                    "account_email": f"bench{index}@example.invalid",
+                    "character_name": f"Bench Client {index}",
+                },
+            },
+        )
+        recv_json_message(self.sock, timeout=10.0)  # hello_ack
+
+    def answer(self, request: dict[str, Any]) -> None:
+        response = make_response(
+            str(request.get("request_id") or ""),
+            {"command": request.get("command"), "echo": request.get("params"), "hwnd": self.hwnd},
+        )
+        with self.send_lock:
+            send_json_message(self.sock, response)
+
+    def heartbeat(self) -> None:
+        with self.send_lock:
+            send_json_message(self.sock, {"type": "heartbeat", "client": {"hwnd": self.hwnd}})
+
+    def recv_loop(self, immediate: bool) -> None:
+        try:
+            while True:
+                msg = recv_json_message(self.sock, timeout=None)
+                if msg.get("type") != "request":
+                    continue
+                if immediate:
+                    self.answer(msg)
+                else:
+                    self.inbox.put(msg)
+        except Exception:
+            os._exit(0)  # daemon went away: the run is over
+
+    def drain(self) -> None:
+        while True:
+            try:
+                request = self.inbox.get_nowait()
+            except queue.Empty:
+                return
+            self.answer(request)
+
+
+def run_widgets(port: int, count: int, frame_ms: float, token: str) -> None:
+    clients = [FakeWidgetClient(port, i, token) for i in range(count)]
+    for client in clients:
+        threading.Thread(target=client.recv_loop, args=(frame_ms <= 0,), daemon=True).start()
+    print(f"[widgets] {count} fake clients connected", flush=True)
+    last_heartbeat = time.time()
+    while True:
+        if frame_ms > 0:
+            time.sleep(frame_ms / 1000.0)
+            for client in clients:
+                client.drain()
+        else:
+            time.sleep(1.0)
+        if time.time() - last_heartbeat > 5.0:
+            last_heartbeat = time.time()
+            for client in clients:
+                client.heartbeat()
+
+
+# ---------------------------------------------------------------------------
+# Control-side load generator
+# ---------------------------------------------------------------------------
+
+
+def _control_call(port: int, command: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+    sock = _connect(port)
+    try:
+        send_json_message(
+            sock,
+            {"type": "request", "request_id": uuid.uuid4().hex, "command": command, "params": params or {}},
+        )
+        return recv_json_message(sock, timeout=10.0)
+    finally:
+        sock.close()
+
+
+def _make_request(command: str, seq: int, clients: int) -> dict[str, Any]:
+    request_id = uuid.uuid4().hex
+    if command == "ping":
+        return {"type": "request", "request_id": request_id, "command": "system.ping", "params": {}}
+    return {
+        "type": "request",
+        "request_id": request_id,
+        "command": "client.request",
+        "params": {
+            "target": {"hwnd": _FIRST_HWND + seq % clients},
+            "payload": {"command": "bench.echo", "params": {"seq": seq}},
+        },
+    }
+
+
+def _drive_connection(
+    port: int,
+    seqs: range,
+    window: int,
+    command: str,
+    clients: int,
+    start: threading.Barrier,
+    latencies: list[float],
+    outcomes: list[tuple[int, int]],
+) -> None:
+    sock = _connect(port)
+    sock.settimeout(None)
+    sent_at: dict[str, tuple[float, int]] = {}
+    slots = threading.Semaphore(window)
+
+    def sender() -> None:
+        for seq in seqs:
+            slots.acquire()
+            request = _make_request(command, seq, clients)
+            sent_at[request["request_id"]] = (time.perf_counter(), seq)
+            send_json_message(sock, request)
+
+    local: list[float] = []
+    ok = failed = 0
+    start.wait()
+    threading.Thread(target=sender, daemon=True).start()
+    try:
+        for _ in seqs:
+            resp = recv_json_message(sock, timeout=60.0)
+            done = time.perf_counter()
+            sent = sent_at.pop(str(resp.get("request_id") or ""), None)
+            slots.release()
+            if sent is None:
+                failed += 1
+                continue
+            local.append((done - sent[0]) * 1000.0)
+            if not resp.get("ok"):
+                failed += 1
+            elif command != "ping":
+                bridge = (resp.get("result") or {}).get("bridge_response") or {}
+                if ((bridge.get("result") or {}).get("echo") or {}).get("seq") != sent[1]:
+                    failed += 1
+                    continue
+            ok += resp.get("ok") is True
+    except Exception:
+        failed = len(seqs) - ok
+    finally:
+        sock.close()
+    latencies.extend(local)
+    outcomes.append((ok, failed))
+
+
+def run_load(
+    engine: str,
+    port: int,
+    requests: int,
+    connections: int,
+    window: int,
+    command: str,
+    clients: int,
+) -> LoadResult:
+    per_conn = max(1, requests // connections)
+    start = threading.Barrier(connections + 1)
+    latencies: list[float] = []
+    outcomes: list[tuple[int, int]] = []
+    threads = [
+        threading.Thread(
+            target=_drive_connection,
+            args=(port, range(i * per_conn, (i + 1) * per_conn), window, command, clients, start, latencies, outcomes),
+            daemon=True,
+        )
+        for i in range(connections)
+    ]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    t0 = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - t0
+    ordered = sorted(latencies)
+    return LoadResult(
+        engine=engine,
+        window=window,
+        completed=sum(ok for ok, _ in outcomes),
+        errors=sum(failed for _, failed in outcomes),
+        seconds=seconds,
+        p50_ms=_percentile(ordered, 50),
+        p95_ms=_percentile(ordered, 95),
+        p99_ms=_percentile(ordered, 99),
+        max_ms=ordered[-1] if ordered else 0.0,
+    )
+
+
+def bench_engine(engine: str, args: argparse.Namespace) -> list[LoadResult]:
+    widget_port, control_port = _free_port(), _free_port()
+    daemon = subprocess.Popen(
+        [
+            sys.executable, os.path.join(_HERE, "bridge_daemon.py"),
+            "--engine", engine,
+            "--widget-port", str(widget_port),
+            "--control-port", str(control_port),
+            "--token", args.token,
+        ],
+        cwd=_HERE,
+        stdout=subprocess.DEVNULL,
+    )
+    widgets = None
+    try:
+        _connect(control_port).close()
+        widgets = subprocess.Popen(
+            [
+                sys.executable, os.path.abspath(__file__),
+                "--role", "widgets",
+                "--widget-port", str(widget_port),
+                "--clients", str(args.clients),
+                "--frame-ms", str(args.frame_ms),
+                "--token", args.token,
+            ],
+            cwd=_HERE,
+            stdout=subprocess.DEVNULL,
+        )
+        deadline = time.time() + 15.0
+        while len(_control_call(control_port, "system.list_clients")["result"]["clients"]) < args.clients:
+            if time.time() > deadline or widgets.poll() is not None:
+                raise RuntimeError("fake widget clients did not register")
+            time.sleep(0.05)
+        # warm-up, not measured
+        run_load(engine, control_port, min(500, args.requests), args.connections, 4, args.command, args.clients)
+        return [
+            run_load(engine, control_port, args.requests, args.connections, window, args.command, args.clients)
+            for window in args.windows
+        ]
+    finally:
+        for proc in (widgets, daemon):
+            if proc is not None:
+                proc.kill()
+                proc.wait()
+
+
+def _print_results(results: list[LoadResult]) -> None:
+    print(f"{'engine':>9} {'window':>6} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'errors':>6}")
+    for r in results:
+        print(
+            f"{r.engine:>9} {r.window:>6} {r.throughput:>9.0f} {r.p50_ms:>8.2f} "
+            f"{r.p95_ms:>8.2f} {r.p99_ms:>8.2f} {r.max_ms:>8.2f} {r.errors:>6}"
+        )
+    by_key = {(r.engine, r.window): r for r in results}
+    for r in results:
+        base = by_key.get(("threaded", r.window))
+        if r.engine == "asyncio" and base is not None and base.throughput > 0:
+            print(f"window {r.window}: asyncio {r.throughput / base.throughput:.2f}x threaded throughput, "
+                  f"p99 {r.p99_ms:.2f} vs {base.p99_ms:.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Py4GW bridge daemon load test")
+    parser.add_argument("--role", choices=("bench", "widgets"), default="bench", help=argparse.SUPPRESS)
+    parser.add_argument("--engines", nargs="+", choices=("threaded", "asyncio"), default=["threaded", "asyncio"])
+    parser.add_argument("--clients", type=int, default=4, help="fake widget clients")
+    parser.add_argument("--connections", type=int, default=4, help="control connections")
+    parser.add_argument("--windows", type=int, nargs="+", default=[1, 8, 32], help="in-flight requests per connection")
+    parser.add_argument("--requests", type=int, default=4000, help="requests per scenario")
+    parser.add_argument("--frame-ms", type=float, default=0.0, help="fake widget frame interval (0 = answer immediately)")
+    parser.add_argument("--command", choices=("request", "ping"), default="request")
+    parser.add_argument("--widget-port", type=int, default=0, help=argparse.SUPPRESS)
+    parser.add_argument("--token", default="loadtest")
+    args = parser.parse_args()
+
+    if args.role == "widgets":
+        run_widgets(args.widget_port, args.clients, args.frame_ms, args.token)
+        return
+
+    print(
+        f"{args.requests} x {args.command} per scenario, {args.connections} control connections, "
+        f"{args.clients} fake clients, frame {args.frame_ms:g} ms"
+    )
+    results: list[LoadResult] = []
+    for engine in args.engines:
+        results.extend(bench_engine(engine, args))
+    _print_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""Benchmark: MCP-style daemon calls, one connection per request vs the connection pool.
+
+A stand-in daemon (started in its own process) accepts control connections
+and answers every request with a canned response using send_json_message /
+recv_json_message, one connection per thread and one request at a time per
+connection like the threaded bridge daemon.  --service-ms adds simulated work
+per request.
+
+Modes, each issuing --requests control calls:
+
+    one-shot    connect, send, receive, close per call (the old _daemon_request)
+    pooled      sequential calls over a persistent DaemonConnectionPool
+    pipelined   submit --window calls, then collect their responses
+    batch       DaemonConnectionPool.batch with --batch-size calls per round trip
+    threads     --threads callers sharing one pooled connection (multiplexing)
+
+    python bridge_pool_bench.py
+    python bridge_pool_bench.py --requests 5000 --service-ms 0.2
+"""
+
+import argparse
+import math
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from typing import Any, Callable
+
+from BridgeRuntime.connection_pool import DaemonConnectionPool
+from BridgeRuntime.protocol import make_response, recv_json_message, send_json_message
+
+_HOST = "127.0.0.1"
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind((_HOST, 0))
+        return probe.getsockname()[1]
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(pct / 100.0 * len(ordered)) - 1)]
+
+
+# ---------------------------------------------------------------------------
+# Stand-in daemon (--role daemon)
+# ---------------------------------------------------------------------------
+
+
+def _canned_result(command: str, params: dict[str, Any]) -> dict[str, Any]:
+    if command == "system.list_clients":
+        return {"clients": [{"key": "hwnd:1000", "hwnd": 1000, "pid": 4242}]}
+    if command == "client.get_map_state":
+        return {"target": params.get("target"), "map_state": {"map_id": 248, "instance_type": "explorable"}}
+    if command == "client.list_agents":
+        return {"target": params.get("target"), "group": params.get("group", "all"), "agents": list(range(40))}
+    return {"command": command, "params": params}
+
+
+def _serve_conn(sock: socket.socket, service_s: float) -> None:
+    try:
+        while True:
+            req = recv_json_message(sock, timeout=300.0)
+            if service_s > 0:
+                time.sleep(service_s)
+            command = str(req.get("command") or "")
+            params = req.get("params") if isinstance(req.get("params"), dict) else {}
+            send_json_message(sock, make_response(str(req.get("request_id") or ""), _canned_result(command, params)))
+    except Exception:
+        pass
+    finally:
+        sock.close()
+
+
+def run_standin_daemon(port: int, service_ms: float) -> None:
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind((_HOST, port))
+    server.listen(128)
+    while True:
+        sock, _ = server.accept()
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        threading.Thread(target=_serve_conn, args=(sock, service_ms / 1000.0), daemon=True).start()
+
+
+# ---------------------------------------------------------------------------
+# Client modes
+# ---------------------------------------------------------------------------
+
+_CALLS = [
+    ("client.get_map_state", {"target": {"hwnd": 1000}}),
+    ("client.list_agents", {"target": {"hwnd": 1000}, "group": "enemy"}),
+    ("system.list_clients", {}),
+]
+
+
+def _one_shot_request(port: int, command: str, params: dict[str, Any], timeout: float = 5.0) -> dict[str, Any]:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect((_HOST, port))
+        send_json_message(sock, {"type": "request", "request_id": uuid.uuid4().hex, "command": command, "params": params})
+        return recv_json_message(sock, timeout=timeout)
+    finally:
+        sock.close()
+
+
+def _mode_one_shot(port: int, pool: DaemonConnectionPool, n: int, args: argparse.Namespace, lat: list[float]) -> int:
+    ok = 0
+    for i in range(n):
+        t0 = time.perf_counter()
+        ok += bool(_one_shot_request(port, *_CALLS[i % len(_CALLS)]).get("ok"))
+        lat.append((time.perf_counter() - t0) * 1000.0)
+    return ok
+
+
+def _mode_pooled(port: int, pool: DaemonConnectionPool, n: int, args: argparse.Namespace, lat: list[float]) -> int:
+    ok = 0
+    for i in range(n):
+        t0 = time.perf_counter()
+        ok += bool(pool.request(*_CALLS[i % len(_CALLS)]).get("ok"))
+        lat.append((time.perf_counter() - t0) * 1000.0)
+    return ok
+
+
+def _mode_pipelined(port: int, pool: DaemonConnectionPool, n: int, args: argparse.Namespace, lat: list[float]) -> int:
+    ok = 0
+    for start in range(0, n, args.window):
+        t0 = time.perf_counter()
+        replies = [pool.submit(*_CALLS[i % len(_CALLS)]) for i in range(start, min(n, start + args.window))]
+        for reply in replies:
+            ok += bool(reply.result(5.0).get("ok"))
+            lat.append((time.perf_counter() - t0) * 1000.0)
+    return ok
+
+
+def _mode_batch(port: int, pool: DaemonConnectionPool, n: int, args: argparse.Namespace, lat: list[float]) -> int:
+    ok = 0
+    for start in range(0, n, args.batch_size):
+        t0 = time.perf_counter()
+        responses = pool.batch([_CALLS[i % len(_CALLS)] for i in range(start, min(n, start + args.batch_size))])
+        elapsed = (time.perf_counter() - t0) * 1000.0
+        ok += sum(bool(resp.get("ok")) for resp in responses)
+        lat.extend([elapsed] * len(responses))
+    return ok
+
+
+def _mode_threads(port: int, pool: DaemonConnectionPool, n: int, args: argparse.Namespace, lat: list[float]) -> int:
+    per_thread = max(1, n // args.threads)
+    oks: list[int] = []
+
+    def worker() -> None:
+        local: list[float] = []
+        oks.append(_mode_pooled(port, pool, per_thread, args, local))
+        lat.extend(local)
+
+    threads = [threading.Thread(target=worker) for _ in range(args.threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(oks)
+
+
+MODES: list[tuple[str, Callable[..., int]]] = [
+    ("one-shot", _mode_one_shot),
+    ("pooled", _mode_pooled),
+    ("pipelined", _mode_pipelined),
+    ("batch", _mode_batch),
+    ("threads", _mode_threads),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bridge daemon connection pool benchmark")
+    parser.add_argument("--role", choices=("bench", "daemon"), default="bench", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=0, help=argparse.SUPPRESS)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--window", type=int, default=16, help="in-flight calls in pipelined mode")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--service-ms", type=float, default=0.0, help="simulated daemon work per request")
+    args = parser.parse_args()
+
+    if args.role == "daemon":
+        run_standin_daemon(args.port, args.service_ms)
+        return
+
+    port = _free_port()
+    daemon = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--role", "daemon", "--port", str(port), "--service-ms", str(args.service_ms)],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    try:
+        deadline = time.time() + 10.0
+        while True:
+            try:
+                socket.create_connection((_HOST, port), timeout=1.0).close()
+                break
+            except OSError:
+                if time.time() > deadline:
+                    raise
+                time.sleep(0.05)
+
+        print(f"{args.requests} control calls per mode, stand-in daemon service {args.service_ms:g} ms")
+        print(f"{'mode':>10} {'calls/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'connects':>8} {'ok':>6}")
+        base = None
+        for label, mode in MODES:
+            pool = DaemonConnectionPool(_HOST, port, size=1, timeout=5.0)
+            mode(port, pool, min(200, args.requests), args, [])  # warm-up
+            connects_before = sum(c.connects for c in pool.connections)
+            lat: list[float] = []
+            t0 = time.perf_counter()
+            ok = mode(port, pool, args.requests, args, lat)
+            seconds = time.perf_counter() - t0
+            connects = sum(c.connects for c in pool.connections) - connects_before
+            if label == "one-shot":
+                connects = args.requests
+            pool.close()
+            ordered = sorted(lat)
+            rate = len(ordered) / seconds
+            base = base or rate
+            print(
+                f"{label:>10} {rate:>9.0f} {_percentile(ordered, 50):>8.3f} {_percentile(ordered, 99):>8.3f} "
+                f"{connects:>8} {ok:>6}   {rate / base:.2f}x"
+            )
+    finally:
+        daemon.kill()
+        daemon.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,10 @@
 import argparse
 import json
-import socket
 import sys
-import uuid
 from pathlib import Path
 from typing import Any
 
-from BridgeRuntime.protocol import recv_json_message
-from BridgeRuntime.protocol import send_json_message
+from BridgeRuntime.connection_pool import DaemonConnectionPool
 
 
 SERVER_NAME = "py4gw-bridge-mcp"
@@ -20,6 +17,7 @@ SUPPORTED_MCP_PROTOCOL_VERSIONS = (
 )
 LOG_PATH = Path(__file__).with_name("py4gw_mcp_server.log")
 STDIO_MODE = "auto"
+MAX_BATCH_CALLS = 32
 
 
 def _log_stderr(message: str) -> None:
@@ -35,32 +33,6 @@ def _log_debug(message: str) -> None:
         pass
 
 
-def _daemon_request(
-    host: str,
-    port: int,
-    command: str,
-    params: dict[str, Any] | None = None,
-    timeout: float = 5.0,
-) -> dict[str, Any]:
-    req = {
-        "type": "request",
-        "request_id": uuid.uuid4().hex,
-        "command": command,
-        "params": params or {},
-    }
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(timeout)
-    try:
-        sock.connect((host, port))
-        send_json_message(sock, req)
-        return recv_json_message(sock, timeout=timeout)
-    finally:
-        try:
-            sock.close()
-        except Exception:
-            pass
-
-
 def _read_stdio_message() -> dict[str, Any] | None:
     global STDIO_MODE
     headers: dict[str, str] = {}
@@ -203,6 +175,34 @@ def _tool_list() -> list[dict[str, Any]]:
                 "additionalProperties": False,
             },
         },
+        {
+            "name": "batch",
+            "description": (
+                "Run several of the other tools in one daemon round trip, e.g. map state, player state "
+                "and agent lists together. Results are returned in call order."
+            ),
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "calls": {
+                        "type": "array",
+                        "minItems": 1,
+                        "maxItems": MAX_BATCH_CALLS,
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string"},
+                                "arguments": {"type": "object"},
+                            },
+                            "required": ["name"],
+                            "additionalProperties": False,
+                        },
+                    },
+                },
+                "required": ["calls"],
+                "additionalProperties": False,
+            },
+        },
     ]
 
 
@@ -211,6 +211,8 @@ class Py4GWMcpServer:
         self.daemon_host = daemon_host
         self.daemon_port = daemon_port
         self.timeout = timeout
+        # one persistent connection, reopened if the daemon drops it
+        self.daemon = DaemonConnectionPool(daemon_host, daemon_port, size=1, timeout=timeout)
 
     def _target_params(self, arguments: dict[str, Any]) -> dict[str, Any]:
         target: dict[str, Any] = {}
@@ -224,62 +226,57 @@ class Py4GWMcpServer:
             raise ValueError("Provide hwnd or pid")
         return {"target": target}
 
-    def _call_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    def _tool_request(self, name: str, arguments: dict[str, Any]) -> tuple[str, dict[str, Any]]:
         if name == "list_clients":
-            return _daemon_request(self.daemon_host, self.daemon_port, "system.list_clients", timeout=self.timeout)
+            return "system.list_clients", {}
         if name == "list_namespaces":
-            return _daemon_request(
-                self.daemon_host,
-                self.daemon_port,
-                "client.list_namespaces",
-                self._target_params(arguments),
-                timeout=self.timeout,
-            )
+            return "client.list_namespaces", self._target_params(arguments)
         if name == "list_commands":
-            return _daemon_request(
-                self.daemon_host,
-                self.daemon_port,
-                "client.list_commands",
-                self._target_params(arguments),
-                timeout=self.timeout,
-            )
+            return "client.list_commands", self._target_params(arguments)
         if name == "describe_runtime":
-            return _daemon_request(
-                self.daemon_host,
-                self.daemon_port,
-                "client.describe_runtime",
-                self._target_params(arguments),
-                timeout=self.timeout,
-            )
+            return "client.describe_runtime", self._target_params(arguments)
         if name == "get_map_state":
-            return _daemon_request(
-                self.daemon_host,
-                self.daemon_port,
-                "client.get_map_state",
-                self._target_params(arguments),
-                timeout=self.timeout,
-            )
+            return "client.get_map_state", self._target_params(arguments)
         if name == "get_player_state":
-            return _daemon_request(
-                self.daemon_host,
-                self.daemon_port,
-                "client.get_player_state",
-                self._target_params(arguments),
-                timeout=self.timeout,
-            )
+            return "client.get_player_state", self._target_params(arguments)
         if name == "list_agents":
             params = self._target_params(arguments)
             if "group" in arguments and arguments.get("group") is not None:
                 params["group"] = str(arguments["group"])
-            return _daemon_request(
-                self.daemon_host,
-                self.daemon_port,
-                "client.list_agents",
-                params,
-                timeout=self.timeout,
-            )
+            return "client.list_agents", params
         raise ValueError(f"Unknown tool: {name}")
 
+    def _call_batch(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        calls = arguments.get("calls")
+        if not isinstance(calls, list) or not calls:
+            raise ValueError("batch requires a non-empty calls list")
+        if len(calls) > MAX_BATCH_CALLS:
+            raise ValueError(f"batch accepts at most {MAX_BATCH_CALLS} calls")
+        names: list[str] = []
+        requests: list[tuple[str, dict[str, Any]]] = []
+        for call in calls:
+            if not isinstance(call, dict):
+                raise ValueError("batch calls must be objects")
+            name = str(call.get("name") or "")
+            call_arguments = call.get("arguments", {})
+            if name == "batch":
+                raise ValueError("batch calls cannot be nested")
+            if not isinstance(call_arguments, dict):
+                raise ValueError(f"arguments for {name} must be an object")
+            names.append(name)
+            requests.append(self._tool_request(name, call_arguments))
+        responses = self.daemon.batch(requests, timeout=self.timeout)
+        return {
+            "ok": all(bool(resp.get("ok", False)) for resp in responses),
+            "results": [{"name": name, "response": resp} for name, resp in zip(names, responses)],
+        }
+
+    def _call_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        if name == "batch":
+            return self._call_batch(arguments)
+        command, params = self._tool_request(name, arguments)
+        return self.daemon.request(command, params, timeout=self.timeout)
+
     def _negotiate_protocol_version(self, requested_version: Any) -> str:
         requested = str(requested_version or "").strip()
         if requested in SUPPORTED_MCP_PROTOCOL_VERSIONS:
@@ -355,17 +352,20 @@ class Py4GWMcpServer:
         return _make_jsonrpc_error(msg_id, -32601, f"Method not found: {method}")
 
     def run(self) -> int:
-        while True:
-            try:
-                message = _read_stdio_message()
-            except Exception as exc:
-                _write_stdio_message(_make_jsonrpc_error(None, -32700, f"Parse error: {exc}"))
-                return 1
-            if message is None:
-                return 0
-            response = self.handle_message(message)
-            if response is not None:
-                _write_stdio_message(response)
+        try:
+            while True:
+                try:
+                    message = _read_stdio_message()
+                except Exception as exc:
+                    _write_stdio_message(_make_jsonrpc_error(None, -32700, f"Parse error: {exc}"))
+                    return 1
+                if message is None:
+                    return 0
+                response = self.handle_message(message)
+                if response is not None:
+                    _write_stdio_message(response)
+        finally:
+            self.daemon.close()
 
 
 def main() -> int: